@@ -1,5 +1,8 @@
 import argparse
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import uvicorn  # pants: no-infer-dep
 from a2a.server.apps import A2AStarletteApplication  # pants: no-infer-dep
@@ -18,9 +21,64 @@ from next_gen_ui_agent.inference.inference_builder import (
     add_inference_comandline_args,
     create_inference_from_arguments,
 )
+from starlette.applications import Starlette  # pants: no-infer-dep
+from starlette.responses import JSONResponse  # pants: no-infer-dep
+from starlette.routing import Route  # pants: no-infer-dep
 
 logger = logging.getLogger("NextGenUI-A2A-Server")
 
+
+def create_health_routes(executor: NextGenUIAgentExecutor) -> list[Route]:
+    """Create /liveness and /readiness routes. Readiness is reported when the `executor` warm-up is done."""
+
+    async def liveness(request) -> JSONResponse:
+        return JSONResponse({"status": "healthy", "service": "a2a-server"})
+
+    async def readiness(request) -> JSONResponse:
+        if not executor.ready:
+            return JSONResponse(
+                {"status": "warming-up", "service": "a2a-server"}, status_code=503
+            )
+        response: dict = {"status": "healthy", "service": "a2a-server"}
+        if executor.ngui_agent.warm_up_duration is not None:
+            response["warm_up_duration"] = executor.ngui_agent.warm_up_duration
+        if executor.ngui_agent.rendering_cache:
+            response["rendering_cache"] = (
+                executor.ngui_agent.rendering_cache.get_stats()
+            )
+        return JSONResponse(response)
+
+    return [
+        Route("/liveness", liveness, methods=["GET"]),
+        Route("/readiness", readiness, methods=["GET"]),
+    ]
+
+
+def create_warm_up_lifespan(executor: NextGenUIAgentExecutor, probe_inference: bool):
+    """Create server lifespan warming up the `executor` in the background, so the server responds to the readiness checks meanwhile."""
+
+    async def warm_up() -> None:
+        try:
+            await executor.warm_up(probe_inference)
+        except Exception:
+            # warm-up only speeds up the first requests, the server is able to process them anyway
+            logger.exception("UI Agent warm-up failed")
+            executor.ready = True
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        task = None
+        if not executor.ready:
+            task = asyncio.create_task(warm_up())
+        try:
+            yield
+        finally:
+            if task and not task.done():
+                task.cancel()
+
+    return lifespan
+
+
 if __name__ == "__main__":
     """Main entry point."""
 
@@ -63,6 +121,18 @@ Examples:
         action=EnvDefault,
         envvar="A2A_PORT",
     )
+    parser.add_argument(
+        "--warm-up",
+        choices=["true", "false", "probe-inference"],
+        default="true",
+        help=(
+            "Warm-up the agent when the server starts (build system prompts, compile configured JSONPaths and renderer templates), "
+            "`/readiness` reports the server ready only when done. `probe-inference` issues also probe inference "
+            "to establish the LLM connection."
+        ),
+        action=EnvDefault,
+        envvar="A2A_WARM_UP",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
@@ -85,8 +155,11 @@ Examples:
 
     inference = create_inference_from_arguments(parser, args, logger)
 
+    agent_executor = NextGenUIAgentExecutor(
+        config=config, inference=inference, warm_up=args.warm_up != "false"
+    )
     request_handler = DefaultRequestHandler(
-        agent_executor=NextGenUIAgentExecutor(config=config, inference=inference),
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
     )
 
@@ -95,4 +168,13 @@ Examples:
         http_handler=request_handler,
     )
 
-    uvicorn.run(server.build(), host=args.host, port=args.port)
+    uvicorn.run(
+        server.build(
+            routes=create_health_routes(agent_executor),
+            lifespan=create_warm_up_lifespan(
+                agent_executor, args.warm_up == "probe-inference"
+            ),
+        ),
+        host=args.host,
+        port=args.port,
+    )
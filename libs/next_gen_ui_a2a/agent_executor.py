@@ -1,19 +1,61 @@
-import json
 import uuid
+from typing import Any, Optional
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
+from a2a.server.tasks import TaskUpdater
 from a2a.types import DataPart, InvalidParamsError, Message, Part, Role, TextPart
 from a2a.utils.errors import ServerError
+from a2a.utils.task import new_task
 from next_gen_ui_agent import AgentConfig, InputData, NextGenUIAgent, UIBlock
+from next_gen_ui_agent.data_transform.types import ComponentDataBase
 from next_gen_ui_agent.inference.inference_base import InferenceBase
+from next_gen_ui_agent.input_data_context import InputDataContext
+from next_gen_ui_agent.json_tools import json_dumps
+from next_gen_ui_agent.types import UIBlockConfiguration
+
+_TRUE_VALUES = {"true", "1", "yes"}
+_FALSE_VALUES = {"false", "0", "no", ""}
+
+
+def _parse_bool_metadata(metadata: dict[str, Any], key: str) -> bool:
+    """Parse boolean request metadata value, booleans and `true`/`false` (also `1`/`0`, `yes`/`no`) strings are accepted."""
+    value = metadata.get(key, False)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value.strip().lower() in _TRUE_VALUES:
+            return True
+        if value.strip().lower() in _FALSE_VALUES:
+            return False
+    raise ServerError(
+        error=InvalidParamsError(
+            message=f"Invalid '{key}' metadata value '{value}', boolean is expected"
+        )
+    )
 
 
 class NextGenUIAgentExecutor(AgentExecutor):
     """Next Gen UI Agent Executor. AgentConfig is required"""
 
-    def __init__(self, inference: InferenceBase, config: AgentConfig):
+    def __init__(
+        self, inference: InferenceBase, config: AgentConfig, warm_up: bool = False
+    ):
+        """
+        * `warm_up` - if `True`, the executor is not `ready` until `warm_up()` is done.
+        """
         self.ngui_agent = NextGenUIAgent(inference=inference, config=config)
+        self.ready = not warm_up
+        """`False` until the warm-up is done, if requested. Used by the readiness check."""
+
+    async def warm_up(self, probe_inference: bool = False) -> float:
+        """
+        Warm-up the agent (see `NextGenUIAgent.warm_up()`) and mark the executor as `ready`.
+        Returns warm-up duration in seconds.
+        """
+        duration = await self.ngui_agent.warm_up(probe_inference=probe_inference)
+        self.ready = True
+        return duration
 
     def _data_selection(self, message: Message) -> tuple[str, list[InputData]]:
         """Get data from the message parts."""
@@ -35,7 +77,7 @@ class NextGenUIAgentExecutor(AgentExecutor):
                     if isinstance(metadata.get("data"), str):
                         data = metadata["data"]
                     else:
-                        data = json.dumps(metadata["data"])
+                        data = json_dumps(metadata["data"])
 
                     data_type = None
                     if metadata.get("type"):
@@ -66,7 +108,7 @@ class NextGenUIAgentExecutor(AgentExecutor):
                 input_data_list.append(
                     InputData(
                         id=id,
-                        data=json.dumps(part_root.data),
+                        data=json_dumps(part_root.data),
                         type=data_type,
                         type_metadata=type_metadata,
                     )
@@ -82,6 +124,7 @@ class NextGenUIAgentExecutor(AgentExecutor):
         if not context.message:
             raise ServerError(error=InvalidParamsError(message="No message provided"))
         component_system = context.metadata.get("component_system", "json")
+        stream_rendering = _parse_bool_metadata(context.metadata, "stream_rendering")
 
         user_prompt, input_data_list = self._data_selection(context.message)
         if len(input_data_list) == 0:
@@ -91,68 +134,191 @@ class NextGenUIAgentExecutor(AgentExecutor):
                 )
             )
 
+        updater = None
+        if stream_rendering:
+            # rendering chunks are streamed as task artifact updates
+            task = context.current_task or new_task(context.message)
+            if not context.current_task:
+                await event_queue.enqueue_event(task)
+            updater = TaskUpdater(event_queue, task.id, task.context_id)
+
         # TODO: Parallelize per input data if needed (depends on NGUI-495	Stabilize input/output A2A schemas, sync with MCP)
         success_output = ["\nSuccessful generated components:"]
         failed_output = ["\nFailed component generation:"]
         for input_data in input_data_list:
             try:
-                # 1. Component selection
-                component_metadata = await self.ngui_agent.select_component(
-                    user_prompt=user_prompt, input_data=input_data
-                )
-                # 2. Data transformation
-                components_data = self.ngui_agent.transform_data(
-                    input_data=input_data,
-                    component=component_metadata,
-                )
-                # 3. Design system rendering
-                rendering = self.ngui_agent.generate_rendering(
-                    component=components_data,
-                    component_system=component_system,
-                )
-                block_config = self.ngui_agent.construct_UIBlockConfiguration(
-                    input_data=input_data,
-                    component_metadata=component_metadata,
-                )
-                ui_block = UIBlock(
-                    id=rendering.id, rendering=rendering, configuration=block_config
-                )
-
-                component_info = self.ngui_agent.component_info(ui_block.configuration)
-                summary = f"Component is rendered in UI. {component_info}"
-                success_output.append(f"{len(success_output)}. {component_info}")
-
-                message = Message(
-                    role=Role.agent,
-                    context_id=context.context_id,
-                    parts=[
-                        Part(
-                            root=TextPart(
-                                text=summary,
-                                # metadata={"structured_data": ui_block},
-                            )
-                        ),
-                        Part(
-                            root=DataPart(
-                                data=ui_block.model_dump(
-                                    exclude_unset=True,
-                                    exclude_defaults=True,
-                                    exclude_none=True,
-                                )
+                # input data are parsed only once and shared by all the steps through the context
+                with InputDataContext(input_data) as input_data_context:
+                    # 1. Component selection
+                    component_metadata = await self.ngui_agent.select_component(
+                        user_prompt=user_prompt, input_data=input_data_context
+                    )
+                    # 2. Data transformation
+                    components_data = await self.ngui_agent.atransform_data(
+                        input_data=input_data_context,
+                        component=component_metadata,
+                    )
+                    block_config = self.ngui_agent.construct_UIBlockConfiguration(
+                        input_data=input_data_context,
+                        component_metadata=component_metadata,
+                    )
+                    component_info = self.ngui_agent.component_info(block_config)
+                    # 3. Design system rendering
+                    if updater:
+                        await self._stream_ui_block(
+                            updater,
+                            components_data,
+                            component_system,
+                            block_config,
+                            input_data_context.data_size,
+                        )
+                    else:
+                        ui_block = await self._generate_ui_block(
+                            components_data,
+                            component_system,
+                            block_config,
+                            input_data_context.data_size,
+                        )
+                        await event_queue.enqueue_event(
+                            self._create_ui_block_message(
+                                context, ui_block, component_info
                             )
-                        ),
-                    ],
-                    message_id=str(uuid.uuid4()),
-                    task_id=None,
-                )
-                await event_queue.enqueue_event(message)
+                        )
+                success_output.append(f"{len(success_output)}. {component_info}")
             except Exception as e:
                 failed_output.append(
                     f"{len(failed_output)}. UI generation failed for this component. {e}"
                 )
 
         summary_message = self.create_a2a_output(context, success_output, failed_output)
-        await event_queue.enqueue_event(summary_message)
+        if updater:
+            await updater.complete(summary_message)
+        else:
+            await event_queue.enqueue_event(summary_message)
+
+    async def _generate_ui_block(
+        self,
+        component: ComponentDataBase,
+        component_system: str | list[str],
+        block_config: UIBlockConfiguration,
+        data_size: Optional[int],
+    ) -> UIBlock:
+        """Render UI block in one component system, or in all of them if list is requested (see `UIBlock.renderings`)."""
+        if isinstance(component_system, list):
+            renderings = await self.ngui_agent.agenerate_rendering(
+                component=component,
+                component_system=component_system,
+                data_size=data_size,
+            )
+            return UIBlock(
+                id=renderings[0].id,
+                rendering=renderings[0],
+                renderings=renderings,
+                configuration=block_config,
+            )
+        rendering = await self.ngui_agent.agenerate_rendering(
+            component=component,
+            component_system=component_system,
+            data_size=data_size,
+        )
+        return UIBlock(id=rendering.id, rendering=rendering, configuration=block_config)
+
+    def _create_ui_block_message(
+        self, context: RequestContext, ui_block: UIBlock, component_info: str
+    ) -> Message:
+        """Create message with one generated UI block."""
+        return Message(
+            role=Role.agent,
+            context_id=context.context_id,
+            parts=[
+                Part(
+                    root=TextPart(
+                        text=f"Component is rendered in UI. {component_info}",
+                        # metadata={"structured_data": ui_block},
+                    )
+                ),
+                Part(
+                    root=DataPart(
+                        data=ui_block.model_dump(
+                            exclude_unset=True,
+                            exclude_defaults=True,
+                            exclude_none=True,
+                        )
+                    )
+                ),
+            ],
+            message_id=str(uuid.uuid4()),
+            task_id=None,
+        )
+
+    async def _stream_ui_block(
+        self,
+        updater: TaskUpdater,
+        component: ComponentDataBase,
+        component_system: str | list[str],
+        block_config: UIBlockConfiguration,
+        data_size: Optional[int],
+    ) -> None:
+        """
+        Stream one UI block as task artifact chunks. First chunk contains `DataPart` with the UI block with empty
+        rendering `content`, next chunks are appended `TextPart`s with the rendered content, the last one has `last_chunk` set.
+        If the rendering fails when the artifact is already streamed, the last chunk is empty `TextPart` with the `error` metadata,
+        so the client doesn't wait for the rest of the content, and the error is raised.
+        """
+        if isinstance(component_system, list):
+            raise ValueError("Streamed rendering supports only one component system")
+        rendering, chunks = await self.ngui_agent.agenerate_rendering_stream(
+            component=component,
+            component_system=component_system,
+            data_size=data_size,
+        )
+        ui_block = UIBlock(
+            id=rendering.id, rendering=rendering, configuration=block_config
+        )
+        artifact_id = str(uuid.uuid4())
+        await updater.add_artifact(
+            [
+                Part(
+                    root=DataPart(
+                        data=ui_block.model_dump(
+                            exclude_unset=True,
+                            exclude_defaults=True,
+                            exclude_none=True,
+                        )
+                    )
+                )
+            ],
+            artifact_id=artifact_id,
+            name=f"ui-block-{ui_block.id}",
+            append=False,
+            last_chunk=False,
+        )
+        # one chunk lookahead, so the last one is marked
+        previous_chunk = ""
+        try:
+            async for chunk in chunks:
+                if previous_chunk:
+                    await updater.add_artifact(
+                        [Part(root=TextPart(text=previous_chunk))],
+                        artifact_id=artifact_id,
+                        append=True,
+                        last_chunk=False,
+                    )
+                previous_chunk = chunk
+        except Exception as e:
+            await updater.add_artifact(
+                [Part(root=TextPart(text="", metadata={"error": str(e)}))],
+                artifact_id=artifact_id,
+                append=True,
+                last_chunk=True,
+            )
+            raise e
+        await updater.add_artifact(
+            [Part(root=TextPart(text=previous_chunk))],
+            artifact_id=artifact_id,
+            append=True,
+            last_chunk=True,
+        )
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
         raise Exception("cancel not supported")
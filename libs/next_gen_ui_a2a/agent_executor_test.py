@@ -1,12 +1,28 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from a2a.server.agent_execution import SimpleRequestContextBuilder
 from a2a.server.events import EventQueue
-from a2a.types import DataPart, Message, MessageSendParams, Part, Role, TextPart
+from a2a.types import (
+    DataPart,
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
 from a2a.utils.errors import ServerError
 from langchain_core.language_models import FakeMessagesListChatModel
 from langchain_core.messages import AIMessage
+from next_gen_ui_a2a.__main__ import create_health_routes, create_warm_up_lifespan
 from next_gen_ui_a2a.agent_executor import NextGenUIAgentExecutor
 from next_gen_ui_agent.data_transform.types import ComponentDataOneCard
 from next_gen_ui_agent.inference.langchain_inference import LangChainModelInference
@@ -504,3 +520,289 @@ async def test_agent_executor_datapart_with_type_metadata() -> None:
     assert ui_block.configuration is not None
     assert ui_block.configuration.data_type == "movie_detail"
     assert ui_block.configuration.data_type_metadata == test_metadata
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_warm_up() -> None:
+    executor = NextGenUIAgentExecutor(
+        inference=LangChainModelInference(FakeMessagesListChatModel(responses=[])),
+        config=AgentConfig(),
+        warm_up=True,
+    )
+    duration = await executor.warm_up()
+
+    assert executor.ready
+    assert executor.ngui_agent.warm_up_duration == duration
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_warm_up_readiness() -> None:
+    executor = NextGenUIAgentExecutor(
+        inference=LangChainModelInference(
+            FakeMessagesListChatModel(responses=[AIMessage(content="OK")])
+        ),
+        config=AgentConfig(),
+        warm_up=True,
+    )
+    readiness = create_health_routes(executor)[1]
+    assert readiness.path == "/readiness"
+
+    response = await readiness.endpoint(None)
+    assert response.status_code == 503
+
+    async with create_warm_up_lifespan(executor, probe_inference=True)(None):
+        for _ in range(100):
+            if executor.ready:
+                break
+            await asyncio.sleep(0.01)
+
+    response = await readiness.endpoint(None)
+    assert response.status_code == 200
+    assert json.loads(response.body)["warm_up_duration"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_stream_rendering() -> None:
+    msg = AIMessage(content=LLM_RESPONSE)
+    llm = FakeMessagesListChatModel(responses=[msg])
+    inference = LangChainModelInference(llm)
+    executor = NextGenUIAgentExecutor(inference=inference, config=AgentConfig())
+
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(message=message, metadata={"stream_rendering": True})
+    )
+
+    event_queue = EventQueue()
+    await executor.execute(context, event_queue)
+
+    task = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(task, Task)
+
+    first = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(first, TaskArtifactUpdateEvent)
+    assert first.task_id == task.id
+    assert not first.append and not first.last_chunk
+    assert isinstance(first.artifact.parts[0].root, DataPart)
+    ui_block = UIBlock.model_validate(first.artifact.parts[0].root.data)
+    assert ui_block.rendering is not None
+    assert ui_block.rendering.content == ""
+    assert ui_block.configuration is not None
+
+    content = ""
+    while True:
+        event = await event_queue.dequeue_event(no_wait=True)
+        assert isinstance(event, TaskArtifactUpdateEvent)
+        assert event.artifact.artifact_id == first.artifact.artifact_id
+        assert event.append
+        assert isinstance(event.artifact.parts[0].root, TextPart)
+        content += event.artifact.parts[0].root.text
+        if event.last_chunk:
+            break
+    c = ComponentDataOneCard.model_validate_json(content)
+    assert "Toy Story Details" == c.title
+
+    status = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(status, TaskStatusUpdateEvent)
+    assert status.final
+    assert status.status.state == TaskState.completed
+    assert status.status.message is not None
+    assert isinstance(status.status.message.parts[0].root, TextPart)
+    assert "Successfully generated 1 UI components" in (
+        status.status.message.parts[0].root.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_component_systems() -> None:
+    msg = AIMessage(content=LLM_RESPONSE)
+    llm = FakeMessagesListChatModel(responses=[msg])
+    inference = LangChainModelInference(llm)
+    executor = NextGenUIAgentExecutor(inference=inference, config=AgentConfig())
+
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(
+            message=message, metadata={"component_system": ["json", "json"]}
+        )
+    )
+
+    event_queue = EventQueue()
+    await executor.execute(context, event_queue)
+
+    event = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(event, Message)
+    assert isinstance(event.parts[1].root, DataPart)
+    ui_block = UIBlock.model_validate(event.parts[1].root.data)
+    assert ui_block.renderings is not None
+    assert len(ui_block.renderings) == 2
+    assert ui_block.rendering == ui_block.renderings[0]
+    c = ComponentDataOneCard.model_validate_json(ui_block.renderings[1].content)
+    assert "Toy Story Details" == c.title
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_stream_rendering_component_systems() -> None:
+    msg = AIMessage(content=LLM_RESPONSE)
+    llm = FakeMessagesListChatModel(responses=[msg])
+    inference = LangChainModelInference(llm)
+    executor = NextGenUIAgentExecutor(inference=inference, config=AgentConfig())
+
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(
+            message=message,
+            metadata={"stream_rendering": True, "component_system": ["json", "json"]},
+        )
+    )
+
+    event_queue = EventQueue()
+    await executor.execute(context, event_queue)
+
+    assert isinstance(await event_queue.dequeue_event(no_wait=True), Task)
+    status = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(status, TaskStatusUpdateEvent)
+    assert status.status.message is not None
+    assert isinstance(status.status.message.parts[0].root, TextPart)
+    assert "Streamed rendering supports only one component system" in (
+        status.status.message.parts[0].root.text
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "value, streamed",
+    [("true", True), ("TRUE", True), ("1", True), ("false", False), ("0", False)],
+)
+async def test_agent_executor_stream_rendering_string_metadata(
+    value: str, streamed: bool
+) -> None:
+    msg = AIMessage(content=LLM_RESPONSE)
+    llm = FakeMessagesListChatModel(responses=[msg])
+    inference = LangChainModelInference(llm)
+    executor = NextGenUIAgentExecutor(inference=inference, config=AgentConfig())
+
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(message=message, metadata={"stream_rendering": value})
+    )
+
+    event_queue = EventQueue()
+    await executor.execute(context, event_queue)
+
+    event = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(event, Task if streamed else Message)
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_stream_rendering_invalid_metadata() -> None:
+    executor = NextGenUIAgentExecutor(
+        inference=LangChainModelInference(FakeMessagesListChatModel(responses=[])),
+        config=AgentConfig(),
+    )
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(message=message, metadata={"stream_rendering": "on"})
+    )
+
+    with pytest.raises(ServerError):
+        await executor.execute(context, EventQueue())
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_stream_rendering_error() -> None:
+    msg = AIMessage(content=LLM_RESPONSE)
+    llm = FakeMessagesListChatModel(responses=[msg])
+    inference = LangChainModelInference(llm)
+    executor = NextGenUIAgentExecutor(inference=inference, config=AgentConfig())
+
+    async def failing_chunks() -> AsyncIterator[str]:
+        yield "first chunk"
+        yield "second chunk"
+        raise RuntimeError("rendering failed")
+
+    original = executor.ngui_agent.agenerate_rendering_stream
+
+    async def agenerate_rendering_stream(**kwargs: Any) -> Any:
+        rendering, _ = await original(**kwargs)
+        return rendering, failing_chunks()
+
+    message = Message(
+        role=Role.user,
+        parts=[
+            Part(root=TextPart(text="Tell me details about Toy Story")),
+            Part(root=DataPart(data=movies_data_obj)),
+        ],
+        message_id=str(uuid4()),
+    )
+    context = await SimpleRequestContextBuilder().build(
+        params=MessageSendParams(message=message, metadata={"stream_rendering": True})
+    )
+
+    event_queue = EventQueue()
+    with patch.object(
+        executor.ngui_agent, "agenerate_rendering_stream", agenerate_rendering_stream
+    ):
+        await executor.execute(context, event_queue)
+
+    assert isinstance(await event_queue.dequeue_event(no_wait=True), Task)
+    first = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(first, TaskArtifactUpdateEvent)
+    assert not first.last_chunk
+
+    chunk = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(chunk, TaskArtifactUpdateEvent)
+    assert isinstance(chunk.artifact.parts[0].root, TextPart)
+    assert chunk.artifact.parts[0].root.text == "first chunk"
+    assert not chunk.last_chunk
+
+    last = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(last, TaskArtifactUpdateEvent)
+    assert last.artifact.artifact_id == first.artifact.artifact_id
+    assert last.append and last.last_chunk
+    assert isinstance(last.artifact.parts[0].root, TextPart)
+    assert last.artifact.parts[0].root.text == ""
+    assert last.artifact.parts[0].root.metadata == {"error": "rendering failed"}
+
+    status = await event_queue.dequeue_event(no_wait=True)
+    assert isinstance(status, TaskStatusUpdateEvent)
+    assert status.final
+    assert status.status.message is not None
+    assert isinstance(status.status.message.parts[0].root, TextPart)
+    assert "Failed: 1" in status.status.message.parts[0].root.text
+    assert "rendering failed" in status.status.message.parts[0].root.text
@@ -1,15 +1,20 @@
-from next_gen_ui_agent.agent import NextGenUIAgent
-from next_gen_ui_agent.types import (
-    AgentConfig,
-    AgentInput,
-    DataField,
-    InputData,
-    UIBlock,
-    UIBlockComponentMetadata,
-    UIBlockConfiguration,
-    UIBlockRendering,
-    UIComponentMetadata,
-)
+from typing import TYPE_CHECKING
+
+from next_gen_ui_agent.lazy_attributes import create_lazy_attributes
+
+if TYPE_CHECKING:
+    from next_gen_ui_agent.agent import NextGenUIAgent
+    from next_gen_ui_agent.types import (
+        AgentConfig,
+        AgentInput,
+        DataField,
+        InputData,
+        UIBlock,
+        UIBlockComponentMetadata,
+        UIBlockConfiguration,
+        UIBlockRendering,
+        UIComponentMetadata,
+    )
 
 __all__ = [
     "NextGenUIAgent",
@@ -23,3 +28,19 @@ __all__ = [
     "UIBlockConfiguration",
     "UIBlockComponentMetadata",
 ]
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "NextGenUIAgent": "next_gen_ui_agent.agent",
+    "AgentConfig": "next_gen_ui_agent.types",
+    "AgentInput": "next_gen_ui_agent.types",
+    "DataField": "next_gen_ui_agent.types",
+    "InputData": "next_gen_ui_agent.types",
+    "UIBlock": "next_gen_ui_agent.types",
+    "UIBlockComponentMetadata": "next_gen_ui_agent.types",
+    "UIBlockConfiguration": "next_gen_ui_agent.types",
+    "UIBlockRendering": "next_gen_ui_agent.types",
+    "UIComponentMetadata": "next_gen_ui_agent.types",
+}
+
+
+__getattr__, __dir__ = create_lazy_attributes(__name__, _LAZY_ATTRIBUTES)
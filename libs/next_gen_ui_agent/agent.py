@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+import time
+from typing import Any, AsyncIterator, Iterator, Optional, cast, overload
 
 from next_gen_ui_agent.agent_config import parse_config_yaml
 from next_gen_ui_agent.all_fields_collector import generate_all_fields
@@ -18,34 +19,56 @@ from next_gen_ui_agent.component_selection_pertype import (
 )
 from next_gen_ui_agent.data_transform.data_transformer_utils import (
     generate_field_id,
+    parse_data_path,
     sanitize_data_path,
 )
 from next_gen_ui_agent.data_transform.types import ComponentDataBase
-from next_gen_ui_agent.data_transformation import generate_component_data
+from next_gen_ui_agent.data_transformation import (
+    generate_component_data,
+    generate_component_data_from_raw_input_data,
+)
 from next_gen_ui_agent.design_system_handler import (
+    DEFAULT_RENDERING_CHUNK_SIZE,
     get_component_system_factory,
     get_component_system_names,
     render_component,
+    render_component_stream,
+    render_component_systems,
 )
 from next_gen_ui_agent.inference.inference_base import InferenceBase
+from next_gen_ui_agent.input_data_context import InputDataContext
 from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    get_input_data_limits,
+    get_input_data_max_rows,
     init_input_data_transformers,
-    perform_input_data_transformation,
-    perform_input_data_transformation_with_transformer_name,
+    perform_input_data_transformation_with_limits,
 )
-from next_gen_ui_agent.json_data_wrapper import wrap_data
+from next_gen_ui_agent.processing_executor import ProcessingExecutor
+from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.rendering_cache import RenderingCache, RenderingCacheKey
 from next_gen_ui_agent.types import (
     AgentConfig,
+    AgentConfigJsonRenderer,
     InputData,
     InputDataInternal,
     UIBlockComponentMetadata,
     UIBlockConfiguration,
     UIBlockRendering,
     UIComponentMetadata,
+    UIComponentMetadataBase,
 )
 
 logger = logging.getLogger(__name__)
 
+_COMPONENT_METADATA_BASE_FIELDS = set(UIComponentMetadataBase.model_fields.keys())
+"""Fields shared by `UIComponentMetadata` and `UIBlockComponentMetadata`, so only they are copied between them."""
+
+_WARM_UP_DATA_PATH = "$..id"
+"""JSONPath parsed during the warm-up even if no data paths are configured, so the JSONPath parser is built."""
+
+_WARM_UP_PROBE_SYSTEM_PROMPT = "You are a health check. Answer with one word."
+_WARM_UP_PROBE_PROMPT = "Respond with OK."
+
 
 class NextGenUIAgent:
     """Next Gen UI Agent."""
@@ -67,18 +90,30 @@ class NextGenUIAgent:
 
         self.inference = inference
 
-        renderers = get_component_system_names()
-        logger.info("Registered renderers: %s", renderers)
+        self.warm_up_duration: Optional[float] = None
+        """Duration of the `warm_up()` in seconds, `None` if the agent was not warmed up."""
+
         if self.config.component_system and self.config.component_system != "json":
+            renderers = get_component_system_names()
+            logger.info("Registered renderers: %s", renderers)
             if self.config.component_system not in renderers:
                 raise ValueError(
                     f"Configured component system '{self.config.component_system}' is not found. "
                     + "Make sure you install appropriate dependency."
                 )
+            # renderer plugin is instantiated on the first use, so broken one fails here and not on the first rendering
+            self._get_component_system_factory(self.config.component_system)
 
         init_pertype_components_mapping(self.config)
         init_input_data_transformers(self.config)
         self._component_selection_strategy = self._create_component_selection_strategy()
+        self.processing_executor = ProcessingExecutor(self.config.processing_executor)
+        self.rendering_cache: Optional[RenderingCache] = (
+            RenderingCache(self.config.rendering_cache)
+            if self.config.rendering_cache
+            else None
+        )
+        """Cache of the rendering results, `None` if not enabled by `AgentConfig.rendering_cache`."""
 
     def _create_component_selection_strategy(self) -> ComponentSelectionStrategy:
         """Create component selection strategy based on config."""
@@ -88,24 +123,100 @@ class NextGenUIAgent:
         else:
             return OnestepLLMCallComponentSelectionStrategy(config=self.config)
 
+    async def warm_up(
+        self,
+        inference: Optional[InferenceBase] = None,
+        probe_inference: bool = False,
+    ) -> float:
+        """
+        Warm-up the agent, so the first requests are not slower than the next ones. Intended to be called once
+        after the agent is created, before the server using it is reported as ready.
+
+        * Builds system prompts for all the configured `data_types`.
+        * Pre-compiles JSONPaths of the pre-configured component fields.
+        * Loads the configured component system renderer and lets it prepare (eg. compile templates).
+        * Optionally issues probe inference to establish LLM connection, if `probe_inference` is `True`.
+
+        Args:
+            inference: Inference used for the probe, agent's inference is used if not provided.
+            probe_inference: If `True`, probe inference is issued.
+        Returns:
+            Warm-up duration in seconds.
+        Raises:
+            ValueError: If `probe_inference` is requested, but no inference is available.
+            Exception: If probe inference fails.
+        """
+        start = time.perf_counter()
+
+        data_types = list(self.config.data_types or {})
+        for data_type in [None, *data_types]:
+            self._component_selection_strategy.get_system_prompt(data_type)
+
+        data_paths = {_WARM_UP_DATA_PATH}
+        for data_type_config in (self.config.data_types or {}).values():
+            for component in data_type_config.components or []:
+                if component.configuration:
+                    for field in component.configuration.fields:
+                        data_path = sanitize_data_path(field.data_path)
+                        if data_path:
+                            data_paths.add(data_path)
+        for data_path in data_paths:
+            try:
+                parse_data_path(data_path)
+            except Exception:
+                logger.warning("Invalid configured data path '%s'", data_path)
+
+        if self.config.component_system:
+            self._get_component_system_factory(self.config.component_system).warm_up()
+
+        if probe_inference:
+            inference = inference if inference else self.inference
+            if not inference:
+                raise ValueError(
+                    "Inference is not defined neither as an input parameter nor as an agent's config"
+                )
+            await inference.call_model(
+                _WARM_UP_PROBE_SYSTEM_PROMPT, _WARM_UP_PROBE_PROMPT
+            )
+
+        duration = time.perf_counter() - start
+        self.warm_up_duration = duration
+        logger.info(
+            "UI Agent warmed up in %.3f s, data types: %s, data paths: %s, probe inference: %s",
+            duration,
+            data_types,
+            len(data_paths),
+            probe_inference,
+        )
+        return duration
+
     async def select_component(
         self,
         user_prompt: str,
-        input_data: InputData,
+        input_data: InputData | InputDataContext,
         inference: Optional[InferenceBase] = None,
     ) -> UIComponentMetadata:
-        """STEP 2: Select component and generate its configuration metadata."""
+        """STEP 2: Select component and generate its configuration metadata.
+
+        `InputDataContext` can be passed instead of `InputData` and reused in the next processing steps, so input data are parsed only once.
+        """
+
+        ctx = InputDataContext.of(input_data)
+        owned_ctx = ctx is not input_data
+        input_data = ctx.input_data
 
         # select per type configured components, for rest run LLM powered component selection, then join results together
-        json_data, input_data_transformer_name = perform_input_data_transformation(
-            input_data
-        )
+        if not ctx.is_transformed:
+            self._transform_input_data(ctx, owned_ctx)
 
         # Try single-component or HBC selection first (no LLM needed)
-        component = select_component_per_type(input_data, json_data)
+        component = select_component_per_type(input_data, ctx.json_data)
         if component:
-            component.input_data_transformer_name = input_data_transformer_name
+            ctx.set_json_wrapping(None)
+            component.input_data_transformer_name = ctx.input_data_transformer_name
             component.input_data_type = input_data.get("type")
+            component.input_data_total_count = ctx.input_data_total_count
+            component.input_data_limits_applied = ctx.input_data_limits_applied or None
             return component
 
         # LLM-based component selection (unified for both data_type-specific and global)
@@ -118,8 +229,8 @@ class NextGenUIAgent:
 
         input_data_for_strategy: InputDataInternal = {
             **input_data,
-            "json_data": json_data,
-            "input_data_transformer_name": input_data_transformer_name,
+            "json_data": ctx.json_data,
+            "input_data_transformer_name": ctx.input_data_transformer_name,
         }
 
         # Single unified call to strategy
@@ -127,12 +238,17 @@ class NextGenUIAgent:
         component = await self._component_selection_strategy.select_component(
             inference, user_prompt, input_data_for_strategy
         )
-        component.input_data_transformer_name = input_data_transformer_name
+        ctx.set_json_wrapping(component.json_wrapping_field_name)
+        component.input_data_transformer_name = ctx.input_data_transformer_name
         component.input_data_type = data_type
+        component.input_data_total_count = ctx.input_data_total_count
+        component.input_data_limits_applied = ctx.input_data_limits_applied or None
         return component
 
     async def refresh_component(
-        self, input_data: InputData, block_configuration: UIBlockConfiguration
+        self,
+        input_data: InputData | InputDataContext,
+        block_configuration: UIBlockConfiguration,
     ) -> UIComponentMetadata:
         """STEP 2a: Refresh component configuration metadata for new `input_data` using previous `block_configuration`."""
 
@@ -144,42 +260,316 @@ class NextGenUIAgent:
         if not block_configuration.component_metadata:
             raise KeyError("Component metadata missing in the block configuration")
 
-        json_data = perform_input_data_transformation_with_transformer_name(
-            input_data, block_configuration.input_data_transformer_name
-        )
-
-        json_data = wrap_data(json_data, block_configuration.json_wrapping_field_name)
+        ctx = InputDataContext.of(input_data)
+        if (
+            not ctx.is_transformed
+            or ctx.input_data_transformer_name
+            != block_configuration.input_data_transformer_name
+        ):
+            self._transform_input_data(
+                ctx,
+                ctx is not input_data,
+                block_configuration.input_data_transformer_name,
+            )
+        ctx.set_json_wrapping(block_configuration.json_wrapping_field_name)
 
         return UIComponentMetadata(
-            **block_configuration.component_metadata.model_dump(),
-            json_data=json_data,
+            **block_configuration.component_metadata.model_dump(
+                include=_COMPONENT_METADATA_BASE_FIELDS
+            ),
+            # data are passed by reference, not copied
+            json_data=ctx.wrapped_json_data,
             input_data_transformer_name=block_configuration.input_data_transformer_name,
             json_wrapping_field_name=block_configuration.json_wrapping_field_name,
+            input_data_total_count=ctx.input_data_total_count,
+            input_data_limits_applied=ctx.input_data_limits_applied or None,
         )
 
     def transform_data(
-        self, input_data: InputData, component: UIComponentMetadata
+        self, input_data: InputData | InputDataContext, component: UIComponentMetadata
     ) -> ComponentDataBase:
         """STEP 3: Transform generated component configuration metadata into component data. Mainly pick up showed data values from `input_data`."""
-        return generate_component_data(input_data, component)
+        ctx = InputDataContext.of(input_data)
+        return generate_component_data(
+            ctx.input_data, self._with_context_json_data(ctx, component)
+        )
+
+    async def atransform_data(
+        self, input_data: InputData | InputDataContext, component: UIComponentMetadata
+    ) -> ComponentDataBase:
+        """
+        STEP 3: Async variant of `transform_data()`, running the transformation on the configured processing executor
+        (see `AgentConfig.processing_executor`), so large data do not block the event loop.
+        """
+        ctx = InputDataContext.of(input_data)
+        data_size = ctx.data_size
+        component = self._with_context_json_data(ctx, component)
+        input_data_transformer_name = (
+            component.input_data_transformer_name or ctx.input_data_transformer_name
+        )
+        process_executor = self.processing_executor.get_transform_process_executor(
+            data_size
+        )
+        if process_executor and input_data_transformer_name:
+            # pickling of the large parsed data to the worker process is more expensive than parsing them again there,
+            # so ship only raw input data and component metadata without parsed data
+            return await self.processing_executor.run_in(
+                process_executor,
+                generate_component_data_from_raw_input_data,
+                ctx.input_data,
+                component.model_copy(update={"json_data": None}),
+                input_data_transformer_name,
+                get_input_data_max_rows(ctx.input_data),
+                get_input_data_limits(ctx.input_data),
+            )
+        return await self.processing_executor.run(
+            data_size, generate_component_data, ctx.input_data, component
+        )
 
+    def _transform_input_data(
+        self,
+        ctx: InputDataContext,
+        owned_ctx: bool,
+        input_data_transformer_name: Optional[str] = None,
+    ) -> None:
+        """Perform the `input data transformation` into the context. Context created by the processing step itself (`owned_ctx`) is closed then."""
+        try:
+            json_data, transformer_name, total_count, limits_applied = (
+                perform_input_data_transformation_with_limits(
+                    ctx.mapped_input_data, input_data_transformer_name
+                )
+            )
+        finally:
+            if owned_ctx:
+                ctx.close()
+        ctx.set_transformed(json_data, transformer_name, total_count, limits_applied)
+
+    def _with_context_json_data(
+        self, ctx: InputDataContext, component: UIComponentMetadata
+    ) -> UIComponentMetadata:
+        update: dict[str, Any] = {}
+        if component.json_data is None and ctx.is_transformed:
+            # reuse data already parsed in the context instead of parsing them again
+            update = {
+                "json_data": ctx.wrapped_json_data,
+                "json_wrapping_field_name": ctx.json_wrapping_field_name,
+                "input_data_total_count": ctx.input_data_total_count,
+                "input_data_limits_applied": ctx.input_data_limits_applied or None,
+            }
+        if (
+            component.chart_data_format is None
+            and self.config.chart_data_format != "points"
+        ):
+            update["chart_data_format"] = self.config.chart_data_format
+        if component.chart_downsampling is None and self.config.chart_downsampling:
+            update["chart_downsampling"] = self.config.chart_downsampling
+        if component.chart_aggregation is None and self.config.chart_aggregation:
+            update["chart_aggregation"] = self.config.chart_aggregation
+        if update:
+            return component.model_copy(update=update)
+        return component
+
+    @overload
     def generate_rendering(
         self, component: ComponentDataBase, component_system: Optional[str] = None
-    ) -> UIBlockRendering:
+    ) -> UIBlockRendering: ...
+
+    @overload
+    def generate_rendering(
+        self, component: ComponentDataBase, component_system: list[str]
+    ) -> list[UIBlockRendering]: ...
+
+    def generate_rendering(
+        self,
+        component: ComponentDataBase,
+        component_system: Optional[str | list[str]] = None,
+    ) -> UIBlockRendering | list[UIBlockRendering]:
         """STEP 4: Render the component with the chosen component system,
-        either via AgentConfig or parameter provided to this method."""
+        either via AgentConfig or parameter provided to this method.
+        Rendering is reused from the rendering cache if enabled (see `AgentConfig.rendering_cache`).
+
+        If list of component systems is provided, list of renderings in the same order is returned,
+        all of them created from the same component data in one pass (see `UIBlock.renderings`).
+        """
+        if isinstance(component_system, list):
+            return render_component_systems(
+                component,
+                [
+                    self._get_component_system_factory(cs)
+                    for cs in self._get_component_systems(component_system)
+                ],
+                self.rendering_cache,
+            )
+        return render_component(
+            component,
+            self._get_component_system_factory(
+                self._get_component_system(component_system)
+            ),
+            self.rendering_cache,
+        )
+
+    @overload
+    async def agenerate_rendering(
+        self,
+        component: ComponentDataBase,
+        component_system: Optional[str] = None,
+        data_size: Optional[int] = None,
+    ) -> UIBlockRendering: ...
+
+    @overload
+    async def agenerate_rendering(
+        self,
+        component: ComponentDataBase,
+        component_system: list[str],
+        data_size: Optional[int] = None,
+    ) -> list[UIBlockRendering]: ...
+
+    async def agenerate_rendering(
+        self,
+        component: ComponentDataBase,
+        component_system: Optional[str | list[str]] = None,
+        data_size: Optional[int] = None,
+    ) -> UIBlockRendering | list[UIBlockRendering]:
+        """
+        STEP 4: Async variant of `generate_rendering()`, running the rendering on the configured processing executor
+        (see `AgentConfig.processing_executor`), so large components do not block the event loop.
+
+        * `data_size` - size of the input data the component was created from (number of characters), used to decide
+          whether the rendering is run inline. Rendering is always run on the executor if not provided.
+
+        Rendering is reused from the rendering cache if enabled (see `AgentConfig.rendering_cache`),
+        the cache is looked up before the rendering is passed to the executor.
+        If list of component systems is provided, they are rendered in one executor task,
+        or concurrently in more worker processes for the `process` executor.
+        """
+        if isinstance(component_system, list):
+            return await self._agenerate_renderings(
+                component, self._get_component_systems(component_system), data_size
+            )
+        renderings = await self._agenerate_renderings(
+            component, [self._get_component_system(component_system)], data_size
+        )
+        return renderings[0]
+
+    async def _agenerate_renderings(
+        self,
+        component: ComponentDataBase,
+        component_systems: list[str],
+        data_size: Optional[int],
+    ) -> list[UIBlockRendering]:
+        renderings: list[Optional[UIBlockRendering]] = [None] * len(component_systems)
+        keys: list[Optional[RenderingCacheKey]] = [None] * len(component_systems)
+        if self.rendering_cache:
+            digest = self.rendering_cache.get_digest(component)
+            for i, component_system in enumerate(component_systems):
+                if digest:
+                    keys[i] = self.rendering_cache.get_key(
+                        component,
+                        self._get_component_system_factory(component_system),
+                        digest,
+                    )
+                renderings[i] = self.rendering_cache.get(keys[i])
+
+        missing = [i for i, rendering in enumerate(renderings) if rendering is None]
+        if not missing:
+            return cast(list[UIBlockRendering], renderings)
+        executor = self.processing_executor
+        if (
+            len(missing) > 1
+            and executor.config.type == "process"
+            and not executor.is_inline(data_size)
+        ):
+            # imported on the first use, not to slow down the UI Agent startup when used synchronously
+            import asyncio
+
+            # worker processes render in parallel, threads would be serialized by the GIL anyway
+            results = await asyncio.gather(
+                *[
+                    executor.run(
+                        data_size,
+                        _render_component,
+                        component,
+                        component_systems[i],
+                        self.config.json_renderer,
+                    )
+                    for i in missing
+                ]
+            )
+        else:
+            results = await executor.run(
+                data_size,
+                _render_component_systems,
+                component,
+                [component_systems[i] for i in missing],
+                self.config.json_renderer,
+            )
+        for i, rendering in zip(missing, results):
+            renderings[i] = rendering
+            if self.rendering_cache:
+                self.rendering_cache.put(keys[i], rendering)
+        return cast(list[UIBlockRendering], renderings)
+
+    def generate_rendering_stream(
+        self,
+        component: ComponentDataBase,
+        component_system: Optional[str] = None,
+        chunk_size: int = DEFAULT_RENDERING_CHUNK_SIZE,
+    ) -> tuple[UIBlockRendering, Iterator[str]]:
+        """
+        STEP 4: Streaming variant of `generate_rendering()`, so large components can be sent to the client
+        as they are rendered, without building whole content in memory.
+
+        Returns `UIBlockRendering` with empty `content` and iterator of the content chunks
+        of at least `chunk_size` characters (except the last one).
+        Rendering errors are raised when the chunks are iterated.
+        """
+        return render_component_stream(
+            component,
+            self._get_component_system_factory(
+                self._get_component_system(component_system)
+            ),
+            chunk_size,
+        )
+
+    async def agenerate_rendering_stream(
+        self,
+        component: ComponentDataBase,
+        component_system: Optional[str] = None,
+        data_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_RENDERING_CHUNK_SIZE,
+    ) -> tuple[UIBlockRendering, AsyncIterator[str]]:
+        """
+        STEP 4: Async variant of `generate_rendering_stream()`, the chunks are rendered on the configured processing executor
+        (see `AgentConfig.processing_executor`), so large components do not block the event loop.
+
+        * `data_size` - size of the input data the component was created from (number of characters), used to decide
+          whether the rendering is run inline. Rendering is always run on the executor if not provided.
+        """
+        rendering, chunks = self.generate_rendering_stream(
+            component, component_system, chunk_size
+        )
+        return rendering, self.processing_executor.iterate(data_size, chunks)
+
+    def _get_component_system_factory(self, component_system: str) -> StrategyFactory:
+        return get_component_system_factory(component_system, self.config.json_renderer)
+
+    def _get_component_systems(self, component_systems: list[str]) -> list[str]:
+        if not component_systems:
+            raise ValueError("At least one component system has to be provided")
+        return [self._get_component_system(cs) for cs in component_systems]
+
+    def _get_component_system(self, component_system: Optional[str]) -> str:
         component_system = (
             component_system if component_system else self.config.component_system
         )
         if not component_system:
             raise Exception("Component system not defined")
-
-        return render_component(
-            component, get_component_system_factory(component_system)
-        )
+        return component_system
 
     def construct_UIBlockConfiguration(
-        self, input_data: InputData, component_metadata: UIComponentMetadata
+        self,
+        input_data: InputData | InputDataContext,
+        component_metadata: UIComponentMetadata,
     ) -> UIBlockConfiguration:
         """
         Construct `UIBlockConfiguration` for component_metadata and input_data,
@@ -187,9 +577,13 @@ class NextGenUIAgent:
 
         It should be returned from AI framework/protocol binding so *Controlling Assistant* can send it back later when it needs to refresh component for the new data.
         """
+        input_data = InputDataContext.of(input_data).input_data
 
+        # dump only fields stored in the block configuration, `json_data` and `llm_interactions` can be large
+        # and dumping them creates their deep copy which is thrown away immediately.
+        # Fields are dumped (copied), as they are modified below and must not be changed in `component_metadata`.
         block_component_metadata = UIBlockComponentMetadata(
-            **component_metadata.model_dump(),
+            **component_metadata.model_dump(include=_COMPONENT_METADATA_BASE_FIELDS),
         )
 
         # put sanitized data paths to the UIBlockConfiguration
@@ -218,6 +612,7 @@ class NextGenUIAgent:
             data_type_metadata=input_data.get("type_metadata"),
             input_data_transformer_name=component_metadata.input_data_transformer_name,
             json_wrapping_field_name=component_metadata.json_wrapping_field_name,
+            input_data_limits_applied=component_metadata.input_data_limits_applied,
         )
 
     def component_info(self, uiblock_config: UIBlockConfiguration | None) -> str:
@@ -232,3 +627,26 @@ class NextGenUIAgent:
                 f"component_type: {uiblock_config.component_metadata.component}"
             )
         return ", ".join(c_info)
+
+
+def _render_component(
+    component: ComponentDataBase,
+    component_system: str,
+    json_renderer: Optional[AgentConfigJsonRenderer] = None,
+) -> UIBlockRendering:
+    """Render the component with the component system. Module level function, so it can be run in the process pool."""
+    return render_component(
+        component, get_component_system_factory(component_system, json_renderer)
+    )
+
+
+def _render_component_systems(
+    component: ComponentDataBase,
+    component_systems: list[str],
+    json_renderer: Optional[AgentConfigJsonRenderer] = None,
+) -> list[UIBlockRendering]:
+    """Render the component with all the component systems. Module level function, so it can be run in the process pool."""
+    return render_component_systems(
+        component,
+        [get_component_system_factory(cs, json_renderer) for cs in component_systems],
+    )
@@ -1,13 +1,14 @@
 import argparse
 import logging
+from typing import Iterable, Optional
 
-import yaml  # type: ignore[import-untyped]
 from next_gen_ui_agent.argparse_env_default_action import EnvDefault, EnvDefaultExtend
 from next_gen_ui_agent.design_system_handler import get_component_system_names
 from next_gen_ui_agent.types import AgentConfig
+from next_gen_ui_agent.yaml_tools import yaml_safe_load_all
 
 
-def merge_configs(config_yamls: list[dict]) -> dict:
+def merge_configs(config_yamls: Iterable[dict]) -> dict:
     """
     Merges multiple configs into one. Last config has the highest precedense on 1st and 2nd object level.
     e.g. `data_types` child nodes are merged.
@@ -22,11 +23,12 @@ def merge_configs(config_yamls: list[dict]) -> dict:
     return config_yaml
 
 
-def parse_config_yaml_to_dict(stream) -> dict:
+def parse_config_yaml_to_dict(stream, max_documents: Optional[int] = None) -> dict:
     """Parse Config Yaml.
-    Any compatible input for yaml.safe_load_all can be passed e.g. file stream or string of 1 or multiple YAMLs
+    Any compatible input for yaml.safe_load_all can be passed e.g. file stream or string of 1 or multiple YAMLs.
+    If `max_documents` is set, `ValueError` is raised when the stream contains more YAML documents, before they are parsed.
     """
-    config_yamls = yaml.safe_load_all(stream)
+    config_yamls = yaml_safe_load_all(stream, max_documents)
     config = merge_configs(config_yamls)
     return config
 
@@ -7,6 +7,7 @@ import pytest
 from next_gen_ui_agent.agent_config import (
     add_agent_config_comandline_args,
     parse_config_yaml,
+    parse_config_yaml_to_dict,
     read_agent_config_dict_from_arguments,
     read_config_yaml_file,
 )
@@ -33,6 +34,16 @@ component_system: json2
     assert config.input_data_json_wrapping is True
 
 
+def test_config_yamls_str_max_documents() -> None:
+    config_yamls = "component_system: json\n---\ncomponent_system: json2\n"
+    assert parse_config_yaml_to_dict(config_yamls, max_documents=2) == {
+        "component_system": "json2",
+        "data_types": {},
+    }
+    with pytest.raises(ValueError, match="YAML contains more than 1 documents"):
+        parse_config_yaml_to_dict(config_yamls, max_documents=1)
+
+
 def test_parse_config_yaml_str_INVALID() -> None:
     with pytest.raises(ValidationError):
         parse_config_yaml("input_data_json_wrapping: ooo")
@@ -1,4 +1,5 @@
-from typing import cast
+from typing import Any, cast
+from unittest.mock import Mock, patch
 
 import pytest
 from next_gen_ui_agent.agent import NextGenUIAgent
@@ -10,16 +11,31 @@ from next_gen_ui_agent.component_selection_llm_twostep import (
 )
 from next_gen_ui_agent.data_transform.data_transformer_utils import (
     generate_field_id,
+    parse_data_path,
     sanitize_data_path,
 )
 from next_gen_ui_agent.data_transform.types import (
+    ComponentDataBarChart,
     ComponentDataBase,
+    ComponentDataLineChart,
     ComponentDataOneCard,
+    ComponentDataPieChart,
+    ComponentDataTable,
 )
+from next_gen_ui_agent.input_data_context import InputDataContext
+from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
 from next_gen_ui_agent.types import (
     AgentConfig,
+    AgentConfigChartAggregation,
+    AgentConfigChartDownsampling,
     AgentConfigComponent,
     AgentConfigDataType,
+    AgentConfigDynamicComponentConfiguration,
+    AgentConfigInputDataLimits,
+    AgentConfigJsonRenderer,
+    AgentConfigProcessingExecutor,
+    AgentConfigRenderingCache,
     DataField,
     InputData,
     UIBlockComponentMetadata,
@@ -29,7 +45,9 @@ from next_gen_ui_agent.types import (
 )
 from next_gen_ui_testing.data_after_transformation import get_transformed_component
 from next_gen_ui_testing.model import MockedExceptionInference, MockedInference
+from pydantic import BaseModel, model_serializer
 from pydantic_core import ValidationError, from_json
+from stevedore.extension import Extension, ExtensionManager
 
 
 class TestAgentConfiguration:
@@ -59,6 +77,22 @@ class TestAgentConfiguration:
         ):
             NextGenUIAgent(config=AgentConfig(component_system="unknown"))
 
+    def test_config_component_system_plugin_broken(self) -> None:
+        def broken_factory() -> StrategyFactory:
+            raise RuntimeError("broken")
+
+        extension = Extension(
+            name="broken", entry_point=None, plugin=broken_factory, obj=None
+        )
+        manager = ExtensionManager.make_test_instance([extension])
+        with patch(
+            "next_gen_ui_agent.design_system_handler.EXTENSION_MANAGER", manager
+        ):
+            with pytest.raises(
+                ValueError, match="Plugin 'broken' could not be instantiated: broken"
+            ):
+                NextGenUIAgent(config=AgentConfig(component_system="broken"))
+
 
 class TestSelectComponent:
     @pytest.mark.asyncio
@@ -170,6 +204,110 @@ class TestSelectComponent:
             )
 
 
+class TestWarmUp:
+    """Tests for the agent warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                data_types={
+                    "my.type": AgentConfigDataType(
+                        components=[
+                            AgentConfigComponent(
+                                component="table",
+                                configuration=AgentConfigDynamicComponentConfiguration(
+                                    title="Movies",
+                                    fields=[
+                                        DataField(
+                                            id="title",
+                                            name="Title",
+                                            data_path="movies[*].warmUpTitle",
+                                        )
+                                    ],
+                                ),
+                            )
+                        ]
+                    ),
+                }
+            )
+        )
+        duration = await agent.warm_up()
+
+        assert duration >= 0
+        assert agent.warm_up_duration == duration
+        # configured data path is pre-compiled, so the data transformation hits the cache
+        hits = parse_data_path.cache_info().hits
+        parse_data_path("$..movies[*].warmUpTitle")
+        assert parse_data_path.cache_info().hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_warm_up_invalid_data_path(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                data_types={
+                    "my.type": AgentConfigDataType(
+                        components=[
+                            AgentConfigComponent(
+                                component="table",
+                                configuration=AgentConfigDynamicComponentConfiguration(
+                                    title="Movies",
+                                    fields=[
+                                        DataField(id="bad", name="Bad", data_path="a[*")
+                                    ],
+                                ),
+                            )
+                        ]
+                    ),
+                }
+            )
+        )
+        # invalid data path is only logged, it is reported during the data transformation
+        assert await agent.warm_up() >= 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_component_system(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig(component_system="json"))
+        with patch.object(
+            JsonStrategyFactory, "warm_up", autospec=True
+        ) as factory_warm_up:
+            await agent.warm_up()
+        factory_warm_up.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_probe_inference(self) -> None:
+        inference = MockedInference(
+            UIComponentMetadata(component="one-card", id="1", title="OK", fields=[])
+        )
+        with patch.object(
+            inference, "call_model", wraps=inference.call_model
+        ) as call_model:
+            agent = NextGenUIAgent(config=AgentConfig(), inference=inference)
+            await agent.warm_up(probe_inference=True)
+            call_model.assert_called_once()
+
+            await NextGenUIAgent(config=AgentConfig()).warm_up(
+                inference, probe_inference=True
+            )
+            assert call_model.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_probe_inference_without_inference(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig())
+        with pytest.raises(ValueError, match="Inference is not defined"):
+            await agent.warm_up(probe_inference=True)
+        assert agent.warm_up_duration is None
+
+    @pytest.mark.asyncio
+    async def test_warm_up_probe_inference_error(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(),
+            inference=MockedExceptionInference(Exception("LLM down")),
+        )
+        with pytest.raises(Exception, match="LLM down"):
+            await agent.warm_up(probe_inference=True)
+
+
 class TestCreateComponentSelectionStrategy:
     """Test suite for _create_component_selection_strategy method."""
 
@@ -314,6 +452,61 @@ class TestSelectComponent_InputDataTransformation:
         assert component.json_data is not None
         assert component.json_data == [{"name": "MYNAME"}]
 
+    @pytest.mark.asyncio
+    async def test_select_component_DATA_TRANSFORMATION_MAX_ROWS_PER_TYPE(
+        self,
+    ) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                input_data_max_rows=10,
+                data_types={
+                    "my.type": AgentConfigDataType(
+                        data_transformer="csv-comma",
+                        input_data_max_rows=2,
+                        components=[AgentConfigComponent(component="one-card-special")],
+                    )
+                },
+            )
+        )
+        input_data = InputData(
+            id="1", data="name,age\nA,1\nB,2\nC,3\nD,4\n", type="my.type"
+        )
+
+        component = await agent.select_component(
+            user_prompt="Test prompt", input_data=input_data
+        )
+        assert component.json_data == [
+            {"name": "A", "age": 1},
+            {"name": "B", "age": 2},
+        ]
+        assert component.input_data_total_count == 4
+
+    @pytest.mark.asyncio
+    async def test_select_component_DATA_TRANSFORMATION_MAX_ROWS_NOT_EXCEEDED(
+        self,
+    ) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                input_data_max_rows=4,
+                data_types={
+                    "my.type": AgentConfigDataType(
+                        data_transformer="csv-comma",
+                        components=[AgentConfigComponent(component="one-card-special")],
+                    )
+                },
+            )
+        )
+        input_data = InputData(
+            id="1", data="name,age\nA,1\nB,2\nC,3\nD,4\n", type="my.type"
+        )
+
+        component = await agent.select_component(
+            user_prompt="Test prompt", input_data=input_data
+        )
+        assert component.json_data is not None
+        assert len(component.json_data) == 4
+        assert component.input_data_total_count is None
+
 
 class TestSelectComponent_InputDataAutoDetection:
     """Test suite for input data auto-detection in select_component step."""
@@ -528,6 +721,180 @@ class TestSelectComponent_InputDataJsonWrapping:
         assert component.json_data == {"my_type": [{"title": "Toy Story"}]}
 
 
+class TestInputDataContext:
+    """Test suite for passing `InputDataContext` through the processing steps, so input data are parsed only once."""
+
+    @pytest.mark.asyncio
+    async def test_select_component_stores_parsed_data_in_context(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig(input_data_json_wrapping=True))
+        ctx = InputDataContext(
+            InputData(id="1", data='[{"title": "Toy Story"}]', type="my_type")
+        )
+
+        mocked_llm_component = UIComponentMetadata(
+            component="one-card",
+            id="1",
+            title="Toy Story",
+            fields=[DataField(id="title", name="Title", data_path="my_type.title")],
+        )
+
+        component = await agent.select_component(
+            user_prompt="Test prompt",
+            input_data=ctx,
+            inference=MockedInference(mocked_llm_component),
+        )
+        assert ctx.is_transformed is True
+        assert ctx.input_data_transformer_name == "json"
+        assert ctx.json_data == [{"title": "Toy Story"}]
+        assert ctx.json_wrapping_field_name == "my_type"
+        assert ctx.wrapped_json_data == {"my_type": [{"title": "Toy Story"}]}
+        # component shares the parsed tree from the context, no copy is created
+        assert component.json_data is not None
+        assert component.json_data["my_type"] is ctx.json_data
+
+    @pytest.mark.asyncio
+    async def test_select_component_does_not_parse_again(self, monkeypatch) -> None:
+        agent = NextGenUIAgent()
+        ctx = InputDataContext(InputData(id="1", data='{"title": "Toy Story"}'))
+        ctx.set_transformed({"title": "Already parsed"}, "json")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("input data parsed again")
+
+        monkeypatch.setattr(
+            "next_gen_ui_agent.agent.perform_input_data_transformation_with_limits",
+            fail,
+        )
+        mocked_llm_component = UIComponentMetadata(
+            component="one-card",
+            id="1",
+            title="Toy Story",
+            fields=[DataField(id="title", name="Title", data_path="title")],
+        )
+        component = await agent.select_component(
+            user_prompt="Test prompt",
+            input_data=ctx,
+            inference=MockedInference(mocked_llm_component),
+        )
+        assert component.json_data == {"title": "Already parsed"}
+
+    @pytest.mark.asyncio
+    async def test_select_component_empty_list_not_parsed_again(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig(input_data_json_wrapping=False))
+        ctx = InputDataContext(InputData(id="1", data="- []", type="my_type"))
+        ctx.set_transformed([], "yaml")
+
+        mocked_llm_component = UIComponentMetadata(
+            component="table",
+            id="1",
+            title="Empty",
+            fields=[DataField(id="title", name="Title", data_path="[*].title")],
+        )
+        # data are not valid JSON, so any attempt to parse them again as JSON fails
+        component = await agent.select_component(
+            user_prompt="Test prompt",
+            input_data=ctx,
+            inference=MockedInference(mocked_llm_component),
+        )
+        assert component.json_data == []
+
+    def test_transform_data_uses_context_data(self) -> None:
+        agent = NextGenUIAgent()
+        # YAML data can't be parsed by the default JSON fallback of the data transformation
+        ctx = InputDataContext(InputData(id="123", data="name: John Doe"))
+        ctx.set_transformed({"name": "John Doe"}, "yaml")
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": "123",
+                "title": "John Doe",
+                "component": "one-card",
+                "fields": [
+                    {"name": "Name", "data_path": "name"},
+                ],
+            }
+        )
+        component_data = cast(
+            ComponentDataOneCard, agent.transform_data(ctx, component)
+        )
+        assert component_data.fields[0].data == ["John Doe"]
+        # component passed in is not altered
+        assert component.json_data is None
+
+    @pytest.mark.asyncio
+    async def test_select_component_data_file_mapped_once(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        path = tmp_path / "data.json"
+        path.write_text('[{"title": "Toy Story"}]')
+        input_data = InputData(id="1", data="", data_file=str(path))
+        mocked_llm_component = UIComponentMetadata(
+            component="one-card",
+            id="1",
+            title="Toy Story",
+            fields=[DataField(id="title", name="Title", data_path="[*].title")],
+        )
+
+        closed: list[InputDataContext] = []
+        close = InputDataContext.close
+
+        def track_close(ctx: InputDataContext) -> None:
+            closed.append(ctx)
+            close(ctx)
+
+        monkeypatch.setattr(InputDataContext, "close", track_close)
+
+        agent = NextGenUIAgent()
+        # context created by the step itself is closed by it
+        component = await agent.select_component(
+            user_prompt="Test prompt",
+            input_data=input_data,
+            inference=MockedInference(mocked_llm_component),
+        )
+        assert component.json_data == [{"title": "Toy Story"}]
+        assert len(closed) == 1
+
+        # context passed in is left open to the caller, file is mapped only once
+        with InputDataContext(input_data) as ctx:
+            await agent.select_component(
+                user_prompt="Test prompt",
+                input_data=ctx,
+                inference=MockedInference(mocked_llm_component),
+            )
+            assert len(closed) == 1
+            mapped = ctx.mapped_input_data
+            assert ctx.mapped_input_data is mapped
+        assert closed[1:] == [ctx]
+        assert ctx.json_data == [{"title": "Toy Story"}]
+
+    @pytest.mark.asyncio
+    async def test_refresh_component_with_context(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig())
+        ctx = InputDataContext(
+            InputData(id="1", data='[{"title": "Toy Story"}]', type="my_type")
+        )
+        block_configuration = UIBlockConfiguration(
+            component_metadata=UIBlockComponentMetadata(
+                component="one-card",
+                id="1",
+                title="Toy Story",
+                fields=[
+                    DataField(id="title", name="Title", data_path="$..my_type[*].title")
+                ],
+            ),
+            input_data_transformer_name="json",
+            json_wrapping_field_name="my_type",
+        )
+        result = await agent.refresh_component(ctx, block_configuration)
+        assert result.json_data == {"my_type": [{"title": "Toy Story"}]}
+        assert ctx.json_wrapping_field_name == "my_type"
+
+        component_data = cast(ComponentDataOneCard, agent.transform_data(ctx, result))
+        assert component_data.fields[0].data == ["Toy Story"]
+
+        configuration = agent.construct_UIBlockConfiguration(ctx, result)
+        assert configuration.data_type == "my_type"
+
+
 class TestRefreshComponent:
     """Test suite for refresh_component method."""
 
@@ -615,10 +982,78 @@ class TestRefreshComponent:
         assert result.input_data_transformer_name == "json"
         assert result.json_wrapping_field_name == "my_type"
 
+    @pytest.mark.asyncio
+    async def test_refresh_component_max_rows(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig(input_data_max_rows=1))
+        input_data = InputData(id="1", data="title\nToy Story\nJumanji\n")
+        block_configuration = UIBlockConfiguration(
+            component_metadata=UIBlockComponentMetadata(
+                component="table",
+                id="1",
+                title="Movies",
+                fields=[DataField(id="title", name="Title", data_path="$..title")],
+            ),
+            input_data_transformer_name="csv-comma",
+        )
+        result = await agent.refresh_component(input_data, block_configuration)
+        assert result.json_data == [{"title": "Toy Story"}]
+        assert result.input_data_total_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_component_json_data_not_copied(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig())
+        input_data_context = InputDataContext(
+            InputData(id="1", data='[{"title": "Toy Story"}]', type="my_type")
+        )
+        block_configuration = UIBlockConfiguration(
+            component_metadata=UIBlockComponentMetadata(
+                component="one-card",
+                id="1",
+                title="Toy Story",
+                fields=[DataField(id="title", name="Title", data_path="$..title")],
+                fields_all=[DataField(id="title", name="Title", data_path="$..title")],
+            ),
+            input_data_transformer_name="json",
+            json_wrapping_field_name="my_type",
+        )
+        result = await agent.refresh_component(input_data_context, block_configuration)
+        assert result.json_data is input_data_context.wrapped_json_data
+        assert "fields_all" not in result.model_dump()
+
 
 class TestConstructUIBlockConfiguration:
     """Test suite for construct_UIBlockConfiguration method."""
 
+    def test_construct_UIBlockConfiguration_json_data_not_dumped(self) -> None:
+        class NotDumpable(BaseModel):
+            @model_serializer
+            def serialize(self) -> Any:
+                raise AssertionError("json_data must not be dumped")
+
+        agent = NextGenUIAgent(config=AgentConfig())
+        input_data = InputData(id="1", data='[{"title": "Toy Story"}]')
+        json_data = [{"title": "Toy Story", "poster": NotDumpable()}]
+        component_metadata = UIComponentMetadata(
+            component="one-card",
+            id="1",
+            title="Toy Story",
+            fields=[DataField(id="title", name="Title", data_path="movie.title")],
+            input_data_transformer_name="json",
+            json_data=json_data,
+            llm_interactions=[{"step": "component_selection", "data": json_data}],
+        )
+        configuration = agent.construct_UIBlockConfiguration(
+            input_data, component_metadata
+        )
+        assert configuration.component_metadata is not None
+        assert configuration.component_metadata.fields[
+            0
+        ].data_path == sanitize_data_path("movie.title")
+        # fields of the component metadata are not changed
+        assert component_metadata.fields[0].data_path == "movie.title"
+        assert component_metadata.fields[0].id == "title"
+        assert component_metadata.json_data is json_data
+
     def test_construct_UIBlockConfiguration_all_info(self) -> None:
         agent = NextGenUIAgent(config=AgentConfig())
         input_data = InputData(
@@ -976,6 +1411,353 @@ class TestTransformData:
         assert component_data.fields[0].name == "Name"
         assert component_data.fields[0].data == ["John Doe"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["inline", "thread", "process"])
+    async def test_atransform_data(self, executor_type) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                processing_executor=AgentConfigProcessingExecutor(
+                    type=executor_type, max_workers=1, inline_threshold=0
+                )
+            )
+        )
+        input_data_context = InputDataContext(
+            InputData(id="123", data="""{"name": "John Doe"}""")
+        )
+        component = await agent.select_component(
+            "Show John",
+            input_data_context,
+            MockedInference(
+                UIComponentMetadata.model_validate(
+                    {
+                        "title": "John Doe",
+                        "component": "one-card",
+                        "fields": [{"name": "Name", "data_path": "name"}],
+                    }
+                )
+            ),
+        )
+        try:
+            component_data = cast(
+                ComponentDataOneCard,
+                await agent.atransform_data(input_data_context, component),
+            )
+        finally:
+            agent.processing_executor.shutdown()
+        assert component_data == agent.transform_data(input_data_context, component)
+        assert component_data.title == "John Doe"
+        assert component_data.fields[0].data == ["John Doe"]
+
+    @pytest.mark.asyncio
+    async def test_atransform_data_transform_process_pool(self, monkeypatch) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                data_transformer="yaml",
+                processing_executor=AgentConfigProcessingExecutor(
+                    transform_process_threshold=10, transform_process_max_workers=1
+                ),
+            )
+        )
+        input_data_context = InputDataContext(
+            InputData(id="123", data="- name: John Doe\n- name: Jane Doe\n")
+        )
+        component = await agent.select_component(
+            "Show people",
+            input_data_context,
+            MockedInference(
+                UIComponentMetadata.model_validate(
+                    {
+                        "title": "People",
+                        "component": "table",
+                        "fields": [{"name": "Name", "data_path": "$..name"}],
+                    }
+                )
+            ),
+        )
+        assert component.json_data is not None
+
+        run_in_args = []
+        original_run_in = agent.processing_executor.run_in
+
+        async def run_in(executor, fn, *args):
+            run_in_args.append(args)
+            return await original_run_in(executor, fn, *args)
+
+        monkeypatch.setattr(agent.processing_executor, "run_in", run_in)
+        try:
+            component_data = await agent.atransform_data(input_data_context, component)
+        finally:
+            agent.processing_executor.shutdown()
+
+        # only raw input data are shipped to the worker process, not parsed data
+        input_data, shipped_component, input_data_transformer_name, max_rows, limits = (
+            run_in_args[0]
+        )
+        assert input_data is input_data_context.input_data
+        assert shipped_component.json_data is None
+        assert input_data_transformer_name == "yaml"
+        assert max_rows is None
+        assert limits is None
+        assert component_data == agent.transform_data(input_data_context, component)
+
+    @pytest.mark.asyncio
+    async def test_transform_data_truncated_input_data(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(data_transformer="csv-comma", input_data_max_rows=2)
+        )
+        input_data_context = InputDataContext(InputData(id="1", data="name\nA\nB\nC\n"))
+        component = await agent.select_component(
+            "Show people",
+            input_data_context,
+            MockedInference(
+                UIComponentMetadata.model_validate(
+                    {
+                        "title": "People",
+                        "component": "table",
+                        "fields": [{"name": "Name", "data_path": "$..name"}],
+                    }
+                )
+            ),
+        )
+
+        component_data = agent.transform_data(input_data_context, component)
+
+        assert component_data.input_data_truncated is True
+        assert component_data.input_data_total_count == 3
+        assert cast(ComponentDataTable, component_data).fields[0].data == ["A", "B"]
+
+    def test_transform_data_not_truncated_input_data(self) -> None:
+        agent = NextGenUIAgent()
+        component = UIComponentMetadata(
+            component="table",
+            id="1",
+            title="People",
+            fields=[DataField(id="name", name="Name", data_path="$..name")],
+            json_data=[{"name": "A"}],
+        )
+
+        component_data = agent.transform_data(
+            InputData(id="1", data='[{"name": "A"}]'), component
+        )
+
+        assert component_data.input_data_truncated is None
+        assert component_data.input_data_total_count is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["inline", "process"])
+    async def test_atransform_data_chart_data_format_columns(
+        self, executor_type
+    ) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                chart_data_format="columns",
+                processing_executor=AgentConfigProcessingExecutor(
+                    type=executor_type, max_workers=1, inline_threshold=0
+                ),
+            )
+        )
+        input_data = InputData(
+            id="1", data='[{"name": "A", "value": 1}, {"name": "B", "value": 2}]'
+        )
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": "1",
+                "title": "Values",
+                "component": "chart-bar",
+                "fields": [
+                    {"name": "Name", "data_path": "$..name"},
+                    {"name": "Value", "data_path": "$..value"},
+                ],
+            }
+        )
+        try:
+            component_data = cast(
+                ComponentDataBarChart,
+                await agent.atransform_data(input_data, component),
+            )
+        finally:
+            agent.processing_executor.shutdown()
+        assert component.chart_data_format is None
+        assert component_data.data is None
+        assert component_data.columns is not None
+        assert component_data.columns.x == ["A", "B"]
+        assert component_data.columns.series[0].y == [1, 2]
+        assert component_data == agent.transform_data(input_data, component)
+
+    def test_transform_data_chart_data_format_points(self) -> None:
+        agent = NextGenUIAgent()
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": "1",
+                "title": "Values",
+                "component": "chart-bar",
+                "fields": [
+                    {"name": "Name", "data_path": "$..name"},
+                    {"name": "Value", "data_path": "$..value"},
+                ],
+            }
+        )
+        component_data = cast(
+            ComponentDataBarChart,
+            agent.transform_data(
+                InputData(id="1", data='[{"name": "A", "value": 1}]'), component
+            ),
+        )
+        assert component_data.columns is None
+        assert component_data.data is not None
+        assert component_data.data[0].data[0].x == "A"
+
+    def test_transform_data_chart_downsampling(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                chart_downsampling=AgentConfigChartDownsampling(max_points=3)
+            )
+        )
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": "1",
+                "title": "Values",
+                "component": "chart-line",
+                "fields": [
+                    {"name": "Name", "data_path": "$..name"},
+                    {"name": "Value", "data_path": "$..value"},
+                ],
+            }
+        )
+        component_data = cast(
+            ComponentDataLineChart,
+            agent.transform_data(
+                InputData(
+                    id="1",
+                    data='[{"name": "A", "value": 1}, {"name": "B", "value": 5}, '
+                    '{"name": "C", "value": 2}, {"name": "D", "value": 3}, '
+                    '{"name": "E", "value": 4}]',
+                ),
+                component,
+            ),
+        )
+        assert component_data.data_points_total_count == 5
+        assert component_data.data is not None
+        assert [p.x for p in component_data.data[0].data] == ["A", "B", "E"]
+
+    def test_transform_data_chart_aggregation(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                chart_aggregation=AgentConfigChartAggregation(max_slices=2)
+            )
+        )
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": "1",
+                "title": "Genres",
+                "component": "chart-pie",
+                "fields": [{"name": "Genre", "data_path": "$..genre"}],
+            }
+        )
+        component_data = cast(
+            ComponentDataPieChart,
+            agent.transform_data(
+                InputData(
+                    id="1",
+                    data='[{"genre": "A"}, {"genre": "B"}, {"genre": "B"}, {"genre": "C"}]',
+                ),
+                component,
+            ),
+        )
+        assert component_data.data_points_total_count == 3
+        assert component_data.data is not None
+        assert [(p.x, p.y) for p in component_data.data[0].data] == [
+            ("B", 2),
+            ("Other", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_input_data_limits_applied(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                input_data_limits=AgentConfigInputDataLimits(
+                    max_items=2, max_items_policy="sample"
+                ),
+            )
+        )
+        input_data_context = InputDataContext(
+            InputData(id="1", data='[{"name": "A"}, {"name": "B"}, {"name": "C"}]')
+        )
+        component = await agent.select_component(
+            "Show people",
+            input_data_context,
+            MockedInference(
+                UIComponentMetadata.model_validate(
+                    {
+                        "title": "People",
+                        "component": "table",
+                        "fields": [{"name": "Name", "data_path": "$..name"}],
+                    }
+                )
+            ),
+        )
+
+        component_data = await agent.atransform_data(input_data_context, component)
+        assert component_data.input_data_truncated is True
+        assert component_data.input_data_total_count == 3
+        assert cast(ComponentDataTable, component_data).fields[0].data == ["A", "B"]
+
+        block_configuration = agent.construct_UIBlockConfiguration(
+            input_data_context, component
+        )
+        assert block_configuration.input_data_limits_applied is not None
+        assert [
+            applied.model_dump()
+            for applied in block_configuration.input_data_limits_applied
+        ] == [
+            {
+                "limit": "max_items",
+                "policy": "sample",
+                "value": 2,
+                "input_data_value": 3,
+            }
+        ]
+
+        # limits are applied again when the component is refreshed for new data
+        component = await agent.refresh_component(
+            InputData(id="1", data='[{"name": "X"}, {"name": "Y"}, {"name": "Z"}]'),
+            block_configuration,
+        )
+        assert component.json_data == [{"name": "X"}, {"name": "Y"}]
+        assert component.input_data_limits_applied == (
+            block_configuration.input_data_limits_applied
+        )
+
+    @pytest.mark.asyncio
+    async def test_input_data_limits_reject(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                input_data_limits=AgentConfigInputDataLimits(max_size=10),
+            )
+        )
+        with pytest.raises(ValueError, match="size 15 exceeds the limit 10"):
+            await agent.select_component(
+                "Show people",
+                InputData(id="1", data='[{"name": "A"}]'),
+                MockedInference(get_transformed_component()),
+            )
+
+
+class _YamlStrategyFactory(JsonStrategyFactory):
+    def get_component_system_name(self) -> str:
+        return "yaml"
+
+    def get_output_mime_type(self) -> str:
+        return "application/yaml"
+
+
+def _patch_yaml_component_system():
+    """Register `yaml` component system rendering the same content as `json`, with the different mime type."""
+    manager = Mock()
+    manager.names.return_value = ["yaml"]
+    manager.__getitem__ = Mock(return_value=Mock(obj=_YamlStrategyFactory()))
+    return patch("next_gen_ui_agent.design_system_handler.EXTENSION_MANAGER", manager)
+
 
 class TestGenerateRendering:
     def test_generate_rendering_wrong_component_system_name(self) -> None:
@@ -1011,3 +1793,181 @@ class TestGenerateRendering:
 
         r = from_json(result.content)
         assert r["component"] == "one-card"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data_size", [None, 10, 1000])
+    async def test_agenerate_rendering(self, data_size) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                processing_executor=AgentConfigProcessingExecutor(inline_threshold=100)
+            )
+        )
+        c = get_transformed_component()
+        try:
+            result = await agent.agenerate_rendering(c, "json", data_size=data_size)
+        finally:
+            agent.processing_executor.shutdown()
+        assert result == agent.generate_rendering(c, "json")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["inline", "process"])
+    async def test_generate_rendering_json_compact(self, executor_type) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                json_renderer=AgentConfigJsonRenderer(compact=True),
+                processing_executor=AgentConfigProcessingExecutor(type=executor_type),
+            )
+        )
+        c = get_transformed_component()
+        result = agent.generate_rendering(c, "json")
+        try:
+            assert await agent.agenerate_rendering(c, "json") == result
+        finally:
+            agent.processing_executor.shutdown()
+
+        r = from_json(result.content)
+        assert r["component"] == "one-card"
+        assert "data_path" not in r["fields"][0]
+        assert len(result.content) < len(
+            NextGenUIAgent().generate_rendering(c, "json").content
+        )
+
+    def test_generate_rendering_cache(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(rendering_cache=AgentConfigRenderingCache())
+        )
+        assert agent.rendering_cache
+        c = get_transformed_component()
+        result = agent.generate_rendering(c, "json")
+        assert agent.generate_rendering(c.model_copy(), "json") == result
+        assert agent.rendering_cache.hits == 1
+
+        # changed component data are rendered again
+        changed = c.model_copy(update={"title": "Changed"})
+        assert agent.generate_rendering(changed, "json") != result
+        assert agent.rendering_cache.get_stats()["entries"] == 2
+
+    def test_generate_rendering_cache_disabled(self) -> None:
+        assert NextGenUIAgent().rendering_cache is None
+
+    @pytest.mark.asyncio
+    async def test_agenerate_rendering_cache(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(rendering_cache=AgentConfigRenderingCache())
+        )
+        assert agent.rendering_cache
+        c = get_transformed_component()
+        try:
+            result = await agent.agenerate_rendering(c, "json")
+            with patch.object(agent.processing_executor, "run") as run:
+                assert await agent.agenerate_rendering(c, "json") == result
+            run.assert_not_called()
+        finally:
+            agent.processing_executor.shutdown()
+        assert agent.rendering_cache.hits == 1
+        assert agent.rendering_cache.misses == 1
+
+    def test_generate_rendering_component_systems(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(rendering_cache=AgentConfigRenderingCache())
+        )
+        assert agent.rendering_cache
+        c = get_transformed_component()
+        with _patch_yaml_component_system():
+            renderings = agent.generate_rendering(c, ["yaml", "json"])
+
+        assert [r.component_system for r in renderings] == ["yaml", "json"]
+        assert renderings[0].mime_type == "application/yaml"
+        assert renderings[1] == agent.generate_rendering(c, "json")
+        assert renderings[0].content == renderings[1].content
+        assert agent.rendering_cache.get_stats()["entries"] == 2
+
+    def test_generate_rendering_component_systems_empty(self) -> None:
+        agent = NextGenUIAgent()
+        with pytest.raises(
+            ValueError, match="At least one component system has to be provided"
+        ):
+            agent.generate_rendering(get_transformed_component(), [])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["thread", "inline"])
+    async def test_agenerate_rendering_component_systems(self, executor_type) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                processing_executor=AgentConfigProcessingExecutor(type=executor_type),
+                rendering_cache=AgentConfigRenderingCache(),
+            )
+        )
+        assert agent.rendering_cache
+        c = get_transformed_component()
+        # cached json rendering is not rendered again
+        expected = agent.generate_rendering(c, "json")
+        try:
+            with _patch_yaml_component_system():
+                renderings = await agent.agenerate_rendering(c, ["json", "yaml"])
+        finally:
+            agent.processing_executor.shutdown()
+
+        assert renderings[0] == expected
+        assert renderings[1].component_system == "yaml"
+        assert renderings[1].content == expected.content
+        assert agent.rendering_cache.hits == 1
+        assert agent.rendering_cache.get_stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_agenerate_rendering_component_systems_process(self) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                processing_executor=AgentConfigProcessingExecutor(
+                    type="process", max_workers=2
+                )
+            )
+        )
+        c = get_transformed_component()
+        try:
+            renderings = await agent.agenerate_rendering(c, ["json", "json"])
+        finally:
+            agent.processing_executor.shutdown()
+
+        expected = agent.generate_rendering(c, "json")
+        assert renderings == [expected, expected]
+
+    def test_generate_rendering_stream(self) -> None:
+        agent = NextGenUIAgent(config=AgentConfig(component_system="json"))
+        c = get_transformed_component()
+        rendering, chunks = agent.generate_rendering_stream(c)
+
+        expected = agent.generate_rendering(c)
+        assert rendering == expected.model_copy(update={"content": ""})
+        assert "".join(chunks) == expected.content
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data_size", [None, 10, 1000])
+    async def test_agenerate_rendering_stream(self, data_size) -> None:
+        agent = NextGenUIAgent(
+            config=AgentConfig(
+                processing_executor=AgentConfigProcessingExecutor(inline_threshold=100)
+            )
+        )
+        c = get_transformed_component()
+        try:
+            rendering, chunks = await agent.agenerate_rendering_stream(
+                c, "json", data_size=data_size
+            )
+            content = "".join([chunk async for chunk in chunks])
+        finally:
+            agent.processing_executor.shutdown()
+        expected = agent.generate_rendering(c, "json")
+        assert rendering == expected.model_copy(update={"content": ""})
+        assert content == expected.content
+
+    @pytest.mark.asyncio
+    async def test_agenerate_rendering_wrong_component_system_name(self) -> None:
+        agent = NextGenUIAgent()
+        with pytest.raises(
+            Exception,
+            match="UI component system 'bad' is not found. Make sure you install appropriate dependency.",
+        ):
+            await agent.agenerate_rendering(
+                ComponentDataBase(id="1", component="one-card"), "bad", data_size=1
+            )
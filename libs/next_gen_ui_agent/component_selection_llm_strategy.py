@@ -1,4 +1,3 @@
-import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Optional, TypedDict
@@ -14,11 +13,13 @@ from next_gen_ui_agent.component_selection_common import (
 )
 from next_gen_ui_agent.inference.inference_base import InferenceBase
 from next_gen_ui_agent.json_data_wrapper import wrap_json_data, wrap_string_as_json
+from next_gen_ui_agent.json_tools import json_loads
 from next_gen_ui_agent.types import (
     AgentConfig,
     AgentConfigPromptComponent,
     InputDataInternal,
     UIComponentMetadata,
+    get_input_data_content,
 )
 
 
@@ -145,8 +146,9 @@ class ComponentSelectionStrategy(ABC):
             "input_data_transformer_name"
         )
 
-        if not json_data:
-            json_data = json.loads(input_data["data"])
+        # parse input data only if it wasn't parsed by the input data transformation yet - falsy values like empty list are valid parsed data
+        if json_data is None:
+            json_data = json_loads(get_input_data_content(input_data))
 
         json_wrapping_field_name: str | None = None
         if isinstance(json_data, str):
@@ -1,8 +1,196 @@
+import codecs
+import mmap
+import os
 import re
-from typing import Optional
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Optional
 
 """ Tools to work with Input Data structure, used in input data transformations and json wrapping """
 
+_NON_WHITESPACE_PATTERN = re.compile(r"\S")
+_NON_WHITESPACE_BYTES_PATTERN = re.compile(rb"\S")
+
+InputDataContent = str | bytes | mmap.mmap
+"""
+Raw content of the input data - `str`, UTF-8 encoded `bytes`,
+or read-only memory map of the input data file (supports the same slicing and searching as `bytes`).
+"""
+
+
+def map_input_data_file(path: str) -> bytes | mmap.mmap:
+    """
+    Memory-map the input data file read-only, so it can be parsed directly from the OS page cache,
+    without reading and decoding whole file into memory. Empty `bytes` are returned for empty file, which can't be mapped.
+
+    Raises:
+        OSError: If the file can't be opened.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def decode_input_data_content(content: InputDataContent) -> str:
+    """
+    Decode the input data content into `str`. UTF-8 encoded content is decoded directly from the buffer, without intermediate copy.
+
+    Raises:
+        UnicodeDecodeError: If the content is not valid UTF-8.
+    """
+    if isinstance(content, str):
+        return content
+    return str(content, "utf-8")
+
+
+class InputDataSample:
+    """
+    Bounded sample of the input data string used by the input data structure detection.
+
+    Only the beginning of the data is inspected and copied, so the detection cost does not depend on the data size.
+    One instance is shared by all the detectors, so the sample is taken only once.
+    """
+
+    SAMPLE_SIZE = 1024
+    """Default size of the sample (number of characters)."""
+
+    raw_prefix: str
+    """First `sample_size` characters of the data."""
+
+    prefix: str
+    """First `sample_size` characters of the data with leading whitespaces skipped (same as sample taken from the stripped data, but without copying whole data)."""
+
+    binary_prefix: Optional[bytes]
+    """First `sample_size` bytes of the data if they are not passed as `str`, `None` otherwise."""
+
+    def __init__(self, data: InputDataContent, sample_size: int = SAMPLE_SIZE):
+        if not isinstance(data, str):
+            self._init_binary(data, sample_size)
+            return
+        self.binary_prefix = None
+        self.raw_prefix = data[:sample_size]
+        start_match = _NON_WHITESPACE_PATTERN.search(data)
+        if not start_match:
+            self.prefix = ""
+            return
+        end = start_match.start() + sample_size
+        prefix = data[start_match.start() : end]
+        # trailing whitespaces are stripped only if they are at the end of the data
+        if end >= len(data) or not _NON_WHITESPACE_PATTERN.search(data, end):
+            prefix = prefix.rstrip()
+        self.prefix = prefix
+
+    def _init_binary(self, data: bytes | mmap.mmap, sample_size: int) -> None:
+        """
+        Take the sample from UTF-8 encoded data, only the sampled bytes are copied and decoded.
+        Text prefixes are empty if the data are not UTF-8 text (eg. binary columnar data).
+        """
+        self.binary_prefix = data[:sample_size]
+        # one character takes at most 4 bytes in UTF-8
+        max_bytes = sample_size * 4
+        try:
+            self.raw_prefix = _decode_prefix(data[:max_bytes])[:sample_size]
+            start_match = _NON_WHITESPACE_BYTES_PATTERN.search(data)
+            if not start_match:
+                self.prefix = ""
+                return
+            start = start_match.start()
+            prefix = _decode_prefix(data[start : start + max_bytes])[:sample_size]
+        except UnicodeDecodeError:
+            self.raw_prefix = ""
+            self.prefix = ""
+            return
+        # trailing whitespaces are stripped only if they are at the end of the data
+        end = start + len(prefix.encode())
+        if end >= len(data) or not _NON_WHITESPACE_BYTES_PATTERN.search(data, end):
+            prefix = prefix.rstrip()
+        self.prefix = prefix
+
+    @property
+    def is_empty(self) -> bool:
+        """`True` if the data are empty or contain only whitespaces."""
+        return not self.prefix
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Non-empty lines of the `prefix`."""
+        return [line for line in self.prefix.splitlines() if line.strip()]
+
+    @cached_property
+    def raw_lines(self) -> list[str]:
+        """Non-empty lines of the `raw_prefix`."""
+        return [line for line in self.raw_prefix.splitlines() if line.strip()]
+
+
+def _decode_prefix(data: bytes) -> str:
+    """Decode the beginning of the UTF-8 encoded data, character possibly cut at the end is ignored."""
+    return codecs.getincrementaldecoder("utf-8")().decode(data)
+
+
+def get_text_prefix(data: InputDataContent, max_size: int) -> str:
+    """
+    Get the first `max_size` characters (bytes for binary data) of the data as `str`, only the prefix is copied and decoded.
+    Character possibly cut at the end of the binary data is ignored.
+
+    Raises:
+        UnicodeDecodeError: If the data are not valid UTF-8.
+    """
+    if isinstance(data, str):
+        return data[:max_size]
+    return _decode_prefix(data[:max_size])
+
+
+def get_lines_prefix(data: InputDataContent, max_size: int) -> InputDataContent:
+    """
+    Get beginning of the data with complete lines only, at most `max_size` characters (bytes for binary data) long.
+    Only the prefix is copied, the data are returned as they are if they are not longer than `max_size`.
+    """
+    if len(data) <= max_size:
+        return data
+    if isinstance(data, str):
+        return data[: data.rfind("\n", 0, max_size) + 1]
+    return data[: data.rfind(b"\n", 0, max_size) + 1]
+
+
+def iter_lines(data: InputDataContent) -> Iterator[str]:
+    """
+    Lazily iterate over the lines of the data, including line endings.
+    Lines are split on `\\n` the same way as iteration over `io.StringIO(data)` does,
+    but whole data are not copied into the buffer (`io.StringIO` uses up to 4 bytes per character for it).
+    UTF-8 encoded data are decoded line by line.
+
+    Args:
+        data: The data string to iterate over
+    Returns:
+        Iterator over the lines of the data
+    """
+    if not isinstance(data, str):
+        yield from _iter_binary_lines(data)
+        return
+    start = 0
+    length = len(data)
+    while start < length:
+        end = data.find("\n", start)
+        if end == -1:
+            end = length
+        else:
+            end += 1
+        yield data[start:end]
+        start = end
+
+
+def _iter_binary_lines(data: bytes | mmap.mmap) -> Iterator[str]:
+    start = 0
+    length = len(data)
+    while start < length:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = length
+        else:
+            end += 1
+        yield str(data[start:end], "utf-8")
+        start = end
+
 
 def sanitize_field_name(field_name: str | None) -> str | None:
     """
@@ -84,3 +272,73 @@ def transform_value(value: Optional[str]) -> str | bool | int | float | None:
     except ValueError:
         # Not a number, return as string
         return trimmed
+
+
+ValueTransformer = Callable[[Optional[str]], str | bool | int | float | None]
+"""Function transforming field string value to appropriate Python type, see `transform_value`."""
+
+
+def _transform_int_value(value: Optional[str]) -> str | bool | int | float | None:
+    """`transform_value` specialised for columns containing integers."""
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return transform_value(value)
+
+
+def _transform_float_value(value: Optional[str]) -> str | bool | int | float | None:
+    """`transform_value` specialised for columns containing decimal numbers."""
+    if value:
+        try:
+            result = float(value)
+        except ValueError:
+            return transform_value(value)
+        # `transform_value` converts only values ending with digit and containing decimal point or exponent to float
+        if value[-1].isdigit() and ("." in value or "e" in value or "E" in value):
+            return result
+    return transform_value(value)
+
+
+def _transform_text_value(value: Optional[str]) -> str | bool | int | float | None:
+    """`transform_value` specialised for columns containing texts."""
+    # value which is not trimmed, boolean or number is returned as is by `transform_value`
+    if (
+        value
+        and len(value) > 5
+        and not value[-1].isdigit()
+        and not value[-1].isspace()
+        and not value[0].isspace()
+    ):
+        return value
+    return transform_value(value)
+
+
+def get_column_value_transformer(
+    sample_values: Iterable[Optional[str]],
+) -> ValueTransformer:
+    """
+    Get function transforming string values of one column (eg. in CSV), specialised for the type of the column values.
+    The type is inferred from the sample of the column values.
+
+    Returned function gives the same results as `transform_value` for any value, even if the value does not match
+    the inferred column type, it is just faster for values of the inferred type.
+
+    Args:
+        sample_values: Sample of the column string values, eg. from the first rows
+    Returns:
+        Function transforming the column string values
+    """
+    types = set()
+    for value in sample_values:
+        transformed = transform_value(value)
+        if transformed is not None:
+            types.add(type(transformed))
+    if types == {int}:
+        return _transform_int_value
+    if float in types and types <= {int, float}:
+        return _transform_float_value
+    if types == {str}:
+        return _transform_text_value
+    return transform_value
@@ -1,4 +1,21 @@
-from next_gen_ui_agent.data_structure_tools import sanitize_field_name, transform_value
+import mmap
+from io import StringIO
+
+import pytest
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataSample,
+    _transform_float_value,
+    _transform_int_value,
+    _transform_text_value,
+    decode_input_data_content,
+    get_column_value_transformer,
+    get_lines_prefix,
+    get_text_prefix,
+    iter_lines,
+    map_input_data_file,
+    sanitize_field_name,
+    transform_value,
+)
 
 
 class TestTransformValue:
@@ -235,3 +252,211 @@ class TestSanitizeFieldName:
         assert sanitize_field_name("-") == "field_-"
         assert sanitize_field_name("_-") == "_-"
         assert sanitize_field_name("-_") == "field_-_"
+
+
+class TestInputDataSample:
+    """Test the InputDataSample used by the input data structure detection."""
+
+    def test_empty(self) -> None:
+        for data in ["", "   ", " \n\t\r "]:
+            sample = InputDataSample(data)
+            assert sample.is_empty is True
+            assert sample.prefix == ""
+            assert sample.lines == []
+
+    def test_short_data_same_as_stripped(self) -> None:
+        for data in ["a", "  a: b\n", "\n\n{ }  \n", "x\n\n  y  \t"]:
+            sample = InputDataSample(data)
+            assert sample.is_empty is False
+            assert sample.prefix == data.strip()[:1024]
+            assert sample.raw_prefix == data
+
+    def test_long_data_same_as_stripped(self) -> None:
+        for data in [
+            "  \n" + "a, b\n" * 1000,
+            "a" * 1024 + "   ",
+            "a" * 1020 + "    " + "b",
+            "  " + "a" * 1020 + "    " + "b",
+            "  " + "a" * 1020 + "    " + "\n \n",
+        ]:
+            sample = InputDataSample(data)
+            assert sample.prefix == data.strip()[:1024]
+            assert sample.raw_prefix == data[:1024]
+
+    def test_sample_size(self) -> None:
+        sample = InputDataSample("  abcdef  ", sample_size=3)
+        assert sample.prefix == "abc"
+        assert sample.raw_prefix == "  a"
+
+    def test_lines(self) -> None:
+        sample = InputDataSample("\n  name  age\n\n  John  30\n")
+        assert sample.lines == ["name  age", "  John  30"]
+        assert sample.raw_lines == ["  name  age", "  John  30"]
+
+    def test_bytes_same_as_string(self) -> None:
+        for data in [
+            "",
+            "   ",
+            "  a: b\n",
+            "  \n" + "a, b\n" * 1000,
+            "  " + "a" * 1020 + "    " + "b",
+            "  " + "a" * 1020 + "    " + "\n \n",
+            "  " + "ž" * 2000,
+            "ž" * 1023 + "\n\n\n",
+        ]:
+            sample = InputDataSample(data)
+            binary_sample = InputDataSample(data.encode())
+            assert binary_sample.prefix == sample.prefix, repr(data)
+            assert binary_sample.raw_prefix == sample.raw_prefix, repr(data)
+            assert binary_sample.binary_prefix == data.encode()[:1024]
+            assert sample.binary_prefix is None
+
+    def test_binary_data_not_text(self) -> None:
+        sample = InputDataSample(b"PAR1\x15\x04\xff\xfe data")
+        assert sample.is_empty is True
+        assert sample.raw_prefix == ""
+        assert sample.binary_prefix == b"PAR1\x15\x04\xff\xfe data"
+
+
+TRICKY_VALUES = [
+    None,
+    "",
+    "  ",
+    "0",
+    "42",
+    "-7",
+    "+5",
+    " 12 ",
+    "1_000",
+    "3.14",
+    " 2.5",
+    "1.",
+    ".5",
+    "1e5",
+    "1E-3",
+    "1e",
+    "nan",
+    "inf",
+    "-Infinity",
+    "true",
+    " FALSE ",
+    "True ",
+    "hello",
+    "hello world",
+    "  padded text  ",
+    "Movie 2",
+    "v1.2.3",
+    "12abc",
+    "abc\n",
+]
+
+
+class TestGetColumnValueTransformer:
+    """Test value transformers specialised for the column type."""
+
+    def test_infer_int(self) -> None:
+        assert get_column_value_transformer(["1", " 2", "", None]) is (
+            _transform_int_value
+        )
+
+    def test_infer_float(self) -> None:
+        assert get_column_value_transformer(["1", "2.5", ""]) is (
+            _transform_float_value
+        )
+
+    def test_infer_text(self) -> None:
+        assert get_column_value_transformer(["John", " Jane "]) is (
+            _transform_text_value
+        )
+
+    def test_infer_mixed_or_unknown(self) -> None:
+        assert get_column_value_transformer(["John", "1"]) is transform_value
+        assert get_column_value_transformer(["true", "false"]) is transform_value
+        assert get_column_value_transformer([None, ""]) is transform_value
+        assert get_column_value_transformer([]) is transform_value
+
+    def test_same_results_as_transform_value(self) -> None:
+        for transformer in [
+            _transform_int_value,
+            _transform_float_value,
+            _transform_text_value,
+        ]:
+            for value in TRICKY_VALUES:
+                expected = transform_value(value)
+                result = transformer(value)
+                assert result == expected, f"{transformer.__name__}({value!r})"
+                assert type(result) is type(expected)
+
+
+class TestIterLines:
+    """Test lazy iteration over the lines of the data."""
+
+    def test_same_as_string_io(self) -> None:
+        for data in [
+            "",
+            "a",
+            "a\n",
+            "\n",
+            "a\nb",
+            "a\r\nb\r\n",
+            "a\rb\n\n\nc",
+            "a\u2028b\nc",
+        ]:
+            assert list(iter_lines(data)) == list(StringIO(data)), repr(data)
+            assert list(iter_lines(data.encode())) == list(iter_lines(data))
+
+    def test_invalid_utf8(self) -> None:
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_lines(b"a\n\xff\n"))
+
+
+class TestInputDataContent:
+    """Test reading of the raw input data content."""
+
+    def test_map_input_data_file(self, tmp_path) -> None:
+        path = tmp_path / "data.json"
+        path.write_bytes('[{"name": "Žluťoučký"}]\n'.encode())
+        content = map_input_data_file(str(path))
+        assert isinstance(content, mmap.mmap)
+        assert content[:2] == b"[{"
+        assert decode_input_data_content(content) == '[{"name": "Žluťoučký"}]\n'
+        assert list(iter_lines(content)) == ['[{"name": "Žluťoučký"}]\n']
+        assert InputDataSample(content).prefix == '[{"name": "Žluťoučký"}]'
+
+    def test_map_input_data_file_empty(self, tmp_path) -> None:
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+        assert map_input_data_file(str(path)) == b""
+
+    def test_map_input_data_file_missing(self, tmp_path) -> None:
+        with pytest.raises(OSError):
+            map_input_data_file(str(tmp_path / "missing.json"))
+
+    def test_decode_input_data_content(self) -> None:
+        assert decode_input_data_content("abc") == "abc"
+        assert decode_input_data_content("ž".encode()) == "ž"
+        with pytest.raises(UnicodeDecodeError):
+            decode_input_data_content(b"\xff")
+
+    def test_get_text_prefix(self) -> None:
+        assert get_text_prefix("abcdef", 3) == "abc"
+        assert get_text_prefix("ža".encode(), 3) == "ža"
+        # character cut at the end is ignored
+        assert get_text_prefix("ža".encode(), 1) == ""
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_get_lines_prefix(self, binary) -> None:
+        data = "a\nbc\ndef\n"
+        content = data.encode() if binary else data
+        expected = [
+            (10, data),
+            (9, data),
+            (8, "a\nbc\n"),
+            (5, "a\nbc\n"),
+            (4, "a\n"),
+            (1, ""),
+        ]
+        for max_size, prefix in expected:
+            assert get_lines_prefix(content, max_size) == (
+                prefix.encode() if binary else prefix
+            )
@@ -1,8 +1,13 @@
-from next_gen_ui_agent.data_transform.audio import AudioPlayerDataTransformer
-from next_gen_ui_agent.data_transform.image import ImageDataTransformer
-from next_gen_ui_agent.data_transform.one_card import OneCardDataTransformer
-from next_gen_ui_agent.data_transform.table import TableDataTransformer
-from next_gen_ui_agent.data_transform.video import VideoPlayerDataTransformer
+from typing import TYPE_CHECKING
+
+from next_gen_ui_agent.lazy_attributes import create_lazy_attributes
+
+if TYPE_CHECKING:
+    from next_gen_ui_agent.data_transform.audio import AudioPlayerDataTransformer
+    from next_gen_ui_agent.data_transform.image import ImageDataTransformer
+    from next_gen_ui_agent.data_transform.one_card import OneCardDataTransformer
+    from next_gen_ui_agent.data_transform.table import TableDataTransformer
+    from next_gen_ui_agent.data_transform.video import VideoPlayerDataTransformer
 
 __all__ = [
     "ImageDataTransformer",
@@ -11,3 +16,14 @@ __all__ = [
     "AudioPlayerDataTransformer",
     "TableDataTransformer",
 ]
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "AudioPlayerDataTransformer": "next_gen_ui_agent.data_transform.audio",
+    "ImageDataTransformer": "next_gen_ui_agent.data_transform.image",
+    "OneCardDataTransformer": "next_gen_ui_agent.data_transform.one_card",
+    "TableDataTransformer": "next_gen_ui_agent.data_transform.table",
+    "VideoPlayerDataTransformer": "next_gen_ui_agent.data_transform.video",
+}
+
+
+__getattr__, __dir__ = create_lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -13,11 +13,17 @@ from typing_extensions import override
 class AudioPlayerDataTransformer(DataTransformerBase[ComponentDataAudio]):
     COMPONENT_NAME = "audio-player"
 
-    def __init__(self):
-        self._component_data = ComponentDataAudio.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataAudio:
+        return ComponentDataAudio.model_construct()
 
     @override
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
+    def main_processing(
+        self,
+        component_data: ComponentDataAudio,
+        json_data: Any,
+        component: UIComponentMetadata,
+    ):
         fields: list[DataFieldSimpleValue] = (
             data_transformer_utils.copy_simple_fields_from_ui_component_metadata(
                 component.fields
@@ -27,7 +33,7 @@ class AudioPlayerDataTransformer(DataTransformerBase[ComponentDataAudio]):
 
         image, _f = data_transformer_utils.find_image_simple_field(fields)
         if image:
-            self._component_data.image = str(image)
+            component_data.image = str(image)
 
         field_with_audio_suffix = next(
             (
@@ -39,7 +45,7 @@ class AudioPlayerDataTransformer(DataTransformerBase[ComponentDataAudio]):
             None,
         )
         if field_with_audio_suffix:
-            self._component_data.audio = str(field_with_audio_suffix.data)
+            component_data.audio = str(field_with_audio_suffix.data)
         # TODO search by field name and make sure it contains url
         else:
             # We cannot render video without the link
@@ -1,12 +1,17 @@
 """Chart data transformers for various chart types."""
 
-from next_gen_ui_agent.data_transform.chart.bar import BarChartDataTransformer
-from next_gen_ui_agent.data_transform.chart.donut import DonutChartDataTransformer
-from next_gen_ui_agent.data_transform.chart.line import LineChartDataTransformer
-from next_gen_ui_agent.data_transform.chart.mirrored_bar import (
-    MirroredBarChartDataTransformer,
-)
-from next_gen_ui_agent.data_transform.chart.pie import PieChartDataTransformer
+from typing import TYPE_CHECKING
+
+from next_gen_ui_agent.lazy_attributes import create_lazy_attributes
+
+if TYPE_CHECKING:
+    from next_gen_ui_agent.data_transform.chart.bar import BarChartDataTransformer
+    from next_gen_ui_agent.data_transform.chart.donut import DonutChartDataTransformer
+    from next_gen_ui_agent.data_transform.chart.line import LineChartDataTransformer
+    from next_gen_ui_agent.data_transform.chart.mirrored_bar import (
+        MirroredBarChartDataTransformer,
+    )
+    from next_gen_ui_agent.data_transform.chart.pie import PieChartDataTransformer
 
 __all__ = [
     "BarChartDataTransformer",
@@ -15,3 +20,14 @@ __all__ = [
     "DonutChartDataTransformer",
     "MirroredBarChartDataTransformer",
 ]
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BarChartDataTransformer": "next_gen_ui_agent.data_transform.chart.bar",
+    "DonutChartDataTransformer": "next_gen_ui_agent.data_transform.chart.donut",
+    "LineChartDataTransformer": "next_gen_ui_agent.data_transform.chart.line",
+    "MirroredBarChartDataTransformer": "next_gen_ui_agent.data_transform.chart.mirrored_bar",
+    "PieChartDataTransformer": "next_gen_ui_agent.data_transform.chart.pie",
+}
+
+
+__getattr__, __dir__ = create_lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,149 @@
+"""
+Aggregation of the chart data with too many categories into histogram bins.
+
+Vectorized `numpy` implementation is used if `numpy` is installed, pure Python one otherwise.
+Both return the same values.
+"""
+
+import math
+from functools import cache
+from typing import Callable, NamedTuple, Optional, Sequence
+
+
+class HistogramBins(NamedTuple):
+    """Histogram bins of the same width covering all the numeric x-axis values."""
+
+    start: float
+    """Lower bound of the first bin."""
+    width: float
+    """Width of each bin."""
+    bin_count: int
+    """Number of bins."""
+    integer: bool
+    """`True` if x-axis values are integers, so bins are ranges of integers."""
+
+    def get_labels(self) -> list[str]:
+        """Get labels of the bins, e.g. `1990 - 1994` for integers, `0.5 - 1.25` for floats."""
+        labels = []
+        for i in range(self.bin_count):
+            lower = self.start + i * self.width
+            if self.integer:
+                upper = lower + self.width - 1
+                labels.append(
+                    f"{int(lower)}"
+                    if upper == lower
+                    else f"{int(lower)} - {int(upper)}"
+                )
+            else:
+                labels.append(
+                    f"{_format_number(lower)} - {_format_number(lower + self.width)}"
+                )
+        return labels
+
+
+def _format_number(value: float) -> str:
+    """Format number with at most 4 decimal places, without trailing zeros."""
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+def parse_numeric_values(values: Sequence[str]) -> Optional[tuple[list[float], bool]]:
+    """
+    Parse x-axis values as numbers.
+
+    Returns:
+        Parsed numbers and `True` if all of them are integers, `None` if any of the values is not a finite number
+    """
+    numbers = []
+    integer = True
+    for value in values:
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        if not math.isfinite(number):
+            return None
+        integer = integer and number.is_integer() and "." not in value
+        numbers.append(number)
+    return numbers, integer
+
+
+def get_histogram_bins(
+    x: Sequence[float], integer: bool, max_bins: int
+) -> HistogramBins:
+    """Get at most `max_bins` histogram bins of the same width covering all the `x` values, integer width for `integer` values."""
+    lower, upper = min(x), max(x)
+    if integer:
+        width = float(math.ceil((upper - lower + 1) / max_bins))
+        return HistogramBins(
+            lower, width, math.ceil((upper - lower + 1) / width), integer
+        )
+    if upper == lower:
+        return HistogramBins(lower, 1.0, 1, integer)
+    return HistogramBins(lower, (upper - lower) / max_bins, max_bins, integer)
+
+
+def _sum_into_bins_python(
+    x: Sequence[float], series_y: list[list[Optional[float]]], bins: HistogramBins
+) -> list[list[float]]:
+    last = bins.bin_count - 1
+    indices = [min(int((value - bins.start) / bins.width), last) for value in x]
+    sums = []
+    for y in series_y:
+        series_sums = [0.0] * bins.bin_count
+        for i, value in zip(indices, y):
+            if value is not None:
+                series_sums[i] += value
+        sums.append(series_sums)
+    return sums
+
+
+@cache
+def _load_sum_into_bins() -> (
+    Callable[
+        [Sequence[float], list[list[Optional[float]]], HistogramBins], list[list[float]]
+    ]
+):
+    """Get the fastest available implementation of the summing into bins, loaded on the first use so `numpy` is not imported until needed."""
+    try:
+        import numpy as np  # type: ignore[import-not-found,unused-ignore] # pants: no-infer-dep
+    except ImportError:
+        return _sum_into_bins_python
+
+    def sum_into_bins_numpy(
+        x: Sequence[float], series_y: list[list[Optional[float]]], bins: HistogramBins
+    ) -> list[list[float]]:
+        x_array = np.asarray(x, dtype=float)
+        indices = np.minimum(
+            ((x_array - bins.start) / bins.width).astype(np.intp), bins.bin_count - 1
+        )
+        sums = []
+        for y in series_y:
+            # `None` values are converted to NaN and summed as 0
+            y_array = np.nan_to_num(
+                np.asarray(y[: len(x)], dtype=float), nan=0.0, copy=False
+            )
+            sums.append(
+                np.bincount(
+                    indices[: len(y_array)], weights=y_array, minlength=bins.bin_count
+                ).tolist()
+            )
+        return sums
+
+    return sum_into_bins_numpy
+
+
+def sum_into_bins(
+    x: Sequence[float], series_y: list[list[Optional[float]]], bins: HistogramBins
+) -> list[list[float]]:
+    """
+    Sum y-axis values of each series into the histogram bins of their x-axis values in one pass.
+
+    Args:
+        x: Numeric x-axis values shared by all the series
+        series_y: Y-axis values of each series aligned with `x` (or its prefix), `None` values are skipped
+        bins: Histogram bins covering all the `x` values
+
+    Returns:
+        Sums of the y-axis values in each bin for each series, `0` for bins without values
+    """
+    return _load_sum_into_bins()(x, series_y, bins)
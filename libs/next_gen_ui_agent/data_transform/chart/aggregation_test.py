@@ -0,0 +1,72 @@
+"""Tests for the chart data aggregation."""
+
+import pytest
+from next_gen_ui_agent.data_transform.chart import aggregation
+from next_gen_ui_agent.data_transform.chart.aggregation import (
+    HistogramBins,
+    get_histogram_bins,
+    parse_numeric_values,
+    sum_into_bins,
+)
+
+
+def test_parse_numeric_values() -> None:
+    assert parse_numeric_values(["1990", "-5", "2001"]) == ([1990, -5, 2001], True)
+    assert parse_numeric_values(["1.5", "2"]) == ([1.5, 2], False)
+    assert parse_numeric_values(["1.0"]) == ([1], False)
+
+
+@pytest.mark.parametrize("values", [["1", "A"], ["1", "nan"], ["inf"]])
+def test_parse_numeric_values_not_numeric(values: list[str]) -> None:
+    assert parse_numeric_values(values) is None
+
+
+def test_get_histogram_bins_integer() -> None:
+    bins = get_histogram_bins([1990, 2001, 1995], True, 5)
+    assert bins == HistogramBins(1990, 3, 4, True)
+    assert bins.get_labels() == [
+        "1990 - 1992",
+        "1993 - 1995",
+        "1996 - 1998",
+        "1999 - 2001",
+    ]
+
+
+def test_get_histogram_bins_integer_single_values() -> None:
+    bins = get_histogram_bins([1, 3, 2, 3], True, 5)
+    assert bins == HistogramBins(1, 1, 3, True)
+    assert bins.get_labels() == ["1", "2", "3"]
+
+
+def test_get_histogram_bins_float() -> None:
+    bins = get_histogram_bins([0.5, 3.2], False, 4)
+    assert bins.bin_count == 4
+    assert bins.get_labels() == [
+        "0.5 - 1.175",
+        "1.175 - 1.85",
+        "1.85 - 2.525",
+        "2.525 - 3.2",
+    ]
+
+
+def test_get_histogram_bins_float_same_values() -> None:
+    assert get_histogram_bins([0.5, 0.5], False, 4).get_labels() == ["0.5 - 1.5"]
+
+
+def test_sum_into_bins() -> None:
+    bins = get_histogram_bins([0, 10], False, 2)
+    assert sum_into_bins([0, 4, 5, 10, 7], [[1, 2, None, 4, 5], [1, 1]], bins) == [
+        [3, 9],
+        [2, 0],
+    ]
+
+
+def test_sum_into_bins_implementations_same_result() -> None:
+    x = [(i * 37) % 1000 / 7 for i in range(5000)]
+    series_y: list[list[float | None]] = [
+        [None if i % 5 == 0 else i / 3 for i in range(5000)],
+        [float(i % 11) for i in range(4000)],
+    ]
+    bins = get_histogram_bins(x, False, 17)
+    expected = aggregation._sum_into_bins_python(x, series_y, bins)
+    assert aggregation._load_sum_into_bins()(x, series_y, bins) == expected
@@ -1,14 +1,25 @@
 """Bar chart data transformer."""
 
+import heapq
 import logging
+import math
 from typing import Any
 
-from next_gen_ui_agent.data_transform.chart.base import ChartDataTransformerBase
+from next_gen_ui_agent.data_transform.chart.aggregation import (
+    get_histogram_bins,
+    parse_numeric_values,
+    sum_into_bins,
+)
+from next_gen_ui_agent.data_transform.chart.base import (
+    ChartDataTransformerBase,
+    ChartSeriesValues,
+)
 from next_gen_ui_agent.data_transform.types import (
     ComponentDataBarChart,
     DataFieldArrayValue,
 )
 from next_gen_ui_agent.types import UIComponentMetadata
+from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
@@ -17,28 +28,31 @@ class BarChartDataTransformer(ChartDataTransformerBase[ComponentDataBarChart]):
     """Data transformer for bar charts (chart-bar)."""
 
     COMPONENT_NAME = "chart-bar"
-    _component_data: ComponentDataBarChart
 
-    def __init__(self):
-        self._component_data = ComponentDataBarChart.model_construct(data=[])
+    @override
+    def create_component_data(self) -> ComponentDataBarChart:
+        return ComponentDataBarChart.model_construct(data=[])
 
+    @override
     def _build_chart_data(
         self,
+        component_data: ComponentDataBarChart,
         fields: list[DataFieldArrayValue],
         json_data: Any,
         component: UIComponentMetadata,
-    ) -> None:
+    ) -> list[ChartSeriesValues]:
         """
         Build bar chart data: First field is x-axis, rest are y-axis series.
 
         Args:
+            component_data: Chart component data
             fields: Extracted fields with data
             json_data: Original JSON data (unused for bar charts)
-            component: Component metadata (unused for bar charts)
+            component: Component metadata with the chart aggregation configuration
         """
         if len(fields) < 2:
             logger.warning("Bar chart needs at least 2 fields (x-axis and y-axis)")
-            return
+            return []
 
         x_field = fields[0]
         y_fields = fields[1:]
@@ -47,7 +61,7 @@ class BarChartDataTransformer(ChartDataTransformerBase[ComponentDataBarChart]):
         x_values = self._extract_x_values(x_field)
         if not x_values:
             logger.warning("No x values found, cannot create bar chart")
-            return
+            return []
 
         # Create a series for each y field
         series_list = []
@@ -56,4 +70,57 @@ class BarChartDataTransformer(ChartDataTransformerBase[ComponentDataBarChart]):
             if series:
                 series_list.append(series)
 
-        self._component_data.data = series_list
+        if component.chart_aggregation:
+            return self._aggregate_bars(
+                component_data,
+                series_list,
+                component.chart_aggregation.max_bars,
+                component.chart_aggregation.bar_histogram,
+            )
+        return series_list
+
+    def _aggregate_bars(
+        self,
+        component_data: ComponentDataBarChart,
+        series_list: list[ChartSeriesValues],
+        max_bars: int,
+        histogram: bool,
+    ) -> list[ChartSeriesValues]:
+        """
+        Aggregate series with more than `max_bars` bars. Bars are sorted by the value of the first series in descending order and limited.
+        If `histogram` is enabled, numeric x-axis values are aggregated into histogram bins instead (values of each series are summed).
+        """
+        x = self._get_shared_x(series_list)
+        if x is None or len(x) <= max_bars:
+            return series_list
+        component_data.data_points_total_count = len(x)
+
+        # numeric identifiers (e.g. ZIP codes) can't be binned, so histogram has to be enabled explicitly
+        numeric_x = parse_numeric_values(x) if histogram else None
+        if numeric_x:
+            x_numbers, integer = numeric_x
+            bins = get_histogram_bins(x_numbers, integer, max_bars)
+            logger.debug("Aggregating %d bars into %d bins", len(x), bins.bin_count)
+            labels = bins.get_labels()
+            sums = sum_into_bins(x_numbers, [series.y for series in series_list], bins)
+            return [
+                ChartSeriesValues(series.name, labels, list(y))
+                for series, y in zip(series_list, sums)
+            ]
+
+        logger.debug("Limiting %d bars to %d largest ones", len(x), max_bars)
+        first_y = series_list[0].y
+
+        def get_first_y(i: int) -> float:
+            value = first_y[i] if i < len(first_y) else None
+            return -math.inf if value is None else value
+
+        selected = heapq.nlargest(max_bars, range(len(x)), key=get_first_y)
+        return [
+            ChartSeriesValues(
+                series.name,
+                [x[i] for i in selected],
+                [series.y[i] if i < len(series.y) else None for i in selected],
+            )
+            for series in series_list
+        ]
@@ -205,3 +205,210 @@ def test_bar_chart_insufficient_fields() -> None:
     # Should fail validation - needs at least 2 fields
     assert any(e.code == "chart.noData" for e in errors)
     assert result.data == []
+
+
+def test_process_bar_chart_columns() -> None:
+    """Test processing bar chart with multiple series into the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_columns",
+            "title": "Sales by Quarter",
+            "component": "chart-bar",
+            "chart_data_format": "columns",
+            "fields": [
+                {"name": "Quarter", "data_path": "data[*].quarter"},
+                {"name": "Product A", "data_path": "data[*].productA"},
+                {"name": "Product B", "data_path": "data[*].productB"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_columns",
+        data="""{
+            "data": [
+                {"quarter": "Q1", "productA": 100, "productB": 80},
+                {"quarter": "Q2", "productA": null, "productB": 95},
+                {"quarter": "Q3", "productA": 120}
+            ]
+        }""",
+    )
+    errors: list[ComponentDataValidationError] = []
+    result = BarChartDataTransformer().validate(c, data, errors)
+    assert errors == []
+    assert result.data is None
+    assert result.x_axis_label == "Quarter"
+    assert result.model_dump(exclude_unset=True)["columns"] == {
+        "x": ["Q1", "Q2", "Q3"],
+        "series": [
+            {"name": "Product A", "y": [100, None, 120]},
+            {"name": "Product B", "y": [80, 95, None]},
+        ],
+    }
+
+
+def test_validate_bar_chart_columns_no_data() -> None:
+    """Test validation fails with no data in the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_columns_empty",
+            "title": "Invalid Chart",
+            "component": "chart-bar",
+            "chart_data_format": "columns",
+            "fields": [
+                {"name": "X", "data_path": "data[*].x"},
+                {"name": "Y", "data_path": "data[*].y"},
+            ],
+        }
+    )
+    data = InputData(id="test_bar_columns_empty", data="""{"data": []}""")
+    errors: list[ComponentDataValidationError] = []
+    result = BarChartDataTransformer().validate(c, data, errors)
+    assert result.columns is None
+    assert any(e.code == "chart.noData" for e in errors)
+
+
+def test_bar_chart_aggregation_sorted_and_limited() -> None:
+    """Test bar chart with more bars than configured keeps the largest ones of the first series."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_limited",
+            "title": "Sales by Product",
+            "component": "chart-bar",
+            "chart_aggregation": {"max_bars": 2},
+            "fields": [
+                {"name": "Product", "data_path": "data[*].product"},
+                {"name": "Sales", "data_path": "data[*].sales"},
+                {"name": "Returns", "data_path": "data[*].returns"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_limited",
+        data="""{
+            "data": [
+                {"product": "A", "sales": 10, "returns": 1},
+                {"product": "B", "sales": 30, "returns": 3},
+                {"product": "C", "sales": null, "returns": 5},
+                {"product": "D", "sales": 20}
+            ]
+        }""",
+    )
+    result = BarChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 4
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("B", 30), ("D", 20)]
+    assert [(p.x, p.y) for p in result.data[1].data] == [("B", 3)]
+
+
+def test_bar_chart_aggregation_histogram_bins() -> None:
+    """Test bar chart with more bars with numeric x-axis values than configured aggregates them into bins."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_bins",
+            "title": "Revenue by Year",
+            "component": "chart-bar",
+            "chart_data_format": "columns",
+            "chart_aggregation": {"max_bars": 3, "bar_histogram": True},
+            "fields": [
+                {"name": "Year", "data_path": "movies[*].year"},
+                {"name": "Revenue", "data_path": "movies[*].revenue"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_bins",
+        data="""{
+            "movies": [
+                {"year": 1990, "revenue": 1},
+                {"year": 1991, "revenue": 2},
+                {"year": 1995, "revenue": 3},
+                {"year": 1999, "revenue": 4},
+                {"year": 1993, "revenue": null}
+            ]
+        }""",
+    )
+    errors: list[ComponentDataValidationError] = []
+    result = BarChartDataTransformer().validate(c, data, errors)
+    assert errors == []
+    assert result.data_points_total_count == 5
+    assert result.columns is not None
+    assert result.columns.x == ["1990 - 1993", "1994 - 1997", "1998 - 2001"]
+    assert result.columns.series[0].y == [3, 3, 4]
+
+
+def test_bar_chart_aggregation_numeric_not_binned_by_default() -> None:
+    """Test bar chart with numeric x-axis values (e.g. ZIP codes) is limited to the largest bars, if histogram is not enabled."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_numeric_limited",
+            "title": "Customers by ZIP code",
+            "component": "chart-bar",
+            "chart_aggregation": {"max_bars": 2},
+            "fields": [
+                {"name": "ZIP", "data_path": "data[*].zip"},
+                {"name": "Customers", "data_path": "data[*].customers"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_numeric_limited",
+        data="""{
+            "data": [
+                {"zip": "10001", "customers": 5},
+                {"zip": "10002", "customers": 50},
+                {"zip": "94105", "customers": 20}
+            ]
+        }""",
+    )
+    result = BarChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 3
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("10002", 50), ("94105", 20)]
+
+
+def test_bar_chart_aggregation_histogram_not_numeric() -> None:
+    """Test bar chart with non numeric x-axis values is limited to the largest bars, even if histogram is enabled."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_histogram_not_numeric",
+            "title": "Sales by Product",
+            "component": "chart-bar",
+            "chart_aggregation": {"max_bars": 1, "bar_histogram": True},
+            "fields": [
+                {"name": "Product", "data_path": "data[*].product"},
+                {"name": "Sales", "data_path": "data[*].sales"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_histogram_not_numeric",
+        data="""{"data": [{"product": "A", "sales": 1}, {"product": "B", "sales": 2}]}""",
+    )
+    result = BarChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 2
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("B", 2)]
+
+
+def test_bar_chart_aggregation_not_needed() -> None:
+    """Test bar chart with less bars than configured is not aggregated."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_bar_not_aggregated",
+            "title": "Sales",
+            "component": "chart-bar",
+            "chart_aggregation": {"max_bars": 2},
+            "fields": [
+                {"name": "Year", "data_path": "data[*].year"},
+                {"name": "Sales", "data_path": "data[*].sales"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_bar_not_aggregated",
+        data="""{"data": [{"year": 2001, "sales": 1}, {"year": 2000, "sales": 2}]}""",
+    )
+    result = BarChartDataTransformer().process(c, data)
+    assert result.data_points_total_count is None
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("2001", 1), ("2000", 2)]
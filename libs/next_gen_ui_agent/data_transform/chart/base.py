@@ -3,11 +3,13 @@
 import logging
 from abc import abstractmethod
 from collections import Counter
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
 
 from next_gen_ui_agent.data_transform import data_transformer_utils
 from next_gen_ui_agent.data_transform.data_transformer import DataTransformerBase
 from next_gen_ui_agent.data_transform.types import (
+    ChartColumns,
+    ChartColumnSeries,
     ChartDataPoint,
     ChartSeries,
     ComponentDataChart,
@@ -16,7 +18,11 @@ from next_gen_ui_agent.data_transform.types import (
 from next_gen_ui_agent.data_transform.validation.types import (
     ComponentDataValidationError,
 )
-from next_gen_ui_agent.types import InputData, UIComponentMetadata
+from next_gen_ui_agent.types import (
+    AgentConfigChartAggregation,
+    InputData,
+    UIComponentMetadata,
+)
 from typing_extensions import override
 
 logger = logging.getLogger(__name__)
@@ -24,17 +30,34 @@ logger = logging.getLogger(__name__)
 TChart = TypeVar("TChart", bound=ComponentDataChart)
 
 
+class ChartSeriesValues(NamedTuple):
+    """
+    Values of one chart series built by the chart transformers, converted to the configured chart data format at the end.
+    Plain lists are used, so data point objects are created only for the `points` chart data format.
+    """
+
+    name: str
+    """Name of the series."""
+    x: list[str]
+    """X-axis values."""
+    y: list[Optional[float]]
+    """Y-axis values aligned with `x`, `None` if there is no numeric value for the x-axis value."""
+
+
 class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
     """Base class for all chart transformers with shared utility methods."""
 
     @override
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
+    def main_processing(
+        self, component_data: TChart, json_data: Any, component: UIComponentMetadata
+    ):
         """
         Transform input data into chart format.
 
         The transformer uses component metadata and fields to build chart data.
 
         Args:
+            component_data: Chart component data to fill
             json_data: The input data to transform
             component: Component metadata containing configuration and fields
         """
@@ -64,23 +87,26 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
                 )
 
         # Build chart data (implemented by subclasses)
-        self._build_chart_data(fields, json_data, component)
+        series_values = self._build_chart_data(
+            component_data, fields, json_data, component
+        )
+        if component.chart_data_format == "columns":
+            component_data.columns = self._create_columns(series_values)
+            component_data.data = None
+        else:
+            component_data.data = self._create_series(series_values)
 
         # Set x-axis label from appropriate field name (all series share the same x-axis)
         # For most charts, first field is x-axis. For multi-series line charts, second field is x-axis.
         # Subclasses can override this by setting x_axis_label in _build_chart_data if needed.
-        if fields and len(fields) > 0 and not self._component_data.x_axis_label:
-            self._component_data.x_axis_label = fields[0].name
+        if fields and len(fields) > 0 and not component_data.x_axis_label:
+            component_data.x_axis_label = fields[0].name
 
-        if self._component_data.data:
+        if series_values:
             logger.debug(
-                "Created %d chart series with %d data points in first series",
-                len(self._component_data.data),
-                (
-                    len(self._component_data.data[0].data)
-                    if self._component_data.data
-                    else 0
-                ),
+                "Created %d chart series with %d values in first series",
+                len(series_values),
+                len(series_values[0].x),
             )
         else:
             logger.warning("No chart data created")
@@ -88,22 +114,99 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
     @abstractmethod
     def _build_chart_data(
         self,
+        component_data: TChart,
         fields: list[DataFieldArrayValue],
         json_data: Any,
         component: UIComponentMetadata,
-    ) -> None:
+    ) -> list[ChartSeriesValues]:
         """
-        Build chart-specific data structure. Implemented by each subclass.
+        Build chart-specific data series, converted into `component_data` in the configured chart data format. Implemented by each subclass.
 
         Args:
+            component_data: Chart component data to fill with additional properties (e.g. x-axis label)
             fields: Extracted fields with data
             json_data: Original JSON data
             component: Component metadata
+
+        Returns:
+            Chart data series, empty list if chart data can't be built
         """
         pass
 
+    def _create_series(
+        self, series_values: list[ChartSeriesValues]
+    ) -> list[ChartSeries]:
+        """Create series of data points (`points` chart data format), values without numeric y-axis value are skipped."""
+        return [
+            ChartSeries(
+                name=values.name,
+                data=[
+                    ChartDataPoint(x=x, y=y)
+                    for x, y in zip(values.x, values.y)
+                    if y is not None
+                ],
+            )
+            for values in series_values
+        ]
+
+    def _create_columns(
+        self, series_values: list[ChartSeriesValues]
+    ) -> Optional[ChartColumns]:
+        """
+        Create columnar chart data (`columns` chart data format). If all the series have the same x-axis values (or their prefix),
+        they are shared directly, otherwise x-axis values of all the series are merged in the order of appearance (e.g. multi-series line chart).
+        X-axis value repeated in a series is merged by its occurrence, so the n-th occurrences of the value in all the series share one position
+        and no data point is lost.
+        """
+        if not series_values:
+            return None
+        x = self._get_shared_x(series_values)
+        if x is not None:
+            columns = [
+                values.y + [None] * (len(x) - len(values.y)) for values in series_values
+            ]
+        else:
+            x = []
+            # positions of the occurrences of each x-axis value in the merged x-axis values
+            index: dict[str, list[int]] = {}
+            series_positions = []
+            for values in series_values:
+                occurrences: dict[str, int] = {}
+                positions = []
+                for x_value in values.x:
+                    occurrence = occurrences.get(x_value, 0)
+                    occurrences[x_value] = occurrence + 1
+                    value_positions = index.setdefault(x_value, [])
+                    if occurrence == len(value_positions):
+                        value_positions.append(len(x))
+                        x.append(x_value)
+                    positions.append(value_positions[occurrence])
+                series_positions.append(positions)
+            columns = []
+            for values, positions in zip(series_values, series_positions):
+                y: list[Optional[float]] = [None] * len(x)
+                for position, y_value in zip(positions, values.y):
+                    y[position] = y_value
+                columns.append(y)
+        return ChartColumns.model_construct(
+            x=x,
+            series=[
+                ChartColumnSeries.model_construct(name=values.name, y=y)
+                for values, y in zip(series_values, columns)
+            ],
+        )
+
     # ===== Shared Utility Methods =====
 
+    def _get_shared_x(
+        self, series_values: list[ChartSeriesValues]
+    ) -> Optional[list[str]]:
+        """Get x-axis values shared by all the series (x-axis values of each series are the same or their prefix), `None` if they differ."""
+        x = max((values.x for values in series_values), key=len, default=[])
+        if all(values.x == x[: len(values.x)] for values in series_values):
+            return x
+        return None
+
     def _extract_x_values(self, x_field: DataFieldArrayValue) -> list[str]:
         """Extract x-axis values from field data."""
         if not x_field.data:
@@ -125,28 +228,21 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
 
     def _create_series_from_field(
         self, y_field: DataFieldArrayValue, x_values: list[str]
-    ) -> ChartSeries | None:
-        """Create a chart series from a y-axis field and x-axis values."""
+    ) -> ChartSeriesValues | None:
+        """Create a chart series from a y-axis field and x-axis values, `None` if there is no numeric y-axis value."""
         if not y_field.data:
             logger.debug("No data in field %s", y_field.name)
             return None
 
-        data_points = []
-        for i, (x_val, y_item) in enumerate(zip(x_values, y_field.data)):
-            # Skip None values
-            if y_item is None:
-                continue
-
-            # Extract numeric value from y_item
-            y_val = self._extract_numeric_value(y_item)
-            if y_val is not None:
-                data_points.append(ChartDataPoint(x=x_val, y=y_val))
-
-        if not data_points:
+        y_values = [
+            None if y_item is None else self._extract_numeric_value(y_item)
+            for y_item in y_field.data[: len(x_values)]
+        ]
+        if all(y is None for y in y_values):
             logger.debug("No valid data points in field %s", y_field.name)
             return None
 
-        return ChartSeries(name=y_field.name, data=data_points)
+        return ChartSeriesValues(y_field.name, x_values[: len(y_values)], y_values)
 
     def _extract_numeric_value(self, item: Any) -> float | None:
         """Extract a numeric value from various data types."""
@@ -169,18 +265,25 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
 
         return None
 
-    def _build_frequency_series(self, field: DataFieldArrayValue) -> None:
+    def _build_frequency_series(
+        self,
+        component_data: TChart,
+        field: DataFieldArrayValue,
+        aggregation: Optional[AgentConfigChartAggregation] = None,
+    ) -> list[ChartSeriesValues]:
         """
-        Build a frequency chart by counting occurrences.
+        Build a frequency chart series by counting occurrences.
 
         Used by pie and donut charts to count category occurrences.
 
         Args:
+            component_data: Chart component data, filled with the number of categories if they are aggregated
             field: Field containing category data to count
+            aggregation: Aggregation of the categories, if there are more than `max_slices` of them, the most frequent ones are kept and the rest are summed into the `other_label` category
         """
         if not field.data:
             logger.warning("No data in field for %s", self.COMPONENT_NAME)
-            return
+            return []
 
         # Flatten and collect all categories
         categories = []
@@ -195,21 +298,44 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
 
         if not categories:
             logger.warning("No categories found for %s", self.COMPONENT_NAME)
-            return
+            return []
 
         # Count occurrences
         category_counts = Counter(categories)
-        logger.debug("Category counts: %s", dict(category_counts))
-
-        # Create data points from counts
-        data_points = []
-        for category, count in category_counts.items():
-            data_points.append(ChartDataPoint(x=category, y=float(count)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Category counts: %s", dict(category_counts))
 
-        self._component_data.data = [ChartSeries(name=field.name, data=data_points)]
         logger.debug(
-            "Created %s with %d categories", self.COMPONENT_NAME, len(data_points)
+            "Created %s with %d categories", self.COMPONENT_NAME, len(category_counts)
         )
+        if aggregation and len(category_counts) > aggregation.max_slices:
+            # most frequent categories are kept, the rest are summed into the "other" one,
+            # category with the same label as the "other" one is always summed into it, so the label is not duplicated
+            top_counts = [
+                (category, count)
+                for category, count in category_counts.most_common(
+                    aggregation.max_slices
+                )
+                if category != aggregation.other_label
+            ][: aggregation.max_slices - 1]
+            other_count = len(categories) - sum(count for _, count in top_counts)
+            component_data.data_points_total_count = len(category_counts)
+            counts: list[Optional[float]] = [float(count) for _, count in top_counts]
+            return [
+                ChartSeriesValues(
+                    field.name,
+                    [category for category, _ in top_counts]
+                    + [aggregation.other_label],
+                    counts + [float(other_count)],
+                )
+            ]
+        return [
+            ChartSeriesValues(
+                field.name,
+                list(category_counts.keys()),
+                [float(count) for count in category_counts.values()],
+            )
+        ]
 
     # ===== Validation Methods =====
 
@@ -225,13 +351,13 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
 
         Subclasses can override _validate_data_series for custom series validation.
         """
-        super().validate(component, data, errors)
+        component_data = super().validate(component, data, errors)
 
         # Validate data series (can be overridden by subclasses)
-        self._validate_data_series(errors)
+        self._validate_data_series(component_data, errors)
 
         # Validate component type is set correctly (defensive check)
-        component_value = getattr(self._component_data, "component", None)
+        component_value = getattr(component_data, "component", None)
         if component_value != self.COMPONENT_NAME:
             errors.append(
                 ComponentDataValidationError(
@@ -240,18 +366,26 @@ class ChartDataTransformerBase(DataTransformerBase[TChart], Generic[TChart]):
                 )
             )
 
-        return self._component_data
+        return component_data
 
-    def _validate_data_series(self, errors: list[ComponentDataValidationError]) -> None:
+    def _validate_data_series(
+        self, component_data: TChart, errors: list[ComponentDataValidationError]
+    ) -> None:
         """
         Validate that the chart has valid data series.
 
         Override in subclasses for custom validation (e.g., mirrored bar requires exactly 2).
         """
-        if not self._component_data.data or len(self._component_data.data) == 0:
+        if self._get_series_count(component_data) == 0:
             errors.append(
                 ComponentDataValidationError(
                     "chart.noData",
                     f"{self.COMPONENT_NAME} requires at least one data series",
                 )
             )
+
+    def _get_series_count(self, component_data: TChart) -> int:
+        """Get number of the data series of the chart in any chart data format."""
+        if component_data.columns:
+            return len(component_data.columns.series)
+        return len(component_data.data) if component_data.data else 0
@@ -3,12 +3,16 @@
 import logging
 from typing import Any
 
-from next_gen_ui_agent.data_transform.chart.base import ChartDataTransformerBase
+from next_gen_ui_agent.data_transform.chart.base import (
+    ChartDataTransformerBase,
+    ChartSeriesValues,
+)
 from next_gen_ui_agent.data_transform.types import (
     ComponentDataDonutChart,
     DataFieldArrayValue,
 )
 from next_gen_ui_agent.types import UIComponentMetadata
+from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
@@ -17,29 +21,34 @@ class DonutChartDataTransformer(ChartDataTransformerBase[ComponentDataDonutChart
     """Data transformer for donut charts (chart-donut)."""
 
     COMPONENT_NAME = "chart-donut"
-    _component_data: ComponentDataDonutChart
 
-    def __init__(self):
-        self._component_data = ComponentDataDonutChart.model_construct(data=[])
+    @override
+    def create_component_data(self) -> ComponentDataDonutChart:
+        return ComponentDataDonutChart.model_construct(data=[])
 
+    @override
     def _build_chart_data(
         self,
+        component_data: ComponentDataDonutChart,
         fields: list[DataFieldArrayValue],
         json_data: Any,
         component: UIComponentMetadata,
-    ) -> None:
+    ) -> list[ChartSeriesValues]:
         """
         Build donut chart data by counting occurrences of categories.
 
         Donut charts expect exactly 1 field containing categories to count.
 
         Args:
+            component_data: Chart component data
             fields: Extracted fields with data
             json_data: Original JSON data (unused for donut charts)
-            component: Component metadata (unused for donut charts)
+            component: Component metadata with the chart aggregation configuration
         """
         if not fields or len(fields) != 1:
             logger.warning("Donut chart expects exactly 1 field")
-            return
+            return []
 
-        self._build_frequency_series(fields[0])
+        return self._build_frequency_series(
+            component_data, fields[0], component.chart_aggregation
+        )
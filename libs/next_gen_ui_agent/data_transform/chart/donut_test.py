@@ -209,3 +209,24 @@ def test_donut_chart_handles_none_values() -> None:
     assert len(result.data[0].data) == 2
     high_point = next(p for p in result.data[0].data if p.x == "high")
     assert high_point.y == 2.0
+
+
+def test_process_donut_chart_top_categories_with_other() -> None:
+    """Test donut chart with more categories than configured slices aggregates the less frequent ones."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_donut_other",
+            "title": "Movies by Genre",
+            "component": "chart-donut",
+            "chart_aggregation": {"max_slices": 2},
+            "fields": [{"name": "Genre", "data_path": "movies[*].genre"}],
+        }
+    )
+    data = InputData(
+        id="test_donut_other",
+        data="""{"movies": [{"genre": "Drama"}, {"genre": "Action"}, {"genre": "Action"}, {"genre": "Crime"}]}""",
+    )
+    result = DonutChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 3
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("Action", 2), ("Other", 2)]
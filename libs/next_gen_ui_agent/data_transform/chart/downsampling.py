@@ -0,0 +1,109 @@
+"""
+Downsampling of the chart data series by the Largest-Triangle-Three-Buckets (LTTB) algorithm,
+which preserves visual shape of the line with much less data points.
+
+Vectorized `numpy` implementation is used if `numpy` is installed, pure Python one otherwise.
+Both return the same data points.
+"""
+
+from functools import cache
+from typing import Callable, Optional, Sequence
+
+
+def _get_bucket_bounds(points: int, max_points: int) -> list[int]:
+    """
+    Get bounds of the buckets the data points between the first and the last one are split into, one bucket for each selected data point.
+    Integer arithmetic is used, so all the implementations split data points the same way.
+    """
+    buckets = max_points - 2
+    return [(i * (points - 2)) // buckets + 1 for i in range(buckets + 1)]
+
+
+def _lttb_python(x: Sequence[float], y: Sequence[float], max_points: int) -> list[int]:
+    bounds = _get_bucket_bounds(len(x), max_points)
+    last = len(x) - 1
+    selected = [0]
+    a = 0
+    for i in range(len(bounds) - 1):
+        # average of the next bucket, the last data point for the last bucket
+        next_start = bounds[i + 1]
+        next_end = bounds[i + 2] if i + 2 < len(bounds) else last + 1
+        count = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / count
+        avg_y = sum(y[next_start:next_end]) / count
+
+        # data point of the current bucket forming the largest triangle with the previously selected one and the average
+        ax, ay = x[a], y[a]
+        max_area = -1.0
+        for j in range(bounds[i], bounds[i + 1]):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                a = j
+        selected.append(a)
+    selected.append(last)
+    return selected
+
+
+@cache
+def _load_lttb() -> Callable[[Sequence[float], Sequence[float], int], list[int]]:
+    """Get the fastest available LTTB implementation, loaded on the first use so `numpy` is not imported until needed."""
+    try:
+        import numpy as np  # type: ignore[import-not-found,unused-ignore] # pants: no-infer-dep
+    except ImportError:
+        return _lttb_python
+
+    def lttb_numpy(
+        x: Sequence[float], y: Sequence[float], max_points: int
+    ) -> list[int]:
+        bounds = _get_bucket_bounds(len(x), max_points)
+        x_array = np.asarray(x, dtype=float)
+        y_array = np.asarray(y, dtype=float)
+        # averages of all the buckets (and of the last data point) don't depend on the selected data points
+        starts = np.asarray(bounds[1:], dtype=np.intp)
+        counts = np.diff(np.append(starts, len(x)))
+        avg_x = (np.add.reduceat(x_array, starts) / counts).tolist()
+        avg_y = (np.add.reduceat(y_array, starts) / counts).tolist()
+
+        selected = [0]
+        a = 0
+        for i in range(len(bounds) - 1):
+            start, end = bounds[i], bounds[i + 1]
+            ax, ay = x[a], y[a]
+            areas = np.abs(
+                (ax - avg_x[i]) * (y_array[start:end] - ay)
+                - (ax - x_array[start:end]) * (avg_y[i] - ay)
+            )
+            a = start + int(areas.argmax())
+            selected.append(a)
+        selected.append(len(x) - 1)
+        return selected
+
+    return lttb_numpy
+
+
+def lttb_indices(y: Sequence[Optional[float]], max_points: int) -> list[int]:
+    """
+    Get indices of the data points of the series selected by the Largest-Triangle-Three-Buckets algorithm.
+
+    X-axis values are positions of the data points in the series, as they are labels (e.g. dates) evenly spaced on the x-axis.
+    Positions of `None` values are never selected.
+
+    Args:
+        y: Y-axis values of the series, `None` if there is no value for the x-axis value
+        max_points: Maximal number of the selected data points, at least 3
+
+    Returns:
+        Sorted indices of the selected data points, all the indices of the non `None` values if there are not more than `max_points` of them
+    """
+    if max_points < 3:
+        raise ValueError("At least 3 data points have to be selected by downsampling")
+    positions: list[float] = []
+    values: list[float] = []
+    for i, value in enumerate(y):
+        if value is not None:
+            positions.append(i)
+            values.append(value)
+    if len(positions) <= max_points:
+        return [int(i) for i in positions]
+    return [int(positions[i]) for i in _load_lttb()(positions, values, max_points)]
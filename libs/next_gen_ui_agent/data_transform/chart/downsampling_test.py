@@ -0,0 +1,56 @@
+"""Tests for the chart data series downsampling."""
+
+import math
+
+import pytest
+from next_gen_ui_agent.data_transform.chart import downsampling
+from next_gen_ui_agent.data_transform.chart.downsampling import lttb_indices
+
+
+def _generate_series(points: int) -> list[float]:
+    return [math.sin(i / 10) * 10 + (i % 7) for i in range(points)]
+
+
+def test_lttb_indices_not_downsampled() -> None:
+    assert lttb_indices([1, 2, 3], 3) == [0, 1, 2]
+
+
+def test_lttb_indices_skips_none_values() -> None:
+    assert lttb_indices([None, 1, None, 3], 3) == [1, 3]
+
+
+def test_lttb_indices_keeps_first_last_and_peak() -> None:
+    y = [0.0] * 100
+    y[42] = 100.0
+    selected = lttb_indices(y, 5)
+    assert len(selected) == 5
+    assert selected[0] == 0
+    assert selected[-1] == 99
+    assert 42 in selected
+
+
+def test_lttb_indices_with_none_values() -> None:
+    y: list[float | None] = list(_generate_series(1000))
+    y[0] = None
+    y[500] = None
+    selected = lttb_indices(y, 100)
+    assert len(selected) == 100
+    assert selected == sorted(set(selected))
+    assert selected[0] == 1
+    assert selected[-1] == 999
+    assert 500 not in selected
+
+
+def test_lttb_indices_invalid_max_points() -> None:
+    with pytest.raises(ValueError, match="At least 3 data points"):
+        lttb_indices([1, 2, 3], 2)
+
+
+@pytest.mark.parametrize("points, max_points", [(4, 3), (101, 10), (10000, 997)])
+def test_lttb_implementations_same_result(points: int, max_points: int) -> None:
+    y = _generate_series(points)
+    x = list(range(points))
+    selected = downsampling._lttb_python(x, y, max_points)
+    assert len(selected) == max_points
+    assert selected == sorted(set(selected))
+    assert downsampling._load_lttb()(x, y, max_points) == selected
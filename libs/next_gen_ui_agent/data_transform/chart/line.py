@@ -3,14 +3,17 @@
 import logging
 from typing import Any
 
-from next_gen_ui_agent.data_transform.chart.base import ChartDataTransformerBase
+from next_gen_ui_agent.data_transform.chart.base import (
+    ChartDataTransformerBase,
+    ChartSeriesValues,
+)
+from next_gen_ui_agent.data_transform.chart.downsampling import lttb_indices
 from next_gen_ui_agent.data_transform.types import (
-    ChartDataPoint,
-    ChartSeries,
     ComponentDataLineChart,
     DataFieldArrayValue,
 )
 from next_gen_ui_agent.types import UIComponentMetadata
+from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
@@ -19,19 +22,21 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
     """Data transformer for line charts (chart-line)."""
 
     COMPONENT_NAME = "chart-line"
-    _component_data: ComponentDataLineChart
 
-    def __init__(self):
-        self._component_data = ComponentDataLineChart.model_construct(data=[])
+    @override
+    def create_component_data(self) -> ComponentDataLineChart:
+        return ComponentDataLineChart.model_construct(data=[])
 
+    @override
     def _build_chart_data(
         self,
+        component_data: ComponentDataLineChart,
         fields: list[DataFieldArrayValue],
         json_data: Any,
         component: UIComponentMetadata,
-    ) -> None:
+    ) -> list[ChartSeriesValues]:
         """
-        Build line chart data.
+        Build line chart data, downsampled if configured by `component.chart_downsampling`.
 
         Supports two modes:
         - Standard: 2+ fields (x-axis, y-axis1, y-axis2, ...)
@@ -40,29 +45,44 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
           Same metric across different entities (e.g., "Revenue for Movie A and Movie B")
 
         Args:
+            component_data: Chart component data
             fields: Extracted fields with data
             json_data: Original JSON data (unused for line charts)
-            component: Component metadata (unused for line charts)
+            component: Component metadata with the chart data format and downsampling configuration
         """
+        series_list = self._build_series(component_data, fields)
+        if component.chart_downsampling:
+            return self._downsample(
+                component_data,
+                series_list,
+                component.chart_downsampling.max_points,
+                component.chart_data_format == "columns",
+            )
+        return series_list
+
+    def _build_series(
+        self, component_data: ComponentDataLineChart, fields: list[DataFieldArrayValue]
+    ) -> list[ChartSeriesValues]:
+        """Build line chart series in the standard or the multi-series mode."""
         # For 3 fields, detect whether it's standard (multiple metrics) or multi-series (same metric across entities)
         if len(fields) == 3:
             # Use smart detection based on field length ratios
             if self._is_multi_series_pattern(fields):
-                self._build_multi_series_line_chart(fields)
-                return
+                return self._build_multi_series_line_chart(component_data, fields)
             else:
                 # Standard mode: first field is x-axis, other two are different metrics
-                self._build_standard_line_chart(fields)
-                return
+                return self._build_standard_line_chart(component_data, fields)
 
         # Standard line chart (2 fields: x, y OR 4+ fields: x, y1, y2, ...)
         if len(fields) >= 2:
-            self._build_standard_line_chart(fields)
-            return
+            return self._build_standard_line_chart(component_data, fields)
 
         logger.warning("Line chart needs at least 2 fields")
+        return []
 
-    def _build_standard_line_chart(self, fields: list[DataFieldArrayValue]) -> None:
+    def _build_standard_line_chart(
+        self, component_data: ComponentDataLineChart, fields: list[DataFieldArrayValue]
+    ) -> list[ChartSeriesValues]:
         """Build standard line chart: First field is x-axis, rest are y-axis series."""
         x_field = fields[0]
         y_fields = fields[1:]
@@ -71,7 +91,7 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
         x_values = self._extract_x_values(x_field)
         if not x_values:
             logger.warning("No x values found, cannot create line chart")
-            return
+            return []
 
         # Create a series for each y field
         series_list = []
@@ -80,9 +100,11 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
             if series:
                 series_list.append(series)
 
-        self._component_data.data = series_list
+        return series_list
 
-    def _build_multi_series_line_chart(self, fields: list[DataFieldArrayValue]) -> None:
+    def _build_multi_series_line_chart(
+        self, component_data: ComponentDataLineChart, fields: list[DataFieldArrayValue]
+    ) -> list[ChartSeriesValues]:
         """
         Build multi-series line chart from 3 fields: series_id, x, y.
 
@@ -106,7 +128,7 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
             logger.warning(
                 "Missing data in one or more fields for multi-series line chart"
             )
-            return
+            return []
 
         series_ids = series_field.data
         x_vals = x_field.data
@@ -130,7 +152,7 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
                 num_points,
                 num_series,
             )
-            return
+            return []
 
         points_per_series = num_points // num_series
         logger.debug("Each series should have %d data points", points_per_series)
@@ -141,21 +163,68 @@ class LineChartDataTransformer(ChartDataTransformerBase[ComponentDataLineChart])
             start_idx = i * points_per_series
             end_idx = start_idx + points_per_series
 
-            data_points = []
-            for j in range(start_idx, end_idx):
-                # Extract numeric value for y
-                numeric_y = self._extract_numeric_value(y_vals[j])
-                if numeric_y is not None:
-                    data_points.append(ChartDataPoint(x=str(x_vals[j]), y=numeric_y))
-
-            if data_points:  # Only add series if it has data
-                series_list.append(ChartSeries(name=str(series_id), data=data_points))
+            # Extract numeric values for y
+            y_series = [
+                self._extract_numeric_value(y_val)
+                for y_val in y_vals[start_idx:end_idx]
+            ]
+            if any(y is not None for y in y_series):  # Only add series if it has data
+                series_list.append(
+                    ChartSeriesValues(
+                        str(series_id),
+                        [str(x_val) for x_val in x_vals[start_idx:end_idx]],
+                        y_series,
+                    )
+                )
 
-        self._component_data.data = series_list
         # For multi-series charts, x-axis is the second field (not the first)
         if len(fields) >= 2:
-            self._component_data.x_axis_label = fields[1].name
+            component_data.x_axis_label = fields[1].name
         logger.debug("Created %d series for multi-series line chart", len(series_list))
+        return series_list
+
+    def _downsample(
+        self,
+        component_data: ComponentDataLineChart,
+        series_list: list[ChartSeriesValues],
+        max_points: int,
+        shared_x: bool,
+    ) -> list[ChartSeriesValues]:
+        """
+        Downsample series with more than `max_points` data points by the Largest-Triangle-Three-Buckets algorithm.
+
+        If `shared_x` is requested (columnar chart data format) and the series have the same x-axis values,
+        data points selected for any series are kept in all of them, so the series still share x-axis values
+        and the columns are filled by values instead of `null`s.
+        """
+        data_points_total_count = max(
+            (sum(y is not None for y in series.y) for series in series_list),
+            default=0,
+        )
+        if data_points_total_count <= max_points:
+            return series_list
+
+        selected = [lttb_indices(series.y, max_points) for series in series_list]
+        if shared_x and self._get_shared_x(series_list) is not None:
+            merged = sorted(set().union(*selected))
+            selected = [
+                [i for i in merged if i < len(series.x)] for series in series_list
+            ]
+
+        logger.debug(
+            "Downsampled line chart series from %d to %d data points",
+            data_points_total_count,
+            max(len(indices) for indices in selected),
+        )
+        component_data.data_points_total_count = data_points_total_count
+        return [
+            ChartSeriesValues(
+                series.name,
+                [series.x[i] for i in indices],
+                [series.y[i] for i in indices],
+            )
+            for series, indices in zip(series_list, selected)
+        ]
 
     def _is_multi_series_pattern(self, fields: list[DataFieldArrayValue]) -> bool:
         """
@@ -1,10 +1,16 @@
 """Tests for line chart data transformer."""
 
+import json
+
 from next_gen_ui_agent.data_transform.chart import LineChartDataTransformer
 from next_gen_ui_agent.data_transform.validation.types import (
     ComponentDataValidationError,
 )
-from next_gen_ui_agent.types import InputData, UIComponentMetadata
+from next_gen_ui_agent.types import (
+    AgentConfigChartDownsampling,
+    InputData,
+    UIComponentMetadata,
+)
 
 
 def test_process_line_chart_standard() -> None:
@@ -339,3 +345,175 @@ def test_line_chart_multi_series_uneven_data() -> None:
     # The multi-series logic expects evenly divisible data
     # With 2 series and 3 total points, it should fail/warn
     assert result.data == []  # No data produced due to uneven distribution
+
+
+def test_process_line_chart_multi_series_columns() -> None:
+    """Test multi-series line chart with different x-axis values of the series in the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_line_multi_columns",
+            "title": "Weekly Revenue by Movie",
+            "component": "chart-line",
+            "chart_data_format": "columns",
+            "fields": [
+                {"name": "Movie", "data_path": "movies[*].title"},
+                {"name": "Week", "data_path": "movies[*].weeklyData[*].week"},
+                {"name": "Revenue", "data_path": "movies[*].weeklyData[*].revenue"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_line_multi_columns",
+        data="""{
+            "movies": [
+                {
+                    "title": "Movie A",
+                    "weeklyData": [
+                        {"week": "W1", "revenue": 100},
+                        {"week": "W2", "revenue": 150}
+                    ]
+                },
+                {
+                    "title": "Movie B",
+                    "weeklyData": [
+                        {"week": "W2", "revenue": 80},
+                        {"week": "W3", "revenue": 120}
+                    ]
+                }
+            ]
+        }""",
+    )
+    result = LineChartDataTransformer().process(c, data)
+    assert result.data is None
+    assert result.x_axis_label == "Week"
+    assert result.columns is not None
+    assert result.columns.x == ["W1", "W2", "W3"]
+    assert [s.name for s in result.columns.series] == ["Movie A", "Movie B"]
+    assert result.columns.series[0].y == [100, 150, None]
+    assert result.columns.series[1].y == [None, 80, 120]
+
+
+def test_process_line_chart_multi_series_columns_repeated_x() -> None:
+    """Test multi-series line chart with x-axis value repeated in a series keeps all the data points in the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_line_multi_columns_repeated",
+            "title": "Weekly Revenue by Movie",
+            "component": "chart-line",
+            "chart_data_format": "columns",
+            "fields": [
+                {"name": "Movie", "data_path": "movies[*].title"},
+                {"name": "Week", "data_path": "movies[*].weeklyData[*].week"},
+                {"name": "Revenue", "data_path": "movies[*].weeklyData[*].revenue"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_line_multi_columns_repeated",
+        data="""{
+            "movies": [
+                {
+                    "title": "Movie A",
+                    "weeklyData": [
+                        {"week": "W1", "revenue": 1},
+                        {"week": "W1", "revenue": 2},
+                        {"week": "W2", "revenue": 3}
+                    ]
+                },
+                {
+                    "title": "Movie B",
+                    "weeklyData": [
+                        {"week": "W2", "revenue": 4},
+                        {"week": "W3", "revenue": 5},
+                        {"week": "W4", "revenue": 6}
+                    ]
+                }
+            ]
+        }""",
+    )
+    points = LineChartDataTransformer().process(
+        c.model_copy(update={"chart_data_format": None}), data
+    )
+    assert points.data is not None
+    assert [(p.x, p.y) for p in points.data[0].data] == [
+        ("W1", 1),
+        ("W1", 2),
+        ("W2", 3),
+    ]
+
+    result = LineChartDataTransformer().process(c, data)
+    assert result.columns is not None
+    assert result.columns.x == ["W1", "W1", "W2", "W3", "W4"]
+    assert result.columns.series[0].y == [1, 2, 3, None, None]
+    assert result.columns.series[1].y == [None, None, 4, 5, 6]
+
+
+def _create_downsampled_line_chart(
+    chart_data_format: str | None = None,
+) -> UIComponentMetadata:
+    return UIComponentMetadata.model_validate(
+        {
+            "id": "test_line_downsampling",
+            "title": "Metrics",
+            "component": "chart-line",
+            "chart_data_format": chart_data_format,
+            "chart_downsampling": {"max_points": 10},
+            "fields": [
+                {"name": "Time", "data_path": "metrics[*].time"},
+                {"name": "CPU", "data_path": "metrics[*].cpu"},
+                {"name": "Memory", "data_path": "metrics[*].memory"},
+            ],
+        }
+    )
+
+
+_DOWNSAMPLING_DATA = InputData(
+    id="test_line_downsampling",
+    data=json.dumps(
+        {
+            "metrics": [
+                {"time": f"T{i}", "cpu": (i * 7) % 11, "memory": (i * 3) % 13}
+                for i in range(100)
+            ]
+        }
+    ),
+)
+
+
+def test_line_chart_downsampling() -> None:
+    """Test line chart series are downsampled to the configured number of data points."""
+    result = LineChartDataTransformer().process(
+        _create_downsampled_line_chart(), _DOWNSAMPLING_DATA
+    )
+    assert result.data_points_total_count == 100
+    assert result.data is not None
+    assert [len(series.data) for series in result.data] == [10, 10]
+    for series in result.data:
+        assert series.data[0].x == "T0"
+        assert series.data[-1].x == "T99"
+    # series are downsampled independently
+    assert [p.x for p in result.data[0].data] != [p.x for p in result.data[1].data]
+
+
+def test_line_chart_downsampling_columns() -> None:
+    """Test downsampled line chart series still share x-axis values in the columnar chart data format."""
+    result = LineChartDataTransformer().process(
+        _create_downsampled_line_chart("columns"), _DOWNSAMPLING_DATA
+    )
+    assert result.data_points_total_count == 100
+    assert result.columns is not None
+    assert 10 < len(result.columns.x) <= 20
+    for series in result.columns.series:
+        assert len(series.y) == len(result.columns.x)
+        assert None not in series.y
+
+
+def test_line_chart_downsampling_not_needed() -> None:
+    """Test line chart series with less data points than configured are not downsampled."""
+    c = _create_downsampled_line_chart().model_copy(
+        update={"chart_downsampling": AgentConfigChartDownsampling(max_points=100)}
+    )
+    result = LineChartDataTransformer().process(c, _DOWNSAMPLING_DATA)
+    assert result.data_points_total_count is None
+    assert result.data is not None
+    assert [len(series.data) for series in result.data] == [100, 100]
@@ -3,7 +3,10 @@
 import logging
 from typing import Any
 
-from next_gen_ui_agent.data_transform.chart.base import ChartDataTransformerBase
+from next_gen_ui_agent.data_transform.chart.base import (
+    ChartDataTransformerBase,
+    ChartSeriesValues,
+)
 from next_gen_ui_agent.data_transform.types import (
     ComponentDataMirroredBarChart,
     DataFieldArrayValue,
@@ -23,17 +26,19 @@ class MirroredBarChartDataTransformer(
     """Data transformer for mirrored bar charts (chart-mirrored-bar)."""
 
     COMPONENT_NAME = "chart-mirrored-bar"
-    _component_data: ComponentDataMirroredBarChart
 
-    def __init__(self):
-        self._component_data = ComponentDataMirroredBarChart.model_construct(data=[])
+    @override
+    def create_component_data(self) -> ComponentDataMirroredBarChart:
+        return ComponentDataMirroredBarChart.model_construct(data=[])
 
+    @override
     def _build_chart_data(
         self,
+        component_data: ComponentDataMirroredBarChart,
         fields: list[DataFieldArrayValue],
         json_data: Any,
         component: UIComponentMetadata,
-    ) -> None:
+    ) -> list[ChartSeriesValues]:
         """
         Build mirrored bar chart data: Exactly 3 fields (x-axis, metric1, metric2).
 
@@ -41,6 +46,7 @@ class MirroredBarChartDataTransformer(
         different scales. The rendering handles the mirroring visualization.
 
         Args:
+            component_data: Chart component data
             fields: Extracted fields with data (must be exactly 3)
             json_data: Original JSON data (unused for mirrored bar charts)
             component: Component metadata (unused for mirrored bar charts)
@@ -49,7 +55,7 @@ class MirroredBarChartDataTransformer(
             logger.warning(
                 "Mirrored bar chart expects exactly 3 fields (x-axis, metric1, metric2)"
             )
-            return
+            return []
 
         x_field = fields[0]
         y_fields = fields[1:]
@@ -58,7 +64,7 @@ class MirroredBarChartDataTransformer(
         x_values = self._extract_x_values(x_field)
         if not x_values:
             logger.warning("No x values found, cannot create mirrored bar chart")
-            return
+            return []
 
         # Create a series for each metric (should be exactly 2)
         series_list = []
@@ -73,15 +79,20 @@ class MirroredBarChartDataTransformer(
                 len(series_list),
             )
 
-        self._component_data.data = series_list
+        return series_list
 
     @override
-    def _validate_data_series(self, errors: list[ComponentDataValidationError]) -> None:
+    def _validate_data_series(
+        self,
+        component_data: ComponentDataMirroredBarChart,
+        errors: list[ComponentDataValidationError],
+    ) -> None:
         """Validate that the mirrored bar chart has exactly 2 series."""
-        if not self._component_data.data or len(self._component_data.data) != 2:
+        series_count = self._get_series_count(component_data)
+        if series_count != 2:
             errors.append(
                 ComponentDataValidationError(
                     "chart.invalidSeriesCount",
-                    f"Mirrored bar chart requires exactly 2 data series, got {len(self._component_data.data) if self._component_data.data else 0}",
+                    f"Mirrored bar chart requires exactly 2 data series, got {series_count}",
                 )
             )
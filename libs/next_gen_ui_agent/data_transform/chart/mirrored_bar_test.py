@@ -155,3 +155,35 @@ def test_mirrored_bar_chart_wrong_field_count() -> None:
     # Should fail - mirrored bar expects exactly 3 fields
     assert any(e.code == "chart.invalidSeriesCount" for e in errors)
     assert result.data == []
+
+
+def test_validate_mirrored_bar_chart_columns() -> None:
+    """Test validation counts series of the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_mirrored_columns",
+            "title": "Mirrored Columns",
+            "component": "chart-mirrored-bar",
+            "chart_data_format": "columns",
+            "fields": [
+                {"name": "Category", "data_path": "data[*].category"},
+                {"name": "Metric1", "data_path": "data[*].metric1"},
+                {"name": "Metric2", "data_path": "data[*].metric2"},
+            ],
+        }
+    )
+    data = InputData(
+        id="test_mirrored_columns",
+        data="""{
+            "data": [
+                {"category": "A", "metric1": 10, "metric2": 100},
+                {"category": "B", "metric1": 15, "metric2": 150}
+            ]
+        }""",
+    )
+    errors: list[ComponentDataValidationError] = []
+    result = MirroredBarChartDataTransformer().validate(c, data, errors)
+    assert errors == []
+    assert result.columns is not None
+    assert result.columns.x == ["A", "B"]
+    assert [s.y for s in result.columns.series] == [[10, 15], [100, 150]]
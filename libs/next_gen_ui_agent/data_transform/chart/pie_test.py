@@ -210,3 +210,125 @@ def test_pie_chart_handles_none_values() -> None:
     assert len(result.data[0].data) == 2
     active_point = next(p for p in result.data[0].data if p.x == "active")
     assert active_point.y == 2.0
+
+
+def test_process_pie_chart_columns() -> None:
+    """Test processing pie chart into the columnar chart data format."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_pie_columns",
+            "title": "Movies by Genre",
+            "component": "chart-pie",
+            "chart_data_format": "columns",
+            "fields": [{"name": "Genre", "data_path": "movies[*].genre"}],
+        }
+    )
+    data = InputData(
+        id="test_pie_columns",
+        data="""{
+            "movies": [
+                {"genre": "Action"},
+                {"genre": "Drama"},
+                {"genre": "Action"}
+            ]
+        }""",
+    )
+    errors: list[ComponentDataValidationError] = []
+    result = PieChartDataTransformer().validate(c, data, errors)
+    assert errors == []
+    assert result.data is None
+    assert result.columns is not None
+    assert result.columns.x == ["Action", "Drama"]
+    assert result.columns.series[0].name == "Genre"
+    assert result.columns.series[0].y == [2, 1]
+
+
+def test_process_pie_chart_top_categories_with_other() -> None:
+    """Test pie chart with more categories than configured slices aggregates the less frequent ones."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_pie_other",
+            "title": "Movies by Genre",
+            "component": "chart-pie",
+            "chart_aggregation": {"max_slices": 3, "other_label": "Rest"},
+            "fields": [{"name": "Genre", "data_path": "movies[*].genre"}],
+        }
+    )
+    data = InputData(
+        id="test_pie_other",
+        data="""{
+            "movies": [
+                {"genre": "Action"},
+                {"genre": "Drama"},
+                {"genre": ["Comedy", "Action"]},
+                {"genre": "Crime"},
+                {"genre": "Drama"},
+                {"genre": "Action"},
+                {"genre": "Horror"}
+            ]
+        }""",
+    )
+    result = PieChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 5
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [
+        ("Action", 3),
+        ("Drama", 2),
+        ("Rest", 3),
+    ]
+
+
+def test_process_pie_chart_other_category_merged() -> None:
+    """Test pie chart with the category labeled the same as the aggregated categories merges them, so the label is not duplicated."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_pie_other_merged",
+            "title": "Movies by Genre",
+            "component": "chart-pie",
+            "chart_aggregation": {"max_slices": 3},
+            "fields": [{"name": "Genre", "data_path": "movies[*].genre"}],
+        }
+    )
+    data = InputData(
+        id="test_pie_other_merged",
+        data="""{
+            "movies": [
+                {"genre": "Other"},
+                {"genre": "Other"},
+                {"genre": "Other"},
+                {"genre": "Action"},
+                {"genre": "Action"},
+                {"genre": "Drama"},
+                {"genre": "Crime"}
+            ]
+        }""",
+    )
+    result = PieChartDataTransformer().process(c, data)
+    assert result.data_points_total_count == 4
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [
+        ("Action", 2),
+        ("Drama", 1),
+        ("Other", 4),
+    ]
+
+
+def test_process_pie_chart_not_aggregated() -> None:
+    """Test pie chart with less categories than configured slices is not aggregated."""
+    c = UIComponentMetadata.model_validate(
+        {
+            "id": "test_pie_not_aggregated",
+            "title": "Movies by Genre",
+            "component": "chart-pie",
+            "chart_aggregation": {"max_slices": 3},
+            "fields": [{"name": "Genre", "data_path": "movies[*].genre"}],
+        }
+    )
+    data = InputData(
+        id="test_pie_not_aggregated",
+        data="""{"movies": [{"genre": "Drama"}, {"genre": "Action"}, {"genre": "Action"}]}""",
+    )
+    result = PieChartDataTransformer().process(c, data)
+    assert result.data_points_total_count is None
+    assert result.data is not None
+    assert [(p.x, p.y) for p in result.data[0].data] == [("Drama", 1), ("Action", 2)]
@@ -1,6 +1,5 @@
-import json
 import logging
-from abc import ABC
+from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Generic, TypeVar
 
 from next_gen_ui_agent.data_transform.data_transformer_utils import (
@@ -17,7 +16,12 @@ from next_gen_ui_agent.data_transform.types import (
 from next_gen_ui_agent.data_transform.validation.types import (
     ComponentDataValidationError,
 )
-from next_gen_ui_agent.types import InputData, UIComponentMetadata
+from next_gen_ui_agent.json_tools import json_loads
+from next_gen_ui_agent.types import (
+    InputData,
+    UIComponentMetadata,
+    get_input_data_content,
+)
 
 T = TypeVar("T", bound=ComponentDataBase)
 
@@ -25,35 +29,54 @@ logger = logging.getLogger(__name__)
 
 
 class DataTransformerBase(ABC, Generic[T]):
-    """Data transformer"""
+    """
+    Data transformer.
+
+    Transformers are stateless singletons shared by all the calls, so they can be used concurrently from more threads.
+    All the per-call state is held in the `component_data` instance created by `create_component_data()`
+    and passed explicitly to all the processing methods. Never store per-call state in the transformer instance.
+    """
 
     # Default component name so subclasses always expose the attribute for logging/type checking
     COMPONENT_NAME: ClassVar[str] = "UNSPECIFIED_COMPONENT"
 
-    def __init__(self):
-        self._component_data: T = None  # type: ignore
-
-    def preprocess_rendering_context(self, component: UIComponentMetadata):
-        """Prepare _component_data property for further use in the transformer"""
-        self._component_data.id = component.id  # type: ignore
-        self._component_data.input_data_type = component.input_data_type
-        if isinstance(self._component_data, ComponentDataBaseWithTitle):
-            self._component_data.title = component.title
-        if isinstance(self._component_data, ComponentDataBaseWithSimpleValueFileds):
-            self._component_data.fields = copy_simple_fields_from_ui_component_metadata(
+    @abstractmethod
+    def create_component_data(self) -> T:
+        """IMPLEMENT: Create new empty component data instance filled by one transformation call"""
+        pass
+
+    def preprocess_rendering_context(
+        self, component_data: T, component: UIComponentMetadata
+    ):
+        """Prepare `component_data` for further use in the transformer"""
+        component_data.id = component.id  # type: ignore
+        component_data.input_data_type = component.input_data_type
+        if component.input_data_total_count is not None:
+            component_data.input_data_truncated = True
+            component_data.input_data_total_count = component.input_data_total_count
+        if component.input_data_limits_applied:
+            component_data.input_data_truncated = True
+        if isinstance(component_data, ComponentDataBaseWithTitle):
+            component_data.title = component.title
+        if isinstance(component_data, ComponentDataBaseWithSimpleValueFileds):
+            component_data.fields = copy_simple_fields_from_ui_component_metadata(
                 component.fields
             )
-        elif isinstance(self._component_data, ComponentDataBaseWithArrayValueFileds):
-            self._component_data.fields = copy_array_fields_from_ui_component_metadata(
+        elif isinstance(component_data, ComponentDataBaseWithArrayValueFileds):
+            component_data.fields = copy_array_fields_from_ui_component_metadata(
                 component.fields
             )
 
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
-        """IMPLEMENT: Main processing of the _component_data from parsed JSON data, UIComponentMetadata passed here also if necessary"""
+    def main_processing(
+        self, component_data: T, json_data: Any, component: UIComponentMetadata
+    ):
+        """IMPLEMENT: Main processing of the `component_data` from parsed JSON data, UIComponentMetadata passed here also if necessary"""
         pass
 
-    def post_processing(self, json_data: Any, component: UIComponentMetadata):
-        """IMPLEMENT: Post processing of the _component_data from parsed JSON data, UIComponentMetadata passed here also if necessary"""
+    def post_processing(
+        self, component_data: T, json_data: Any, component: UIComponentMetadata
+    ):
+        """IMPLEMENT: Post processing of the `component_data` from parsed JSON data, UIComponentMetadata passed here also if necessary"""
         pass
 
     def process(self, component: UIComponentMetadata, data: InputData) -> T:
@@ -61,19 +84,19 @@ class DataTransformerBase(ABC, Generic[T]):
         main-post processing flow. You can use `data_transformer_utils` for the implementation.
         """
 
-        data_content = data["data"]
-        if not data_content:
+        if not data["data"] and not data.get("data_file"):
             raise ValueError(f"No data content found for the component {data['id']}")
 
-        # if json_data is provided in `UIComponentMetadata`, use it, otherwise load from data_content
+        # if json_data is provided in `UIComponentMetadata`, use it, otherwise load from data content
         json_data = component.json_data
-        if not json_data:
-            json_data = json.loads(data_content)
+        if json_data is None:
+            json_data = json_loads(get_input_data_content(data))
 
-        self.preprocess_rendering_context(component)
-        self.main_processing(json_data, component)
-        self.post_processing(json_data, component)
-        return self._component_data
+        component_data = self.create_component_data()
+        self.preprocess_rendering_context(component_data, component)
+        self.main_processing(component_data, json_data, component)
+        self.post_processing(component_data, json_data, component)
+        return component_data
 
     def validate(
         self,
@@ -82,18 +105,18 @@ class DataTransformerBase(ABC, Generic[T]):
         errors: list[ComponentDataValidationError],
     ) -> T:
         """
-        Validate the component configuration agains provided data. Basic implementation inits `_component_data` and then validates the data paths and data presence for `fields`.
+        Validate the component configuration agains provided data. Basic implementation processes the data into component data and then validates the data paths and data presence for `fields`.
         You can override it to perform more complex validation for components with specific type (you should always call super().validate() in your implementation).
         """
 
-        self.process(component, data)
+        component_data = self.process(component, data)
 
         if isinstance(
-            self._component_data, ComponentDataBaseWithSimpleValueFileds
-        ) or isinstance(self._component_data, ComponentDataBaseWithArrayValueFileds):
+            component_data, ComponentDataBaseWithSimpleValueFileds
+        ) or isinstance(component_data, ComponentDataBaseWithArrayValueFileds):
             # variable for check of data length used for array components only. start with minimal data len here, until we fill it with real data len from field, to make sure all fields select data of the same length
             data_len = 2
-            for i, field in enumerate(self._component_data.fields):
+            for i, field in enumerate(component_data.fields):
                 fn = f"fields[{i}]."
                 sanitized_data_path = sanitize_data_path(field.data_path)
                 if not sanitized_data_path or sanitized_data_path == "":
@@ -104,9 +127,7 @@ class DataTransformerBase(ABC, Generic[T]):
                         )
                     )
                 elif not field.data or (
-                    isinstance(
-                        self._component_data, ComponentDataBaseWithArrayValueFileds
-                    )
+                    isinstance(component_data, ComponentDataBaseWithArrayValueFileds)
                     and (field.data == [])
                 ):
                     # we cant perform full incorrect path check for `ComponentDataBaseWithSimpleValueFileds` as `[]` is valid value here for input data fields containing empty array :-(
@@ -116,9 +137,7 @@ class DataTransformerBase(ABC, Generic[T]):
                             f"No value found in input data for data_path='{field.data_path}'",
                         )
                     )
-                elif isinstance(
-                    self._component_data, ComponentDataBaseWithArrayValueFileds
-                ):
+                elif isinstance(component_data, ComponentDataBaseWithArrayValueFileds):
                     # check of data length used for array components only
                     if len(field.data) < data_len:
                         errors.append(
@@ -130,4 +149,4 @@ class DataTransformerBase(ABC, Generic[T]):
                     else:
                         data_len = len(field.data)
 
-        return self._component_data
+        return component_data
@@ -10,10 +10,15 @@ from next_gen_ui_agent.types import InputData, UIComponentMetadata
 class TestDataTransformer(DataTransformerBase):
     json_data: Any = None
 
-    def __init__(self):
-        self._component_data = ComponentDataBase.model_construct()
-
-    def main_processing(self, json_data: Any, component: UIComponentMetadata) -> None:
+    def create_component_data(self) -> ComponentDataBase:
+        return ComponentDataBase.model_construct()
+
+    def main_processing(
+        self,
+        component_data: ComponentDataBase,
+        json_data: Any,
+        component: UIComponentMetadata,
+    ) -> None:
         self.json_data = json_data
 
 
@@ -79,7 +84,7 @@ def test_process_data_in_component() -> None:
         data="{}",  # put empty data here to test that component.json_data is really used with preference over InputData.data
     )
 
-    data_transformer.process(component, data)
+    component_data = data_transformer.process(component, data)
 
     assert data_transformer.json_data == json.loads(data_str)
-    assert data_transformer._component_data.input_data_type == "test_input_data_type"
+    assert component_data.input_data_type == "test_input_data_type"
@@ -1,9 +1,9 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Callable, Optional
 from uuid import uuid4
 
-from jsonpath_ng import parse  # type: ignore
 from next_gen_ui_agent.data_transform.types import (
     IMAGE_DATA_PATH_SUFFIXES,
     IMAGE_URL_SUFFIXES,
@@ -139,6 +139,19 @@ def sanitize_data_path(
         return None
 
 
+@lru_cache(maxsize=1024)
+def parse_data_path(data_path: str) -> Any:
+    """
+    Parse (compile) JSONPath expression, parsed expressions are cached as the same paths are used repeatedly.
+    Raises:
+        Exception: If the JSONPath expression can't be parsed.
+    """
+    # jsonpath_ng builds its parser on the first use, it is imported lazily not to slow down the UI Agent startup
+    from jsonpath_ng import parse  # type: ignore
+
+    return parse(data_path)
+
+
 def get_data_value_for_path(data_path: str | None, json_data: Any) -> list[Any] | None:
     """
     Get data for path generated by LLM from JSON parsed data.
@@ -149,7 +162,7 @@ def get_data_value_for_path(data_path: str | None, json_data: Any) -> list[Any]
 
     je = None
     try:
-        je = parse(data_path)
+        je = parse_data_path(data_path)
     except Exception:
         logger.exception("Failed JSONPath expression parsing for '%s'", data_path)
         return None
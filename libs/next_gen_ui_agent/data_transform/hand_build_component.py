@@ -14,13 +14,19 @@ class HandBuildComponentDataTransformer(
 ):
     COMPONENT_NAME = "hand-build-component"
 
-    def __init__(self):
-        self._component_data = ComponentDataHandBuildComponent.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataHandBuildComponent:
+        return ComponentDataHandBuildComponent.model_construct()
 
     @override
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
+    def main_processing(
+        self,
+        component_data: ComponentDataHandBuildComponent,
+        json_data: Any,
+        component: UIComponentMetadata,
+    ):
         if not isinstance(component, UIComponentMetadataHandBuildComponent):
             raise ValueError(f"Component {component.id} is not a hand-build component")
 
-        self._component_data.data = json_data
-        self._component_data.component = component.component_type
+        component_data.data = json_data
+        component_data.component = component.component_type
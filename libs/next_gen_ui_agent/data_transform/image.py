@@ -20,11 +20,17 @@ logger = logging.getLogger(__name__)
 class ImageDataTransformer(DataTransformerBase[ComponentDataImage]):
     COMPONENT_NAME = "image"
 
-    def __init__(self):
-        self._component_data = ComponentDataImage.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataImage:
+        return ComponentDataImage.model_construct()
 
     @override
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
+    def main_processing(
+        self,
+        component_data: ComponentDataImage,
+        json_data: Any,
+        component: UIComponentMetadata,
+    ):
         fields: list[DataFieldSimpleValue] = (
             data_transformer_utils.copy_simple_fields_from_ui_component_metadata(
                 component.fields
@@ -36,7 +42,7 @@ class ImageDataTransformer(DataTransformerBase[ComponentDataImage]):
         image, _f = data_transformer_utils.find_image_simple_field(fields)
         # If the image like URL is present, then set it, otherwise leave it blank
         if image:
-            self._component_data.image = image
+            component_data.image = image
         else:
             logger.warning("No image found in Image Component")
 
@@ -49,7 +55,7 @@ class ImageDataTransformer(DataTransformerBase[ComponentDataImage]):
     ) -> ComponentDataImage:
         ret = super().validate(component, data, errors)
 
-        imageUrl = self._component_data.image
+        imageUrl = ret.image
 
         if imageUrl:
             if not is_url_http(imageUrl):
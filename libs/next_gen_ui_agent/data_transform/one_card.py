@@ -14,20 +14,26 @@ from typing_extensions import override
 class OneCardDataTransformer(DataTransformerBase[ComponentDataOneCard]):
     COMPONENT_NAME = "one-card"
 
-    def __init__(self):
-        self._component_data = ComponentDataOneCard.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataOneCard:
+        return ComponentDataOneCard.model_construct()
 
     @override
-    def main_processing(self, json_data: Any, component: UIComponentMetadata):
-        fields = self._component_data.fields
+    def main_processing(
+        self,
+        component_data: ComponentDataOneCard,
+        json_data: Any,
+        component: UIComponentMetadata,
+    ):
+        fields = component_data.fields
         data_transformer_utils.fill_fields_with_simple_data(fields, json_data)
 
         # Trying to find field that would contain an image link
         image, field = data_transformer_utils.find_image_simple_field(fields)
         if image:
-            self._component_data.image = image
+            component_data.image = image
         if field:
-            self._component_data.fields.remove(field)
+            component_data.fields.remove(field)
 
     @override
     def validate(
@@ -38,7 +44,7 @@ class OneCardDataTransformer(DataTransformerBase[ComponentDataOneCard]):
     ) -> ComponentDataOneCard:
         ret = super().validate(component, data, errors)
 
-        imageUrl = self._component_data.image
+        imageUrl = ret.image
 
         if imageUrl:
             if not is_url_http(imageUrl):
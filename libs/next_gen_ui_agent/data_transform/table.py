@@ -7,13 +7,19 @@ from next_gen_ui_agent.types import UIComponentMetadata
 from typing_extensions import override
 
 
-class TableDataTransformer(DataTransformerBase):
+class TableDataTransformer(DataTransformerBase[ComponentDataTable]):
     COMPONENT_NAME = "table"
 
-    def __init__(self):
-        self._component_data = ComponentDataTable.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataTable:
+        return ComponentDataTable.model_construct()
 
     @override
-    def main_processing(self, data: Any, component: UIComponentMetadata):
-        fields = self._component_data.fields
+    def main_processing(
+        self,
+        component_data: ComponentDataTable,
+        data: Any,
+        component: UIComponentMetadata,
+    ):
+        fields = component_data.fields
         data_transformer_utils.fill_fields_with_array_data(fields, data)
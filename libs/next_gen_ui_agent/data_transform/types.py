@@ -12,6 +12,14 @@ class ComponentDataBase(BaseModel):
         default=None,
         description="Optional type of the input data. Can be used for frontend customization of the component for concrete data type, eg. by using it in CSS class names.",
     )
+    input_data_truncated: Optional[bool] = Field(
+        default=None,
+        description="`True` if the input data rows were truncated to the configured maximal number of rows, or input data limit was applied to them, so the component shows only part of the data.",
+    )
+    input_data_total_count: Optional[int] = Field(
+        default=None,
+        description="Total number of rows in the input data, provided only if the input data were truncated.",
+    )
 
 
 class ComponentDataBaseWithTitle(ComponentDataBase):
@@ -118,12 +126,38 @@ class ChartSeries(BaseModel):
     )
 
 
+class ChartColumnSeries(BaseModel):
+    """A series of the columnar chart data"""
+
+    name: str = Field(description="Name of the series (shown in legend)")
+    y: list[Optional[Union[int, float]]] = Field(
+        description="Y-axis values of the series aligned with the shared `x` values, `null` if the series has no value for the x-axis value"
+    )
+
+
+class ChartColumns(BaseModel):
+    """Columnar chart data - x-axis values shared by all the series, and y-axis values of each series"""
+
+    x: list[Union[str, int, float]] = Field(
+        description="X-axis values (labels) shared by all the series"
+    )
+    series: list[ChartColumnSeries] = Field(description="Array of data series")
+
+
 class ComponentDataChartBase(ComponentDataBaseWithTitle):
     """Base Component Data for Chart visualization with common properties."""
 
     data: Optional[list[ChartSeries]] = Field(
         default=None, description="Array of data series for the chart"
     )
+    columns: Optional[ChartColumns] = Field(
+        default=None,
+        description="Columnar chart data, used instead of `data` if configured by the `chart_data_format` agent configuration",
+    )
+    data_points_total_count: Optional[int] = Field(
+        default=None,
+        description="Number of data points of the longest series before downsampling or aggregation, provided only if the chart data were downsampled or aggregated.",
+    )
     x_axis_label: Optional[str] = Field(
         default=None,
         description="Label for the x-axis (shared by all series). Typically taken from the first field's name.",
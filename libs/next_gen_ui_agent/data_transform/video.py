@@ -45,11 +45,17 @@ class VideoPlayerDataTransformer(DataTransformerBase[ComponentDataVideo]):
     YOUTUBE = ".youtube."  # https://github.com/v2fly/domain-list-community/blob/master/data/youtube
     YOUTUBE_SHARE = "youtu.be"  # https://github.com/v2fly/domain-list-community/blob/master/data/youtube
 
-    def __init__(self):
-        self._component_data = ComponentDataVideo.model_construct()
+    @override
+    def create_component_data(self) -> ComponentDataVideo:
+        return ComponentDataVideo.model_construct()
 
     @override
-    def main_processing(self, data: Any, component: UIComponentMetadata):
+    def main_processing(
+        self,
+        component_data: ComponentDataVideo,
+        data: Any,
+        component: UIComponentMetadata,
+    ):
         fields = data_transformer_utils.copy_simple_fields_from_ui_component_metadata(
             component.fields
         )
@@ -62,7 +68,7 @@ class VideoPlayerDataTransformer(DataTransformerBase[ComponentDataVideo]):
             video_id = video_url[video_url.find("/watch?v=") + 9 :]
             video_url = f"https://www.youtube.com/embed/{video_id}"
             # https://img.youtube.com/vi/v-PjgYDrg70/maxresdefault.jpg
-            self._component_data.video_img = (
+            component_data.video_img = (
                 f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
             )
         if not video_url:
@@ -74,7 +80,7 @@ class VideoPlayerDataTransformer(DataTransformerBase[ComponentDataVideo]):
                 video_id = video_url[video_url.find("youtu.be/") + 9 :]
                 video_url = f"https://www.youtube.com/embed/{video_id}"
                 # https://img.youtube.com/vi/v-PjgYDrg70/maxresdefault.jpg
-                self._component_data.video_img = (
+                component_data.video_img = (
                     f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
                 )
 
@@ -95,10 +101,10 @@ class VideoPlayerDataTransformer(DataTransformerBase[ComponentDataVideo]):
 
         if not video_url:
             logger.warning("No video url found in Video Component")
-            self._component_data.video = None
-            self._component_data.video_img = None
+            component_data.video = None
+            component_data.video_img = None
         else:
-            self._component_data.video = str(video_url)
+            component_data.video = str(video_url)
 
     @override
     def validate(
@@ -109,7 +115,7 @@ class VideoPlayerDataTransformer(DataTransformerBase[ComponentDataVideo]):
     ) -> ComponentDataVideo:
         ret = super().validate(component, data, errors)
 
-        video_url = self._component_data.video
+        video_url = ret.video
 
         if video_url:
             if not is_url_http(video_url):
@@ -1,6 +1,5 @@
-import copy
 import logging
-from typing import cast
+from typing import Optional, cast
 
 from next_gen_ui_agent.data_transform.audio import AudioPlayerDataTransformer
 from next_gen_ui_agent.data_transform.chart import (
@@ -20,7 +19,18 @@ from next_gen_ui_agent.data_transform.set_of_cards import SetOfCardsDataTransfor
 from next_gen_ui_agent.data_transform.table import TableDataTransformer
 from next_gen_ui_agent.data_transform.types import ComponentDataBase
 from next_gen_ui_agent.data_transform.video import VideoPlayerDataTransformer
-from next_gen_ui_agent.types import InputData, UIComponentMetadata
+from next_gen_ui_agent.input_data_transform.input_data_limits import (
+    transform_input_data_with_limits,
+)
+from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    get_input_data_transformer,
+)
+from next_gen_ui_agent.json_data_wrapper import wrap_data
+from next_gen_ui_agent.types import (
+    AgentConfigInputDataLimits,
+    InputData,
+    UIComponentMetadata,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +51,10 @@ COMPONENT_TRANSFORMERS_REGISTRY: dict[str, DataTransformerBase] = {
 
 
 def get_data_transformer(component: str) -> DataTransformerBase[ComponentDataBase]:
-    """Get data transformer for UI component"""
-    # TODO improve this by use of FactoryPattern instead of instance copy?
+    """Get data transformer for UI component. Transformers are stateless, so the shared registry instance is returned."""
 
     data_transformer = COMPONENT_TRANSFORMERS_REGISTRY.get(component)
     if data_transformer:
-        data_transformer = copy.deepcopy(data_transformer)
         return cast(DataTransformerBase[ComponentDataBase], data_transformer)
     else:
         raise Exception(f"No data transformer found for component {component}")
@@ -60,3 +68,28 @@ def generate_component_data(
         component.component
     )
     return data_transformer.process(component, input_data)
+
+
+def generate_component_data_from_raw_input_data(
+    input_data: InputData,
+    component: UIComponentMetadata,
+    input_data_transformer_name: str,
+    max_rows: Optional[int] = None,
+    limits: Optional[AgentConfigInputDataLimits] = None,
+) -> ComponentDataBase:
+    """
+    Parse raw input data with the input data transformer (with at most `max_rows` rows and input data `limits` applied),
+    apply `JSON Wrapping` configured in the component metadata, and generate component data.
+    Used in the process pool workers, so only raw input data string and component metadata without parsed data are pickled.
+    Maximal number of rows and limits are passed explicitly, as the agent configuration is not initialized in the worker process.
+    """
+    json_data, _, _ = transform_input_data_with_limits(
+        get_input_data_transformer(input_data_transformer_name),
+        input_data,
+        max_rows,
+        limits,
+    )
+    component = component.model_copy(
+        update={"json_data": wrap_data(json_data, component.json_wrapping_field_name)}
+    )
+    return generate_component_data(input_data, component)
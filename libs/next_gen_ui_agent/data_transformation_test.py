@@ -1,7 +1,16 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
-from next_gen_ui_agent.data_transform.types import ComponentDataOneCard
-from next_gen_ui_agent.data_transformation import generate_component_data
+from next_gen_ui_agent.data_transform.types import (
+    ComponentDataOneCard,
+    ComponentDataTable,
+)
+from next_gen_ui_agent.data_transformation import (
+    generate_component_data,
+    generate_component_data_from_raw_input_data,
+    get_data_transformer,
+)
 from next_gen_ui_agent.types import InputData, UIComponentMetadata
 
 
@@ -28,3 +37,56 @@ def test_generate_component_data() -> None:
     assert component_data.component == "one-card"
     assert component_data.fields[0].name == "Name"
     assert component_data.fields[0].data == ["John Doe"]
+
+
+def test_get_data_transformer_returns_shared_instance() -> None:
+    assert get_data_transformer("table") is get_data_transformer("table")
+
+
+def test_generate_component_data_concurrently() -> None:
+    def transform(i: int) -> ComponentDataTable:
+        input_data = InputData(
+            id=f"id-{i}",
+            data=json.dumps([{"name": f"Name {i}-{j}"} for j in range(i + 1)]),
+        )
+        component = UIComponentMetadata.model_validate(
+            {
+                "id": f"id-{i}",
+                "title": f"Table {i}",
+                "component": "table",
+                "fields": [
+                    {"name": "Name", "data_path": "$..name"},
+                ],
+            }
+        )
+        return cast(ComponentDataTable, generate_component_data(input_data, component))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(transform, range(50)))
+
+    for i, component_data in enumerate(results):
+        assert component_data.id == f"id-{i}"
+        assert component_data.title == f"Table {i}"
+        assert component_data.fields[0].data == [f"Name {i}-{j}" for j in range(i + 1)]
+
+
+def test_generate_component_data_from_raw_input_data() -> None:
+    input_data = InputData(id="123", data="- name: John Doe\n- name: Jane Doe\n")
+    component = UIComponentMetadata.model_validate(
+        {
+            "id": "123",
+            "title": "People",
+            "component": "table",
+            "fields": [
+                {"name": "Name", "data_path": "$..people[*].name"},
+            ],
+            "json_wrapping_field_name": "people",
+        }
+    )
+    component_data = cast(
+        ComponentDataTable,
+        generate_component_data_from_raw_input_data(input_data, component, "yaml"),
+    )
+    assert component_data.fields[0].data == ["John Doe", "Jane Doe"]
+    # component metadata passed in are not changed
+    assert component.json_data is None
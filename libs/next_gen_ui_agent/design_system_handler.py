@@ -1,44 +1,110 @@
 import logging
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 from next_gen_ui_agent.data_transform.types import ComponentDataBase
+from next_gen_ui_agent.plugins import get_extension_manager, get_extension_obj
 from next_gen_ui_agent.renderer.base_renderer import RendererContext, StrategyFactory
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
-from next_gen_ui_agent.types import UIBlockRendering
-from stevedore import ExtensionManager
+from next_gen_ui_agent.types import AgentConfigJsonRenderer, UIBlockRendering
+
+if TYPE_CHECKING:
+    from next_gen_ui_agent.rendering_cache import RenderingCache
+    from stevedore import ExtensionManager
 
 logger = logging.getLogger(__name__)
 
 PLUGGABLE_RENDERERS_NAMESPACE = "next_gen_ui.agent.renderer_factory"
 
-EXTENSION_MANAGER = ExtensionManager(
-    namespace=PLUGGABLE_RENDERERS_NAMESPACE, invoke_on_load=True
-)
+DEFAULT_RENDERING_CHUNK_SIZE = 64 * 1024
+"""Default minimal size (number of characters) of the chunks of the streamed rendering."""
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 - stevedore `EXTENSION_MANAGER` is created on the first access, so renderer plugins are not loaded
+    # until a pluggable component system is used. It can be replaced, e.g. by `ExtensionManager.make_test_instance` in tests.
+    if name == "EXTENSION_MANAGER":
+        return get_extension_manager(PLUGGABLE_RENDERERS_NAMESPACE)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_extension_manager() -> "ExtensionManager":
+    manager = globals().get("EXTENSION_MANAGER")
+    if manager is None:
+        return get_extension_manager(PLUGGABLE_RENDERERS_NAMESPACE)
+    return manager
 
 
-def get_component_system_factory(component_system: str) -> StrategyFactory:
-    """Get the factory for the given component system name."""
+def get_component_system_factory(
+    component_system: str, json_renderer: Optional[AgentConfigJsonRenderer] = None
+) -> StrategyFactory:
+    """Get the factory for the given component system name. `json_renderer` configures the `json` component system."""
 
     if component_system == "json":
-        return JsonStrategyFactory()
-    elif component_system not in EXTENSION_MANAGER.names():
+        return JsonStrategyFactory(json_renderer)
+    extension_manager = _get_extension_manager()
+    if component_system not in extension_manager.names():
         raise ValueError(
             f"UI component system '{component_system}' is not found. "
             + "Make sure you install appropriate dependency."
         )
     else:
-        return EXTENSION_MANAGER[component_system].obj  # type: ignore
+        return get_extension_obj(  # type: ignore[no-any-return]
+            extension_manager[component_system]
+        )
 
 
 def get_component_system_names() -> list[str]:
     """Get the list of all supported/installed component system names."""
-    return ["json"] + EXTENSION_MANAGER.names()  # type: ignore
+    return ["json"] + _get_extension_manager().names()  # type: ignore
 
 
 def render_component(
     component: ComponentDataBase,
     factory: StrategyFactory,
+    cache: Optional["RenderingCache"] = None,
+) -> UIBlockRendering:
+    """
+    Render the component with the given UI renderer factory.
+    Rendering is reused from the `cache` if provided and the same component data were already rendered by the same renderer.
+    """
+    return render_component_systems(component, [factory], cache)[0]
+
+
+def render_component_systems(
+    component: ComponentDataBase,
+    factories: list[StrategyFactory],
+    cache: Optional["RenderingCache"] = None,
+) -> list[UIBlockRendering]:
+    """
+    Render the component with all the given UI renderer factories, renderings are returned in the order of the `factories`.
+    Renderings are reused from the `cache` if provided, digest of the component data is computed only once for all the factories.
+    """
+    digest = cache.get_digest(component) if cache else None
+    renderings = []
+    for factory in factories:
+        key = None
+        if cache and digest:
+            key = cache.get_key(component, factory, digest)
+        cached = cache.get(key) if cache else None
+        if cached:
+            logger.debug(
+                "Rendering of component %s by %s found in cache",
+                component.id,
+                factory.__class__.__name__,
+            )
+            renderings.append(cached)
+            continue
+        rendering = _render_component(component, factory)
+        if cache:
+            cache.put(key, rendering)
+        renderings.append(rendering)
+    return renderings
+
+
+def _render_component(
+    component: ComponentDataBase,
+    factory: StrategyFactory,
 ) -> UIBlockRendering:
-    """Render the component with the given UI renderer factory."""
     logger.debug(
         "\n\n---design_system_handler processing component id: %s with %s renderer",
         component.id,
@@ -61,3 +127,58 @@ def render_component(
     except Exception as e:
         logger.exception("There was an issue while rendering component template")
         raise e
+
+
+def render_component_stream(
+    component: ComponentDataBase,
+    factory: StrategyFactory,
+    chunk_size: int = DEFAULT_RENDERING_CHUNK_SIZE,
+) -> tuple[UIBlockRendering, Iterator[str]]:
+    """
+    Render the component with the given UI renderer factory in chunks, so large components are not built in memory as a whole.
+    Returns `UIBlockRendering` with empty `content` and iterator of the content chunks.
+    Small chunks generated by the renderer are joined to chunks of at least `chunk_size` characters (except the last one).
+
+    Raises ValueError immediately if the component is not supported by the renderer,
+    rendering errors are raised when the chunks are iterated.
+    """
+    logger.debug(
+        "\n\n---design_system_handler streaming component id: %s with %s renderer",
+        component.id,
+        factory.__class__.__name__,
+    )
+    try:
+        renderer = RendererContext(factory.get_render_strategy(component))
+    except ValueError as e:
+        logger.exception("Component selection used non-supported component name")
+        raise e
+    rendering = UIBlockRendering(
+        id=component.id,
+        content="",
+        component_system=factory.get_component_system_name(),
+        mime_type=factory.get_output_mime_type(),
+    )
+    return rendering, _join_chunks(
+        component.id, renderer.render_stream(component), chunk_size
+    )
+
+
+def _join_chunks(
+    component_id: str, chunks: Iterator[str], chunk_size: int
+) -> Iterator[str]:
+    buffer: list[str] = []
+    buffer_size = 0
+    try:
+        for chunk in chunks:
+            buffer.append(chunk)
+            buffer_size += len(chunk)
+            if buffer_size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffer_size = 0
+    except Exception as e:
+        logger.exception("There was an issue while rendering component template")
+        raise e
+    if buffer:
+        yield "".join(buffer)
+    logger.debug("Streamed rendering of component %s", component_id)
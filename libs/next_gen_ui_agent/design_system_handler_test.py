@@ -6,9 +6,12 @@ from next_gen_ui_agent.design_system_handler import (
     get_component_system_factory,
     get_component_system_names,
     render_component,
+    render_component_stream,
+    render_component_systems,
 )
 from next_gen_ui_agent.renderer.base_renderer import RenderStrategyBase, StrategyFactory
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.rendering_cache import RenderingCache
 from next_gen_ui_agent.types import UIBlockRendering
 
 
@@ -154,3 +157,120 @@ class TestRenderComponent:
         # The content should be valid JSON
         assert isinstance(result.content, str)
         assert "test-id-456" in result.content or "one-card" in result.content
+
+    def test_render_component_with_cache(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id-456")
+        factory = JsonStrategyFactory()
+        cache = RenderingCache()
+
+        with patch.object(
+            JsonStrategyFactory,
+            "get_render_strategy",
+            wraps=factory.get_render_strategy,
+        ) as get_render_strategy:
+            result = render_component(component, factory, cache)
+            cached = render_component(component.model_copy(), factory, cache)
+
+        get_render_strategy.assert_called_once()
+        assert cached == result
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+
+class TestRenderComponentSystems:
+    """Tests for render_component_systems function."""
+
+    def test_render_component_systems(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id-456")
+        mock_factory = Mock(spec=StrategyFactory)
+        mock_factory.get_component_system_name.return_value = "rhds"
+        mock_factory.get_output_mime_type.return_value = "text/html"
+        mock_factory.get_renderer_version.return_value = "1"
+        mock_strategy = Mock(spec=RenderStrategyBase)
+        mock_strategy.render.return_value = "<div>rendered</div>"
+        mock_factory.get_render_strategy.return_value = mock_strategy
+        cache = RenderingCache()
+
+        with patch.object(cache, "get_digest", wraps=cache.get_digest) as get_digest:
+            results = render_component_systems(
+                component, [JsonStrategyFactory(), mock_factory], cache
+            )
+            get_digest.assert_called_once()
+
+        assert [r.component_system for r in results] == ["json", "rhds"]
+        assert results[1].content == "<div>rendered</div>"
+        assert results[0] == render_component(component, JsonStrategyFactory())
+        assert cache.get_stats()["entries"] == 2
+
+    def test_render_component_systems_without_cache(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id-456")
+        results = render_component_systems(
+            component, [JsonStrategyFactory(), JsonStrategyFactory()]
+        )
+        assert results == [render_component(component, JsonStrategyFactory())] * 2
+
+
+class TestRenderComponentStream:
+    """Tests for render_component_stream function."""
+
+    def test_render_component_stream_joins_chunks(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id-123")
+
+        mock_strategy = Mock(spec=RenderStrategyBase)
+        mock_strategy.render_stream.return_value = iter(["ab", "c", "defg", "h", "i"])
+
+        mock_factory = Mock(spec=StrategyFactory)
+        mock_factory.get_render_strategy.return_value = mock_strategy
+        mock_factory.get_component_system_name.return_value = "json"
+        mock_factory.get_output_mime_type.return_value = "application/json"
+
+        rendering, chunks = render_component_stream(
+            component, mock_factory, chunk_size=3
+        )
+
+        assert rendering == UIBlockRendering(
+            id="test-id-123",
+            content="",
+            component_system="json",
+            mime_type="application/json",
+        )
+        assert list(chunks) == ["abc", "defg", "hi"]
+
+    def test_render_component_stream_value_error(self) -> None:
+        """Unsupported component is reported before the streaming starts."""
+        component = ComponentDataBase(component="invalid-component", id="test-id")
+
+        mock_factory = Mock(spec=StrategyFactory)
+        mock_factory.get_render_strategy.side_effect = ValueError(
+            "Component not supported"
+        )
+
+        with pytest.raises(ValueError, match="Component not supported"):
+            render_component_stream(component, mock_factory)
+
+    def test_render_component_stream_general_exception(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id")
+
+        def failing_stream():
+            yield "a"
+            raise RuntimeError("Rendering failed")
+
+        mock_strategy = Mock(spec=RenderStrategyBase)
+        mock_strategy.render_stream.return_value = failing_stream()
+
+        mock_factory = Mock(spec=StrategyFactory)
+        mock_factory.get_render_strategy.return_value = mock_strategy
+        mock_factory.get_component_system_name.return_value = "json"
+        mock_factory.get_output_mime_type.return_value = "application/json"
+
+        _, chunks = render_component_stream(component, mock_factory)
+        with pytest.raises(RuntimeError, match="Rendering failed"):
+            list(chunks)
+
+    def test_render_component_stream_with_json_factory(self) -> None:
+        component = ComponentDataBase(component="one-card", id="test-id-456")
+        factory = JsonStrategyFactory()
+
+        _, chunks = render_component_stream(component, factory)
+
+        assert list(chunks) == [render_component(component, factory).content]
@@ -0,0 +1,163 @@
+import logging
+import mmap
+from typing import Any, Callable, Optional, cast
+
+from next_gen_ui_agent.data_structure_tools import map_input_data_file
+from next_gen_ui_agent.json_data_wrapper import wrap_data
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataLimitApplied,
+    get_input_data_size,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InputDataContext:
+    """
+    Context of the processing of one `InputData` shared by all the agent's processing steps
+    (`select_component` → `transform_data` → `construct_UIBlockConfiguration`, or `refresh_component`).
+
+    It owns the raw input data and the object tree parsed from it by the `input data transformation`,
+    so the input data are parsed only once per request. Pass the same instance to all the processing steps.
+
+    `InputData.data_file` is memory-mapped only once for all the processing steps, see `mapped_input_data`.
+    Close the context when the processing is done (use it as a context manager, or call `close()`), so the file is unmapped.
+    """
+
+    input_data: InputData
+    """Raw input data."""
+
+    json_data: Any
+    """Object tree parsed from the `input_data` by the `input data transformation`, before `JSON Wrapping`. `None` if not parsed yet."""
+
+    input_data_transformer_name: Optional[str]
+    """Name of the input data transformer used to parse `json_data`. `None` if not parsed yet."""
+
+    json_wrapping_field_name: Optional[str]
+    """Name of the field used for `JSON Wrapping`, `None` if `JSON Wrapping` was not performed."""
+
+    input_data_total_count: Optional[int]
+    """Total number of rows in the input data if they were truncated during the `input data transformation`, `None` if not truncated."""
+
+    input_data_limits_applied: list[InputDataLimitApplied]
+    """Input data limits applied during the `input data transformation`, empty if no limit was applied."""
+
+    is_transformed: bool
+    """`True` if the `input data transformation` has been already performed and `json_data` is filled."""
+
+    def __init__(self, input_data: InputData):
+        self.input_data = input_data
+        self.json_data = None
+        self.input_data_transformer_name = None
+        self.json_wrapping_field_name = None
+        self.input_data_total_count = None
+        self.input_data_limits_applied = []
+        self.is_transformed = False
+        self._derived: dict[str, Any] = {}
+        self._mapped_input_data: Optional[InputData] = None
+        self._mapped_content: Optional[bytes | mmap.mmap] = None
+
+    def __enter__(self) -> "InputDataContext":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the memory-mapped `InputData.data_file`, if it was mapped. Parsed `json_data` stay available."""
+        content = self._mapped_content
+        self._mapped_input_data = None
+        self._mapped_content = None
+        if isinstance(content, mmap.mmap):
+            try:
+                content.close()
+            except BufferError:
+                # buffer is still exported (e.g. zero-copy view held by a parser), it's unmapped when garbage collected
+                logger.debug("Memory-mapped input data '%s' still in use", self.id)
+
+    @property
+    def mapped_input_data(self) -> InputData:
+        """
+        `input_data` to be parsed - with the `InputData.data_file` memory-mapped into the `data`, so the file is mapped only once
+        for all the processing steps and the input data format detection. The same `input_data` if `data_file` is not set.
+
+        Raises:
+            OSError: If the `InputData.data_file` can't be read.
+        """
+        data_file = self.input_data.get("data_file")
+        if not data_file:
+            return self.input_data
+        if self._mapped_input_data is None:
+            self._mapped_content = map_input_data_file(data_file)
+            # memory-mapped file supports the same slicing and searching as `bytes`
+            self._mapped_input_data = cast(
+                InputData,
+                {**self.input_data, "data": self._mapped_content, "data_file": None},
+            )
+        return self._mapped_input_data
+
+    @classmethod
+    def of(cls, input_data: "InputData | InputDataContext") -> "InputDataContext":
+        """Get context for input data - the same instance is returned if context is passed in."""
+        if isinstance(input_data, InputDataContext):
+            return input_data
+        return cls(input_data)
+
+    @property
+    def id(self) -> str:
+        """ID of the input data."""
+        return self.input_data["id"]
+
+    @property
+    def data(self) -> str | bytes:
+        """Raw input data string (or bytes), empty if the data are passed in the `InputData.data_file`."""
+        return self.input_data["data"]
+
+    @property
+    def data_size(self) -> int:
+        """Size of the raw input data - length of the `data`, or size of the `InputData.data_file` in bytes."""
+        return get_input_data_size(self.input_data)
+
+    @property
+    def data_type(self) -> Optional[str]:
+        """Optional type of the input data."""
+        return self.input_data.get("type")
+
+    def set_transformed(
+        self,
+        json_data: Any,
+        input_data_transformer_name: str,
+        input_data_total_count: Optional[int] = None,
+        input_data_limits_applied: Optional[list[InputDataLimitApplied]] = None,
+    ) -> None:
+        """Store result of the `input data transformation`. Clears all the data derived from the previous `json_data`."""
+        self.json_data = json_data
+        self.input_data_transformer_name = input_data_transformer_name
+        self.input_data_total_count = input_data_total_count
+        self.input_data_limits_applied = input_data_limits_applied or []
+        self.json_wrapping_field_name = None
+        self.is_transformed = True
+        self._derived.clear()
+
+    def set_json_wrapping(self, json_wrapping_field_name: Optional[str]) -> None:
+        """Store name of the field used for `JSON Wrapping` of the `json_data`."""
+        if json_wrapping_field_name != self.json_wrapping_field_name:
+            self.json_wrapping_field_name = json_wrapping_field_name
+            self._derived.pop("wrapped_json_data", None)
+
+    @property
+    def wrapped_json_data(self) -> Any:
+        """`json_data` with `JSON Wrapping` applied if it was performed. Data paths in the component configuration point to this structure."""
+        return self.get_derived(
+            "wrapped_json_data",
+            lambda: wrap_data(self.json_data, self.json_wrapping_field_name),
+        )
+
+    def get_derived(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get value derived from the `json_data` (eg. index or reduced data for LLM), computed by `factory` on the first use only.
+        """
+        if key not in self._derived:
+            self._derived[key] = factory()
+        return self._derived[key]
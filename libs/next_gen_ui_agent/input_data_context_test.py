@@ -0,0 +1,90 @@
+import mmap
+from typing import cast
+
+from next_gen_ui_agent.input_data_context import InputDataContext
+from next_gen_ui_agent.types import InputData
+
+
+def test_of_returns_same_context() -> None:
+    ctx = InputDataContext(InputData(id="1", data="[]"))
+    assert InputDataContext.of(ctx) is ctx
+
+
+def test_of_creates_context_for_input_data() -> None:
+    input_data = InputData(id="1", data='{"a": 1}', type="my_type")
+    ctx = InputDataContext.of(input_data)
+    assert ctx.input_data is input_data
+    assert ctx.id == "1"
+    assert ctx.data == '{"a": 1}'
+    assert ctx.data_type == "my_type"
+    assert ctx.is_transformed is False
+    assert ctx.json_data is None
+
+
+def test_data_size() -> None:
+    assert InputDataContext(InputData(id="1", data="[1, 2]")).data_size == 6
+    assert InputDataContext(InputData(id="1", data="ž".encode())).data_size == 2
+
+
+def test_data_size_data_file(tmp_path) -> None:
+    path = tmp_path / "data.json"
+    path.write_text("[1, 2, 3]")
+    ctx = InputDataContext(InputData(id="1", data="", data_file=str(path)))
+    assert ctx.data == ""
+    assert ctx.data_size == 9
+
+
+def test_wrapped_json_data() -> None:
+    ctx = InputDataContext(InputData(id="1", data="[1]"))
+    ctx.set_transformed([1], "json")
+    assert ctx.wrapped_json_data == [1]
+
+    ctx.set_json_wrapping("my_type")
+    assert ctx.wrapped_json_data == {"my_type": [1]}
+    assert ctx.wrapped_json_data["my_type"] is ctx.json_data
+
+
+def test_derived_values_computed_once_and_cleared_on_new_data() -> None:
+    ctx = InputDataContext(InputData(id="1", data="[1]"))
+    ctx.set_transformed([1], "json")
+
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return len(ctx.json_data)
+
+    assert ctx.get_derived("len", factory) == 1
+    assert ctx.get_derived("len", factory) == 1
+    assert len(calls) == 1
+
+    ctx.set_transformed([1, 2], "json")
+    assert ctx.get_derived("len", factory) == 2
+    assert len(calls) == 2
+
+
+def test_mapped_input_data_without_data_file() -> None:
+    input_data = InputData(id="1", data="[1]")
+    with InputDataContext(input_data) as ctx:
+        assert ctx.mapped_input_data is input_data
+
+
+def test_mapped_input_data_mapped_once_and_closed(tmp_path) -> None:
+    path = tmp_path / "data.json"
+    path.write_text("[1, 2, 3]")
+    input_data = InputData(id="1", data="", data_file=str(path))
+    with InputDataContext(input_data) as ctx:
+        mapped = ctx.mapped_input_data
+        assert mapped["data"][:] == b"[1, 2, 3]"
+        assert mapped.get("data_file") is None
+        assert mapped["id"] == "1"
+        assert ctx.mapped_input_data is mapped
+        content = cast(mmap.mmap, mapped["data"])
+
+    assert content.closed
+    assert ctx.input_data is input_data
+
+    # mapped again when used after close
+    assert ctx.mapped_input_data["data"][:] == b"[1, 2, 3]"
+    ctx.close()
+    ctx.close()
@@ -0,0 +1,225 @@
+import base64
+import importlib.util
+from functools import cache
+from typing import Any, Literal, Optional
+
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataContent,
+    InputDataSample,
+    sanitize_field_name,
+)
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
+
+ARROW_FILE_MAGIC = b"ARROW1"
+"""Magic bytes at the beginning of the Arrow IPC file format."""
+
+ARROW_STREAM_CONTINUATION = b"\xff\xff\xff\xff"
+"""Continuation marker at the beginning of the Arrow IPC stream format."""
+
+PARQUET_MAGIC = b"PAR1"
+"""Magic bytes at the beginning of the Parquet file."""
+
+MAGIC_SIZE = max(
+    len(ARROW_FILE_MAGIC), len(ARROW_STREAM_CONTINUATION), len(PARQUET_MAGIC)
+)
+
+
+@cache
+def _is_pyarrow_available() -> bool:
+    """Check if `pyarrow` is installed, without importing it."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore # pants: no-infer-dep
+        import pyarrow.ipc  # type: ignore # pants: no-infer-dep
+        import pyarrow.parquet  # type: ignore # pants: no-infer-dep
+    except ImportError as e:
+        raise ImportError(
+            "Apache Arrow dependencies not found. Install with: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+class ArrowInputDataTransformer(InputDataTransformerBase):
+    """
+    Input Data transformer from Apache Arrow IPC (file or stream format) or Apache Parquet columnar data,
+    passed base64 encoded in the `InputData.data` string, or raw binary in `InputData.data` bytes or `InputData.data_file`.
+    Only raw binary data are auto-detected. Requires optional `pyarrow` dependency.
+    """
+
+    TRANSFORMER_NAME = "arrow"
+
+    TRANSFORMER_NAME_LITERAL = Literal["arrow"]
+
+    TRANSFORMS_BINARY_CONTENT = True
+
+    BATCH_SIZE = 65536
+    """Maximal number of rows read from Parquet at once."""
+
+    def transform(self, input_data: InputDataContent) -> Any:
+        """
+        Transform the input data into the object tree matching parsed JSON format.
+
+        Column names are sanitized the same way as CSV headers, values not representable in JSON are converted:
+        - date/time values into ISO strings
+        - decimal numbers into float
+        - binary values into base64 encoded strings
+
+        Args:
+            input_data: Base64 encoded Arrow IPC or Parquet data.
+        Returns:
+            Object tree matching parsed JSON format (list of dicts, one for each row), so `jsonpath_ng` can be used
+            to access the data, and Pydantic `model_dump_json()` can be used to convert it to JSON string.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format.
+            ImportError: If `pyarrow` is not installed.
+        """
+        return self.transform_rows(input_data, None)[0]
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """Transform the input data with at most `max_rows` rows, see `transform_rows`."""
+        return self.transform_rows(self.get_content(input_data), max_rows)
+
+    def transform_rows(
+        self, input_data: InputDataContent, max_rows: Optional[int]
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        Transform the input data into the list of row dicts, see `transform`.
+
+        Columnar data are read without copying, and Python dicts are built only for `max_rows` rows.
+        Total number of rows is taken from the data metadata.
+
+        Args:
+            input_data: Base64 encoded Arrow IPC or Parquet data, or raw binary data (`bytes` or memory-mapped file).
+            max_rows: Maximal number of rows to transform, `None` for no limit.
+        Returns:
+            * List of row dicts.
+            * Total number of rows in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format.
+            ImportError: If `pyarrow` is not installed.
+        """
+        pa = _import_pyarrow()
+        try:
+            data = input_data
+            if isinstance(data, str) or not data[:MAGIC_SIZE].startswith(
+                (ARROW_FILE_MAGIC, ARROW_STREAM_CONTINUATION, PARQUET_MAGIC)
+            ):
+                data = base64.b64decode(data)
+            # bytes and memory-mapped file are wrapped without copying
+            buffer = pa.py_buffer(data)
+            magic = data[:MAGIC_SIZE]
+            if magic.startswith(PARQUET_MAGIC):
+                table, total_count = self._read_parquet(pa, buffer, max_rows)
+            elif magic.startswith(ARROW_FILE_MAGIC):
+                reader = pa.ipc.open_file(buffer)
+                batches = (
+                    reader.get_batch(i) for i in range(reader.num_record_batches)
+                )
+                table, total_count = self._read_batches(
+                    pa, reader.schema, batches, max_rows
+                )
+            else:
+                reader = pa.ipc.open_stream(buffer)
+                table, total_count = self._read_batches(
+                    pa, reader.schema, reader, max_rows
+                )
+            table = self._to_json_compatible(pa, table)
+        except (ValueError, pa.ArrowException) as e:
+            raise ValueError(f"Invalid Arrow format of the Input Data: {e}") from e
+
+        parsed_data = table.to_pylist()
+        if total_count > len(parsed_data):
+            return parsed_data, total_count
+        return parsed_data, None
+
+    def _read_parquet(
+        self, pa: Any, buffer: Any, max_rows: Optional[int]
+    ) -> tuple[Any, int]:
+        """Read at most `max_rows` rows from the Parquet data, only needed row groups are decoded."""
+        parquet_file = pa.parquet.ParquetFile(pa.BufferReader(buffer))
+        total_count = parquet_file.metadata.num_rows
+        if max_rows is None:
+            return parquet_file.read(), total_count
+        batches = parquet_file.iter_batches(batch_size=min(max_rows, self.BATCH_SIZE))
+        table, _ = self._read_batches(pa, parquet_file.schema_arrow, batches, max_rows)
+        return table, total_count
+
+    def _read_batches(
+        self, pa: Any, schema: Any, batches: Any, max_rows: Optional[int]
+    ) -> tuple[Any, int]:
+        """Collect record batches up to `max_rows` rows, rest of the batches is only counted."""
+        selected = []
+        selected_rows = 0
+        total_count = 0
+        for batch in batches:
+            total_count += batch.num_rows
+            if max_rows is None or selected_rows < max_rows:
+                if max_rows is not None and selected_rows + batch.num_rows > max_rows:
+                    batch = batch.slice(0, max_rows - selected_rows)
+                selected.append(batch)
+                selected_rows += batch.num_rows
+        return pa.Table.from_batches(selected, schema=schema), total_count
+
+    def _to_json_compatible(self, pa: Any, table: Any) -> Any:
+        """Sanitize column names and convert columns with values not representable in JSON."""
+        columns = []
+        names = []
+        for index, field in enumerate(table.schema):
+            name = sanitize_field_name(field.name)
+            if not name:
+                name = f"field_{index}"
+            column = table.column(index)
+            field_type = field.type
+            if pa.types.is_dictionary(field_type):
+                column = column.cast(field_type.value_type)
+                field_type = field_type.value_type
+            if pa.types.is_temporal(field_type):
+                column = column.cast(pa.string())
+            elif pa.types.is_decimal(field_type):
+                column = column.cast(pa.float64())
+            elif (
+                pa.types.is_binary(field_type)
+                or pa.types.is_large_binary(field_type)
+                or pa.types.is_fixed_size_binary(field_type)
+            ):
+                column = pa.array(
+                    [
+                        base64.b64encode(value).decode() if value is not None else None
+                        for value in column.to_pylist()
+                    ],
+                    pa.string(),
+                )
+            columns.append(column)
+            names.append(name)
+        return pa.Table.from_arrays(columns, names=names)
+
+    def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data looks like Arrow IPC or Parquet data."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
+        """
+        Detect if input data are raw binary Arrow IPC or Parquet data, by the magic bytes of the formats at the beginning of the data.
+        Base64 encoded data are not detected, as short base64 prefixes match ordinary text too, the transformer has to be configured for them.
+        Never detected if `pyarrow` is not installed, so the data are left for the other transformers.
+        """
+        return (
+            sample.binary_prefix is not None
+            and sample.binary_prefix.startswith(
+                (ARROW_FILE_MAGIC, ARROW_STREAM_CONTINUATION, PARQUET_MAGIC)
+            )
+            and _is_pyarrow_available()
+        )
@@ -0,0 +1,182 @@
+import base64
+import datetime
+import decimal
+import io
+import sys
+
+import pytest
+from next_gen_ui_agent.input_data_transform import arrow_input_data_transformer
+from next_gen_ui_agent.input_data_transform.arrow_input_data_transformer import (
+    ArrowInputDataTransformer,
+)
+from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    get_auto_detected_transformer_name,
+)
+from next_gen_ui_agent.types import InputData
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def create_table():
+    return pa.table(
+        {
+            "Movie Title": ["Toy Story", "Jumanji", "Heat"],
+            "year": [1995, 1995, 1995],
+            "released": [datetime.date(1995, 11, 22)] * 3,
+            "price": pa.array([decimal.Decimal("9.99")] * 3, pa.decimal128(5, 2)),
+            "poster": [b"img", None, b"img"],
+            "genre": pa.array(["Animation", "Adventure", "Crime"]).dictionary_encode(),
+            "actors": [["Tom Hanks"], [], ["Al Pacino", "Robert De Niro"]],
+        }
+    )
+
+
+EXPECTED_ROWS = [
+    {
+        "Movie_Title": "Toy Story",
+        "year": 1995,
+        "released": "1995-11-22",
+        "price": 9.99,
+        "poster": "aW1n",
+        "genre": "Animation",
+        "actors": ["Tom Hanks"],
+    },
+    {
+        "Movie_Title": "Jumanji",
+        "year": 1995,
+        "released": "1995-11-22",
+        "price": 9.99,
+        "poster": None,
+        "genre": "Adventure",
+        "actors": [],
+    },
+    {
+        "Movie_Title": "Heat",
+        "year": 1995,
+        "released": "1995-11-22",
+        "price": 9.99,
+        "poster": "aW1n",
+        "genre": "Crime",
+        "actors": ["Al Pacino", "Robert De Niro"],
+    },
+]
+
+
+def encode_arrow_stream(table) -> str:
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=1):
+            writer.write_batch(batch)
+    return base64.b64encode(sink.getvalue()).decode()
+
+
+def encode_arrow_file(table) -> str:
+    sink = io.BytesIO()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=2):
+            writer.write_batch(batch)
+    return base64.b64encode(sink.getvalue()).decode()
+
+
+def encode_parquet(table) -> str:
+    sink = io.BytesIO()
+    pq.write_table(table, sink, row_group_size=1)
+    return base64.b64encode(sink.getvalue()).decode()
+
+
+ENCODERS = [encode_arrow_stream, encode_arrow_file, encode_parquet]
+
+
+class TestArrowInputDataTransformer:
+    """Test cases for Apache Arrow / Parquet input data transformer."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.transformer = ArrowInputDataTransformer()
+
+    def test_transformer_name(self) -> None:
+        assert self.transformer.TRANSFORMER_NAME == "arrow"
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_transform(self, encode) -> None:
+        result = self.transformer.transform(encode(create_table()))
+        assert result == EXPECTED_ROWS
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_transform_rows_max_rows(self, encode) -> None:
+        result, total_count = self.transformer.transform_rows(encode(create_table()), 2)
+        assert result == EXPECTED_ROWS[:2]
+        assert total_count == 3
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_transform_rows_max_rows_not_exceeded(self, encode) -> None:
+        result, total_count = self.transformer.transform_rows(encode(create_table()), 3)
+        assert result == EXPECTED_ROWS
+        assert total_count is None
+
+    def test_transform_rows_bytes(self) -> None:
+        data = base64.b64decode(encode_parquet(create_table()))
+        result, total_count = self.transformer.transform_rows(data, 1)
+        assert result == EXPECTED_ROWS[:1]
+        assert total_count == 3
+
+    def test_transform_input_data_with_max_rows(self) -> None:
+        input_data = InputData(id="1", data=encode_arrow_stream(create_table()))
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            input_data, 1
+        )
+        assert result == EXPECTED_ROWS[:1]
+        assert total_count == 3
+
+    def test_transform_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid Arrow format of the Input Data"):
+            self.transformer.transform("QVJST1cxAAAA")
+        with pytest.raises(ValueError, match="Invalid Arrow format of the Input Data"):
+            self.transformer.transform("not base64 !")
+
+    def test_transform_missing_pyarrow(self, monkeypatch) -> None:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            self.transformer.transform(encode_parquet(create_table()))
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_detect_base64_not_detected(self, encode) -> None:
+        input_data = InputData(id="1", data=encode(create_table()))
+        assert self.transformer.detect_my_data_structure(input_data) is False
+        assert get_auto_detected_transformer_name(input_data) != "arrow"
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_transform_and_detect_raw_bytes(self, encode, tmp_path) -> None:
+        data = base64.b64decode(encode(create_table()))
+        data_file = tmp_path / "data"
+        data_file.write_bytes(data)
+        for input_data in [
+            InputData(id="1", data=data),
+            InputData(id="1", data="", data_file=str(data_file)),
+        ]:
+            assert self.transformer.transform_input_data(input_data) == EXPECTED_ROWS
+            assert get_auto_detected_transformer_name(input_data) == "arrow"
+
+    def test_detect_invalid(self) -> None:
+        for data in [
+            "",
+            '{"a": 1}',
+            "name,age\nJohn,30",
+            "QVJ",
+            # ordinary text starting with base64 encoded magic bytes
+            "QVJST1cx is not an Arrow file",
+            "UEFSMy report",
+            "/////",
+        ]:
+            input_data = InputData(id="1", data=data)
+            assert self.transformer.detect_my_data_structure(input_data) is False
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    def test_detect_missing_pyarrow(self, encode, monkeypatch) -> None:
+        monkeypatch.setattr(
+            arrow_input_data_transformer, "_is_pyarrow_available", lambda: False
+        )
+        input_data = InputData(id="1", data=base64.b64decode(encode(create_table())))
+        assert self.transformer.detect_my_data_structure(input_data) is False
+        assert get_auto_detected_transformer_name(input_data) != "arrow"
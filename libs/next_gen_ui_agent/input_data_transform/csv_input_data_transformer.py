@@ -1,14 +1,31 @@
 import csv
-from io import StringIO
-from typing import Any, Literal
-
-from next_gen_ui_agent.data_structure_tools import sanitize_field_name, transform_value
-from next_gen_ui_agent.types import InputData, InputDataTransformerBase
+from itertools import chain, islice
+from typing import Any, Literal, Optional
+
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataContent,
+    InputDataSample,
+    ValueTransformer,
+    get_column_value_transformer,
+    get_lines_prefix,
+    iter_lines,
+    sanitize_field_name,
+)
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
 
 
 class CsvInputDataTransformer(InputDataTransformerBase):
     """Input Data transformer from CSV format with configurable delimiter."""
 
+    TRANSFORMS_BINARY_CONTENT = True
+
+    COLUMN_TYPE_SAMPLE_ROWS = 100
+    """Number of the first rows used to infer type of the column values."""
+
     def __init__(self, delimiter: str = ",") -> None:
         """
         Initialize the CSV transformer with a specific delimiter.
@@ -17,7 +34,7 @@ class CsvInputDataTransformer(InputDataTransformerBase):
         """
         self.delimiter = delimiter
 
-    def transform(self, input_data: str) -> Any:
+    def transform(self, input_data: InputDataContent) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
 
@@ -26,6 +43,9 @@ class CsvInputDataTransformer(InputDataTransformerBase):
         - Headers starting with numbers or hyphens get "field_" prefix
         - This ensures headers work with jsonpath_ng dot notation
 
+        Headers are sanitized only once, and values are transformed by transformers specialised for the column type
+        inferred from the first `COLUMN_TYPE_SAMPLE_ROWS` rows, giving the same result as `transform_value`.
+
         Args:
             input_data: Input data string to transform (CSV format with headers).
         Returns:
@@ -34,42 +54,114 @@ class CsvInputDataTransformer(InputDataTransformerBase):
         Raises:
             ValueError: If the input data can't be parsed due to invalid format or if the CSV is empty.
         """
+        return self.transform_rows(input_data, None)[0]
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """Transform the input data with at most `max_rows` rows, see `transform_rows`."""
+        return self.transform_rows(self.get_content(input_data), max_rows)
+
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """Transform complete rows in the first `max_size` characters/bytes of the input data."""
+        return self.transform(get_lines_prefix(self.get_content(input_data), max_size))
+
+    def transform_rows(
+        self, input_data: InputDataContent, max_rows: Optional[int]
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        Transform the input data into the list of row dicts, see `transform`.
+
+        Rows are parsed lazily from the input data string, so only `max_rows` rows are transformed and held in memory,
+        rest of the rows is only counted.
+
+        Args:
+            input_data: Input data string to transform (CSV format with headers).
+            max_rows: Maximal number of rows to transform, `None` for no limit.
+        Returns:
+            * List of row dicts.
+            * Total number of rows in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format.
+        """
         try:
-            # Parse CSV using DictReader which treats first row as headers
-            csv_reader = csv.DictReader(StringIO(input_data), delimiter=self.delimiter)
+            csv_reader = csv.reader(iter_lines(input_data), delimiter=self.delimiter)
+            # First row contains headers
+            header = next(csv_reader, None)
+            if header is None:
+                return [], None
+            # Empty rows are skipped
+            rows = (row for row in csv_reader if row)
+            sample_size = self.COLUMN_TYPE_SAMPLE_ROWS
+            if max_rows is not None:
+                sample_size = min(sample_size, max_rows)
+            sample_rows = list(islice(rows, sample_size))
+            columns = self._get_columns(header, sample_rows)
+            header_length = len(header)
             parsed_data = []
-            for row in csv_reader:
-                # Sanitize field names and transform values
-                sanitized_row = {}
-                for key, value in row.items():
-                    sanitized_key = sanitize_field_name(key)
-                    if sanitized_key:  # Only include if sanitization didn't return None
-                        sanitized_row[sanitized_key] = transform_value(value)
-                parsed_data.append(sanitized_row)
+            for row in islice(chain(sample_rows, rows), max_rows):
+                if len(row) < header_length:
+                    # Missing trailing values
+                    row = row + [""] * (header_length - len(row))
+                parsed_data.append(
+                    {
+                        sanitized_key: transformer(row[index])
+                        for sanitized_key, index, transformer in columns
+                    }
+                )
+            # Rest of the rows over `max_rows` is only counted
+            skipped_rows = sum(1 for _ in rows)
         except csv.Error as e:
             raise ValueError(f"Invalid CSV format of the Input Data: {e}") from e
 
-        return parsed_data
+        if skipped_rows:
+            return parsed_data, len(parsed_data) + skipped_rows
+        return parsed_data, None
+
+    def _get_columns(
+        self, header: list[str], sample_rows: list[list[str]]
+    ) -> list[tuple[str, int, ValueTransformer]]:
+        """
+        Get sanitized field name, index of the column in the row and value transformer specialised for the column type,
+        for all the columns to be included in the output. Headers are sanitized once for whole CSV.
+        """
+        # If header is duplicated, the last column with it is used on the position of the first one
+        header_indexes = {field_name: index for index, field_name in enumerate(header)}
+        columns: dict[str, tuple[str, int, ValueTransformer]] = {}
+        for field_name, index in header_indexes.items():
+            sanitized_key = sanitize_field_name(field_name)
+            if sanitized_key:  # Only include if sanitization didn't return None
+                transformer = get_column_value_transformer(
+                    row[index] if index < len(row) else None for row in sample_rows
+                )
+                columns[sanitized_key] = (sanitized_key, index, transformer)
+        return list(columns.values())
 
     def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data looks like CSV using heuristics."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
         """
         Detect if input data looks like CSV using heuristics.
         Checks first 1KB for delimiter patterns without parsing.
         """
-        data_str = input_data["data"].strip()
-        if not data_str:
+        if sample.is_empty:
             return False
 
         # Should NOT look like JSON or YAML. Just basic checks to avoid false positives.
-        first_char = data_str[0]
+        first_char = sample.prefix[0]
         if first_char in ("{", "["):  # JSON
             return False
-        if data_str.startswith("---"):  # YAML document marker
+        if sample.prefix.startswith("---"):  # YAML document marker
             return False
 
-        # Get first 1KB to check structure (should cover first few lines)
-        sample = data_str[:1024]
-        lines = [line for line in sample.splitlines() if line.strip()]
+        # First 1KB is used to check structure (should cover first few lines)
+        lines = sample.lines
 
         if len(lines) < 2:
             return False
@@ -177,6 +177,87 @@ Jane,25,Boston"""
         assert result[0]["city"] is None
         assert result[1]["city"] == "Boston"
 
+    def test_transform_duplicate_and_colliding_headers(self) -> None:
+        """Test the last column is used for duplicated headers, on the position of the first one."""
+        input_data = """a,b,a,c d,c_d,c d
+1,2,3,4,5,6"""
+
+        result = self.transformer.transform(input_data)
+
+        assert result == [{"a": 3, "b": 2, "c_d": 5}]
+        assert list(result[0].keys()) == ["a", "b", "c_d"]
+
+    def test_transform_with_more_fields_than_headers(self) -> None:
+        """Test values without header are ignored."""
+        input_data = """name,age
+John,30,extra,values
+Jane"""
+
+        result = self.transformer.transform(input_data)
+
+        assert result == [{"name": "John", "age": 30}, {"name": "Jane", "age": None}]
+
+    def test_transform_value_types_changed_after_sample_rows(self) -> None:
+        """Test values not matching column type inferred from the sample rows are transformed correctly."""
+        self.transformer.COLUMN_TYPE_SAMPLE_ROWS = 2
+        input_data = """id,rating,name
+1,1.5,John
+2,2.5,Jane
+x,3,true
+4.5,,42
+,nan,  Joe  """
+
+        result = self.transformer.transform(input_data)
+
+        assert result == [
+            {"id": 1, "rating": 1.5, "name": "John"},
+            {"id": 2, "rating": 2.5, "name": "Jane"},
+            {"id": "x", "rating": 3, "name": True},
+            {"id": 4.5, "rating": None, "name": 42},
+            {"id": None, "rating": "nan", "name": "Joe"},
+        ]
+        assert isinstance(result[2]["rating"], int)
+
+    def test_transform_rows_max_rows(self) -> None:
+        """Test rows over max rows are only counted, including rows with multiline values."""
+        input_data = """name,age
+John,30
+
+Jane,25
+Jack,"multi
+line"
+Jill,40
+"""
+
+        result, total_count = self.transformer.transform_rows(input_data, 2)
+
+        assert result == [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}]
+        assert total_count == 4
+
+    def test_transform_rows_max_rows_not_exceeded(self) -> None:
+        """Test total count is not provided if rows are not truncated."""
+        input_data = """name,age
+John,30
+Jane,25"""
+
+        assert self.transformer.transform_rows(input_data, 2) == (
+            [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}],
+            None,
+        )
+        assert self.transformer.transform_rows(input_data, None)[1] is None
+        assert self.transformer.transform_rows("", 2) == ([], None)
+
+    def test_transform_input_data_with_max_rows(self) -> None:
+        """Test transformation of the InputData with max rows."""
+        input_data = InputData(id="1", data="name\nJohn\nJane\n")
+
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            input_data, 1
+        )
+
+        assert result == [{"name": "John"}]
+        assert total_count == 2
+
     def test_transform_custom_delimiter(self) -> None:
         """Test transforming CSV with custom delimiter."""
         transformer = CsvInputDataTransformer(delimiter="|")
@@ -1,8 +1,20 @@
 import re
-from typing import Any, Literal
-
-from next_gen_ui_agent.data_structure_tools import sanitize_field_name, transform_value
-from next_gen_ui_agent.types import InputData, InputDataTransformerBase
+from itertools import islice
+from typing import Any, Literal, Optional
+
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataContent,
+    InputDataSample,
+    get_lines_prefix,
+    iter_lines,
+    sanitize_field_name,
+    transform_value,
+)
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
 
 # Regex pattern to find column separators in the header line. Indices are taken from it and used for further lines parsing
 COLUMN_SEPARATOR_PATTERN = re.compile(r"\s{2,}")
@@ -14,18 +26,26 @@ class FwctableInputDataTransformer(InputDataTransformerBase):
     TRANSFORMER_NAME = "fwctable"
     TRANSFORMER_NAME_LITERAL = Literal["fwctable"]
 
+    TRANSFORMS_BINARY_CONTENT = True
+
     def __init__(self) -> None:
         """Initialize the FWCTABLE transformer."""
 
     def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data is valid FWCTABLE by checking header line and data line patterns."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
         """
         Detect if input data is valid FWCTABLE by checking header line and data line patterns.
         For efficiency, only checks first 1KB and uses simple pattern matching.
         """
-        data_str = input_data["data"]
-        # Only check first 1KB to find header
-        sample = data_str[:1024]
-        lines = [line for line in sample.splitlines() if line.strip()]
+        # Only check first 1KB to find header, leading whitespaces are significant here
+        lines = sample.raw_lines
 
         if len(lines) < 2:
             return False
@@ -47,7 +67,7 @@ class FwctableInputDataTransformer(InputDataTransformerBase):
 
         return len(header_columns) == len(data_columns)
 
-    def transform(self, input_data: str) -> Any:
+    def transform(self, input_data: InputDataContent) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
 
@@ -64,59 +84,86 @@ class FwctableInputDataTransformer(InputDataTransformerBase):
         Raises:
             ValueError: If the input data can't be parsed due to invalid format or if the FWCTABLE is empty.
         """
-        try:
-            # Split input into lines and filter out empty lines
-            lines = [line.rstrip() for line in input_data.splitlines() if line.strip()]
+        return self.transform_rows(input_data, None)[0]
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """Transform the input data with at most `max_rows` rows, see `transform_rows`."""
+        return self.transform_rows(self.get_content(input_data), max_rows)
+
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """Transform complete rows in the first `max_size` characters/bytes of the input data."""
+        return self.transform(get_lines_prefix(self.get_content(input_data), max_size))
+
+    def transform_rows(
+        self, input_data: InputDataContent, max_rows: Optional[int]
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        Transform the input data into the list of row dicts, see `transform`.
+
+        Lines are parsed lazily from the input data string, so only `max_rows` rows are transformed and held in memory,
+        rest of the rows is only counted.
 
-            if not lines:
-                return []
+        Args:
+            input_data: Input data string to transform (FWCTABLE format with headers).
+            max_rows: Maximal number of rows to transform, `None` for no limit.
+        Returns:
+            * List of row dicts.
+            * Total number of rows in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format.
+        """
+        try:
+            # Iterate over input lines and filter out empty lines
+            lines = (
+                line.rstrip()
+                for chunk in iter_lines(input_data)
+                for line in chunk.splitlines()
+                if line.strip()
+            )
 
             # Parse header row to detect column start positions
-            header_line = lines[0]
+            header_line = next(lines, None)
+            if header_line is None:
+                return [], None
             column_starts = self._detect_column_boundaries(header_line)
 
             if not column_starts:
-                return []
+                return [], None
 
-            # Extract and sanitize header column names
-            sanitized_headers = []
+            # Extract and sanitize header column names, and compute column end positions
+            columns: list[tuple[str, int, Optional[int]]] = []
             for i, start in enumerate(column_starts):
                 # Extract header text from start to next column start or end of line
-                if i + 1 < len(column_starts):
-                    end = column_starts[i + 1]
-                    header_text = header_line[start:end].strip()
-                else:
-                    header_text = header_line[start:].strip()
+                end = column_starts[i + 1] if i + 1 < len(column_starts) else None
+                header_text = header_line[start:end].strip()
 
                 sanitized_header = sanitize_field_name(header_text)
-                if sanitized_header:
-                    sanitized_headers.append(sanitized_header)
-                else:
-                    sanitized_headers.append(f"field_{len(sanitized_headers)}")
+                if not sanitized_header:
+                    sanitized_header = f"field_{len(columns)}"
+                columns.append((sanitized_header, start, end))
 
-            # Parse data rows using column start positions
+            # Parse data rows using column positions
+            # For the last column, value extends to the end of the line
             parsed_data = []
-            for line in lines[1:]:
+            for line in islice(lines, max_rows):
                 row_dict = {}
-                for i, start in enumerate(column_starts):
-                    sanitized_header = sanitized_headers[i]
-                    # Extract value from the column start position
-                    # For the last column, extend to the end of the line
-                    if i == len(column_starts) - 1:
-                        value_text = line[start:].strip()
-                    else:
-                        # For non-last columns, use the next column's start position as end
-                        next_start = column_starts[i + 1]
-                        value_text = line[start:next_start].strip()
-
-                    row_dict[sanitized_header] = transform_value(value_text)
-
+                for sanitized_header, start, end in columns:
+                    row_dict[sanitized_header] = transform_value(
+                        line[start:end].strip()
+                    )
                 parsed_data.append(row_dict)
 
+            # Rest of the rows over `max_rows` is only counted
+            skipped_rows = sum(1 for _ in lines)
+
         except Exception as e:
             raise ValueError(f"Invalid FWCTABLE format of the Input Data: {e}") from e
 
-        return parsed_data
+        if skipped_rows:
+            return parsed_data, len(parsed_data) + skipped_rows
+        return parsed_data, None
 
     def _detect_column_boundaries(self, header_line: str) -> list[int]:
         """
@@ -384,6 +384,42 @@ Jane    25   Boston
         assert result == expected
         assert len(result) == 2  # Empty lines should be filtered out
 
+    def test_transform_rows_max_rows(self) -> None:
+        """Test rows over max rows are only counted."""
+        input_data = """name    age
+John    30
+
+Jane    25
+Jack    35
+"""
+
+        result, total_count = self.transformer.transform_rows(input_data, 2)
+
+        assert result == [{"name": "John", "age": 30}, {"name": "Jane", "age": 25}]
+        assert total_count == 3
+
+    def test_transform_rows_max_rows_not_exceeded(self) -> None:
+        """Test total count is not provided if rows are not truncated."""
+        input_data = """name    age
+John    30
+Jane    25"""
+
+        result, total_count = self.transformer.transform_rows(input_data, 2)
+
+        assert len(result) == 2
+        assert total_count is None
+
+    def test_transform_input_data_with_max_rows(self) -> None:
+        """Test transformation of the InputData with max rows."""
+        input_data = InputData(id="1", data="name    age\nJohn    30\nJane    25\n")
+
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            input_data, 1
+        )
+
+        assert result == [{"name": "John", "age": 30}]
+        assert total_count == 2
+
 
 class TestFwctableInputDataTransformerDetectMyDataStructure:
     """Test cases for FwctableInputDataTransformer.detect_my_data_structure()."""
@@ -0,0 +1,287 @@
+"""
+Input data limits (guardrails) configured in the `AgentConfig.input_data_limits`.
+
+Size of the raw input data is checked before they are parsed, number of items is checked during the lazy parsing
+by the transformers supporting it, so oversized input data are rejected or truncated before they are parsed whole.
+Depth is checked before parsing by the transformers supporting it (eg. `json`), after parsing otherwise.
+"""
+
+import logging
+from typing import Any, Iterable, Literal, Optional, cast
+
+from next_gen_ui_agent.types import (
+    AgentConfigInputDataLimits,
+    InputData,
+    InputDataLimitApplied,
+    InputDataTransformerBase,
+    get_input_data_size,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def merge_input_data_limits(
+    limits: Optional[AgentConfigInputDataLimits],
+    override: AgentConfigInputDataLimits,
+) -> AgentConfigInputDataLimits:
+    """Merge limits, limits (and policies) explicitly set in the `override` replace the ones from `limits`."""
+    if not limits:
+        return override
+    return limits.model_copy(
+        update={name: getattr(override, name) for name in override.model_fields_set}
+    )
+
+
+def transform_input_data_with_limits(
+    transformer: InputDataTransformerBase,
+    input_data: InputData,
+    max_rows: Optional[int],
+    limits: Optional[AgentConfigInputDataLimits],
+) -> tuple[Any, Optional[int], list[InputDataLimitApplied]]:
+    """
+    Transform the input data with at most `max_rows` rows (see `InputDataTransformerBase.transform_input_data_with_max_rows`)
+    and apply the input data `limits`.
+    Args:
+        transformer: Input data transformer to use.
+        input_data: Input data to transform.
+        max_rows: Maximal number of rows to parse, `None` for no limit.
+        limits: Input data limits to apply, `None` for no limits.
+    Returns:
+        * Object tree matching parsed JSON format produced by the transformer.
+        * Total number of rows in the input data if they were truncated, `None` if not truncated or unknown.
+        * Limits applied to the input data (truncated or sampled), empty if no limit was applied.
+    Raises:
+        ValueError: If the input data exceed the limit with `reject` policy, or can't be parsed.
+    """
+    if not limits:
+        json_data, total_count = transformer.transform_input_data_with_max_rows(
+            input_data, max_rows
+        )
+        return json_data, total_count, []
+
+    limits_applied: list[InputDataLimitApplied] = []
+    size = get_input_data_size(input_data) if limits.max_size is not None else 0
+    depth_checked = False
+    if limits.max_depth is not None:
+        input_data, depth_checked = _apply_max_depth_before_parsing(
+            transformer,
+            input_data,
+            limits.max_depth,
+            limits.max_depth_policy,
+            limits_applied,
+        )
+    try:
+        json_data, total_count = _transform_with_max_size(
+            transformer, input_data, size, max_rows, limits, limits_applied
+        )
+    except RecursionError as e:
+        # depth of the input data is unknown, as they can't be parsed
+        message = f"Input data '{input_data['id']}' are nested too deeply to be parsed"
+        if limits.max_depth is not None:
+            message = f"{message}, depth exceeds the limit {limits.max_depth}"
+            if limits.max_depth_policy == "truncate":
+                message = f"{message} and the input data transformer can't truncate them before parsing"
+        raise ValueError(message) from e
+    if limits.max_items is not None and isinstance(json_data, list):
+        json_data, total_count = _apply_max_items(
+            input_data,
+            json_data,
+            total_count,
+            limits.max_items,
+            limits.max_items_policy,
+            limits_applied,
+        )
+    if limits.max_depth is not None and not depth_checked:
+        json_data = _apply_max_depth(
+            input_data,
+            json_data,
+            limits.max_depth,
+            limits.max_depth_policy,
+            limits_applied,
+        )
+    return json_data, total_count, limits_applied
+
+
+def _transform_with_max_size(
+    transformer: InputDataTransformerBase,
+    input_data: InputData,
+    size: int,
+    max_rows: Optional[int],
+    limits: AgentConfigInputDataLimits,
+    limits_applied: list[InputDataLimitApplied],
+) -> tuple[Any, Optional[int]]:
+    if limits.max_size is not None:
+        if size > limits.max_size:
+            message = f"Input data '{input_data['id']}' size {size} exceeds the limit {limits.max_size}"
+            if limits.max_size_policy == "reject":
+                raise ValueError(message)
+            try:
+                json_data = transformer.transform_input_data_prefix(
+                    input_data, limits.max_size
+                )
+            except NotImplementedError as e:
+                raise ValueError(
+                    f"{message} and the input data transformer can't truncate them: {e}"
+                ) from e
+            logger.info("%s, input data truncated", message)
+            limits_applied.append(
+                InputDataLimitApplied(
+                    limit="max_size",
+                    policy="truncate",
+                    value=limits.max_size,
+                    input_data_value=size,
+                )
+            )
+            # total number of rows is unknown, as only the beginning of the input data is parsed
+            if max_rows is not None and isinstance(json_data, list):
+                json_data = json_data[:max_rows]
+            return json_data, None
+
+    if limits.max_items is not None and limits.max_items_policy != "sample":
+        # lazy parsing transformers parse only needed rows, the rest is counted
+        max_rows = (
+            limits.max_items if max_rows is None else min(max_rows, limits.max_items)
+        )
+    return transformer.transform_input_data_with_max_rows(input_data, max_rows)
+
+
+def _apply_max_items(
+    input_data: InputData,
+    json_data: list[Any],
+    total_count: Optional[int],
+    max_items: int,
+    policy: Literal["reject", "truncate", "sample"],
+    limits_applied: list[InputDataLimitApplied],
+) -> tuple[list[Any], Optional[int]]:
+    count = total_count if total_count is not None else len(json_data)
+    if count <= max_items:
+        return json_data, total_count
+    message = f"Input data '{input_data['id']}' number of items {count} exceeds the limit {max_items}"
+    if policy == "reject":
+        raise ValueError(message)
+    if policy == "sample":
+        json_data = sample_items(json_data, max_items)
+    else:
+        json_data = json_data[:max_items]
+    logger.info("%s, input data %s", message, policy)
+    limits_applied.append(
+        InputDataLimitApplied(
+            limit="max_items",
+            policy=policy,
+            value=max_items,
+            input_data_value=count,
+        )
+    )
+    # total count is unknown if the input data were truncated by size before
+    return json_data, None if _is_applied(limits_applied, "max_size") else count
+
+
+def _apply_max_depth_before_parsing(
+    transformer: InputDataTransformerBase,
+    input_data: InputData,
+    max_depth: int,
+    policy: Literal["reject", "truncate"],
+    limits_applied: list[InputDataLimitApplied],
+) -> tuple[InputData, bool]:
+    """Apply the `max_depth` limit to the raw input data, returns input data to parse and `True` if the limit was checked."""
+    try:
+        depth = transformer.get_input_data_depth(input_data)
+    except NotImplementedError:
+        return input_data, False
+    if depth <= max_depth:
+        return input_data, True
+    message = (
+        f"Input data '{input_data['id']}' depth {depth} exceeds the limit {max_depth}"
+    )
+    if policy == "reject":
+        raise ValueError(message)
+    try:
+        content = transformer.truncate_input_data_depth(input_data, max_depth)
+    except NotImplementedError:
+        return input_data, False
+    logger.info("%s, input data truncated", message)
+    limits_applied.append(
+        InputDataLimitApplied(
+            limit="max_depth",
+            policy="truncate",
+            value=max_depth,
+            input_data_value=depth,
+        )
+    )
+    return cast(InputData, {**input_data, "data": content, "data_file": None}), True
+
+
+def _apply_max_depth(
+    input_data: InputData,
+    json_data: Any,
+    max_depth: int,
+    policy: Literal["reject", "truncate"],
+    limits_applied: list[InputDataLimitApplied],
+) -> Any:
+    depth = get_depth(json_data)
+    if depth <= max_depth:
+        return json_data
+    message = (
+        f"Input data '{input_data['id']}' depth {depth} exceeds the limit {max_depth}"
+    )
+    if policy == "reject":
+        raise ValueError(message)
+    logger.info("%s, input data truncated", message)
+    limits_applied.append(
+        InputDataLimitApplied(
+            limit="max_depth",
+            policy="truncate",
+            value=max_depth,
+            input_data_value=depth,
+        )
+    )
+    return truncate_depth(json_data, max_depth)
+
+
+def _is_applied(limits_applied: list[InputDataLimitApplied], limit: str) -> bool:
+    return any(applied.limit == limit for applied in limits_applied)
+
+
+def sample_items(items: list[Any], count: int) -> list[Any]:
+    """
+    Get `count` items evenly spread over the `items`, in their original order. First item is always included.
+    Sampling is deterministic, so the same items are selected for the same input.
+    """
+    length = len(items)
+    if length <= count:
+        return items
+    return [items[i * length // count] for i in range(count)]
+
+
+def get_depth(value: Any) -> int:
+    """Get nesting depth of the objects and arrays in the value, root object or array has depth 1, other values 0."""
+    max_depth = 0
+    # iterative traversal, so deeply nested data can't exceed the recursion limit
+    stack: list[tuple[Any, int]] = [(value, 1)]
+    while stack:
+        node, depth = stack.pop()
+        children: Iterable[Any]
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        max_depth = max(max_depth, depth)
+        stack.extend(
+            (child, depth + 1) for child in children if isinstance(child, (dict, list))
+        )
+    return max_depth
+
+
+def truncate_depth(value: Any, max_depth: int) -> Any:
+    """Get copy of the value with objects and arrays nested deeper than `max_depth` replaced by `None`."""
+    if not isinstance(value, (dict, list)):
+        return value
+    if max_depth < 1:
+        return None
+    if isinstance(value, dict):
+        return {
+            key: truncate_depth(child, max_depth - 1) for key, child in value.items()
+        }
+    return [truncate_depth(child, max_depth - 1) for child in value]
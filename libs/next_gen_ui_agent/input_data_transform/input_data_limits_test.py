@@ -0,0 +1,457 @@
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+from next_gen_ui_agent.input_data_transform.input_data_limits import (
+    get_depth,
+    merge_input_data_limits,
+    sample_items,
+    transform_input_data_with_limits,
+    truncate_depth,
+)
+from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    BUILTIN_INPUT_DATA_TRANSFORMERS,
+    get_input_data_limits,
+    init_input_data_transformers,
+    perform_input_data_transformation_with_limits,
+)
+from next_gen_ui_agent.types import (
+    AgentConfig,
+    AgentConfigDataType,
+    AgentConfigInputDataLimits,
+    InputData,
+    InputDataTransformerBase,
+)
+
+ROWS = [{"name": f"Name {i}", "age": i} for i in range(10)]
+
+ROWS_DATA = {
+    "json": json.dumps(ROWS, indent=1),
+    "jsonl": "\n".join(json.dumps(row) for row in ROWS),
+    "csv-comma": "name,age\n" + "\n".join(f"{r['name']},{r['age']}" for r in ROWS),
+    "fwctable": "name    age\n" + "\n".join(f"{r['name']}  {r['age']}" for r in ROWS),
+}
+
+
+def transform(
+    transformer_name: str,
+    data: str | bytes,
+    limits: AgentConfigInputDataLimits,
+    max_rows=None,
+):
+    return transform_input_data_with_limits(
+        BUILTIN_INPUT_DATA_TRANSFORMERS[transformer_name],
+        InputData(id="1", data=data),
+        max_rows,
+        limits,
+    )
+
+
+class TestMaxSize:
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    def test_not_exceeded(self, transformer_name) -> None:
+        data = ROWS_DATA[transformer_name]
+        json_data, total_count, limits_applied = transform(
+            transformer_name, data, AgentConfigInputDataLimits(max_size=len(data))
+        )
+        assert json_data == ROWS
+        assert total_count is None
+        assert limits_applied == []
+
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    def test_reject(self, transformer_name) -> None:
+        with pytest.raises(
+            ValueError, match="Input data '1' size .* exceeds the limit 50"
+        ):
+            transform(
+                transformer_name,
+                ROWS_DATA[transformer_name],
+                AgentConfigInputDataLimits(max_size=50),
+            )
+
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_truncate(self, transformer_name, binary) -> None:
+        data = ROWS_DATA[transformer_name]
+        # cut in the middle of the 4th row
+        max_size = (
+            data.index("Name 3")
+            if transformer_name != "json"
+            else data.index('"Name 3"')
+        ) + 5
+        json_data, total_count, limits_applied = transform(
+            transformer_name,
+            data.encode() if binary else data,
+            AgentConfigInputDataLimits(max_size=max_size, max_size_policy="truncate"),
+        )
+        assert json_data == ROWS[:3]
+        assert total_count is None
+        assert [applied.model_dump() for applied in limits_applied] == [
+            {
+                "limit": "max_size",
+                "policy": "truncate",
+                "value": max_size,
+                "input_data_value": len(data),
+            }
+        ]
+
+    def test_truncate_max_rows(self) -> None:
+        json_data, total_count, _ = transform(
+            "jsonl",
+            ROWS_DATA["jsonl"],
+            AgentConfigInputDataLimits(max_size=200, max_size_policy="truncate"),
+            max_rows=2,
+        )
+        assert json_data == ROWS[:2]
+        assert total_count is None
+
+    def test_truncate_noop(self) -> None:
+        json_data, _, limits_applied = transform(
+            "noop",
+            "Žluťoučký kůň".encode(),
+            AgentConfigInputDataLimits(max_size=5, max_size_policy="truncate"),
+        )
+        # character cut in the middle is ignored
+        assert json_data == "Žlu"
+        assert len(limits_applied) == 1
+
+    def test_truncate_not_supported(self) -> None:
+        with pytest.raises(ValueError, match="can't truncate them"):
+            transform(
+                "yaml",
+                "- name: A\n- name: B\n",
+                AgentConfigInputDataLimits(max_size=10, max_size_policy="truncate"),
+            )
+
+    def test_truncate_json_root_object(self) -> None:
+        with pytest.raises(ValueError, match="Only JSON with root array"):
+            transform(
+                "json",
+                '{"items": [1, 2, 3]}',
+                AgentConfigInputDataLimits(max_size=10, max_size_policy="truncate"),
+            )
+
+    def test_data_file(self, tmp_path) -> None:
+        data_file = tmp_path / "data.jsonl"
+        data_file.write_text(ROWS_DATA["jsonl"])
+        json_data, _, limits_applied = transform_input_data_with_limits(
+            BUILTIN_INPUT_DATA_TRANSFORMERS["jsonl"],
+            InputData(id="1", data="", data_file=str(data_file)),
+            None,
+            AgentConfigInputDataLimits(max_size=60, max_size_policy="truncate"),
+        )
+        assert json_data == ROWS[:2]
+        assert limits_applied[0].input_data_value == len(ROWS_DATA["jsonl"])
+
+
+class TestMaxItems:
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    def test_reject(self, transformer_name) -> None:
+        with pytest.raises(
+            ValueError, match="Input data '1' number of items 10 exceeds the limit 3"
+        ):
+            transform(
+                transformer_name,
+                ROWS_DATA[transformer_name],
+                AgentConfigInputDataLimits(max_items=3),
+            )
+
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    def test_truncate(self, transformer_name) -> None:
+        json_data, total_count, limits_applied = transform(
+            transformer_name,
+            ROWS_DATA[transformer_name],
+            AgentConfigInputDataLimits(max_items=3, max_items_policy="truncate"),
+        )
+        assert json_data == ROWS[:3]
+        assert total_count == 10
+        assert [applied.model_dump() for applied in limits_applied] == [
+            {
+                "limit": "max_items",
+                "policy": "truncate",
+                "value": 3,
+                "input_data_value": 10,
+            }
+        ]
+
+    @pytest.mark.parametrize("transformer_name", list(ROWS_DATA))
+    def test_sample(self, transformer_name) -> None:
+        json_data, total_count, limits_applied = transform(
+            transformer_name,
+            ROWS_DATA[transformer_name],
+            AgentConfigInputDataLimits(max_items=4, max_items_policy="sample"),
+        )
+        assert json_data == [ROWS[0], ROWS[2], ROWS[5], ROWS[7]]
+        assert total_count == 10
+        assert limits_applied[0].policy == "sample"
+
+    def test_max_rows_lower(self) -> None:
+        json_data, total_count, limits_applied = transform(
+            "csv-comma",
+            ROWS_DATA["csv-comma"],
+            AgentConfigInputDataLimits(max_items=5, max_items_policy="truncate"),
+            max_rows=2,
+        )
+        assert json_data == ROWS[:2]
+        assert total_count == 10
+        assert len(limits_applied) == 1
+
+    def test_max_rows_not_exceeded(self) -> None:
+        json_data, total_count, limits_applied = transform(
+            "csv-comma",
+            ROWS_DATA["csv-comma"],
+            AgentConfigInputDataLimits(max_items=10),
+            max_rows=2,
+        )
+        assert json_data == ROWS[:2]
+        assert total_count == 10
+        assert limits_applied == []
+
+    def test_root_object_not_limited(self) -> None:
+        json_data, _, limits_applied = transform(
+            "json", '{"a": [1, 2, 3]}', AgentConfigInputDataLimits(max_items=1)
+        )
+        assert json_data == {"a": [1, 2, 3]}
+        assert limits_applied == []
+
+    def test_after_max_size_truncation(self) -> None:
+        json_data, total_count, limits_applied = transform(
+            "jsonl",
+            ROWS_DATA["jsonl"],
+            AgentConfigInputDataLimits(
+                max_size=200,
+                max_size_policy="truncate",
+                max_items=2,
+                max_items_policy="truncate",
+            ),
+        )
+        assert json_data == ROWS[:2]
+        # only the beginning of the data was parsed
+        assert total_count is None
+        assert [applied.limit for applied in limits_applied] == [
+            "max_size",
+            "max_items",
+        ]
+
+
+class TestMaxDepth:
+    DATA = '[{"name": "A", "address": {"city": "Brno", "geo": {"lat": 49}}, "tags": ["a"]}]'
+
+    def test_not_exceeded(self) -> None:
+        json_data, _, limits_applied = transform(
+            "json", self.DATA, AgentConfigInputDataLimits(max_depth=4)
+        )
+        assert json_data == json.loads(self.DATA)
+        assert limits_applied == []
+
+    def test_reject(self) -> None:
+        with pytest.raises(ValueError, match="depth 4 exceeds the limit 2"):
+            transform("json", self.DATA, AgentConfigInputDataLimits(max_depth=2))
+
+    def test_truncate(self) -> None:
+        json_data, _, limits_applied = transform(
+            "json",
+            self.DATA,
+            AgentConfigInputDataLimits(max_depth=2, max_depth_policy="truncate"),
+        )
+        assert json_data == [{"name": "A", "address": None, "tags": None}]
+        assert [applied.model_dump() for applied in limits_applied] == [
+            {
+                "limit": "max_depth",
+                "policy": "truncate",
+                "value": 2,
+                "input_data_value": 4,
+            }
+        ]
+
+    @pytest.mark.parametrize("transformer_name", ["json", "jsonl"])
+    def test_checked_before_parsing(self, transformer_name) -> None:
+        transformer = BUILTIN_INPUT_DATA_TRANSFORMERS[transformer_name]
+        data = self.DATA if transformer_name == "json" else self.DATA[1:-1]
+        with patch.object(transformer, "transform") as transform_mock:
+            with pytest.raises(ValueError, match="depth 4 exceeds the limit 2"):
+                transform(
+                    transformer_name, data, AgentConfigInputDataLimits(max_depth=2)
+                )
+        transform_mock.assert_not_called()
+
+    def test_truncate_jsonl(self) -> None:
+        json_data, _, limits_applied = transform(
+            "jsonl",
+            self.DATA[1:-1] + "\n" + '{"name": "B", "tags": [["b"]]}',
+            AgentConfigInputDataLimits(max_depth=2, max_depth_policy="truncate"),
+        )
+        assert json_data == [
+            {"name": "A", "address": None, "tags": None},
+            {"name": "B", "tags": None},
+        ]
+        assert limits_applied[0].input_data_value == 4
+
+
+class TestMaxDepthNestedTooDeeply:
+    """Input data nested deeper than the recursion limit can't be parsed."""
+
+    DEPTH = sys.getrecursionlimit() * 100
+    DATA = '[{"a": 1}, ' + "[" * DEPTH + "]" * DEPTH + "]"
+
+    def test_reject(self) -> None:
+        with pytest.raises(
+            ValueError, match=f"depth {self.DEPTH + 1} exceeds the limit 5"
+        ):
+            transform("json", self.DATA, AgentConfigInputDataLimits(max_depth=5))
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_truncate(self, binary) -> None:
+        data = self.DATA.encode() if binary else self.DATA
+        json_data, _, limits_applied = transform(
+            "json",
+            data,
+            AgentConfigInputDataLimits(max_depth=3, max_depth_policy="truncate"),
+        )
+        assert json_data == [{"a": 1}, [[None]]]
+        assert limits_applied[0].input_data_value == self.DEPTH + 1
+
+    def test_truncate_with_max_items(self) -> None:
+        json_data, total_count, _ = transform(
+            "json",
+            self.DATA,
+            AgentConfigInputDataLimits(
+                max_depth=3,
+                max_depth_policy="truncate",
+                max_items=1,
+                max_items_policy="truncate",
+            ),
+        )
+        assert json_data == [{"a": 1}]
+        assert total_count == 2
+
+    def test_data_file(self, tmp_path) -> None:
+        data_file = tmp_path / "data.json"
+        data_file.write_text(self.DATA)
+        json_data, _, _ = transform_input_data_with_limits(
+            BUILTIN_INPUT_DATA_TRANSFORMERS["json"],
+            InputData(id="1", data="", data_file=str(data_file)),
+            None,
+            AgentConfigInputDataLimits(max_depth=2, max_depth_policy="truncate"),
+        )
+        assert json_data == [{"a": 1}, [None]]
+
+    @pytest.mark.parametrize("policy", ["reject", "truncate"])
+    def test_transformer_without_raw_depth(self, policy) -> None:
+        """Transformers not checking depth before parsing fail with the policy error instead of `RecursionError`."""
+
+        class StdlibJsonInputDataTransformer(InputDataTransformerBase):
+            def transform(self, input_data: str):
+                return json.loads(input_data)
+
+        with pytest.raises(
+            ValueError,
+            match="Input data '1' are nested too deeply to be parsed, depth exceeds the limit 5",
+        ):
+            transform_input_data_with_limits(
+                StdlibJsonInputDataTransformer(),
+                InputData(id="1", data=self.DATA),
+                None,
+                AgentConfigInputDataLimits(max_depth=5, max_depth_policy=policy),
+            )
+
+    def test_not_limited(self) -> None:
+        with pytest.raises(
+            ValueError, match="Input data '1' are nested too deeply to be parsed$"
+        ):
+            transform("json", self.DATA, AgentConfigInputDataLimits(max_size=10**9))
+
+
+class TestTools:
+    def test_sample_items(self) -> None:
+        assert sample_items(list(range(10)), 3) == [0, 3, 6]
+        assert sample_items(list(range(10)), 10) == list(range(10))
+        assert sample_items([1, 2], 5) == [1, 2]
+
+    def test_get_depth(self) -> None:
+        assert get_depth("a") == 0
+        assert get_depth([]) == 1
+        assert get_depth({"a": [1, {"b": {}}]}) == 4
+
+    def test_get_depth_deeply_nested(self) -> None:
+        data: list = []
+        for _ in range(5000):
+            data = [data]
+        assert get_depth(data) == 5001
+
+    def test_truncate_depth(self) -> None:
+        data = {"a": [1, {"b": {}}], "c": "d"}
+        assert truncate_depth(data, 4) == data
+        assert truncate_depth(data, 3) == {"a": [1, {"b": None}], "c": "d"}
+        assert truncate_depth(data, 2) == {"a": [1, None], "c": "d"}
+        assert truncate_depth(data, 1) == {"a": None, "c": "d"}
+        assert truncate_depth("a", 1) == "a"
+
+    def test_merge_input_data_limits(self) -> None:
+        limits = AgentConfigInputDataLimits(max_size=100, max_items=10)
+        override = AgentConfigInputDataLimits(max_items=5, max_items_policy="sample")
+        assert merge_input_data_limits(limits, override) == AgentConfigInputDataLimits(
+            max_size=100, max_items=5, max_items_policy="sample"
+        )
+        assert merge_input_data_limits(None, override) is override
+
+
+class TestConfiguration:
+    def teardown_method(self) -> None:
+        init_input_data_transformers(AgentConfig())
+
+    def test_get_input_data_limits(self) -> None:
+        init_input_data_transformers(
+            AgentConfig(
+                input_data_limits=AgentConfigInputDataLimits(max_size=100),
+                data_types={
+                    "limited": AgentConfigDataType(
+                        input_data_limits=AgentConfigInputDataLimits(max_items=5)
+                    ),
+                    "other": AgentConfigDataType(),
+                },
+            )
+        )
+        assert get_input_data_limits(
+            InputData(id="1", data="", type="limited")
+        ) == AgentConfigInputDataLimits(max_size=100, max_items=5)
+        assert get_input_data_limits(
+            InputData(id="1", data="", type="other")
+        ) == AgentConfigInputDataLimits(max_size=100)
+        assert get_input_data_limits(
+            InputData(id="1", data="")
+        ) == AgentConfigInputDataLimits(max_size=100)
+
+    def test_not_limited_by_default(self) -> None:
+        init_input_data_transformers(AgentConfig())
+        input_data = InputData(id="1", data=ROWS_DATA["json"])
+        assert get_input_data_limits(input_data) is None
+        assert perform_input_data_transformation_with_limits(input_data) == (
+            ROWS,
+            "json",
+            None,
+            [],
+        )
+
+    def test_perform_input_data_transformation_with_limits(self) -> None:
+        init_input_data_transformers(
+            AgentConfig(
+                data_types={
+                    "limited": AgentConfigDataType(
+                        input_data_limits=AgentConfigInputDataLimits(
+                            max_items=2, max_items_policy="truncate"
+                        )
+                    ),
+                },
+            )
+        )
+        json_data, transformer_name, total_count, limits_applied = (
+            perform_input_data_transformation_with_limits(
+                InputData(id="1", data=ROWS_DATA["jsonl"], type="limited")
+            )
+        )
+        assert json_data == ROWS[:2]
+        assert transformer_name == "jsonl"
+        assert total_count == 10
+        assert limits_applied[0].limit == "max_items"
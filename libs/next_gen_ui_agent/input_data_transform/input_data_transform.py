@@ -1,6 +1,10 @@
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from next_gen_ui_agent.data_structure_tools import InputDataSample
+from next_gen_ui_agent.input_data_transform.arrow_input_data_transformer import (
+    ArrowInputDataTransformer,
+)
 from next_gen_ui_agent.input_data_transform.csv_input_data_transformer import (
     CsvCommaInputDataTransformer,
     CsvSemicolonInputDataTransformer,
@@ -9,17 +13,34 @@ from next_gen_ui_agent.input_data_transform.csv_input_data_transformer import (
 from next_gen_ui_agent.input_data_transform.fwctable_input_data_transformer import (
     FwctableInputDataTransformer,
 )
+from next_gen_ui_agent.input_data_transform.input_data_limits import (
+    merge_input_data_limits,
+    transform_input_data_with_limits,
+)
 from next_gen_ui_agent.input_data_transform.json_input_data_transformer import (
     JsonInputDataTransformer,
 )
+from next_gen_ui_agent.input_data_transform.jsonl_input_data_transformer import (
+    JsonlInputDataTransformer,
+)
 from next_gen_ui_agent.input_data_transform.noop_input_data_transformer import (
     NoopInputDataTransformer,
 )
 from next_gen_ui_agent.input_data_transform.yaml_input_data_transformer import (
     YamlInputDataTransformer,
 )
-from next_gen_ui_agent.types import AgentConfig, InputData, InputDataTransformerBase
-from stevedore import ExtensionManager
+from next_gen_ui_agent.plugins import get_extension_manager, get_extension_obj
+from next_gen_ui_agent.types import (
+    AgentConfig,
+    AgentConfigInputDataLimits,
+    InputData,
+    InputDataLimitApplied,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
+
+if TYPE_CHECKING:
+    from stevedore import ExtensionManager
 
 logger = logging.getLogger(__name__)
 
@@ -28,23 +49,32 @@ PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE = (
 )
 """ Stevedore namespace for the input data transformers."""
 
-input_data_transformer_extension_manager = ExtensionManager(
-    namespace=PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE,
-    invoke_on_load=True,
-)
 
-logger.info(
-    "Dynamically registered input data transformers: %s",
-    input_data_transformer_extension_manager.names(),
-)
+def __getattr__(name: str) -> Any:
+    # PEP 562 - stevedore `input_data_transformer_extension_manager` is created on the first access,
+    # so transformer plugins are not loaded until a pluggable transformer is used (or auto-detection needs them).
+    if name == "input_data_transformer_extension_manager":
+        return get_extension_manager(PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_extension_manager() -> "ExtensionManager":
+    manager = globals().get("input_data_transformer_extension_manager")
+    if manager is None:
+        return get_extension_manager(PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE)
+    return manager
+
 
 # default transformers implemented in this module to be selected more efficiently
 BUILTIN_INPUT_DATA_TRANSFORMERS: dict[str, InputDataTransformerBase] = {
     YamlInputDataTransformer.TRANSFORMER_NAME: YamlInputDataTransformer(),
+    # must be detected before JSON, as JSON detection matches the first JSON Lines record too
+    JsonlInputDataTransformer.TRANSFORMER_NAME: JsonlInputDataTransformer(),
     JsonInputDataTransformer.TRANSFORMER_NAME: JsonInputDataTransformer(),
     CsvCommaInputDataTransformer.TRANSFORMER_NAME: CsvCommaInputDataTransformer(),
     CsvSemicolonInputDataTransformer.TRANSFORMER_NAME: CsvSemicolonInputDataTransformer(),
     CsvTabInputDataTransformer.TRANSFORMER_NAME: CsvTabInputDataTransformer(),
+    ArrowInputDataTransformer.TRANSFORMER_NAME: ArrowInputDataTransformer(),
     NoopInputDataTransformer.TRANSFORMER_NAME: NoopInputDataTransformer(),
     FwctableInputDataTransformer.TRANSFORMER_NAME: FwctableInputDataTransformer(),
 }
@@ -54,6 +84,10 @@ class InputDataTransformersConfig:
     default_data_transformer: str
     per_type_data_transformers: dict[str, str] = {}
     enable_auto_detection: bool = True
+    max_rows: Optional[int] = None
+    per_type_max_rows: dict[str, int] = {}
+    limits: Optional[AgentConfigInputDataLimits] = None
+    per_type_limits: dict[str, AgentConfigInputDataLimits] = {}
 
 
 c = InputDataTransformersConfig()
@@ -84,6 +118,42 @@ def init_input_data_transformers(config: AgentConfig) -> None:
     # store auto-detection config
     c.enable_auto_detection = config.enable_input_data_type_detection
 
+    # store max rows config
+    c.max_rows = config.input_data_max_rows
+    c.per_type_max_rows.clear()
+    if config.data_types:
+        for type, type_config in config.data_types.items():
+            if type_config.input_data_max_rows:
+                c.per_type_max_rows[type] = type_config.input_data_max_rows
+
+    # store input data limits config, per type limits are merged with the global ones
+    c.limits = config.input_data_limits
+    c.per_type_limits.clear()
+    if config.data_types:
+        for type, type_config in config.data_types.items():
+            if type_config.input_data_limits:
+                c.per_type_limits[type] = merge_input_data_limits(
+                    config.input_data_limits, type_config.input_data_limits
+                )
+
+
+def get_input_data_max_rows(input_data: InputData) -> Optional[int]:
+    """Get maximal number of rows parsed from the input data based on input data type, `None` if not limited."""
+    data_type = input_data.get("type")
+    if data_type and data_type in c.per_type_max_rows:
+        return c.per_type_max_rows[data_type]
+    return c.max_rows
+
+
+def get_input_data_limits(
+    input_data: InputData,
+) -> Optional[AgentConfigInputDataLimits]:
+    """Get limits of the input data based on input data type, `None` if not limited."""
+    data_type = input_data.get("type")
+    if data_type and data_type in c.per_type_limits:
+        return c.per_type_limits[data_type]
+    return c.limits
+
 
 def get_input_data_transformer_name(input_data: InputData) -> str:
     """Get input data transformer name based on input data type."""
@@ -110,22 +180,27 @@ def get_input_data_transformer_name(input_data: InputData) -> str:
 def get_auto_detected_transformer_name(input_data: InputData) -> Optional[str]:
     """Get the input data transformer name via auto-detection from data structure.
 
-    Iterates through all available transformers (built-in first, then pluggable)
-    and returns the name of the first transformer that detects the data structure.
+    Bounded sample of the data is taken once and shared by all the detectors, so the detection cost
+    does not depend on the data size. Built-in transformers are checked first in their priority order,
+    pluggable transformers are consulted only if no built-in transformer detects the data structure.
 
     Args:
         input_data: InputData to detect
     Returns:
         Transformer name if a compatible transformer is found, None otherwise
     """
+    sample = InputDataSample(get_input_data_content(input_data))
+
     # Check built-in transformers first
     for name, transformer in BUILTIN_INPUT_DATA_TRANSFORMERS.items():
-        if transformer.detect_my_data_structure(input_data):
+        if transformer.detect_my_data_structure_in_sample(input_data, sample):
             return name
 
     # Check pluggable transformers
-    for ext in input_data_transformer_extension_manager:
-        if ext.obj.detect_my_data_structure(input_data):
+    for ext in _get_extension_manager():
+        if get_extension_obj(ext).detect_my_data_structure_in_sample(
+            input_data, sample
+        ):
             return str(ext.name)
 
     return None
@@ -138,51 +213,45 @@ def get_input_data_transformer(
 
     if input_data_transformer_name in BUILTIN_INPUT_DATA_TRANSFORMERS:
         return BUILTIN_INPUT_DATA_TRANSFORMERS[input_data_transformer_name]
-    elif input_data_transformer_name in input_data_transformer_extension_manager:
-        return input_data_transformer_extension_manager[  # type:ignore
-            input_data_transformer_name
-        ].obj
+    extension_manager = _get_extension_manager()
+    if input_data_transformer_name in extension_manager:
+        return get_extension_obj(  # type:ignore[no-any-return]
+            extension_manager[input_data_transformer_name]
+        )
     else:
         raise KeyError(
             f"No input data transformer found for name: {input_data_transformer_name}"
         )
 
 
-def perform_input_data_transformation(input_data: InputData) -> tuple[Any, str]:
-    """Perform the input data transformation with configured transformer - InputData.type or default transformer.
+def perform_input_data_transformation_with_limits(
+    input_data: InputData, transformer_name: Optional[str] = None
+) -> tuple[Any, str, Optional[int], list[InputDataLimitApplied]]:
+    """Perform the input data transformation with at most max rows (see `get_input_data_max_rows`)
+    and with limits (see `get_input_data_limits`) configured for the input data type.
     Args:
         input_data: Input data to transform. Must contain InputData.data and optionally InputData.type`.
+        transformer_name: Transformer name to use for the transformation. If not provided, transformer configured for InputData.type or default transformer is used.
     Returns:
         * Object tree matching parsed JSON format produced by the transformer.
         * Transformer name used for the transformation.
+        * Total number of rows in the input data if they were truncated, `None` if not truncated or unknown.
+        * Input data limits applied to the input data, empty if no limit was applied.
     Raises:
-        ValueError if InputData.data is None
-        KeyError if configuredtransformer name is not found
-    """
-
-    if input_data.get("data") is None:
-        raise ValueError("Input data not provided")
-
-    transformer_name = get_input_data_transformer_name(input_data)
-    transformer = get_input_data_transformer(transformer_name)
-    return transformer.transform_input_data(input_data), transformer_name
-
-
-def perform_input_data_transformation_with_transformer_name(
-    input_data: InputData, transformer_name: str
-) -> Any:
-    """Perform the input data transformation with provided transformer name.
-    Args:
-        input_data: Input data to transform. Must contain InputData.data and optionally InputData.type if given transformer requires it (typically not).
-        transformer_name: Transformer name to use for the transformation.
-    Returns: Object tree matching parsed JSON format produced by the transformer.
-    Raises:
-        ValueError if InputData.data is None
-        KeyError if provided transformer name is not found
+        ValueError if InputData.data is None, or if the input data exceed limit with `reject` policy
+        KeyError if transformer name is not found
     """
 
     if input_data.get("data") is None:
         raise ValueError("Input data not provided")
 
+    if not transformer_name:
+        transformer_name = get_input_data_transformer_name(input_data)
     transformer = get_input_data_transformer(transformer_name)
-    return transformer.transform_input_data(input_data)
+    json_data, total_count, limits_applied = transform_input_data_with_limits(
+        transformer,
+        input_data,
+        get_input_data_max_rows(input_data),
+        get_input_data_limits(input_data),
+    )
+    return json_data, transformer_name, total_count, limits_applied
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,16 +12,19 @@ from next_gen_ui_agent.input_data_transform.input_data_transform import (
     PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE,
     c,
     get_auto_detected_transformer_name,
+    get_input_data_max_rows,
     get_input_data_transformer,
     get_input_data_transformer_name,
     init_input_data_transformers,
     input_data_transformer_extension_manager,
-    perform_input_data_transformation,
-    perform_input_data_transformation_with_transformer_name,
+    perform_input_data_transformation_with_limits,
 )
 from next_gen_ui_agent.input_data_transform.json_input_data_transformer import (
     JsonInputDataTransformer,
 )
+from next_gen_ui_agent.input_data_transform.jsonl_input_data_transformer import (
+    JsonlInputDataTransformer,
+)
 from next_gen_ui_agent.input_data_transform.noop_input_data_transformer import (
     NoopInputDataTransformer,
 )
@@ -204,6 +208,18 @@ class TestGetInputDataTransformer:
         )
         assert transformer.__class__.__name__ == "JsonInputDataTransformer"
 
+    def test_get_input_data_transformer_jsonl(self) -> None:
+        """Test getting JSON Lines input data transformer."""
+        transformer = get_input_data_transformer("jsonl")
+
+        assert (
+            transformer
+            is BUILTIN_INPUT_DATA_TRANSFORMERS[
+                JsonlInputDataTransformer.TRANSFORMER_NAME
+            ]
+        )
+        assert transformer.__class__.__name__ == "JsonlInputDataTransformer"
+
     def test_get_input_data_transformer_csv_comma(self) -> None:
         """Test getting CSV comma input data transformer."""
         transformer = get_input_data_transformer("csv-comma")
@@ -288,7 +304,9 @@ class TestPerformInputDataTransformation:
         input_data = InputData(
             id="1", data='{"name": "John", "age": 30, "city": "New York"}'
         )
-        result, transformer_name = perform_input_data_transformation(input_data)
+        result, transformer_name, _, _ = perform_input_data_transformation_with_limits(
+            input_data
+        )
 
         expected = {"name": "John", "age": 30, "city": "New York"}
         assert result == expected
@@ -309,7 +327,9 @@ age: 30
 city: New York
 """,
         )
-        result, transformer_name = perform_input_data_transformation(input_data)
+        result, transformer_name, _, _ = perform_input_data_transformation_with_limits(
+            input_data
+        )
 
         expected = {"name": "John", "age": 30, "city": "New York"}
         assert result == expected
@@ -336,7 +356,9 @@ age: 30
 city: New York
 """,
         )
-        result, transformer_name = perform_input_data_transformation(input_data)
+        result, transformer_name, _, _ = perform_input_data_transformation_with_limits(
+            input_data
+        )
 
         expected = {"name": "John", "age": 30, "city": "New York"}
         assert result == expected
@@ -344,6 +366,73 @@ city: New York
         assert transformer_name == "yaml"
 
 
+class TestPerformInputDataTransformationWithMaxRows:
+    """Test cases for the input data transformation with max rows."""
+
+    def test_get_input_data_max_rows(self) -> None:
+        init_input_data_transformers(
+            AgentConfig(
+                input_data_max_rows=100,
+                data_types={
+                    "small": AgentConfigDataType(input_data_max_rows=2),
+                    "other": AgentConfigDataType(data_transformer="yaml"),
+                },
+            )
+        )
+        assert get_input_data_max_rows(InputData(id="1", data="")) == 100
+        assert get_input_data_max_rows(InputData(id="1", data="", type="other")) == 100
+        assert get_input_data_max_rows(InputData(id="1", data="", type="small")) == 2
+
+    def test_get_input_data_max_rows_UNCONFIGURED(self) -> None:
+        init_input_data_transformers(AgentConfig())
+        assert get_input_data_max_rows(InputData(id="1", data="", type="small")) is None
+
+    def test_perform_input_data_transformation_with_max_rows(self) -> None:
+        init_input_data_transformers(
+            AgentConfig(data_transformer="csv-comma", input_data_max_rows=2)
+        )
+        input_data = InputData(id="1", data="name\nA\nB\nC\n")
+
+        result, transformer_name, total_count, _ = (
+            perform_input_data_transformation_with_limits(input_data)
+        )
+
+        assert result == [{"name": "A"}, {"name": "B"}]
+        assert transformer_name == "csv-comma"
+        assert total_count == 3
+
+    def test_perform_input_data_transformation_with_max_rows_transformer_name(
+        self,
+    ) -> None:
+        init_input_data_transformers(AgentConfig(input_data_max_rows=1))
+        input_data = InputData(id="1", data="name\nA\nB\nC\n")
+
+        result, transformer_name, total_count, _ = (
+            perform_input_data_transformation_with_limits(input_data, "csv-comma")
+        )
+
+        assert result == [{"name": "A"}]
+        assert transformer_name == "csv-comma"
+        assert total_count == 3
+
+    def test_perform_input_data_transformation_with_max_rows_json(
+        self,
+    ) -> None:
+        init_input_data_transformers(AgentConfig(input_data_max_rows=1))
+        input_data = InputData(id="1", data='[{"name": "A"}, {"name": "B"}]')
+
+        result, transformer_name, total_count, _ = (
+            perform_input_data_transformation_with_limits(input_data)
+        )
+
+        assert result == [{"name": "A"}]
+        assert transformer_name == "json"
+        assert total_count == 2
+
+    def teardown_method(self) -> None:
+        init_input_data_transformers(AgentConfig())
+
+
 class TestPerformInputDataTransformationWithTransformerName:
     """Test cases for input_data_transform module."""
 
@@ -363,9 +452,7 @@ age: 30
 city: New York
 """,
         )
-        result = perform_input_data_transformation_with_transformer_name(
-            input_data, "yaml"
-        )
+        result = perform_input_data_transformation_with_limits(input_data, "yaml")[0]
 
         expected = {"name": "John", "age": 30, "city": "New York"}
         assert result == expected
@@ -383,10 +470,79 @@ city: New York
         with pytest.raises(
             KeyError, match="No input data transformer found for name: invalid"
         ):
-            perform_input_data_transformation_with_transformer_name(
-                input_data, "invalid"
+            perform_input_data_transformation_with_limits(input_data, "invalid")
+
+
+BINARY_CONTENT_DATA = {
+    "json": '[{"name": "Žluťoučký", "age": 30}]',
+    "jsonl": '{"name": "Žluťoučký", "age": 30}\n{"name": "Žluťoučký", "age": 30}',
+    "yaml": "- name: Žluťoučký\n  age: 30\n",
+    "csv-comma": "name,age\nŽluťoučký,30\n",
+    "csv-semicolon": "name;age\nŽluťoučký;30\n",
+    "csv-tab": "name\tage\nŽluťoučký\t30\n",
+    "fwctable": "name       age\nŽluťoučký  30\n",
+}
+
+
+class TestBinaryContentInputData:
+    """Test transformation and detection of the input data passed as bytes or file reference."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        init_input_data_transformers(AgentConfig())
+
+    def get_input_data_variants(self, data: str, tmp_path) -> list[InputData]:
+        path = tmp_path / "data"
+        path.write_bytes(data.encode())
+        return [
+            InputData(id="1", data=data.encode()),
+            InputData(id="1", data=memoryview(data.encode())),  # type: ignore[typeddict-item]
+            InputData(id="1", data="", data_file=str(path)),
+        ]
+
+    @pytest.mark.parametrize("transformer_name", list(BINARY_CONTENT_DATA))
+    def test_transform_same_as_string(self, transformer_name, tmp_path) -> None:
+        data = BINARY_CONTENT_DATA[transformer_name]
+        expected = perform_input_data_transformation_with_limits(
+            InputData(id="1", data=data), transformer_name
+        )[0]
+        for input_data in self.get_input_data_variants(data, tmp_path):
+            assert (
+                perform_input_data_transformation_with_limits(
+                    input_data, transformer_name
+                )[0]
+                == expected
+            )
+            assert get_auto_detected_transformer_name(input_data) == transformer_name
+
+    def test_transform_noop_decoded(self, tmp_path) -> None:
+        for input_data in self.get_input_data_variants("Žluťoučký kůň", tmp_path):
+            assert (
+                perform_input_data_transformation_with_limits(input_data, "noop")[0]
+                == "Žluťoučký kůň"
             )
 
+    def test_transform_with_max_rows_data_file(self, tmp_path) -> None:
+        init_input_data_transformers(AgentConfig(input_data_max_rows=1))
+        path = tmp_path / "data.csv"
+        path.write_text("name\nA\nB\nC\n")
+        input_data = InputData(id="1", data="", data_file=str(path))
+        result, transformer_name, total_count, _ = (
+            perform_input_data_transformation_with_limits(input_data, "csv-comma")
+        )
+        assert result == [{"name": "A"}]
+        assert total_count == 3
+
+    def test_transform_data_file_missing(self, tmp_path) -> None:
+        input_data = InputData(
+            id="1", data="", data_file=str(tmp_path / "missing.json")
+        )
+        with pytest.raises(OSError):
+            perform_input_data_transformation_with_limits(input_data, "json")
+
+    def teardown_method(self) -> None:
+        init_input_data_transformers(AgentConfig())
+
 
 class TestConstantsAndGlobals:
     def setup_method(self) -> None:
@@ -462,6 +618,12 @@ class TestGetAutoDetectedTransformerName:
         result = get_auto_detected_transformer_name(input_data)
         assert result == "json"
 
+    def test_detect_jsonl(self) -> None:
+        """Test auto-detection returns 'jsonl' for JSON Lines data, not 'json'."""
+        input_data = InputData(id="test17", data='{"name": "John"}\n{"name": "Jane"}\n')
+        result = get_auto_detected_transformer_name(input_data)
+        assert result == "jsonl"
+
     def test_detect_yaml_with_key_value(self) -> None:
         """Test auto-detection returns 'yaml' for YAML with key-value pairs."""
         input_data = InputData(id="test3", data="name: John\nage: 30")
@@ -549,6 +711,42 @@ class TestGetAutoDetectedTransformerName:
         result = get_auto_detected_transformer_name(input_data)
         assert result == "csv-comma"
 
+    def test_detect_large_data_with_whitespaces(self) -> None:
+        """Test auto-detection with large data surrounded by whitespaces."""
+        data = "\n  \n" + json.dumps([{"id": i} for i in range(100000)]) + "\n  \n"
+        input_data = InputData(id="test15", data=data)
+        result = get_auto_detected_transformer_name(input_data)
+        assert result == "json"
+
+    def test_detect_shares_sample(self, monkeypatch) -> None:
+        """Test that all the detectors get the same data sample, and detection stops on the first matching transformer."""
+        samples = []
+
+        def spy(transformer_class):
+            original = transformer_class.detect_my_data_structure_in_sample
+
+            def detect(self, input_data, sample):
+                samples.append((transformer_class, sample))
+                return original(self, input_data, sample)
+
+            monkeypatch.setattr(
+                transformer_class, "detect_my_data_structure_in_sample", detect
+            )
+
+        spy(JsonInputDataTransformer)
+        spy(JsonlInputDataTransformer)
+        spy(YamlInputDataTransformer)
+        spy(CsvCommaInputDataTransformer)
+        input_data = InputData(id="test16", data='{"name": "John"}')
+        assert get_auto_detected_transformer_name(input_data) == "json"
+        assert [t for t, _ in samples] == [
+            YamlInputDataTransformer,
+            JsonlInputDataTransformer,
+            JsonInputDataTransformer,
+        ]
+        assert samples[0][1] is samples[1][1]
+        assert samples[0][1] is samples[2][1]
+
 
 class TestAutoDetectionWithConfiguration:
     """Test cases for auto-detection with configuration enabled/disabled."""
@@ -1,7 +1,19 @@
 import json
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
-from next_gen_ui_agent.types import InputData, InputDataTransformerBase
+from next_gen_ui_agent.data_structure_tools import InputDataContent, InputDataSample
+from next_gen_ui_agent.json_tools import (
+    json_get_depth,
+    json_loads,
+    json_loads_array_items,
+    json_loads_array_prefix,
+    json_truncate_depth,
+)
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
 
 
 class JsonInputDataTransformer(InputDataTransformerBase):
@@ -11,7 +23,9 @@ class JsonInputDataTransformer(InputDataTransformerBase):
 
     TRANSFORMER_NAME_LITERAL = Literal["json"]
 
-    def transform(self, input_data: str) -> Any:
+    TRANSFORMS_BINARY_CONTENT = True
+
+    def transform(self, input_data: InputDataContent) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
         Args:
@@ -23,7 +37,7 @@ class JsonInputDataTransformer(InputDataTransformerBase):
             ValueError: If the input data can't be parsed due to invalid format or if root is not object or array.
         """
         try:
-            parsed_data = json.loads(input_data)
+            parsed_data = json_loads(input_data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format of the Input Data: {e}") from e
 
@@ -35,19 +49,67 @@ class JsonInputDataTransformer(InputDataTransformerBase):
 
         return parsed_data
 
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """
+        Transform the input data with at most `max_rows` items of the JSON root array. Items are parsed one by one,
+        so items over `max_rows` are never parsed, they are only counted. JSON with root object is parsed whole.
+        """
+        if max_rows is None:
+            return self.transform_input_data(input_data), None
+        content = self.get_content(input_data)
+        try:
+            items, total_count = json_loads_array_items(content, max_rows)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format of the Input Data: {e}") from e
+        except ValueError:
+            # JSON root is not an array
+            return self.transform(content), None
+        return items, total_count if total_count > max_rows else None
+
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """
+        Transform items of the JSON root array complete in the first `max_size` characters/bytes of the input data,
+        they are parsed one by one. JSON with root object can't be transformed this way.
+        """
+        try:
+            return json_loads_array_prefix(self.get_content(input_data), max_size)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format of the Input Data: {e}") from e
+        except ValueError as e:
+            raise NotImplementedError(
+                "Only JSON with root array can be transformed partially"
+            ) from e
+
+    def get_input_data_depth(self, input_data: InputData) -> int:
+        """Get nesting depth of the JSON without parsing it."""
+        return json_get_depth(self.get_content(input_data))
+
+    def truncate_input_data_depth(
+        self, input_data: InputData, max_depth: int
+    ) -> InputDataContent:
+        """Replace the objects and arrays nested deeper than `max_depth` in the JSON by `null`, without parsing it."""
+        return json_truncate_depth(self.get_content(input_data), max_depth)
+
     def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data looks like JSON using heuristics."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
         """
         Detect if input data looks like JSON using heuristics.
         Checks first 1KB for JSON-like patterns without actual parsing.
         """
-        data_str = input_data["data"].strip()
-        if not data_str:
+        if sample.is_empty:
             return False
 
-        # Check first and last characters for JSON structure
-        first_char = data_str[0]
-        # For large data, check a reasonable sample for closing character
-        sample = data_str[:1024] if len(data_str) > 1024 else data_str
+        sample_str = sample.prefix
+        first_char = sample_str[0]
 
         # JSON must start with { or [
         if first_char not in ("{", "["):
@@ -55,12 +117,12 @@ class JsonInputDataTransformer(InputDataTransformerBase):
 
         # Basic heuristics: look for JSON-like patterns
         # Check for common JSON patterns: quotes, colons (for objects), commas, braces/brackets
-        has_quotes = '"' in sample
-        has_colons = ":" in sample
-        has_commas = "," in sample
+        has_quotes = '"' in sample_str
+        has_colons = ":" in sample_str
+        has_commas = "," in sample_str
         # Single-pass check: scan sample once instead of up to 4 times
-        has_structural_chars = any(c in "{}[]" for c in sample)
-        has_objects_inside = "{" in sample
+        has_structural_chars = any(c in "{}[]" for c in sample_str)
+        has_objects_inside = "{" in sample_str
 
         # For objects (starts with {), require colons and quotes
         if first_char == "{":
@@ -78,10 +140,10 @@ class JsonInputDataTransformer(InputDataTransformerBase):
             # - Look for JSON keywords (true, false, null) or quotes (strings) or commas
             # - Check for nested brackets (nested arrays like [[1], [2]])
             has_json_keywords = any(
-                keyword in sample for keyword in ("true", "false", "null")
+                keyword in sample_str for keyword in ("true", "false", "null")
             )
             # Count brackets to detect nested arrays - if more than 2 brackets, likely nested
-            bracket_count = sample.count("[") + sample.count("]")
+            bracket_count = sample_str.count("[") + sample_str.count("]")
             has_nested_arrays = bracket_count > 2
 
             return has_structural_chars and (
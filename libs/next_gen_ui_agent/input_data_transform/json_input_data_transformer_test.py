@@ -509,6 +509,73 @@ class TestJsonInputDataTransformer:
         assert len(engineering_matches[0]["employees"]) == 2
 
 
+class TestJsonInputDataTransformerWithMaxRows:
+    """Test cases for JsonInputDataTransformer with max rows."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.transformer = JsonInputDataTransformer()
+
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_truncated(self, binary) -> None:
+        data = json.dumps([{"id": i, "tags": ["a", "b"]} for i in range(10)])
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            InputData(id="1", data=data.encode() if binary else data), 3
+        )
+        assert result == [{"id": i, "tags": ["a", "b"]} for i in range(3)]
+        assert total_count == 10
+
+    def test_items_over_max_rows_not_parsed(self) -> None:
+        """Items over `max_rows` are only counted, so they are not parsed at all."""
+        data = '[{"id": 1}, {"id": 2}, {"id": nope}, [unparsable, "]"], 5]'
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            InputData(id="1", data=data), 2
+        )
+        assert result == [{"id": 1}, {"id": 2}]
+        assert total_count == 5
+
+    def test_not_truncated(self) -> None:
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            InputData(id="1", data="[1, 2]"), 2
+        )
+        assert result == [1, 2]
+        assert total_count is None
+
+    def test_root_object(self) -> None:
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            InputData(id="1", data='{"a": [1, 2, 3]}'), 1
+        )
+        assert result == {"a": [1, 2, 3]}
+        assert total_count is None
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="Invalid JSON format of the Input Data"):
+            self.transformer.transform_input_data_with_max_rows(
+                InputData(id="1", data="[1, {]"), 2
+            )
+        with pytest.raises(ValueError, match="Invalid JSON format of the Input Data"):
+            self.transformer.transform_input_data_with_max_rows(
+                InputData(id="1", data=""), 2
+            )
+
+
+class TestJsonInputDataTransformerDepth:
+    """Test cases for JsonInputDataTransformer depth of the raw input data."""
+
+    def test_get_input_data_depth(self) -> None:
+        transformer = JsonInputDataTransformer()
+        data = "[" * 100000 + "]" * 100000
+        assert transformer.get_input_data_depth(InputData(id="1", data=data)) == 100000
+
+    def test_truncate_input_data_depth(self) -> None:
+        transformer = JsonInputDataTransformer()
+        data = '[{"a": [1], "b": "[{"}]'
+        assert (
+            transformer.truncate_input_data_depth(InputData(id="1", data=data), 2)
+            == '[{"a": null, "b": "[{"}]'
+        )
+
+
 class TestJsonInputDataTransformerDetectMyDataStructure:
     """Test cases for JsonInputDataTransformer.detect_my_data_structure()."""
 
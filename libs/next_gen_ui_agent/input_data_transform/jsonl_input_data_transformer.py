@@ -0,0 +1,138 @@
+import json
+from itertools import islice
+from typing import Any, Iterator, Literal, Optional
+
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataContent,
+    InputDataSample,
+    get_lines_prefix,
+    iter_lines,
+)
+from next_gen_ui_agent.json_tools import json_get_depth, json_loads, json_truncate_depth
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
+
+
+class JsonlInputDataTransformer(InputDataTransformerBase):
+    """Input Data transformer from JSON Lines (aka NDJSON, newline-delimited JSON) format."""
+
+    TRANSFORMER_NAME = "jsonl"
+
+    TRANSFORMER_NAME_LITERAL = Literal["jsonl"]
+
+    TRANSFORMS_BINARY_CONTENT = True
+
+    def transform(self, input_data: InputDataContent) -> Any:
+        """
+        Transform the input data into the object tree matching parsed JSON format.
+
+        Every non-empty line of the input data must contain one JSON object, empty lines are skipped.
+
+        Args:
+            input_data: Input data string to transform.
+        Returns:
+            Object tree matching parsed JSON format (list of dicts, one for each line), so `jsonpath_ng` can be used
+            to access the data, and Pydantic `model_dump_json()` can be used to convert it to JSON string.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format or if any line is not JSON object.
+        """
+        return self.transform_rows(input_data, None)[0]
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """Transform the input data with at most `max_rows` records, see `transform_rows`."""
+        return self.transform_rows(self.get_content(input_data), max_rows)
+
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """Transform complete records (lines) in the first `max_size` characters/bytes of the input data."""
+        return self.transform(get_lines_prefix(self.get_content(input_data), max_size))
+
+    def get_input_data_depth(self, input_data: InputData) -> int:
+        """Get nesting depth of the records without parsing them, records are items of the root array."""
+        return json_get_depth(self.get_content(input_data)) + 1
+
+    def truncate_input_data_depth(
+        self, input_data: InputData, max_depth: int
+    ) -> InputDataContent:
+        """Replace the objects and arrays nested deeper than `max_depth` in the records by `null`, without parsing them."""
+        if max_depth < 2:
+            raise NotImplementedError("Records can't be replaced by null")
+        return json_truncate_depth(self.get_content(input_data), max_depth - 1)
+
+    def transform_rows(
+        self, input_data: InputDataContent, max_rows: Optional[int]
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """
+        Transform the input data into the list of records, see `transform`.
+
+        Lines are parsed lazily from the input data string, so only `max_rows` records are parsed and held in memory,
+        rest of the non-empty lines is only counted.
+
+        Args:
+            input_data: Input data string to transform.
+            max_rows: Maximal number of records to parse, `None` for no limit.
+        Returns:
+            * List of records.
+            * Total number of records in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format or if any line is not JSON object.
+        """
+        lines = self._iter_non_empty_lines(input_data)
+        parsed_data = []
+        for line_number, line in islice(lines, max_rows):
+            try:
+                record = json_loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"Invalid JSON Lines format of the Input Data on line {line_number}: {e}"
+                ) from e
+            if not isinstance(record, dict):
+                raise ValueError(
+                    f"Invalid JSON Lines format of the Input Data on line {line_number}: JSON object expected"
+                )
+            parsed_data.append(record)
+
+        # Rest of the records over `max_rows` is only counted
+        skipped_rows = sum(1 for _ in lines)
+        if skipped_rows:
+            return parsed_data, len(parsed_data) + skipped_rows
+        return parsed_data, None
+
+    def _iter_non_empty_lines(
+        self, input_data: InputDataContent
+    ) -> Iterator[tuple[int, str]]:
+        """Iterate over non-empty lines of the input data with their line numbers (starting from 1)."""
+        for line_number, line in enumerate(iter_lines(input_data), start=1):
+            if not line.isspace():
+                yield line_number, line
+
+    def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data looks like JSON Lines using heuristics."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
+        """
+        Detect if input data looks like JSON Lines using heuristics.
+        Checks first 1KB for at least two lines with JSON objects, without actual parsing.
+        So the first record must fit into the first 1KB to be detected.
+        """
+        lines = sample.lines
+        if len(lines) < 2:
+            return False
+
+        # First line must contain whole JSON object, second line must start a JSON object
+        first_line = lines[0].rstrip()
+        return (
+            first_line.startswith("{")
+            and first_line.endswith("}")
+            and '"' in first_line
+            and lines[1].lstrip().startswith("{")
+        )
@@ -0,0 +1,124 @@
+import pytest
+from jsonpath_ng import parse  # type: ignore
+from next_gen_ui_agent.input_data_transform.jsonl_input_data_transformer import (
+    JsonlInputDataTransformer,
+)
+from next_gen_ui_agent.types import InputData
+
+
+class TestJsonlInputDataTransformer:
+    """Test cases for JSON Lines input data transformer."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.transformer = JsonlInputDataTransformer()
+
+    def test_transformer_name(self) -> None:
+        """Test that transformer has correct name."""
+        assert self.transformer.TRANSFORMER_NAME == "jsonl"
+
+    def test_transform_basic(self) -> None:
+        """Test transforming basic JSON Lines data, empty lines are skipped."""
+        input_data = """{"name": "John", "age": 30, "tags": ["a", "b"]}
+
+{"name": "Jane", "age": 25, "address": {"city": "Boston"}}\r
+"""
+
+        result = self.transformer.transform(input_data)
+
+        assert result == [
+            {"name": "John", "age": 30, "tags": ["a", "b"]},
+            {"name": "Jane", "age": 25, "address": {"city": "Boston"}},
+        ]
+
+    def test_transform_empty(self) -> None:
+        """Test transforming empty data."""
+        assert self.transformer.transform("") == []
+        assert self.transformer.transform("  \n\n") == []
+
+    def test_transform_output_accessible_with_jsonpath_ng(self) -> None:
+        """Test that output can be accessed with jsonpath_ng."""
+        result = self.transformer.transform('{"name": "John"}\n{"name": "Jane"}')
+
+        names = [match.value for match in parse("$[*].name").find(result)]
+        assert names == ["John", "Jane"]
+
+    def test_transform_invalid_json_line(self) -> None:
+        """Test invalid JSON on line raises ValueError with line number."""
+        with pytest.raises(
+            ValueError,
+            match="Invalid JSON Lines format of the Input Data on line 3: ",
+        ):
+            self.transformer.transform('{"name": "John"}\n\n{"name": \n')
+
+    def test_transform_not_object_line(self) -> None:
+        """Test line with other JSON value than object raises ValueError."""
+        with pytest.raises(
+            ValueError,
+            match="Invalid JSON Lines format of the Input Data on line 2: JSON object expected",
+        ):
+            self.transformer.transform('{"name": "John"}\n[1, 2]\n')
+
+    def test_transform_rows_max_rows(self) -> None:
+        """Test records over max rows are only counted, not parsed."""
+        input_data = '{"id": 1}\n{"id": 2}\n\n{"id": 3}\nnot parsed\n'
+
+        result, total_count = self.transformer.transform_rows(input_data, 2)
+
+        assert result == [{"id": 1}, {"id": 2}]
+        assert total_count == 4
+
+    def test_transform_rows_max_rows_not_exceeded(self) -> None:
+        """Test total count is not provided if records are not truncated."""
+        result, total_count = self.transformer.transform_rows(
+            '{"id": 1}\n{"id": 2}\n', 2
+        )
+
+        assert result == [{"id": 1}, {"id": 2}]
+        assert total_count is None
+
+    def test_transform_input_data_with_max_rows(self) -> None:
+        """Test transformation of the InputData with max rows."""
+        input_data = InputData(id="1", data='{"id": 1}\n{"id": 2}\n')
+
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            input_data, 1
+        )
+
+        assert result == [{"id": 1}]
+        assert total_count == 2
+
+
+class TestJsonlInputDataTransformerDetectMyDataStructure:
+    """Test cases for JSON Lines detection."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.transformer = JsonlInputDataTransformer()
+
+    def test_detect_valid(self) -> None:
+        input_data = InputData(
+            id="1", data='\n{"name": "John"}\n  {"name": "Jane"}\n{"name": "Jack"}'
+        )
+        assert self.transformer.detect_my_data_structure(input_data) is True
+
+    def test_detect_large_data(self) -> None:
+        input_data = InputData(id="1", data='{"name": "John"}\n' * 100000)
+        assert self.transformer.detect_my_data_structure(input_data) is True
+
+    def test_detect_invalid_single_line_json(self) -> None:
+        input_data = InputData(id="1", data='{"name": "John"}\n')
+        assert self.transformer.detect_my_data_structure(input_data) is False
+
+    def test_detect_invalid_pretty_printed_json(self) -> None:
+        input_data = InputData(id="1", data='{\n  "name": "John"\n}\n')
+        assert self.transformer.detect_my_data_structure(input_data) is False
+
+    def test_detect_invalid_json_array(self) -> None:
+        input_data = InputData(id="1", data='[{"name": "John"},\n{"name": "Jane"}]')
+        assert self.transformer.detect_my_data_structure(input_data) is False
+
+    def test_detect_invalid_other_formats(self) -> None:
+        for data in ["", "name: John\nage: 30", "a,b\n1,2", "{a}\n{b}"]:
+            input_data = InputData(id="1", data=data)
+            assert self.transformer.detect_my_data_structure(input_data) is False
@@ -1,6 +1,11 @@
 from typing import Any, Literal
 
-from next_gen_ui_agent.types import InputData, InputDataTransformerBase
+from next_gen_ui_agent.data_structure_tools import get_text_prefix
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
 
 
 class NoopInputDataTransformer(InputDataTransformerBase):
@@ -26,6 +31,10 @@ class NoopInputDataTransformer(InputDataTransformerBase):
         """
         return input_data
 
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """Keep only the first `max_size` characters (bytes for binary data) of the input data, only they are decoded."""
+        return get_text_prefix(get_input_data_content(input_data), max_size)
+
     def detect_my_data_structure(self, input_data: InputData) -> bool:
         """
         NOOP transformer should not be auto-detected.
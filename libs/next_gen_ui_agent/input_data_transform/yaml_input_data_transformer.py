@@ -1,7 +1,12 @@
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
-import yaml  # type: ignore[import-untyped]
-from next_gen_ui_agent.types import InputData, InputDataTransformerBase
+from next_gen_ui_agent.data_structure_tools import InputDataContent, InputDataSample
+from next_gen_ui_agent.types import (
+    InputData,
+    InputDataTransformerBase,
+    get_input_data_content,
+)
+from next_gen_ui_agent.yaml_tools import yaml_safe_load_documents
 
 
 class YamlInputDataTransformer(InputDataTransformerBase):
@@ -11,9 +16,13 @@ class YamlInputDataTransformer(InputDataTransformerBase):
 
     TRANSFORMER_NAME_LITERAL = Literal["yaml"]
 
-    def transform(self, input_data: str) -> Any:
+    TRANSFORMS_BINARY_CONTENT = True
+
+    def transform(self, input_data: InputDataContent) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
+
+        If the input data contain more YAML documents (separated by `---`), they are returned as array of the documents.
         Args:
             input_data: Input data string to transform.
         Returns:
@@ -22,41 +31,79 @@ class YamlInputDataTransformer(InputDataTransformerBase):
         Raises:
             ValueError: If the input data can't be parsed due to invalid format or if root is not object or array.
         """
+        return self.transform_documents(input_data, None)[0]
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """Transform the input data with at most `max_rows` YAML documents, see `transform_documents`."""
+        return self.transform_documents(self.get_content(input_data), max_rows)
+
+    def transform_documents(
+        self, input_data: InputDataContent, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """
+        Transform the input data into the object tree, see `transform`.
+
+        Multi-document YAML is transformed into array of at most `max_rows` documents, rest of the documents is only
+        counted by the YAML parser, without constructing them. Single YAML document is never truncated.
+        Args:
+            input_data: Input data string to transform.
+            max_rows: Maximal number of YAML documents to transform, `None` for no limit.
+        Returns:
+            * Object tree matching parsed JSON format.
+            * Total number of YAML documents in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format or if root is not object or array.
+        """
+        import yaml  # type: ignore[import-untyped]
+
         try:
-            parsed_data = yaml.safe_load(input_data)
+            documents, total_count = yaml_safe_load_documents(input_data, max_rows)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format of the Input Data: {e}") from e
 
+        if len(documents) > 1 or total_count is not None:
+            return documents, total_count
+
         # Check that the root element is either an object (dict) or array (list)
+        parsed_data = documents[0] if documents else None
         if not isinstance(parsed_data, (dict, list)):
             raise ValueError(
                 "Invalid YAML format of the Input Data: YAML root must be an object or array"
             )
 
-        return parsed_data
+        return parsed_data, None
 
     def detect_my_data_structure(self, input_data: InputData) -> bool:
+        """Detect if input data looks like YAML using heuristics."""
+        return self.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(get_input_data_content(input_data))
+        )
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
         """
         Detect if input data looks like YAML using heuristics.
         Checks first 1KB for YAML-like patterns without actual parsing.
         """
-        data_str = input_data["data"].strip()
-        if not data_str:
+        if sample.is_empty:
             return False
 
         # Check first 1KB for YAML patterns
-        sample = data_str[:1024] if len(data_str) > 1024 else data_str
+        sample_str = sample.prefix
 
         # YAML heuristics - check for common YAML patterns:
         # - Starts with document marker (---)
         # - Has key: value patterns (colon followed by space or newline)
         # - Has list markers (- followed by space)
-        has_yaml_separator = sample.startswith("---")
-        has_key_value = ": " in sample or ":\n" in sample
-        has_list_marker = "\n- " in sample or sample.startswith("- ")
+        has_yaml_separator = sample_str.startswith("---")
+        has_key_value = ": " in sample_str or ":\n" in sample_str
+        has_list_marker = "\n- " in sample_str or sample_str.startswith("- ")
 
         # Should NOT look like JSON (starts with { or [)
-        looks_like_json = data_str[0] in ("{", "[")
+        looks_like_json = sample_str[0] in ("{", "[")
 
         return (
             has_yaml_separator or has_key_value or has_list_marker
@@ -209,6 +209,43 @@ title: "Simple Title"
         ):
             self.transformer.transform(input_data)
 
+    def test_transform_multiple_documents(self) -> None:
+        """Test that multi-document YAML is transformed into array of documents, empty documents are skipped."""
+        input_data = "---\nname: John\n---\nname: Jane\n---\n"
+
+        result = self.transformer.transform(input_data)
+
+        assert result == [{"name": "John"}, {"name": "Jane"}]
+
+    def test_transform_multiple_documents_max_rows(self) -> None:
+        """Test that only `max_rows` documents are transformed and rest is counted."""
+        input_data = "\n---\n".join(f"name: User {i}" for i in range(5)) + "\n---\n"
+
+        result, total_count = self.transformer.transform_input_data_with_max_rows(
+            cast(InputData, {"id": "test", "data": input_data}), 2
+        )
+
+        assert result == [{"name": "User 0"}, {"name": "User 1"}]
+        assert total_count == 5
+
+    def test_transform_multiple_documents_max_rows_not_exceeded(self) -> None:
+        """Test that documents are not truncated if there is not more than `max_rows` of them."""
+        input_data = "name: John\n---\nname: Jane\n---\n"
+
+        result, total_count = self.transformer.transform_documents(input_data, 2)
+
+        assert result == [{"name": "John"}, {"name": "Jane"}]
+        assert total_count is None
+
+    def test_transform_single_document_max_rows(self) -> None:
+        """Test that single document is never truncated."""
+        input_data = "- name: John\n- name: Jane\n"
+
+        result, total_count = self.transformer.transform_documents(input_data, 1)
+
+        assert result == [{"name": "John"}, {"name": "Jane"}]
+        assert total_count is None
+
     def test_transform_accepts_object_root(self) -> None:
         """Test that object root values are accepted."""
         input_data = """
@@ -0,0 +1,313 @@
+"""
+JSON encoding and decoding used by the UI Agent and its bindings.
+
+Fast `orjson` or `msgspec` library is used if installed, stdlib `json` module otherwise.
+Parsed results are the same for all backends: if the fast backend can't process the value
+(eg. `NaN` or integers out of 64 bit range), stdlib `json` is used for it, so also the same
+`json.JSONDecodeError` is raised for invalid JSON.
+"""
+
+import codecs
+import json
+import mmap
+import operator
+import re
+from array import array
+from itertools import accumulate
+from typing import Any, AnyStr, Callable, Optional, cast
+
+JsonInput = str | bytes | mmap.mmap
+"""JSON string, UTF-8 encoded bytes, or memory-mapped file with JSON."""
+
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_MSGSPEC = "msgspec"
+JSON_BACKEND_STDLIB = "json"
+
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+_ARRAY_ITEMS_PREFIX_SIZE = 64 * 1024
+_STRUCTURE_CHUNK_SIZE = 1024 * 1024
+_ESCAPE_PATTERN = re.compile(rb"\\.", re.DOTALL)
+_STRUCTURE_STRING_PATTERN = re.compile(rb'"[^"]*"')
+_NOT_STRUCTURE = bytes(char for char in range(256) if char not in b'[]{},"')
+# translations of the structure (brackets and commas), -1 is stored as 255 read as signed byte
+_DEPTH_CHANGES = bytes.maketrans(b"[{]},", b"\x01\x01\xff\xff\x00")
+_COMMAS = bytes.maketrans(b"[{]},", b"\x00\x00\x00\x00\x01")
+_JSON_TOKEN = r'"[^"\\]*(?:\\.[^"\\]*)*"|([\[{])|([\]}])'
+"""String, opening (group 1) or closing (group 2) bracket of JSON."""
+_JSON_TOKEN_PATTERN = re.compile(_JSON_TOKEN, re.DOTALL)
+_JSON_TOKEN_PATTERN_BINARY = re.compile(_JSON_TOKEN.encode(), re.DOTALL)
+
+
+def _stdlib_loads(data: JsonInput) -> Any:
+    if isinstance(data, mmap.mmap):
+        data = str(data, "utf-8")
+    return json.loads(data)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _load_backend() -> tuple[str, Callable[[JsonInput], Any], Callable[[Any], str]]:
+    """Get name, loads and dumps function of the fastest installed JSON backend."""
+    try:
+        import orjson  # type: ignore[import-not-found,unused-ignore] # pants: no-infer-dep
+
+        def orjson_loads(data: JsonInput) -> Any:
+            try:
+                if isinstance(data, mmap.mmap):
+                    with memoryview(data) as view:
+                        return orjson.loads(view)
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                return _stdlib_loads(data)
+
+        def orjson_dumps(value: Any) -> str:
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                return _stdlib_dumps(value)
+
+        return JSON_BACKEND_ORJSON, orjson_loads, orjson_dumps
+    except ImportError:
+        pass
+
+    try:
+        import msgspec  # type: ignore[import-not-found,unused-ignore] # pants: no-infer-dep
+
+        decoder = msgspec.json.Decoder()
+        encoder = msgspec.json.Encoder()
+
+        def msgspec_loads(data: JsonInput) -> Any:
+            try:
+                if isinstance(data, mmap.mmap):
+                    with memoryview(data) as view:
+                        return decoder.decode(view)
+                return decoder.decode(data)
+            except msgspec.DecodeError:
+                return _stdlib_loads(data)
+
+        def msgspec_dumps(value: Any) -> str:
+            try:
+                encoded: bytes = encoder.encode(value)
+                return encoded.decode()
+            except (TypeError, msgspec.EncodeError):
+                return _stdlib_dumps(value)
+
+        return JSON_BACKEND_MSGSPEC, msgspec_loads, msgspec_dumps
+    except ImportError:
+        pass
+
+    return JSON_BACKEND_STDLIB, _stdlib_loads, _stdlib_dumps
+
+
+JSON_BACKEND, _loads, _dumps = _load_backend()
+"""Name of the used JSON backend - `orjson`, `msgspec` or `json`."""
+
+
+def json_loads(data: JsonInput) -> Any:
+    """
+    Parse JSON string into the object tree, same as `json.loads()`.
+    Memory-mapped file is parsed directly by fast backends, without reading it into memory.
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    return _loads(data)
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Serialize the object tree into compact JSON string, non-ASCII characters are not escaped.
+    Fast backends serialize `NaN` and infinite float values as `null`, as JSON has no representation for them.
+    Raises:
+        TypeError: If the value is not JSON serializable.
+    """
+    return _dumps(value)
+
+
+def json_loads_array_prefix(data: JsonInput, max_size: int) -> list[Any]:
+    """
+    Parse items of the JSON root array which are complete in the first `max_size` characters (bytes for binary data) of the data.
+    Only this beginning of the data is decoded and parsed, item by item, so huge JSON array is never parsed whole.
+    Parsing stops at the first item which can't be parsed, as it is considered to be cut at the end of the prefix.
+    Raises:
+        json.JSONDecodeError: If items are not delimited correctly.
+        ValueError: If the JSON root is not an array.
+    """
+    text = _decode_prefix(data, max_size)
+    if _skip_whitespace(text, 0) == len(text):
+        return []
+    return _loads_array_prefix(text, None, max_size >= len(data))[0]
+
+
+def json_loads_array_items(data: JsonInput, max_items: int) -> tuple[list[Any], int]:
+    """
+    Parse the first `max_items` items of the JSON root array, the remaining items are only counted.
+    Only the beginning of the data containing these items is decoded and parsed, item by item. The remaining items
+    are neither parsed nor validated, only delimiters of the root array items are counted (see `json_get_depth`).
+    Returns:
+        * Parsed items, at most `max_items` of them.
+        * Total number of the root array items.
+    Raises:
+        json.JSONDecodeError: If the parsed items are not valid JSON or not delimited correctly.
+        ValueError: If the JSON root is not an array.
+    """
+    # grow the parsed beginning of the data until it contains all the needed items
+    size = len(data) if isinstance(data, str) else _ARRAY_ITEMS_PREFIX_SIZE
+    while True:
+        text = _decode_prefix(data, size)
+        items, index, closed = _loads_array_prefix(text, max_items, size >= len(data))
+        if closed:
+            return items, len(items)
+        if len(items) == max_items:
+            break
+        if size >= len(data):
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, len(text))
+        size *= 4
+    offset = index if isinstance(data, str) else len(text[:index].encode())
+    # data continue with the next item after the delimiter
+    return items, max_items + 1 + _count_root_commas(_get_structure(data, offset))
+
+
+def json_get_depth(data: JsonInput) -> int:
+    """
+    Get nesting depth of the objects and arrays in the JSON (or JSON Lines) without parsing it, root object or array has depth 1, other values 0.
+    Only brackets outside of the strings are counted, in bulk string operations, so the depth of the JSON nested too deeply
+    to be parsed can be checked too, and much faster than the JSON can be parsed. The JSON is not validated.
+    """
+    return max(
+        accumulate(array("b", _get_structure(data).translate(_DEPTH_CHANGES))),
+        default=0,
+    )
+
+
+def json_truncate_depth(data: JsonInput, max_depth: int) -> JsonInput:
+    """
+    Replace the objects and arrays nested deeper than `max_depth` in the JSON (or JSON Lines) by `null`, without parsing it,
+    so also the JSON nested too deeply to be parsed can be truncated. The JSON is not validated.
+    Returns:
+        Truncated JSON - `str` for `str` data, `bytes` otherwise. The same `data` if nothing is nested deeper than `max_depth`.
+    """
+    if isinstance(data, str):
+        return _truncate_depth(data, max_depth, _JSON_TOKEN_PATTERN, "null")
+    # memory-mapped file supports the same slicing and searching as `bytes`
+    return _truncate_depth(
+        cast(bytes, data), max_depth, _JSON_TOKEN_PATTERN_BINARY, b"null"
+    )
+
+
+def _truncate_depth(
+    data: AnyStr, max_depth: int, pattern: re.Pattern[AnyStr], null: AnyStr
+) -> AnyStr:
+    parts = []
+    depth = 0
+    # end of the data already copied into the parts
+    copied = 0
+    for match in pattern.finditer(data):
+        if match.lastindex == 1:
+            depth += 1
+            if depth == max_depth + 1:
+                parts.append(data[copied : match.start()])
+                parts.append(null)
+        elif match.lastindex == 2:
+            if depth == max_depth + 1:
+                copied = match.end()
+            depth -= 1
+    if not parts:
+        return data
+    parts.append(data[copied:])
+    return null[:0].join(parts)
+
+
+def _decode_prefix(data: JsonInput, max_size: int) -> str:
+    if isinstance(data, str):
+        return data[:max_size]
+    # character possibly cut at the end is ignored
+    return codecs.getincrementaldecoder("utf-8")().decode(data[:max_size])
+
+
+def _loads_array_prefix(
+    text: str, max_items: Optional[int], whole: bool
+) -> tuple[list[Any], int, bool]:
+    """
+    Parse items of the JSON root array complete in the text, at most `max_items` of them.
+    `whole` is `True` if the text contains the whole data, not only its prefix.
+    Returns parsed items, index of the text after the delimiter of the last parsed item, and `True` if the root array is closed by it.
+    """
+    decoder = json.JSONDecoder()
+    items: list[Any] = []
+    index = _skip_whitespace(text, 0)
+    if index == len(text) and not whole:
+        # root is not in the prefix yet
+        return items, index, False
+    if not text.startswith("[", index):
+        raise ValueError("JSON root is not an array")
+    index = _skip_whitespace(text, index + 1)
+    if text.startswith("]", index):
+        return items, index + 1, True
+    while index < len(text) and len(items) != max_items:
+        try:
+            item, end = decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            # item cut at the end of the prefix
+            break
+        end = _skip_whitespace(text, end)
+        if end == len(text):
+            # item may be cut at the end of the prefix (eg. number), so it is not complete
+            break
+        if text[end] not in ",]":
+            if not whole:
+                # item cut at the end of the prefix can be parsed as valid shorter one, eg. `1.` as `1`
+                break
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, end)
+        items.append(item)
+        index = end + 1
+        if text[end] == "]":
+            return items, index, True
+        index = _skip_whitespace(text, index)
+    return items, index, False
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    match = _WHITESPACE_PATTERN.match(text, index)
+    return match.end() if match else index
+
+
+def _get_structure(data: JsonInput, start: int = 0) -> bytes:
+    """
+    Get brackets and commas of the JSON from the `start` index outside of the strings, in their order.
+    Data are processed in chunks by bulk string operations, so the structure of huge JSON is obtained quickly, without parsing it.
+    """
+    chunks = []
+    skip_escaped = False
+    for chunk_start in range(start, len(data), _STRUCTURE_CHUNK_SIZE):
+        chunk = data[chunk_start : chunk_start + _STRUCTURE_CHUNK_SIZE]
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8", "surrogatepass")
+        if skip_escaped:
+            chunk = chunk[1:]
+            skip_escaped = False
+        if b"\\" in chunk:
+            # escaped characters can't delimit strings
+            chunk = _ESCAPE_PATTERN.sub(b"", chunk)
+            if chunk.endswith(b"\\"):
+                # escaped character is in the next chunk
+                chunk = chunk[:-1]
+                skip_escaped = True
+        chunks.append(chunk.translate(None, _NOT_STRUCTURE))
+    structure = b"".join(chunks)
+    # strings without brackets and commas are removed as pairs of quotes, only strings containing them need regex,
+    # as the first such string always leaves unpaired quote
+    without_strings = structure.replace(b'""', b"")
+    if b'"' in without_strings:
+        without_strings = _STRUCTURE_STRING_PATTERN.sub(b"", structure)
+    return without_strings
+
+
+def _count_root_commas(structure: bytes) -> int:
+    """Count commas of the structure (see `_get_structure`) starting inside the root array which are not nested deeper."""
+    depths = accumulate(array("b", structure.translate(_DEPTH_CHANGES)))
+    return sum(
+        map(operator.and_, structure.translate(_COMMAS), map(operator.not_, depths))
+    )
@@ -0,0 +1,205 @@
+import json
+import math
+import sys
+
+import pytest
+from next_gen_ui_agent import json_tools
+from next_gen_ui_agent.json_tools import (
+    JSON_BACKEND,
+    JSON_BACKEND_STDLIB,
+    _load_backend,
+    json_dumps,
+    json_get_depth,
+    json_loads,
+    json_loads_array_items,
+    json_loads_array_prefix,
+    json_truncate_depth,
+)
+
+DATA = {
+    "title": "Toy Story ☃",
+    "year": 1995,
+    "rating": 8.3,
+    "actors": ["Tom Hanks", "Tim Allen"],
+    "director": {"name": "John Lasseter", "alive": True, "oscars": None},
+    "big": 2**70,
+}
+
+
+def get_backends():
+    """Get all available backends, stdlib as the last one."""
+    backends = [_load_backend()]
+    if backends[0][0] != JSON_BACKEND_STDLIB:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setitem(sys.modules, "orjson", None)
+            mp.setitem(sys.modules, "msgspec", None)
+            backends.append(_load_backend())
+    return backends
+
+
+BACKENDS = get_backends()
+BACKEND_IDS = [backend[0] for backend in BACKENDS]
+
+
+def test_backend_stdlib_fallback() -> None:
+    assert BACKENDS[-1][0] == JSON_BACKEND_STDLIB
+    assert JSON_BACKEND == BACKENDS[0][0]
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=BACKEND_IDS)
+class TestJsonBackend:
+    """Test cases for JSON backends, results must be the same as for stdlib `json`."""
+
+    def test_loads(self, backend) -> None:
+        _, loads, _ = backend
+        data = json.dumps(DATA)
+        assert loads(data) == DATA
+        assert loads(data.encode()) == DATA
+
+    def test_loads_nan_and_big_int(self, backend) -> None:
+        _, loads, _ = backend
+        result = loads('{"a": NaN, "b": 123456789012345678901234567890}')
+        assert math.isnan(result["a"])
+        assert result["b"] == 123456789012345678901234567890
+
+    def test_loads_invalid(self, backend) -> None:
+        _, loads, _ = backend
+        with pytest.raises(json.JSONDecodeError) as e:
+            loads('{"a": 1,}')
+        with pytest.raises(json.JSONDecodeError) as stdlib_e:
+            json.loads('{"a": 1,}')
+        assert str(e.value) == str(stdlib_e.value)
+
+    def test_dumps(self, backend) -> None:
+        _, _, dumps = backend
+        result = dumps(DATA)
+        assert isinstance(result, str)
+        assert "☃" in result
+        assert json.loads(result) == DATA
+
+    def test_dumps_non_str_keys(self, backend) -> None:
+        _, _, dumps = backend
+        assert json.loads(dumps({1: "a"})) == {"1": "a"}
+
+    def test_dumps_not_serializable(self, backend) -> None:
+        _, _, dumps = backend
+        with pytest.raises(TypeError):
+            dumps({"a": object()})
+
+
+def test_json_loads_dumps() -> None:
+    assert json_loads(json_dumps(DATA)) == DATA
+
+
+class TestJsonLoadsArrayPrefix:
+    DATA = '  [ {"a": 1}, 22 ,"x", [1, 2] ]  '
+
+    def test_whole_data(self) -> None:
+        assert json_loads_array_prefix(self.DATA, 1000) == json.loads(self.DATA)
+        assert json_loads_array_prefix(" [ ] ", 1000) == []
+
+    def test_prefix(self) -> None:
+        expected = [
+            (len(self.DATA), [{"a": 1}, 22, "x", [1, 2]]),
+            (30, [{"a": 1}, 22, "x"]),
+            # number may be cut, so it is not used
+            (16, [{"a": 1}]),
+            (10, []),
+            (1, []),
+        ]
+        for max_size, items in expected:
+            assert json_loads_array_prefix(self.DATA, max_size) == items
+            assert json_loads_array_prefix(self.DATA.encode(), max_size) == items
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="JSON root is not an array"):
+            json_loads_array_prefix('{"a": [1]}', 5)
+        with pytest.raises(json.JSONDecodeError, match="Expecting ',' delimiter"):
+            json_loads_array_prefix("[1 2, 3]", 100)
+        # invalid delimiter may be caused by the cut item, so it's not an error in the prefix
+        assert json_loads_array_prefix("[1 2, 3]", 5) == []
+
+    @pytest.mark.parametrize(
+        "data, max_size, items",
+        [
+            ("[1, 12345.678]", 9, [1]),
+            ("[1, 1e5, 2]", 6, [1]),
+            ("[1, -5, 2]", 5, [1]),
+            (json.dumps([12345.678] * 20000), 7, []),
+        ],
+    )
+    def test_prefix_cut_in_number(self, data: str, max_size: int, items: list) -> None:
+        assert json_loads_array_prefix(data, max_size) == items
+        assert json_loads_array_prefix(data.encode(), max_size) == items
+
+
+class TestJsonLoadsArrayItems:
+    DATA = '  [ {"a": 1}, 22 ,"x,]", [1, {"b": "\\"]"}], "\\\\"]  '
+
+    def test_items(self) -> None:
+        items = json.loads(self.DATA)
+        for max_items in range(1, 7):
+            expected = (items[:max_items], len(items))
+            assert json_loads_array_items(self.DATA, max_items) == expected
+            assert json_loads_array_items(self.DATA.encode(), max_items) == expected
+
+    def test_empty(self) -> None:
+        assert json_loads_array_items(" [ ] ", 3) == ([], 0)
+
+    def test_prefix_growing(self, monkeypatch) -> None:
+        monkeypatch.setattr(json_tools, "_ARRAY_ITEMS_PREFIX_SIZE", 3)
+        data = json.dumps(list(range(100))).encode()
+        assert json_loads_array_items(data, 30) == (list(range(30)), 100)
+
+    @pytest.mark.parametrize("number", ["1.5", "1e5", "-5", "12345.678"])
+    def test_prefix_cut_in_number(self, number: str, monkeypatch) -> None:
+        data = ("[" + ", ".join([number] * 100) + "]").encode()
+        expected = json.loads(data)
+        # every cut position inside the numbers is tried
+        for prefix_size in range(2, 2 + len(number) + 2):
+            monkeypatch.setattr(json_tools, "_ARRAY_ITEMS_PREFIX_SIZE", prefix_size)
+            assert json_loads_array_items(data, 3) == (expected[:3], 100)
+            assert json_loads_array_items(b"  " + data, 3) == (expected[:3], 100)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="JSON root is not an array"):
+            json_loads_array_items('{"a": [1]}', 5)
+        with pytest.raises(json.JSONDecodeError, match="Expecting ',' delimiter"):
+            json_loads_array_items(b"[1 2, 3]", 5)
+        with pytest.raises(json.JSONDecodeError, match="Expecting ',' delimiter"):
+            json_loads_array_items("[1 2, 3]", 5)
+        with pytest.raises(json.JSONDecodeError):
+            json_loads_array_items("[1, 2", 5)
+
+
+class TestJsonDepth:
+    def test_get_depth(self) -> None:
+        assert json_get_depth("1") == 0
+        assert json_get_depth(" [ ] ") == 1
+        assert json_get_depth('{"a": [1, {"b": {}}], "c": "]]"}') == 4
+        assert json_get_depth('["[[", "\\"[", "\\\\", [{}]]'.encode()) == 3
+        # JSON Lines
+        assert json_get_depth('{"a": [1]}\n{"b": 2}') == 2
+
+    def test_get_depth_deeply_nested(self) -> None:
+        data = "[" * 100000 + "]" * 100000
+        assert json_get_depth(data) == 100000
+
+    def test_get_depth_escapes_across_chunks(self, monkeypatch) -> None:
+        monkeypatch.setattr(json_tools, "_STRUCTURE_CHUNK_SIZE", 3)
+        for data in ['["\\"[", [[1]]]', '[" \\\\", [[1]]]', '["\\\\\\"[", [[1]]]']:
+            assert json_get_depth(data) == 3
+            assert json_get_depth(data.encode()) == 3
+
+    def test_truncate_depth(self) -> None:
+        data = '{"a": [1, {"b": {}}], "c": "}]"}'
+        assert json_truncate_depth(data, 4) is data
+        assert json_truncate_depth(data, 3) == '{"a": [1, {"b": null}], "c": "}]"}'
+        assert json_truncate_depth(data, 2) == '{"a": [1, null], "c": "}]"}'
+        assert json_truncate_depth(data, 1) == '{"a": null, "c": "}]"}'
+        assert json_truncate_depth(data.encode(), 1) == b'{"a": null, "c": "}]"}'
+        assert json_truncate_depth('{"a": "\\"{"}', 1) == '{"a": "\\"{"}'
+
+    def test_truncate_depth_deeply_nested(self) -> None:
+        data = "[" * 100000 + "]" * 100000
+        assert json_loads(json_truncate_depth(data, 3)) == [[[None]]]
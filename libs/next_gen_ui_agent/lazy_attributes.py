@@ -0,0 +1,32 @@
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def create_lazy_attributes(
+    module_name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create PEP 562 module `__getattr__` and `__dir__` functions for the module (package) `module_name`,
+    so its `attributes` are imported from their submodules on the first access, not to slow down the UI Agent startup.
+
+    Args:
+        module_name: Name of the module the functions are created for, `__name__` of the module
+        attributes: Names of the attributes mapped to the names of the modules they are imported from
+    Returns:
+        `__getattr__` and `__dir__` functions to be assigned in the module
+    """
+
+    def __getattr__(name: str) -> Any:
+        attribute_module_name = attributes.get(name)
+        if attribute_module_name is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(attribute_module_name), name)
+        # next access doesn't go through `__getattr__`
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,60 @@
+"""
+Plugins (renderers, input data transformers) registered by the stevedore entry points.
+
+Plugins are loaded lazily, so nothing is imported until a plugin is used for the first time:
+* stevedore `ExtensionManager` of the namespace is created on the first use. It imports plugin modules, plugins which
+  can't be imported are logged and skipped, so `names()` contains only the loadable ones.
+* plugin is instantiated (invoked without arguments) on the first use by `get_extension_obj`.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stevedore import ExtensionManager
+    from stevedore.extension import Extension
+
+logger = logging.getLogger(__name__)
+
+_extension_managers: dict[str, "ExtensionManager"] = {}
+_lock = threading.Lock()
+
+
+def get_extension_manager(namespace: str) -> "ExtensionManager":
+    """Get stevedore `ExtensionManager` of the plugins registered under the `namespace`, created on the first use. Thread safe."""
+    manager = _extension_managers.get(namespace)
+    if manager is None:
+        with _lock:
+            manager = _extension_managers.get(namespace)
+            if manager is None:
+                # stevedore is slow to import, so it's imported only when plugins are used
+                from stevedore import ExtensionManager
+
+                manager = ExtensionManager(namespace=namespace, invoke_on_load=False)
+                logger.info("Registered plugins in %s: %s", namespace, manager.names())
+                _extension_managers[namespace] = manager
+    return manager
+
+
+def get_extension_obj(extension: "Extension") -> Any:
+    """
+    Get instance of the plugin, created on the first use and stored in `extension.obj`.
+    Extensions created with `obj` (e.g. by `ExtensionManager.make_test_instance`) are returned as they are. Thread safe.
+
+    Raises:
+        ValueError: If the plugin can't be instantiated (error is logged).
+    """
+    if extension.obj is None:
+        with _lock:
+            if extension.obj is None:
+                try:
+                    extension.obj = extension.plugin()
+                except Exception as e:
+                    logger.exception(
+                        "Could not instantiate plugin '%s'", extension.name
+                    )
+                    raise ValueError(
+                        f"Plugin '{extension.name}' could not be instantiated: {e}"
+                    ) from e
+    return extension.obj
@@ -0,0 +1,62 @@
+import pytest
+from next_gen_ui_agent import design_system_handler
+from next_gen_ui_agent.design_system_handler import PLUGGABLE_RENDERERS_NAMESPACE
+from next_gen_ui_agent.input_data_transform import input_data_transform
+from next_gen_ui_agent.plugins import get_extension_manager, get_extension_obj
+from stevedore import ExtensionManager
+from stevedore.extension import Extension
+
+
+class _Plugin:
+    instances = 0
+
+    def __init__(self) -> None:
+        _Plugin.instances += 1
+
+
+def test_get_extension_manager() -> None:
+    manager = get_extension_manager(PLUGGABLE_RENDERERS_NAMESPACE)
+    assert isinstance(manager, ExtensionManager)
+    assert manager.namespace == PLUGGABLE_RENDERERS_NAMESPACE
+    assert get_extension_manager(PLUGGABLE_RENDERERS_NAMESPACE) is manager
+
+
+def test_module_extension_managers() -> None:
+    assert design_system_handler.EXTENSION_MANAGER is get_extension_manager(
+        PLUGGABLE_RENDERERS_NAMESPACE
+    )
+    assert isinstance(
+        input_data_transform.input_data_transformer_extension_manager,
+        ExtensionManager,
+    )
+
+
+def test_get_extension_obj_instantiated_once() -> None:
+    _Plugin.instances = 0
+    extension = Extension(name="test", entry_point=None, plugin=_Plugin, obj=None)
+    obj = get_extension_obj(extension)
+    assert isinstance(obj, _Plugin)
+    assert get_extension_obj(extension) is obj
+    assert extension.obj is obj
+    assert _Plugin.instances == 1
+
+
+def test_get_extension_obj_test_instance() -> None:
+    obj = _Plugin()
+    extension = Extension(name="test", entry_point=None, plugin=None, obj=obj)
+    assert get_extension_obj(extension) is obj
+
+
+def test_get_extension_obj_broken() -> None:
+    def broken() -> None:
+        raise RuntimeError("broken")
+
+    extension = Extension(name="test", entry_point=None, plugin=broken, obj=None)
+    with pytest.raises(ValueError, match="Plugin 'test' could not be instantiated"):
+        get_extension_obj(extension)
+    assert extension.obj is None
+
+
+def test_module_has_no_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        design_system_handler.Unknown
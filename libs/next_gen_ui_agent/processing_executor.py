@@ -0,0 +1,139 @@
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from next_gen_ui_agent.types import AgentConfigProcessingExecutor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()
+"""Marker of the end of the iteration in the pool."""
+
+
+def _next_item(iterator: Iterator[Any]) -> Any:
+    return next(iterator, _END)
+
+
+class ProcessingExecutor:
+    """
+    Runs CPU-bound processing steps (data transformation, rendering) out of the asyncio event loop,
+    on the thread or process pool configured by `AgentConfigProcessingExecutor`.
+
+    Small data are processed inline, as dispatching them to the pool costs more than the processing itself.
+    Very large data can be transformed in the dedicated (opt-in) process pool.
+    Pools are created on the first use.
+    """
+
+    def __init__(self, config: Optional[AgentConfigProcessingExecutor] = None):
+        self.config = config if config else AgentConfigProcessingExecutor()
+        self._executor: Optional[Executor] = None
+        self._transform_process_executor: Optional[Executor] = None
+
+    def is_inline(self, data_size: Optional[int]) -> bool:
+        """Check if data of given size (number of characters, `None` if unknown) are processed inline in the event loop."""
+        if self.config.type == "inline":
+            return True
+        return data_size is not None and data_size < self.config.inline_threshold
+
+    def get_executor(self) -> Executor:
+        """Get the pool, create it if not created yet."""
+        if not self._executor:
+            if self.config.type == "process":
+                self._executor = self._create_process_pool(self.config.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix="ngui-processing",
+                )
+            logger.debug(
+                "Created %s processing executor with max_workers=%s",
+                self.config.type,
+                self.config.max_workers,
+            )
+        return self._executor
+
+    def get_transform_process_executor(
+        self, data_size: Optional[int]
+    ) -> Optional[Executor]:
+        """
+        Get process pool the data transformation of the data of given size (number of characters, `None` if unknown) is run in.
+        `None` is returned if the transformation is not run in a process pool.
+        """
+        threshold = self.config.transform_process_threshold
+        if threshold is not None and data_size is not None and data_size >= threshold:
+            if not self._transform_process_executor:
+                self._transform_process_executor = self._create_process_pool(
+                    self.config.transform_process_max_workers
+                )
+                logger.debug(
+                    "Created data transformation process pool with max_workers=%s",
+                    self.config.transform_process_max_workers,
+                )
+            return self._transform_process_executor
+        if self.config.type == "process" and not self.is_inline(data_size):
+            return self.get_executor()
+        return None
+
+    def _create_process_pool(self, max_workers: Optional[int]) -> Executor:
+        # process pool is opt-in, multiprocessing is imported only when used
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            max_tasks_per_child=self.config.max_tasks_per_child,
+        )
+
+    async def run(
+        self, data_size: Optional[int], fn: Callable[..., T], *args: Any
+    ) -> T:
+        """
+        Run `fn(*args)` inline or in the pool, depending on the `data_size` (number of characters, `None` if unknown).
+        `fn` and `args` have to be picklable for the `process` executor.
+        """
+        if self.is_inline(data_size):
+            return fn(*args)
+        return await self.run_in(self.get_executor(), fn, *args)
+
+    async def run_in(self, executor: Executor, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in the given pool."""
+        # imported on the first use, not to slow down the UI Agent startup when used synchronously
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(fn, *args))
+
+    async def iterate(
+        self, data_size: Optional[int], iterator: Iterator[T]
+    ) -> AsyncIterator[T]:
+        """
+        Iterate the `iterator` (eg. generator of the streamed rendering) inline or in the pool, depending on the `data_size`
+        (number of characters, `None` if unknown).
+        Generators can't be passed to other processes, so they are iterated in the default asyncio thread pool
+        for the `process` executor.
+        """
+        if self.is_inline(data_size):
+            for item in iterator:
+                yield item
+            return
+
+        import asyncio
+
+        executor = None if self.config.type == "process" else self.get_executor()
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(executor, _next_item, iterator)
+            if item is _END:
+                return
+            yield item
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the pools if created. They are created again on the next use."""
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._transform_process_executor:
+            self._transform_process_executor.shutdown(wait=wait)
+            self._transform_process_executor = None
@@ -0,0 +1,176 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+from next_gen_ui_agent.processing_executor import ProcessingExecutor
+from next_gen_ui_agent.types import AgentConfigProcessingExecutor
+
+
+def get_thread_and_pid(value: str) -> tuple[str, int, int]:
+    return value, threading.get_ident(), os.getpid()
+
+
+def generate_thread_ids(count: int) -> Iterator[int]:
+    for _ in range(count):
+        yield threading.get_ident()
+
+
+class TestProcessingExecutor:
+    def test_default_config(self) -> None:
+        executor = ProcessingExecutor()
+        assert executor.config.type == "thread"
+        assert executor.config.max_workers is None
+        assert executor.config.inline_threshold == 50000
+
+    def test_is_inline(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(type="thread", inline_threshold=10)
+        )
+        assert executor.is_inline(9) is True
+        assert executor.is_inline(10) is False
+        # unknown size is never processed inline
+        assert executor.is_inline(None) is False
+
+    def test_is_inline_type_inline(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(type="inline", inline_threshold=10)
+        )
+        assert executor.is_inline(1000) is True
+        assert executor.is_inline(None) is True
+
+    @pytest.mark.asyncio
+    async def test_run_inline_under_threshold(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(inline_threshold=10)
+        )
+        value, thread_id, _ = await executor.run(5, get_thread_and_pid, "a")
+        assert value == "a"
+        assert thread_id == threading.get_ident()
+        # pool is not created for inline processing
+        assert executor._executor is None
+
+    @pytest.mark.asyncio
+    async def test_run_thread_pool(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(
+                type="thread", max_workers=2, inline_threshold=10
+            )
+        )
+        try:
+            value, thread_id, pid = await executor.run(10, get_thread_and_pid, "a")
+            assert value == "a"
+            assert thread_id != threading.get_ident()
+            assert pid == os.getpid()
+            assert isinstance(executor._executor, ThreadPoolExecutor)
+            assert executor._executor._max_workers == 2
+        finally:
+            executor.shutdown()
+        assert executor._executor is None
+
+    @pytest.mark.asyncio
+    async def test_run_process_pool(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(type="process", max_workers=1)
+        )
+        try:
+            value, _, pid = await executor.run(None, get_thread_and_pid, "a")
+            assert value == "a"
+            assert pid != os.getpid()
+            assert isinstance(executor._executor, ProcessPoolExecutor)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_exception_propagated(self) -> None:
+        executor = ProcessingExecutor(AgentConfigProcessingExecutor(inline_threshold=0))
+        try:
+            with pytest.raises(ValueError, match="invalid literal"):
+                await executor.run(10, int, "not a number")
+        finally:
+            executor.shutdown()
+
+    def test_get_transform_process_executor_disabled(self) -> None:
+        executor = ProcessingExecutor(AgentConfigProcessingExecutor(inline_threshold=0))
+        assert executor.get_transform_process_executor(10_000_000) is None
+
+    def test_get_transform_process_executor_threshold(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(
+                transform_process_threshold=1000,
+                transform_process_max_workers=2,
+                max_tasks_per_child=5,
+            )
+        )
+        try:
+            assert executor.get_transform_process_executor(999) is None
+            assert executor.get_transform_process_executor(None) is None
+            process_executor = executor.get_transform_process_executor(1000)
+            assert isinstance(process_executor, ProcessPoolExecutor)
+            assert process_executor._max_workers == 2  # type: ignore[attr-defined]
+            assert process_executor._max_tasks_per_child == 5  # type: ignore[attr-defined]
+            # the same pool is reused
+            assert executor.get_transform_process_executor(2000) is process_executor
+            # general executor is still thread pool
+            assert isinstance(executor.get_executor(), ThreadPoolExecutor)
+        finally:
+            executor.shutdown()
+        assert executor._transform_process_executor is None
+
+    def test_get_transform_process_executor_process_type(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(type="process", inline_threshold=10)
+        )
+        try:
+            assert executor.get_transform_process_executor(9) is None
+            assert (
+                executor.get_transform_process_executor(10) is executor.get_executor()
+            )
+        finally:
+            executor.shutdown()
+
+
+class TestProcessingExecutorIterate:
+    @pytest.mark.asyncio
+    async def test_iterate_inline(self) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(inline_threshold=10)
+        )
+        thread_ids = [i async for i in executor.iterate(5, generate_thread_ids(3))]
+        assert thread_ids == [threading.get_ident()] * 3
+        assert executor._executor is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor_type", ["thread", "process"])
+    async def test_iterate_in_thread(self, executor_type) -> None:
+        executor = ProcessingExecutor(
+            AgentConfigProcessingExecutor(type=executor_type, inline_threshold=10)
+        )
+        try:
+            thread_ids = [i async for i in executor.iterate(10, generate_thread_ids(3))]
+        finally:
+            executor.shutdown()
+        assert len(thread_ids) == 3
+        assert threading.get_ident() not in thread_ids
+
+    @pytest.mark.asyncio
+    async def test_iterate_empty(self) -> None:
+        executor = ProcessingExecutor()
+        try:
+            assert [i async for i in executor.iterate(None, iter(list[int]()))] == []
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_iterate_exception_propagated(self) -> None:
+        def failing() -> Iterator[int]:
+            yield 1
+            raise ValueError("boom")
+
+        executor = ProcessingExecutor()
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                [i async for i in executor.iterate(None, failing())]
+        finally:
+            executor.shutdown()
@@ -1,21 +1,54 @@
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Any, Sized
+from functools import lru_cache
+from typing import Any, Iterator, Sized
 
 from next_gen_ui_agent.data_transform.types import (
     ComponentDataBase,
     ComponentDataBaseWithArrayValueFileds,
 )
+from pydantic import BaseModel
 from typing_extensions import override
 
 
+def shallow_model_dump(model: BaseModel) -> dict[str, Any]:
+    """
+    Convert the pydantic `model` to the dictionary like `model.model_dump()` does, but without copying the field values
+    which are not pydantic models (eg. lists with the data of the component fields), so it is cheap for large data.
+    Nested models and lists of models are converted recursively, lists are expected to contain items of the same type.
+
+    Returned dictionary must be used as read only, it shares the values with the `model`.
+    Intended for the template based renderers, to create the template rendering context.
+    """
+    return {name: _shallow_dump_value(value) for name, value in model.__dict__.items()}
+
+
+def _shallow_dump_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return shallow_model_dump(value)
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        return [_shallow_dump_value(item) for item in value]
+    return value
+
+
 class RenderStrategyBase(ABC):
     """UI Renderer Base."""
 
+    COMPONENT_NAME: str
+    """Name of the component rendered by the strategy, defined by the component specific strategies."""
+
     def render(self, component: ComponentDataBase) -> str:
         """Prepare additional fields for rendering if necessary and finally call generate_output"""
         additional_context = self.get_additional_context(component)
         return self.generate_output(component, additional_context)
 
+    def render_stream(self, component: ComponentDataBase) -> Iterator[str]:
+        """
+        Streaming variant of `render()`, yields chunks of the output as they are generated, so large components
+        are not built in memory as a whole. Concatenated chunks are equal to the `render()` output.
+        """
+        additional_context = self.get_additional_context(component)
+        return self.generate_output_stream(component, additional_context)
+
     def get_additional_context(self, component: ComponentDataBase) -> dict[str, Any]:
         """Get additional fields for rendering context if necessary."""
         return {}
@@ -29,6 +62,15 @@ class RenderStrategyBase(ABC):
         """
         return component.model_dump_json()
 
+    def generate_output_stream(
+        self, component: ComponentDataBase, additional_context: dict
+    ) -> Iterator[str]:
+        """Generate output by defined UI renderer strategy in chunks.
+
+        If not overriden then whole `generate_output()` result is yielded as one chunk.
+        """
+        yield self.generate_output(component, additional_context)
+
 
 class RendererStrategyBaseWithArrayValueFileds(RenderStrategyBase):
     """
@@ -71,6 +113,13 @@ class RendererContext:
         """
         return self.render_strategy.render(component)
 
+    def render_stream(self, component: ComponentDataBase) -> Iterator[str]:
+        """
+        Render the UI component with the given strategy in chunks, see `render()`.
+        Exceptions are raised when the chunks are iterated.
+        """
+        return self.render_strategy.render_stream(component)
+
 
 class StrategyFactory(metaclass=ABCMeta):
     """Abstract Strategy Factory Base."""
@@ -92,3 +141,30 @@ class StrategyFactory(metaclass=ABCMeta):
         raise NotImplementedError(
             "Renderer Strategy has to implement get_render_strategy method"
         )
+
+    def get_renderer_version(self) -> str:
+        """
+        Get version of the renderer, used in the key of the rendering cache, so renderings from another renderer version are not reused.
+        By default it is the factory class name with the version of the installed package it comes from.
+        """
+        return _get_class_version(type(self))
+
+    def warm_up(self) -> None:
+        """
+        Prepare the component system for the first rendering, eg. load and compile templates, so the first request is not slower.
+        Called by `NextGenUIAgent.warm_up()`, does nothing by default.
+        """
+        pass
+
+
+@lru_cache(maxsize=None)
+def _get_class_version(cls: type) -> str:
+    # imported on the first use, not to slow down the UI Agent startup
+    from importlib.metadata import PackageNotFoundError, version
+
+    package = cls.__module__.split(".")[0]
+    try:
+        package_version = version(package)
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return f"{cls.__module__}.{cls.__qualname__}:{package_version}"
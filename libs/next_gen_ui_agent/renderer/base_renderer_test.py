@@ -0,0 +1,55 @@
+from next_gen_ui_agent.data_transform.types import (
+    ChartDataPoint,
+    ChartSeries,
+    ComponentDataBarChart,
+    ComponentDataTable,
+    DataFieldArrayValue,
+)
+from next_gen_ui_agent.renderer.base_renderer import RendererContext, shallow_model_dump
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_testing.data_after_transformation import get_transformed_component
+
+
+def test_shallow_model_dump_one_card() -> None:
+    component = get_transformed_component()
+    assert shallow_model_dump(component) == component.model_dump()
+
+
+def test_shallow_model_dump_does_not_copy_data() -> None:
+    data: list = ["Toy Story", ["a", "b"], None, 1]
+    component = ComponentDataTable(
+        id="1",
+        component="table",
+        title="Movies",
+        fields=[DataFieldArrayValue(id="t", name="Title", data_path="t", data=data)],
+    )
+
+    dump = shallow_model_dump(component)
+
+    assert dump == component.model_dump()
+    assert isinstance(dump["fields"][0], dict)
+    assert dump["fields"][0]["data"] is component.fields[0].data
+
+
+def test_shallow_model_dump_nested_models() -> None:
+    component = ComponentDataBarChart(
+        id="1",
+        component="chart-bar",
+        title="Revenue",
+        data=[
+            ChartSeries(
+                name="Revenue",
+                data=[ChartDataPoint(x="Toy Story", y=1), ChartDataPoint(x="Up", y=2)],
+            )
+        ],
+    )
+    dump = shallow_model_dump(component)
+    assert dump == component.model_dump()
+    assert isinstance(dump["data"][0]["data"][0], dict)
+
+
+def test_render_stream_default() -> None:
+    """Strategy not supporting streaming renders whole output as one chunk."""
+    component = get_transformed_component()
+    renderer = RendererContext(JsonStrategyFactory().get_render_strategy(component))
+    assert list(renderer.render_stream(component)) == [renderer.render(component)]
@@ -0,0 +1,26 @@
+"""Persistent cache of the compiled Jinja templates shared by the renderers based on Jinja templates."""
+
+import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache  # pants: no-infer-dep
+
+BYTECODE_CACHE_DIR_ENV = "NGUI_RENDERER_BYTECODE_CACHE_DIR"
+"""
+Environment variable with the directory of the persistent cache of the compiled templates,
+so they are compiled only once for all the server processes and restarts. Cache is disabled if not set.
+"""
+
+
+def create_bytecode_cache() -> Optional["BytecodeCache"]:
+    """
+    Create persistent cache of the compiled templates in the directory set by the `NGUI_RENDERER_BYTECODE_CACHE_DIR` env variable,
+    `None` if it is not set, so the compiled templates are not written to the disk by default.
+    """
+    directory = os.getenv(BYTECODE_CACHE_DIR_ENV, "").strip()
+    if not directory:
+        return None
+    from jinja2 import FileSystemBytecodeCache  # pants: no-infer-dep
+
+    return FileSystemBytecodeCache(directory)
@@ -0,0 +1,21 @@
+import pytest
+from next_gen_ui_agent.renderer.bytecode_cache import (
+    BYTECODE_CACHE_DIR_ENV,
+    create_bytecode_cache,
+)
+
+
+def test_create_bytecode_cache_disabled_by_default(monkeypatch) -> None:
+    monkeypatch.delenv(BYTECODE_CACHE_DIR_ENV, raising=False)
+    assert create_bytecode_cache() is None
+
+    monkeypatch.setenv(BYTECODE_CACHE_DIR_ENV, " ")
+    assert create_bytecode_cache() is None
+
+
+def test_create_bytecode_cache(monkeypatch, tmp_path) -> None:
+    jinja2 = pytest.importorskip("jinja2")
+    monkeypatch.setenv(BYTECODE_CACHE_DIR_ENV, str(tmp_path))
+    cache = create_bytecode_cache()
+    assert isinstance(cache, jinja2.FileSystemBytecodeCache)
+    assert cache.directory == str(tmp_path)
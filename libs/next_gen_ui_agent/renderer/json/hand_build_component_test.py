@@ -7,6 +7,7 @@ from next_gen_ui_agent.renderer.hand_build_component_shareable_tests import (
     BaseHandBuildComponentRendererTests,
 )
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
 
 
 class TestHandBuildComponentJsonRendererWithShareableTests(
@@ -18,6 +19,15 @@ class TestHandBuildComponentJsonRendererWithShareableTests(
         return JsonStrategyFactory()
 
 
+class TestHandBuildComponentCompactJsonRendererWithShareableTests(
+    BaseHandBuildComponentRendererTests
+):
+    """Test class for compact JSON renderer using shared test cases for hand-build component."""
+
+    def get_strategy_factory(self) -> StrategyFactory:
+        return JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
+
+
 def test_render_json_output() -> None:
     strategy = HandBuildComponentRenderStrategy()
     c = ComponentDataHandBuildComponent.model_validate(
@@ -3,6 +3,7 @@ from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
 from next_gen_ui_agent.renderer.image import ImageRenderStrategy
 from next_gen_ui_agent.renderer.image_shareable_tests import BaseImageRendererTests
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
 
 
 class TestImageJsonRendererWithShareableTests(BaseImageRendererTests):
@@ -12,6 +13,13 @@ class TestImageJsonRendererWithShareableTests(BaseImageRendererTests):
         return JsonStrategyFactory()
 
 
+class TestImageCompactJsonRendererWithShareableTests(BaseImageRendererTests):
+    """Test class for compact JSON renderer using shared test cases for image component."""
+
+    def get_strategy_factory(self) -> StrategyFactory:
+        return JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
+
+
 def test_render_json_output() -> None:
     strategy = ImageRenderStrategy()
     c = ComponentDataImage.model_validate(
@@ -1,6 +1,9 @@
-from next_gen_ui_agent.data_transform.types import ComponentDataBase
+from typing import Any, Optional
+
+from next_gen_ui_agent.data_transform.types import ComponentDataBase, DataFieldBase
+from next_gen_ui_agent.json_tools import json_dumps
 from next_gen_ui_agent.renderer.audio import AudioPlayerRenderStrategy
-from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.renderer.base_renderer import RenderStrategyBase, StrategyFactory
 from next_gen_ui_agent.renderer.hand_build_component import (
     HandBuildComponentRenderStrategy,
 )
@@ -9,21 +12,80 @@ from next_gen_ui_agent.renderer.one_card import OneCardRenderStrategy
 from next_gen_ui_agent.renderer.set_of_cards import SetOfCardsRenderStrategy
 from next_gen_ui_agent.renderer.table import TableRenderStrategy
 from next_gen_ui_agent.renderer.video import VideoRenderStrategy
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
+from pydantic import BaseModel
+
+
+def compact_model_dump(model: BaseModel) -> dict[str, Any]:
+    """
+    Convert the pydantic `model` to the dictionary for the compact JSON output - `None` values, values equal to the defaults
+    (except the `component` type) and `data_path` of the component fields are omitted.
+    Like `shallow_model_dump()`, field values which are not pydantic models are not copied, so it is cheap for large data.
+    """
+    result: dict[str, Any] = {}
+    is_data_field = isinstance(model, DataFieldBase)
+    for name, field_info in type(model).model_fields.items():
+        value = model.__dict__.get(name)
+        if value is None or (is_data_field and name == "data_path"):
+            continue
+        if (
+            name != "component"
+            and not field_info.is_required()
+            and value == field_info.default
+        ):
+            continue
+        result[name] = _compact_dump_value(value)
+    return result
+
+
+def _compact_dump_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return compact_model_dump(value)
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        return [_compact_dump_value(item) for item in value]
+    return value
+
+
+class CompactJsonRenderStrategy(RenderStrategyBase):
+    """Renders the component as compact JSON (see `AgentConfigJsonRenderer.compact`), for all the component types."""
+
+    def __init__(self, strategy: RenderStrategyBase):
+        self.COMPONENT_NAME = strategy.COMPONENT_NAME
+
+    def generate_output(
+        self, component: ComponentDataBase, additional_context: dict
+    ) -> str:
+        return json_dumps(compact_model_dump(component))
 
 
 class JsonStrategyFactory(StrategyFactory):
     """JSON Renderer.
 
-    Rendering output is JSON
+    Rendering output is JSON, compact if configured by `AgentConfigJsonRenderer.compact`.
     """
 
+    def __init__(self, config: Optional[AgentConfigJsonRenderer] = None):
+        self.config = config if config else AgentConfigJsonRenderer()
+
     def get_component_system_name(self) -> str:
         return "json"
 
     def get_output_mime_type(self) -> str:
         return "application/json"
 
+    def get_renderer_version(self) -> str:
+        version = super().get_renderer_version()
+        return f"{version}:compact" if self.config.compact else version
+
     def get_render_strategy(self, component: ComponentDataBase):
+        strategy = self._get_component_render_strategy(component)
+        if self.config.compact:
+            return CompactJsonRenderStrategy(strategy)
+        return strategy
+
+    def _get_component_render_strategy(
+        self, component: ComponentDataBase
+    ) -> RenderStrategyBase:
         match component.component:
             case OneCardRenderStrategy.COMPONENT_NAME:
                 return OneCardRenderStrategy()
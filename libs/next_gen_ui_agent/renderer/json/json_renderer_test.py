@@ -0,0 +1,100 @@
+import json
+
+from next_gen_ui_agent.data_transform.types import (
+    ComponentDataBarChart,
+    ComponentDataOneCard,
+    ComponentDataTable,
+)
+from next_gen_ui_agent.renderer.json.json_renderer import (
+    CompactJsonRenderStrategy,
+    JsonStrategyFactory,
+    compact_model_dump,
+)
+from next_gen_ui_agent.renderer.one_card import OneCardRenderStrategy
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
+
+TABLE = ComponentDataTable.model_validate(
+    {
+        "id": "test_id_1",
+        "title": "Movies",
+        "component": "table",
+        "fields": [
+            {
+                "id": "title",
+                "name": "Title",
+                "data_path": "$..movies[*].title",
+                "data": ["Toy Story", "Toy Story 2"],
+            },
+            {
+                "id": "rating",
+                "name": "Rating",
+                "data_path": "$..movies[*].imdbRating",
+                "data": [8.3, None],
+            },
+            {
+                "id": "empty",
+                "name": "Empty",
+                "data_path": "$..movies[*].empty",
+                "data": [],
+            },
+        ],
+    }
+)
+
+
+def test_compact_model_dump() -> None:
+    assert compact_model_dump(TABLE) == {
+        "component": "table",
+        "id": "test_id_1",
+        "title": "Movies",
+        "fields": [
+            {"id": "title", "name": "Title", "data": ["Toy Story", "Toy Story 2"]},
+            {"id": "rating", "name": "Rating", "data": [8.3, None]},
+            {"id": "empty", "name": "Empty"},
+        ],
+    }
+
+
+def test_compact_model_dump_nested_models() -> None:
+    chart = ComponentDataBarChart.model_validate(
+        {
+            "id": "chart_1",
+            "title": "Revenue",
+            "data": [{"name": "2024", "data": [{"x": "Q1", "y": 10}]}],
+        }
+    )
+    assert compact_model_dump(chart) == {
+        "component": "chart-bar",
+        "id": "chart_1",
+        "title": "Revenue",
+        "data": [{"name": "2024", "data": [{"x": "Q1", "y": 10}]}],
+    }
+
+
+def test_render_compact() -> None:
+    factory = JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
+    strategy = factory.get_render_strategy(TABLE)
+    assert isinstance(strategy, CompactJsonRenderStrategy)
+    assert strategy.COMPONENT_NAME == "table"
+
+    result = strategy.render(TABLE)
+    assert json.loads(result) == compact_model_dump(TABLE)
+    assert len(result) < len(
+        JsonStrategyFactory().get_render_strategy(TABLE).render(TABLE)
+    )
+
+
+def test_render_not_compact_by_default() -> None:
+    c = ComponentDataOneCard(id="1", title="Toy Story", fields=[])
+    strategy = JsonStrategyFactory().get_render_strategy(c)
+    assert isinstance(strategy, OneCardRenderStrategy)
+    assert strategy.render(c) == c.model_dump_json()
+
+
+def test_renderer_version() -> None:
+    assert (
+        JsonStrategyFactory(
+            AgentConfigJsonRenderer(compact=True)
+        ).get_renderer_version()
+        != JsonStrategyFactory().get_renderer_version()
+    )
@@ -3,6 +3,7 @@ from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
 from next_gen_ui_agent.renderer.one_card import OneCardRenderStrategy
 from next_gen_ui_agent.renderer.one_card_shareable_tests import BaseOneCardRendererTests
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
 
 
 class TestOneCardJsonRendererWithShareableTests(BaseOneCardRendererTests):
@@ -12,6 +13,13 @@ class TestOneCardJsonRendererWithShareableTests(BaseOneCardRendererTests):
         return JsonStrategyFactory()
 
 
+class TestOneCardCompactJsonRendererWithShareableTests(BaseOneCardRendererTests):
+    """Test class for compact JSON renderer using shared test cases for one-card component."""
+
+    def get_strategy_factory(self) -> StrategyFactory:
+        return JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
+
+
 def test_render_json_output() -> None:
     strategy = OneCardRenderStrategy()
     c = ComponentDataOneCard.model_validate(
@@ -1,6 +1,7 @@
 from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
 from next_gen_ui_agent.renderer.table_shareable_tests import BaseTableRendererTests
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
 
 
 class TestTableJsonRendererWithShareableTests(BaseTableRendererTests):
@@ -8,3 +9,10 @@ class TestTableJsonRendererWithShareableTests(BaseTableRendererTests):
 
     def get_strategy_factory(self) -> StrategyFactory:
         return JsonStrategyFactory()
+
+
+class TestTableCompactJsonRendererWithShareableTests(BaseTableRendererTests):
+    """Test class for compact JSON renderer using shared test cases for table component."""
+
+    def get_strategy_factory(self) -> StrategyFactory:
+        return JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
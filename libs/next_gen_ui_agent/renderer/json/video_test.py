@@ -1,6 +1,7 @@
 from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
 from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
 from next_gen_ui_agent.renderer.video_shareable_tests import BaseVideoRendererTests
+from next_gen_ui_agent.types import AgentConfigJsonRenderer
 
 
 class TestVideoJsonRendererWithShareableTests(BaseVideoRendererTests):
@@ -8,3 +9,10 @@ class TestVideoJsonRendererWithShareableTests(BaseVideoRendererTests):
 
     def get_strategy_factory(self) -> StrategyFactory:
         return JsonStrategyFactory()
+
+
+class TestVideoCompactJsonRendererWithShareableTests(BaseVideoRendererTests):
+    """Test class for compact JSON renderer using shared test cases for video component."""
+
+    def get_strategy_factory(self) -> StrategyFactory:
+        return JsonStrategyFactory(AgentConfigJsonRenderer(compact=True))
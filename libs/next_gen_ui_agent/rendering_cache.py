@@ -0,0 +1,126 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+
+from next_gen_ui_agent.data_transform.types import ComponentDataBase
+from next_gen_ui_agent.json_tools import json_dumps
+from next_gen_ui_agent.renderer.base_renderer import StrategyFactory, shallow_model_dump
+from next_gen_ui_agent.types import AgentConfigRenderingCache, UIBlockRendering
+
+logger = logging.getLogger(__name__)
+
+RenderingCacheKey = tuple[str, str, str]
+"""Rendering cache key - component system, renderer version and digest of the component data."""
+
+
+class RenderingCache:
+    """
+    Bounded LRU cache of the rendering results configured by `AgentConfigRenderingCache`, with hit-rate metrics.
+    Thread safe, as rendering can run in the processing executor threads.
+
+    Key contains digest of the component data computed from their JSON serialization (by the fast JSON backend
+    if installed), which is much cheaper than the rendering itself.
+    """
+
+    def __init__(self, config: Optional[AgentConfigRenderingCache] = None):
+        self.config = config if config else AgentConfigRenderingCache()
+        self._entries: OrderedDict[RenderingCacheKey, UIBlockRendering] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        """Number of the renderings found in the cache."""
+        self.misses = 0
+        """Number of the renderings not found in the cache (including the ones which can't be cached)."""
+        self.evictions = 0
+        """Number of the renderings evicted from the cache because of the size limits."""
+
+    def get_digest(self, component: ComponentDataBase) -> Optional[str]:
+        """Get digest of the `component` data, `None` if the component data can't be serialized."""
+        try:
+            data = json_dumps(shallow_model_dump(component))
+        except Exception:
+            logger.debug(
+                "Component %s data can't be serialized, rendering is not cached",
+                component.id,
+            )
+            return None
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+    def get_key(
+        self,
+        component: ComponentDataBase,
+        factory: StrategyFactory,
+        digest: Optional[str] = None,
+    ) -> Optional[RenderingCacheKey]:
+        """
+        Get cache key of the `component` rendered by the `factory`, `None` if the component data can't be serialized.
+        `digest` of the component data can be passed if already known from `get_digest()`, e.g. when the component is rendered by more factories.
+        """
+        if digest is None:
+            digest = self.get_digest(component)
+            if digest is None:
+                return None
+        return (
+            factory.get_component_system_name(),
+            factory.get_renderer_version(),
+            digest,
+        )
+
+    def get(self, key: Optional[RenderingCacheKey]) -> Optional[UIBlockRendering]:
+        """Get cached rendering for the `key` and count the hit or miss, `None` if not cached."""
+        with self._lock:
+            rendering = self._entries.get(key) if key else None
+            if rendering is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)  # type: ignore[arg-type]
+            self.hits += 1
+        # copy, so the caller can't change the cached instance
+        return rendering.model_copy()
+
+    def put(
+        self, key: Optional[RenderingCacheKey], rendering: UIBlockRendering
+    ) -> None:
+        """Store the `rendering` for the `key`, evict least recently used renderings if size limits are exceeded."""
+        size = len(rendering.content)
+        if not key or size > self.config.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = rendering.model_copy()
+            self._size += size
+            while (
+                len(self._entries) > self.config.max_entries
+                or self._size > self.config.max_size
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the cached renderings, metrics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of the cache hits to all the lookups, `0` if there was no lookup yet."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache metrics - number of entries, their total size, hits, misses, evictions and hit rate."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
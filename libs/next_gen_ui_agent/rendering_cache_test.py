@@ -0,0 +1,135 @@
+from next_gen_ui_agent.data_transform.types import ComponentDataBase
+from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.rendering_cache import RenderingCache
+from next_gen_ui_agent.types import AgentConfigRenderingCache, UIBlockRendering
+from next_gen_ui_testing.data_after_transformation import get_transformed_component
+
+
+def _component(title: str = "Toy Story") -> ComponentDataBase:
+    component: ComponentDataBase = get_transformed_component()
+    return component.model_copy(update={"title": title})
+
+
+def _rendering(content: str, id: str = "test-id") -> UIBlockRendering:
+    return UIBlockRendering(
+        id=id, content=content, component_system="json", mime_type="application/json"
+    )
+
+
+def test_get_key() -> None:
+    cache = RenderingCache()
+    factory = JsonStrategyFactory()
+
+    key = cache.get_key(_component(), factory)
+    assert key is not None
+    assert key[0] == "json"
+    assert key[1] == factory.get_renderer_version()
+    assert cache.get_key(_component(), factory) == key
+    assert cache.get_key(_component("Toy Story 2"), factory) != key
+
+
+def test_get_key_renderer_version() -> None:
+    class OtherJsonStrategyFactory(JsonStrategyFactory):
+        pass
+
+    cache = RenderingCache()
+    assert cache.get_key(_component(), JsonStrategyFactory()) != cache.get_key(
+        _component(), OtherJsonStrategyFactory()
+    )
+
+
+def test_get_renderer_version() -> None:
+    version = JsonStrategyFactory().get_renderer_version()
+    assert version.startswith(
+        "next_gen_ui_agent.renderer.json.json_renderer.JsonStrategyFactory:"
+    )
+    assert isinstance(JsonStrategyFactory(), StrategyFactory)
+
+
+def test_get_put() -> None:
+    cache = RenderingCache()
+    key = cache.get_key(_component(), JsonStrategyFactory())
+
+    assert cache.get(key) is None
+    cache.put(key, _rendering("{}"))
+    cached = cache.get(key)
+    assert cached == _rendering("{}")
+
+    # cached instance can't be changed by the caller
+    assert cached
+    cached.content = "changed"
+    assert cache.get(key) == _rendering("{}")
+
+    assert cache.get_stats() == {
+        "entries": 1,
+        "size": 2,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 2 / 3,
+    }
+
+
+def test_get_put_no_key() -> None:
+    cache = RenderingCache()
+    cache.put(None, _rendering("{}"))
+
+    assert cache.get(None) is None
+    assert cache.get_stats()["entries"] == 0
+    assert cache.misses == 1
+
+
+def test_evict_max_entries() -> None:
+    cache = RenderingCache(AgentConfigRenderingCache(max_entries=2))
+    keys = [("json", "1", str(i)) for i in range(3)]
+    cache.put(keys[0], _rendering("0"))
+    cache.put(keys[1], _rendering("1"))
+    # least recently used is the second one
+    assert cache.get(keys[0])
+    cache.put(keys[2], _rendering("2"))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0])
+    assert cache.get(keys[2])
+    assert cache.evictions == 1
+
+
+def test_evict_max_size() -> None:
+    cache = RenderingCache(AgentConfigRenderingCache(max_size=10))
+    keys = [("json", "1", str(i)) for i in range(3)]
+    cache.put(keys[0], _rendering("a" * 4))
+    cache.put(keys[1], _rendering("b" * 4))
+    cache.put(keys[2], _rendering("c" * 4))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1])
+    assert cache.get_stats()["size"] == 8
+    assert cache.evictions == 1
+
+    # too large rendering is not cached at all
+    cache.put(keys[0], _rendering("d" * 11))
+    assert cache.get(keys[0]) is None
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_put_replace() -> None:
+    cache = RenderingCache()
+    key = ("json", "1", "0")
+    cache.put(key, _rendering("aaa"))
+    cache.put(key, _rendering("b"))
+
+    assert cache.get(key) == _rendering("b")
+    assert cache.get_stats()["size"] == 1
+
+
+def test_clear() -> None:
+    cache = RenderingCache()
+    key = ("json", "1", "0")
+    cache.put(key, _rendering("{}"))
+    assert cache.get(key)
+    cache.clear()
+
+    assert cache.get(key) is None
+    assert cache.get_stats()["entries"] == 0
+    assert cache.hit_rate == 0.5
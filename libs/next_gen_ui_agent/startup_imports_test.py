@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+
+import next_gen_ui_agent
+import pytest
+from next_gen_ui_agent import data_transform
+from next_gen_ui_agent.agent import NextGenUIAgent
+from next_gen_ui_agent.data_transform import chart
+from next_gen_ui_agent.data_transform.table import TableDataTransformer
+from next_gen_ui_agent.types import AgentConfig
+
+# modules which are slow to import, and are not needed until the first request processing
+DEFERRED_MODULES = [
+    "yaml",
+    "jsonpath_ng",
+    "stevedore",
+    "asyncio",
+    "multiprocessing",
+]
+
+
+def get_imported_modules(code: str) -> list[str]:
+    """Get modules imported by the python `code` run in a fresh process."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code + "\nimport json, sys\nprint(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return list(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_package_import_is_lazy() -> None:
+    modules = get_imported_modules("import next_gen_ui_agent")
+    assert "next_gen_ui_agent" in modules
+    assert "next_gen_ui_agent.agent" not in modules
+    assert "pydantic" not in modules
+
+
+@pytest.fixture(scope="module")
+def agent_construction_modules() -> list[str]:
+    return get_imported_modules(
+        "from next_gen_ui_agent import AgentConfig, NextGenUIAgent\n"
+        + "NextGenUIAgent(config=AgentConfig())"
+    )
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_agent_construction_does_not_import(agent_construction_modules, module) -> None:
+    assert module not in agent_construction_modules
+
+
+def test_lazy_attributes() -> None:
+    assert next_gen_ui_agent.NextGenUIAgent is NextGenUIAgent
+    assert next_gen_ui_agent.AgentConfig is AgentConfig
+    assert data_transform.TableDataTransformer is TableDataTransformer
+    assert chart.BarChartDataTransformer.__name__ == "BarChartDataTransformer"
+    assert "NextGenUIAgent" in dir(next_gen_ui_agent)
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        next_gen_ui_agent.Unknown
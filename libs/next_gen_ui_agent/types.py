@@ -1,6 +1,14 @@
+import mmap
+import os
 from abc import ABC
 from typing import Any, Literal, Optional
 
+from next_gen_ui_agent.data_structure_tools import (
+    InputDataContent,
+    InputDataSample,
+    decode_input_data_content,
+    map_input_data_file,
+)
 from pydantic import BaseModel, Field, model_validator
 from typing_extensions import NotRequired, TypedDict
 
@@ -8,10 +16,12 @@ CONFIG_OPTIONS_DATA_TRANSFORMER = Optional[
     str
     | Literal["json"]
     | Literal["yaml"]
+    | Literal["jsonl"]
     | Literal["csv-comma"]
     | Literal["csv-semicolon"]
     | Literal["csv-tab"]
     | Literal["fwctable"]
+    | Literal["arrow"]
 ]
 """ data_transformer config option possibilities used on multiple levels """
 
@@ -31,6 +41,9 @@ CONFIG_OPTIONS_ALL_COMPONETS = Optional[
 ]
 """Valid component names that can be selected by the agent's LLM for data visualization."""
 
+CONFIG_OPTIONS_CHART_DATA_FORMAT = Literal["points"] | Literal["columns"]
+"""Formats of the chart components data."""
+
 
 class DataField(BaseModel):
     """UI Component Field Metadata."""
@@ -103,17 +116,105 @@ class AgentConfigComponent(BaseModel):
     """Optional prompt customization for this component."""
 
 
+class AgentConfigInputDataLimits(BaseModel):
+    """
+    Limits (guardrails) of the input data size, checked before the input data are parsed whole,
+    so single oversized tool output can't consume all the memory. Each limit has its own policy applied when it is exceeded.
+    """
+
+    max_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal size of the raw input data - number of characters for string data, number of bytes for binary data and data files. Checked before the input data are parsed. Not limited if not set.",
+    )
+    """
+    Maximal size of the raw input data - number of characters for string data, number of bytes for binary data and data files.
+    Checked before the input data are parsed. Not limited if not set.
+    """
+
+    max_size_policy: Literal["reject", "truncate"] = Field(
+        default="reject",
+        description="Policy applied if the input data exceed `max_size`. `reject` (default) - processing of the input data fails, `truncate` - only complete records (rows) from the first `max_size` characters/bytes are parsed. Truncation is supported by the `json` (root array), `jsonl`, `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable` and `noop` input data transformers, input data are rejected by the other transformers.",
+    )
+    """
+    Policy applied if the input data exceed `max_size`:
+    - `reject` (default) - processing of the input data fails
+    - `truncate` - only complete records (rows) from the first `max_size` characters/bytes are parsed.
+      Supported by the `json` (root array), `jsonl`, `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable` and `noop` input data transformers,
+      input data are rejected by the other transformers.
+    """
+
+    max_items: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of items (records, rows) of the root array of the input data. Transformers parsing rows lazily (see `input_data_max_rows`) parse at most `max_items` rows for `reject` and `truncate` policies. Not limited if not set.",
+    )
+    """
+    Maximal number of items (records, rows) of the root array of the input data.
+    Transformers parsing rows lazily (see `AgentConfig.input_data_max_rows`) parse at most `max_items` rows for `reject` and `truncate` policies.
+    Not limited if not set.
+    """
+
+    max_items_policy: Literal["reject", "truncate", "sample"] = Field(
+        default="reject",
+        description="Policy applied if the input data exceed `max_items`. `reject` (default) - processing of the input data fails, `truncate` - first `max_items` items are used, `sample` - `max_items` items evenly spread over the whole input data are used (in their original order), useful eg. for charts.",
+    )
+    """
+    Policy applied if the input data exceed `max_items`:
+    - `reject` (default) - processing of the input data fails
+    - `truncate` - first `max_items` items are used
+    - `sample` - `max_items` items evenly spread over the whole input data are used (in their original order), useful eg. for charts
+    """
+
+    max_depth: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal nesting depth of the objects and arrays in the parsed input data, root object or array has depth 1. Checked on the raw input data before they are parsed by the `json` and `jsonl` input data transformers, after parsing by the other ones. Not limited if not set.",
+    )
+    """
+    Maximal nesting depth of the objects and arrays in the parsed input data, root object or array has depth 1.
+    Checked on the raw input data before they are parsed by the `json` and `jsonl` input data transformers, after parsing by the other ones.
+    Not limited if not set.
+    """
+
+    max_depth_policy: Literal["reject", "truncate"] = Field(
+        default="reject",
+        description="Policy applied if the input data exceed `max_depth`. `reject` (default) - processing of the input data fails, `truncate` - objects and arrays nested deeper than `max_depth` are replaced by `null`.",
+    )
+    """
+    Policy applied if the input data exceed `max_depth`:
+    - `reject` (default) - processing of the input data fails
+    - `truncate` - objects and arrays nested deeper than `max_depth` are replaced by `null`
+    """
+
+
 class AgentConfigDataType(BaseModel):
     """Agent Configuration for the Data Type."""
 
     data_transformer: CONFIG_OPTIONS_DATA_TRANSFORMER = Field(
         default=None,
-        description="Transformer to use to transform the input data of this type. Available transformers: `json`, `yaml`, `csv-comma`, `csv-semicolon`, `csv-tab`. Other transformers can be installed, see docs.",
+        description="Transformer to use to transform the input data of this type. Available transformers: `json`, `yaml`, `jsonl`, `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable`, `arrow` (requires `pyarrow`). Other transformers can be installed, see docs.",
     )
     """
     Data transformer to use to transform the input data of this type.
     """
 
+    input_data_max_rows: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of rows parsed from the input data of this type, rest of the rows is only counted. Overrides `AgentConfig.input_data_max_rows`. Supported by the `jsonl`, `yaml` (multi-document YAML), `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable` and `arrow` input data transformers.",
+    )
+    """
+    Maximal number of rows parsed from the input data of this type, rest of the rows is only counted.
+    Overrides `AgentConfig.input_data_max_rows`.
+    """
+
+    input_data_limits: Optional[AgentConfigInputDataLimits] = Field(
+        default=None,
+        description="Limits of the input data of this type. Limits (and their policies) set here override the ones from `AgentConfig.input_data_limits`.",
+    )
+    """Limits of the input data of this type. Limits (and their policies) set here override the ones from `AgentConfig.input_data_limits`."""
+
     generate_all_fields: Optional[bool] = Field(
         default=None,
         description="If `True`, the agent will generate all possible view Fields for the UI component into its output configuration `UIBlockComponentMetadata.fields_all`, if `False` then all fields aren't generated, if `None` then agent's default setting is used. Supported only for `table` and `set-of-cards` components.",
@@ -260,6 +361,155 @@ class AgentConfigPrompt(AgentConfigPromptBase):
     """Component metadata overrides. Keys are component names, values are field overrides."""
 
 
+class AgentConfigProcessingExecutor(BaseModel):
+    """Configuration of the executor used by the agent's async methods to run CPU-bound processing steps (data transformation, rendering) out of the asyncio event loop."""
+
+    type: Literal["thread", "process", "inline"] = Field(
+        default="thread",
+        description="Type of the executor. `thread` (default) - thread pool, `process` - process pool (avoids GIL contention for large data, but data have to be pickled to the worker process), `inline` - run directly in the event loop.",
+    )
+    """
+    Type of the executor:
+    - `thread` (default) - thread pool
+    - `process` - process pool, avoids GIL contention for large data, but data have to be pickled to the worker process
+    - `inline` - run directly in the event loop
+    """
+
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of workers in the pool. Python's `concurrent.futures` default is used if not set.",
+    )
+    """Maximal number of workers in the pool. Python's `concurrent.futures` default is used if not set."""
+
+    inline_threshold: int = Field(
+        default=50000,
+        ge=0,
+        description="Input data smaller than this size (number of characters) are processed inline in the event loop, as dispatching them to the pool costs more than the processing itself. Default `50000`.",
+    )
+    """Input data smaller than this size (number of characters) are processed inline in the event loop, as dispatching them to the pool costs more than the processing itself."""
+
+    max_tasks_per_child: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of tasks processed by one worker process of the process pools before it is replaced by a new one (worker recycling), to release memory retained after processing of large data. Workers are not recycled if not set.",
+    )
+    """
+    Maximal number of tasks processed by one worker process of the process pools before it is replaced by a new one (worker recycling),
+    to release memory retained after processing of large data. Workers are not recycled if not set.
+    """
+
+    transform_process_threshold: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Opt-in process pool for the data transformation of very large input data. Input data of this size (number of characters) and larger are transformed in the dedicated process pool, where the raw input data are parsed again instead of pickling parsed data. Disabled if not set.",
+    )
+    """
+    Opt-in process pool for the data transformation of very large input data.
+    Input data of this size (number of characters) and larger are transformed in the dedicated process pool,
+    where the raw input data are parsed again instead of pickling parsed data. Disabled if not set.
+    """
+
+    transform_process_max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of workers in the data transformation process pool. Python's `concurrent.futures` default is used if not set.",
+    )
+    """Maximal number of workers in the data transformation process pool. Python's `concurrent.futures` default is used if not set."""
+
+
+class AgentConfigRenderingCache(BaseModel):
+    """Configuration of the cache of the rendering results, so unchanged components (e.g. refreshed by polling dashboards) are not rendered again."""
+
+    max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximal number of the cached renderings, least recently used ones are evicted. Default `256`.",
+    )
+    """Maximal number of the cached renderings, least recently used ones are evicted."""
+
+    max_size: int = Field(
+        default=50_000_000,
+        ge=1,
+        description="Maximal total size of the cached rendering contents (number of characters), least recently used ones are evicted. Larger renderings are not cached. Default `50000000`.",
+    )
+    """
+    Maximal total size of the cached rendering contents (number of characters), least recently used ones are evicted.
+    Larger renderings are not cached.
+    """
+
+
+class AgentConfigJsonRenderer(BaseModel):
+    """Configuration of the `json` component system renderer."""
+
+    compact: bool = Field(
+        default=False,
+        description="Render compact JSON - `None` values and values equal to the defaults are omitted, and fields are referenced by their `id` only, without the `data_path` (available in the `UIBlockConfiguration.component_metadata`). Default `False`.",
+    )
+    """
+    Render compact JSON - `None` values and values equal to the defaults are omitted,
+    and fields are referenced by their `id` only, without the `data_path` (available in the `UIBlockConfiguration.component_metadata`).
+    """
+
+
+class AgentConfigChartDownsampling(BaseModel):
+    """Configuration of the line chart data downsampling."""
+
+    max_points: int = Field(
+        default=1000,
+        ge=3,
+        description="Target number of data points of each line chart series. Series with more data points are downsampled by the Largest-Triangle-Three-Buckets algorithm, preserving visual shape of the line. Default `1000`.",
+    )
+    """
+    Target number of data points of each line chart series.
+    Series with more data points are downsampled by the Largest-Triangle-Three-Buckets algorithm, preserving visual shape of the line.
+    """
+
+
+class AgentConfigChartAggregation(BaseModel):
+    """Configuration of the aggregation of the chart data with too many categories."""
+
+    max_slices: int = Field(
+        default=10,
+        ge=2,
+        description="Maximal number of pie and donut chart slices. If there are more categories, the most frequent ones are shown and the rest are aggregated into one `other_label` slice. Default `10`.",
+    )
+    """
+    Maximal number of pie and donut chart slices.
+    If there are more categories, the most frequent ones are shown and the rest are aggregated into one `other_label` slice.
+    """
+
+    other_label: str = Field(
+        default="Other",
+        description="Label of the pie and donut chart slice aggregating the less frequent categories. Category with the same label in the data is aggregated into this slice too. Default `Other`.",
+    )
+    """
+    Label of the pie and donut chart slice aggregating the less frequent categories.
+    Category with the same label in the data is aggregated into this slice too.
+    """
+
+    max_bars: int = Field(
+        default=50,
+        ge=1,
+        description="Maximal number of bar chart bars. If there are more bars, they are sorted by the value of the first series in descending order and limited, or aggregated into histogram bins if `bar_histogram` is enabled. Default `50`.",
+    )
+    """
+    Maximal number of bar chart bars.
+    If there are more bars, they are sorted by the value of the first series in descending order and limited,
+    or aggregated into histogram bins if `bar_histogram` is enabled.
+    """
+
+    bar_histogram: bool = Field(
+        default=False,
+        description="If `True`, bar chart bars with numeric x-axis values (e.g. years) exceeding `max_bars` are aggregated into histogram bins of the same width (values of each series are summed). Enable it only if x-axis values are quantities, not identifiers like ZIP codes. Bars with non numeric x-axis values are always limited. Default `False`.",
+    )
+    """
+    If `True`, bar chart bars with numeric x-axis values (e.g. years) exceeding `max_bars` are aggregated into histogram bins of the same width
+    (values of each series are summed). Enable it only if x-axis values are quantities, not identifiers like ZIP codes.
+    Bars with non numeric x-axis values are always limited.
+    """
+
+
 # Intentionaly TypeDict because of passing ABC class InferenceBase
 class AgentConfig(BaseModel):
     """Next Gen UI Agent Configuration."""
@@ -272,7 +522,7 @@ class AgentConfig(BaseModel):
 
     data_transformer: CONFIG_OPTIONS_DATA_TRANSFORMER = Field(
         default="json",
-        description="Transformer used to parse the input data (can be overriden on 'data type' level). Default `json`, available transformers: `yaml`, `csv-comma`, `csv-semicolon`, `csv-tab`. Other transformers can be installed, see docs.",
+        description="Transformer used to parse the input data (can be overriden on 'data type' level). Default `json`, available transformers: `yaml`, `jsonl`, `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable`, `arrow` (requires `pyarrow`). Other transformers can be installed, see docs.",
     )
     """
     Data transformer to use to transform the input data of this type.
@@ -316,6 +566,35 @@ class AgentConfig(BaseModel):
     If `False`, the agent will never wrap the JSON input data into data type field.
     """
 
+    chart_data_format: CONFIG_OPTIONS_CHART_DATA_FORMAT = Field(
+        default="points",
+        description="Format of the data of the chart components. `points` (default) - `data` with the array of series, each with the array of data points objects. `columns` - `columns` with the array of the x-axis values shared by all the series, and the array of y-axis values for each series, which is more compact and faster to generate for large charts.",
+    )
+    """
+    Format of the data of the chart components:
+    * `points` (default) - `data` with the array of series, each with the array of data points objects.
+    * `columns` - `columns` with the array of the x-axis values shared by all the series, and the array of y-axis values for each series,
+      which is more compact and faster to generate for large charts.
+    """
+
+    chart_downsampling: Optional[AgentConfigChartDownsampling] = Field(
+        default=None,
+        description="Downsampling of the line chart data series with too many data points, so large time series are not sent to the client. Disabled if not set.",
+    )
+    """
+    Downsampling of the line chart data series with too many data points, so large time series are not sent to the client.
+    Disabled if not set.
+    """
+
+    chart_aggregation: Optional[AgentConfigChartAggregation] = Field(
+        default=None,
+        description="Aggregation of the pie, donut and bar chart data with too many categories (top-N slices with `Other`, histogram binning, limited bars), so chart payloads stay bounded. Disabled if not set.",
+    )
+    """
+    Aggregation of the pie, donut and bar chart data with too many categories (top-N slices with `Other`, histogram binning, limited bars),
+    so chart payloads stay bounded. Disabled if not set.
+    """
+
     generate_all_fields: bool = Field(
         default=False,
         description="If `True`, the agent will generate all possible view Fields for the UI component into its output configuration `UIBlockComponentMetadata.fields_all`, if `False` then all fields aren't generated. Can be overriden for individual `data_types`. Supported only for `table` and `set-of-cards` components.",
@@ -341,6 +620,48 @@ class AgentConfig(BaseModel):
     If `False`, auto-detection is disabled and the default transformer is always used unless explicitly configured for a data type.
     """
 
+    input_data_max_rows: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximal number of rows parsed from the input data, rest of the rows is only counted and component data are marked as truncated. Not limited by default. Can be overriden for individual `data_types`. Supported by the `jsonl`, `yaml` (multi-document YAML), `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable` and `arrow` input data transformers, which parse the rows lazily.",
+    )
+    """
+    Maximal number of rows parsed from the input data, rest of the rows is only counted and component data are marked as truncated
+    (see `ComponentDataBase.input_data_truncated` and `ComponentDataBase.input_data_total_count`).
+    Not limited by default. Can be overriden for individual `data_types`.
+    Supported by the `jsonl`, `yaml` (multi-document YAML), `csv-comma`, `csv-semicolon`, `csv-tab`, `fwctable` and `arrow` input data transformers, which parse the rows lazily.
+    """
+
+    input_data_limits: Optional[AgentConfigInputDataLimits] = Field(
+        default=None,
+        description="Limits (guardrails) of the input data size, number of items and nesting depth, with policy applied when they are exceeded. Applied policies are recorded in the `UIBlockConfiguration.input_data_limits_applied`. Not limited by default. Can be overriden for individual `data_types`.",
+    )
+    """
+    Limits (guardrails) of the input data size, number of items and nesting depth, with policy applied when they are exceeded.
+    Applied policies are recorded in the `UIBlockConfiguration.input_data_limits_applied`. Not limited by default. Can be overriden for individual `data_types`.
+    """
+
+    processing_executor: Optional[AgentConfigProcessingExecutor] = Field(
+        default=None,
+        description="Configuration of the executor used by the agent's async methods (`atransform_data`, `agenerate_rendering`) to run CPU-bound processing steps out of the asyncio event loop. Thread pool with default settings is used if not set.",
+    )
+    """Configuration of the executor used by the agent's async methods to run CPU-bound processing steps out of the asyncio event loop."""
+
+    json_renderer: Optional[AgentConfigJsonRenderer] = Field(
+        default=None,
+        description="Configuration of the `json` component system renderer, e.g. compact output mode.",
+    )
+    """Configuration of the `json` component system renderer, e.g. compact output mode."""
+
+    rendering_cache: Optional[AgentConfigRenderingCache] = Field(
+        default=None,
+        description="Cache of the rendering results keyed by the component system, renderer version and digest of the component data, so unchanged components are not rendered again. Disabled if not set.",
+    )
+    """
+    Cache of the rendering results keyed by the component system, renderer version and digest of the component data,
+    so unchanged components are not rendered again. Disabled if not set.
+    """
+
 
 class InputData(TypedDict):
     """Agent Input Data."""
@@ -350,8 +671,17 @@ class InputData(TypedDict):
     ID of the input data so we can reference them during the agent processing.
     Must be unique for each `InputData` in one UI Agent call (in one `AgentInput`).
     """
-    data: str
-    """JSON data to be processed."""
+    data: str | bytes
+    """
+    JSON data to be processed.
+    Can be passed also as UTF-8 encoded `bytes` (or `memoryview`), which are parsed by the built-in input data transformers
+    directly, without decoding whole data into `str`.
+    """
+    data_file: NotRequired[str | None]
+    """
+    Optional path of the local file with the data to be processed, used instead of `data` (which should be empty then).
+    File is memory-mapped and parsed by the built-in input data transformers directly, without reading it into memory.
+    """
     type: NotRequired[str | None]
     """
     Optional type identification of the input data. Used for processing (see `AgentConfig.data_types`) and frontend visualization customizations.
@@ -380,6 +710,41 @@ class InputDataInternal(InputData):
     """
 
 
+def get_input_data_content(input_data: InputData) -> InputDataContent:
+    """
+    Get raw content of the input data - memory-mapped `InputData.data_file` if set, `InputData.data` otherwise.
+    `memoryview` data are unwrapped to the underlying `bytes` if possible, copied otherwise.
+
+    Raises:
+        OSError: If the `InputData.data_file` can't be read.
+    """
+    data_file = input_data.get("data_file")
+    if data_file:
+        return map_input_data_file(data_file)
+    data: str | bytes | memoryview = input_data["data"]
+    if isinstance(data, memoryview):
+        underlying = data.obj
+        if isinstance(underlying, (bytes, mmap.mmap)) and data.nbytes == len(
+            underlying
+        ):
+            return underlying
+        return data.tobytes()
+    return data
+
+
+def get_input_data_size(input_data: InputData) -> int:
+    """
+    Get size of the raw input data - length of the `InputData.data`, or size of the `InputData.data_file` in bytes.
+
+    Raises:
+        OSError: If the `InputData.data_file` can't be accessed.
+    """
+    data_file = input_data.get("data_file")
+    if data_file:
+        return os.path.getsize(data_file)
+    return len(input_data["data"])
+
+
 class AgentInput(TypedDict):
     """Agent Input."""
 
@@ -389,6 +754,26 @@ class AgentInput(TypedDict):
     """Input data to be processed - one or more can be provided."""
 
 
+class InputDataLimitApplied(BaseModel):
+    """Input data limit (see `AgentConfigInputDataLimits`) applied during the `input data transformation`."""
+
+    limit: Literal["max_size", "max_items", "max_depth"] = Field(
+        description="Name of the exceeded limit."
+    )
+    """Name of the exceeded limit."""
+    policy: Literal["truncate", "sample"] = Field(
+        description="Policy applied to the input data."
+    )
+    """Policy applied to the input data."""
+    value: int = Field(description="Configured value of the limit.")
+    """Configured value of the limit."""
+    input_data_value: Optional[int] = Field(
+        default=None,
+        description="Value found in the input data (size, number of items, depth), if known.",
+    )
+    """Value found in the input data (size, number of items, depth), if known."""
+
+
 class UIComponentMetadataBase(BaseModel):
     """UI Component Metadata - part shared between UIBlockConfiguration and UIComponentMetadata."""
 
@@ -433,6 +818,32 @@ class UIComponentMetadata(UIComponentMetadataBase):
     Optional type of the input data. Can be used for frontend customization of the component for concrete data type, eg. by using it in CSS class names.
     """
 
+    input_data_total_count: Optional[int] = None
+    """
+    Total number of rows in the input data if they were truncated to `AgentConfig.input_data_max_rows` during the `input data transformation`,
+    `None` if the input data were not truncated.
+    """
+
+    input_data_limits_applied: Optional[list[InputDataLimitApplied]] = None
+    """
+    Input data limits applied during the `input data transformation` (see `AgentConfig.input_data_limits`), `None` if no limit was applied.
+    """
+
+    chart_data_format: Optional[CONFIG_OPTIONS_CHART_DATA_FORMAT] = None
+    """
+    Format of the data of the chart components generated by the data transformation (see `AgentConfig.chart_data_format`), `points` if not set.
+    """
+
+    chart_downsampling: Optional[AgentConfigChartDownsampling] = None
+    """
+    Downsampling of the line chart data series applied by the data transformation (see `AgentConfig.chart_downsampling`), no downsampling if not set.
+    """
+
+    chart_aggregation: Optional[AgentConfigChartAggregation] = None
+    """
+    Aggregation of the chart data applied by the data transformation (see `AgentConfig.chart_aggregation`), no aggregation if not set.
+    """
+
     # Debug information for LLM interactions
     llm_interactions: Optional[list[dict[str, Any]]] = None
     """
@@ -497,6 +908,11 @@ class UIBlockConfiguration(BaseModel):
         description="Name of the field used for the input data `JSON Wrapping` if it was performed, `None` if `JSON Wrapping` was not performed.",
     )
     "Name of the field used for the input data `JSON Wrapping` if it was performed, `None` if `JSON Wrapping` was not performed."
+    input_data_limits_applied: Optional[list[InputDataLimitApplied]] = Field(
+        default=None,
+        description="Input data limits applied during the input data transformation (see `AgentConfig.input_data_limits`), so the component shows only part of the input data. `None` if no limit was applied.",
+    )
+    "Input data limits applied during the input data transformation, `None` if no limit was applied."
     component_metadata: Optional[UIBlockComponentMetadata] = Field(
         default=None, description="Metadata of the generated UI component."
     )
@@ -510,6 +926,11 @@ class UIBlock(BaseModel):
     """ID of the `InputData` this instance is for."""
     rendering: Optional[UIBlockRendering] = None
     "Rendering of UI block"
+    renderings: Optional[list[UIBlockRendering]] = None
+    """
+    Renderings of UI block in all the requested component systems, if more than one was requested.
+    `rendering` contains the first one.
+    """
     configuration: Optional[UIBlockConfiguration] = None
     "Configuration of the block"
 
@@ -517,11 +938,30 @@ class UIBlock(BaseModel):
 class InputDataTransformerBase(ABC):
     """Base of the Input Data transformer"""
 
+    TRANSFORMS_BINARY_CONTENT = False
+    """
+    If `True`, `transform` accepts also UTF-8 encoded `bytes` and memory-mapped file content (see `InputDataContent`),
+    so the input data are parsed without decoding them into `str` first.
+    """
+
+    def get_content(self, input_data: InputData) -> InputDataContent:
+        """
+        Get content of the input data to be passed to `transform` - decoded into `str` unless `TRANSFORMS_BINARY_CONTENT` is `True`.
+
+        Raises:
+            ValueError: If the content is not valid UTF-8.
+            OSError: If the `InputData.data_file` can't be read.
+        """
+        content = get_input_data_content(input_data)
+        if self.TRANSFORMS_BINARY_CONTENT:
+            return content
+        return decode_input_data_content(content)
+
     def transform_input_data(self, input_data: InputData) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
 
-        Default implementation calls #transform(string) method with content.
+        Default implementation calls #transform(string) method with content, see `get_content`.
 
         Args:
             input_data: InputData to transform
@@ -532,13 +972,93 @@ class InputDataTransformerBase(ABC):
         Raises:
             ValueError: If the input data can't be parsed due to invalid format.
         """
-        return self.transform(input_data["data"])
+        # content is `str` unless the transformer declares it transforms binary content too
+        content: Any = self.get_content(input_data)
+        return self.transform(content)
+
+    def transform_input_data_with_max_rows(
+        self, input_data: InputData, max_rows: Optional[int]
+    ) -> tuple[Any, Optional[int]]:
+        """
+        Transform the input data into the object tree matching parsed JSON format, with at most `max_rows` rows (items of the root array).
+
+        Default implementation does not support truncation, it calls `transform_input_data(input_data)` and never truncates the data.
+        Override it for formats which can be parsed row by row.
+
+        Args:
+            input_data: InputData to transform
+            max_rows: Maximal number of rows to parse, `None` for no limit
+        Returns:
+            * Object tree matching parsed JSON format, see `transform_input_data`.
+            * Total number of rows in the input data if they were truncated to `max_rows`, `None` if not truncated.
+        Raises:
+            ValueError: If the input data can't be parsed due to invalid format.
+        """
+        return self.transform_input_data(input_data), None
+
+    def transform_input_data_prefix(self, input_data: InputData, max_size: int) -> Any:
+        """
+        Transform only the beginning of the input data - complete records (rows) contained in the first `max_size` characters/bytes.
+        Used by the `truncate` policy of the `AgentConfigInputDataLimits.max_size` limit, so oversized input data are never parsed whole.
+
+        Default implementation does not support it. Override it for formats which can be parsed record by record.
+
+        Args:
+            input_data: InputData to transform
+            max_size: Maximal number of characters (bytes for binary content) to parse
+        Returns:
+            Object tree matching parsed JSON format, see `transform_input_data`.
+        Raises:
+            NotImplementedError: If the transformer can't parse beginning of the input data.
+            ValueError: If the input data can't be parsed due to invalid format.
+        """
+        raise NotImplementedError(
+            "Transformation of the beginning of the input data is not supported"
+        )
+
+    def get_input_data_depth(self, input_data: InputData) -> int:
+        """
+        Get nesting depth of the objects and arrays in the raw input data, without parsing them, root object or array has depth 1.
+        Used by the `AgentConfigInputDataLimits.max_depth` limit, so input data nested too deeply to be parsed are rejected
+        or truncated (see `truncate_input_data_depth`) before parsing.
+
+        Default implementation does not support it, depth is checked after the input data are parsed.
+
+        Args:
+            input_data: InputData to check
+        Returns:
+            Nesting depth of the input data
+        Raises:
+            NotImplementedError: If the transformer can't get depth of the raw input data.
+        """
+        raise NotImplementedError(
+            "Depth of the raw input data is not supported, it is checked after parsing"
+        )
+
+    def truncate_input_data_depth(
+        self, input_data: InputData, max_depth: int
+    ) -> InputDataContent:
+        """
+        Replace the objects and arrays nested deeper than `max_depth` in the raw input data by `null`, without parsing them.
+        Used by the `truncate` policy of the `AgentConfigInputDataLimits.max_depth` limit, if supported by `get_input_data_depth`.
+
+        Args:
+            input_data: InputData to truncate
+            max_depth: Maximal nesting depth of the objects and arrays
+        Returns:
+            Truncated content of the input data to be passed to `transform`, see `get_content`.
+        Raises:
+            NotImplementedError: If the transformer can't truncate the raw input data.
+        """
+        raise NotImplementedError(
+            "Truncation of the raw input data depth is not supported"
+        )
 
     def transform(self, input_data: str) -> Any:
         """
         Transform the input data into the object tree matching parsed JSON format.
         Args:
-            input_data: Input data string to transform
+            input_data: Input data string to transform, or `InputDataContent` if `TRANSFORMS_BINARY_CONTENT` is `True`
         Returns:
             Object tree matching parsed JSON using `json.loads()`, so `jsonpath_ng` can be used
             to access the data, and Pydantic `model_dump_json()` can be used to convert it to JSON string.
@@ -561,3 +1081,21 @@ class InputDataTransformerBase(ABC):
             True if the input data is compatible with this transformer, False otherwise
         """
         return False
+
+    def detect_my_data_structure_in_sample(
+        self, input_data: InputData, sample: InputDataSample
+    ) -> bool:
+        """
+        Detect whether the input data structure is compatible with this transformer, using the bounded sample of the data
+        shared by all the detectors during auto-detection.
+
+        Default implementation calls `detect_my_data_structure(input_data)`. Override it to inspect only the `sample`,
+        so the detection cost does not depend on the data size.
+
+        Args:
+            input_data: InputData to detect
+            sample: Bounded sample of the `input_data` data
+        Returns:
+            True if the input data is compatible with this transformer, False otherwise
+        """
+        return self.detect_my_data_structure(input_data)
@@ -0,0 +1,140 @@
+"""
+YAML parsing used by the UI Agent.
+
+C-accelerated `CSafeLoader` is used if PyYAML is built with `libyaml`, which is many times faster
+than the pure python `SafeLoader` used otherwise. Both loaders construct the same objects.
+"""
+
+from typing import Any, Iterator, Optional
+
+# PyYAML is imported on the first use, not to slow down the UI Agent startup
+_NULL_TAG = "tag:yaml.org,2002:null"
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily initialized module attributes (PEP 562):
+    * `YamlSafeLoader` - YAML safe loader class, `yaml.CSafeLoader` if available, `yaml.SafeLoader` otherwise.
+    * `YAML_LIBYAML` - `True` if C-accelerated `libyaml` loader is used.
+    """
+    if name in ("YamlSafeLoader", "YAML_LIBYAML"):
+        import yaml  # type: ignore[import-untyped]
+
+        loader = globals().setdefault(
+            "YamlSafeLoader", getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        )
+        globals()["YAML_LIBYAML"] = loader is not yaml.SafeLoader
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_safe_loader() -> Any:
+    loader = globals().get("YamlSafeLoader")
+    return loader if loader is not None else __getattr__("YamlSafeLoader")
+
+
+def yaml_safe_load(stream: Any) -> Any:
+    """
+    Parse the only YAML document in the stream, same as `yaml.safe_load()`.
+    Raises:
+        yaml.YAMLError: If the stream is not valid YAML or contains more documents.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=_get_safe_loader())
+
+
+def yaml_safe_load_all(
+    stream: Any, max_documents: Optional[int] = None
+) -> Iterator[Any]:
+    """
+    Parse all YAML documents in the stream lazily, same as `yaml.safe_load_all()`.
+    Args:
+        stream: YAML string or file stream.
+        max_documents: Maximal number of documents in the stream, `None` for no limit.
+    Raises:
+        yaml.YAMLError: If the stream is not valid YAML.
+        ValueError: If the stream contains more than `max_documents` documents.
+            Error is raised before the next document is parsed, so huge stream doesn't have to be parsed whole.
+    """
+    loader = _get_safe_loader()(stream)
+    try:
+        count = 0
+        while loader.check_data():
+            if max_documents is not None and count >= max_documents:
+                raise ValueError(f"YAML contains more than {max_documents} documents")
+            count += 1
+            yield loader.get_data()
+    finally:
+        loader.dispose()
+
+
+def yaml_safe_load_documents(
+    stream: Any, max_documents: Optional[int]
+) -> tuple[list[Any], Optional[int]]:
+    """
+    Parse at most `max_documents` YAML documents in the stream, rest of the documents is only counted.
+    Only YAML parser events are processed for the rest of the documents, objects are not constructed for them.
+    Empty (`null`) documents, eg. after trailing `---` document marker, are skipped.
+    Args:
+        stream: YAML string or file stream.
+        max_documents: Maximal number of documents to parse, `None` for no limit.
+    Returns:
+        * List of parsed documents.
+        * Total number of documents in the stream if they were truncated to `max_documents`, `None` if not truncated.
+    Raises:
+        yaml.YAMLError: If the stream is not valid YAML.
+    """
+    loader = _get_safe_loader()(stream)
+    try:
+        documents: list[Any] = []
+        while loader.check_data():
+            if max_documents is not None and len(documents) >= max_documents:
+                skipped_documents = _count_documents(loader)
+                if skipped_documents:
+                    return documents, len(documents) + skipped_documents
+                break
+            document = loader.get_data()
+            if document is not None:
+                documents.append(document)
+        return documents, None
+    finally:
+        loader.dispose()
+
+
+def _count_documents(loader: Any) -> int:
+    """Count rest of the not empty documents in the `loader` from parser events, without constructing them."""
+    from yaml.events import (  # type: ignore[import-untyped]
+        DocumentEndEvent,
+        DocumentStartEvent,
+        StreamEndEvent,
+    )
+
+    count = 0
+    document_node_events: list[Any] = []
+    while not loader.check_event(StreamEndEvent):
+        event = loader.get_event()
+        if isinstance(event, DocumentEndEvent):
+            if not _is_null_document(loader, document_node_events):
+                count += 1
+            document_node_events = []
+        elif (
+            not isinstance(event, DocumentStartEvent) and len(document_node_events) < 2
+        ):
+            document_node_events.append(event)
+    return count
+
+
+def _is_null_document(loader: Any, node_events: list[Any]) -> bool:
+    """Check if document with these (first two) node events is constructed as `None`."""
+    from yaml.events import ScalarEvent
+    from yaml.nodes import ScalarNode  # type: ignore[import-untyped]
+
+    if len(node_events) != 1 or not isinstance(node_events[0], ScalarEvent):
+        return False
+    # same tag resolution as in the YAML composer
+    event = node_events[0]
+    tag: Optional[str] = event.tag
+    if tag is None or tag == "!":
+        tag = loader.resolve(ScalarNode, event.value, event.implicit)
+    return tag == _NULL_TAG
@@ -0,0 +1,86 @@
+import pytest
+import yaml  # type: ignore[import-untyped]
+from next_gen_ui_agent import yaml_tools
+from next_gen_ui_agent.yaml_tools import (
+    yaml_safe_load,
+    yaml_safe_load_all,
+    yaml_safe_load_documents,
+)
+
+MULTI_DOCUMENT_YAML = """---
+kind: Pod
+metadata:
+  name: pod-1
+---
+---
+null
+--- !!null
+---
+"null"
+---
+kind: Service
+created: 2024-01-02
+---
+"""
+
+DOCUMENTS = [
+    {"kind": "Pod", "metadata": {"name": "pod-1"}},
+    "null",
+    {"kind": "Service", "created": yaml.safe_load("2024-01-02")},
+]
+
+
+@pytest.fixture(params=["SafeLoader", "CSafeLoader"])
+def loader(request, monkeypatch):
+    """Run the test with both pure python and `libyaml` loader."""
+    loader_class = getattr(yaml, request.param, None)
+    if loader_class is None:
+        pytest.skip("PyYAML is not built with libyaml")
+    monkeypatch.setattr(yaml_tools, "YamlSafeLoader", loader_class)
+    return loader_class
+
+
+def test_libyaml_loader_used_if_available() -> None:
+    assert yaml_tools.YAML_LIBYAML == hasattr(yaml, "CSafeLoader")
+
+
+def test_yaml_safe_load(loader) -> None:
+    assert yaml_safe_load("a: 1\nb: [x, y]") == {"a": 1, "b": ["x", "y"]}
+    with pytest.raises(yaml.YAMLError):
+        yaml_safe_load("a: 1\n---\nb: 2")
+
+
+def test_yaml_safe_load_all(loader) -> None:
+    assert list(yaml_safe_load_all("a: 1\n---\nb: 2")) == [{"a": 1}, {"b": 2}]
+    assert list(yaml_safe_load_all("a: 1\n---\nb: 2", max_documents=2)) == [
+        {"a": 1},
+        {"b": 2},
+    ]
+
+
+def test_yaml_safe_load_all_max_documents(loader) -> None:
+    documents = yaml_safe_load_all("a: 1\n---\nb: 2\n---\nc: [", max_documents=2)
+    assert next(documents) == {"a": 1}
+    assert next(documents) == {"b": 2}
+    # error is raised before invalid third document is parsed
+    with pytest.raises(ValueError, match="YAML contains more than 2 documents"):
+        next(documents)
+
+
+def test_yaml_safe_load_documents(loader) -> None:
+    assert yaml_safe_load_documents(MULTI_DOCUMENT_YAML, None) == (DOCUMENTS, None)
+    assert yaml_safe_load_documents(MULTI_DOCUMENT_YAML, 3) == (DOCUMENTS, None)
+    assert yaml_safe_load_documents("", 3) == ([], None)
+
+
+@pytest.mark.parametrize("max_documents", [0, 1, 2])
+def test_yaml_safe_load_documents_truncated(loader, max_documents) -> None:
+    assert yaml_safe_load_documents(MULTI_DOCUMENT_YAML, max_documents) == (
+        DOCUMENTS[:max_documents],
+        3,
+    )
+
+
+def test_yaml_safe_load_documents_invalid(loader) -> None:
+    with pytest.raises(yaml.YAMLError):
+        yaml_safe_load_documents("a: 1\n---\nb: [", 1)
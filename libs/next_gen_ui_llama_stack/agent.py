@@ -12,6 +12,7 @@ from next_gen_ui_agent import (
     UIComponentMetadata,
 )
 from next_gen_ui_agent.inference.inference_base import InferenceBase
+from next_gen_ui_agent.input_data_context import InputDataContext
 from next_gen_ui_llama_stack.llama_stack_inference import (
     LlamaStackAgentInference,
     LlamaStackAsyncAgentInference,
@@ -113,39 +114,56 @@ class NextGenUILlamaStackAgent:
         """
         # TODO error handling for component selection and rendering - how to do it?
         try:
+            # Input data are parsed only once and shared by all the steps through the context
+            input_data_contexts = [
+                InputDataContext(input_data) for input_data in tool_data_list
+            ]
+
             # Process all input_data in parallel for component selection
             components = await asyncio.gather(
                 *[
-                    self.ngui_agent.select_component(user_prompt, input_data)
-                    for input_data in tool_data_list
+                    self.ngui_agent.select_component(user_prompt, input_data_context)
+                    for input_data_context in input_data_contexts
                 ]
             )
 
-            # Transform data for each component (synchronous operations)
-            components_data = [
-                self.ngui_agent.transform_data(input_data, component)
-                for input_data, component in zip(tool_data_list, components)
-            ]
+            # Transform data for each component in parallel, out of the event loop for large data
+            components_data = await asyncio.gather(
+                *[
+                    self.ngui_agent.atransform_data(input_data_context, component)
+                    for input_data_context, component in zip(
+                        input_data_contexts, components
+                    )
+                ]
+            )
 
-            # Render all components (synchronous operations)
-            renderings = [
-                self.ngui_agent.generate_rendering(component_data, component_system)
-                for component_data in components_data
-            ]
+            # Render all components in parallel, out of the event loop for large data
+            renderings = await asyncio.gather(
+                *[
+                    self.ngui_agent.agenerate_rendering(
+                        component_data,
+                        component_system,
+                        data_size=input_data_context.data_size,
+                    )
+                    for input_data_context, component_data in zip(
+                        input_data_contexts, components_data
+                    )
+                ]
+            )
 
             # Yield all renderings at once
             yield ResponseEventSuccess(
                 event_type="success",
                 payload=[
                     UIBlock(
-                        id=input_data["id"],
+                        id=input_data_context.id,
                         rendering=rendering,
                         configuration=self.ngui_agent.construct_UIBlockConfiguration(
-                            input_data, component
+                            input_data_context, component
                         ),
                     )
-                    for input_data, component, rendering in zip(
-                        tool_data_list, components, renderings
+                    for input_data_context, component, rendering in zip(
+                        input_data_contexts, components, renderings
                     )
                 ],
             )
@@ -164,17 +182,19 @@ class NextGenUILlamaStackAgent:
         Parallel component selection with progressive feedback.
         """
 
-        # Create a lookup map from id to input_data for quick retrieval
+        # Create a lookup map from id to input_data context for quick retrieval
+        # Input data are parsed only once and shared by all the steps through the context
         id_to_input_data = {
-            input_data["id"]: input_data for input_data in tool_data_list
+            input_data["id"]: InputDataContext(input_data)
+            for input_data in tool_data_list
         }
 
         # Create all selection tasks in parallel
         selection_tasks = [
             asyncio.create_task(
-                self.ngui_agent.select_component(user_prompt, input_data)
+                self.ngui_agent.select_component(user_prompt, input_data_context)
             )
-            for input_data in tool_data_list
+            for input_data_context in id_to_input_data.values()
         ]
 
         # Process results as they complete
@@ -185,10 +205,14 @@ class NextGenUILlamaStackAgent:
                 # Find the corresponding input_data by matching the id from the component
                 input_data = id_to_input_data[component.id]  # type: ignore
 
-                # Transform and render immediately
-                component_data = self.ngui_agent.transform_data(input_data, component)
-                rendering = self.ngui_agent.generate_rendering(
-                    component_data, component_system
+                # Transform and render immediately, out of the event loop for large data
+                component_data = await self.ngui_agent.atransform_data(
+                    input_data, component
+                )
+                rendering = await self.ngui_agent.agenerate_rendering(
+                    component_data,
+                    component_system,
+                    data_size=input_data.data_size,
                 )
 
                 # Construct UI block configuration and yield it immediately
@@ -5,6 +5,7 @@ import pytest
 from llama_stack_client import AsyncLlamaStackClient, LlamaStackClient
 from llama_stack_client.types.inference_step import InferenceStep
 from llama_stack_client.types.tool_execution_step import ToolExecutionStep
+from next_gen_ui_agent.input_data_context import InputDataContext
 from next_gen_ui_agent.types import (
     AgentConfig,
     AgentConfigComponent,
@@ -206,15 +207,15 @@ async def test_agent_turn_batch_with_exception() -> None:
         client, "not-used", inference=mocked_inference, execution_mode="batch"
     )
 
-    # Patch transform_data to throw exception for specific ID
-    original_transform = ngui_agent.ngui_agent.transform_data
+    # Patch atransform_data to throw exception for specific ID
+    original_transform = ngui_agent.ngui_agent.atransform_data
 
-    def transform_with_error(input_data, component):
-        if input_data["id"] == "c9918g7d-fb79-5g6g-b470-5b2653243f8b":
+    async def transform_with_error(input_data, component):
+        if InputDataContext.of(input_data).id == "c9918g7d-fb79-5g6g-b470-5b2653243f8b":
             raise ValueError(f"Simulated error for component {component.id}")
-        return original_transform(input_data, component)
+        return await original_transform(input_data, component)
 
-    ngui_agent.ngui_agent.transform_data = transform_with_error  # type: ignore
+    ngui_agent.ngui_agent.atransform_data = transform_with_error  # type: ignore
 
     success_count = 0
     error_count = 0
@@ -392,15 +393,15 @@ async def test_agent_turn_stream_with_exception() -> None:
         client, "not-used", inference=mocked_inference, execution_mode="stream"
     )
 
-    # Patch transform_data to throw exception for specific ID
-    original_transform = ngui_agent.ngui_agent.transform_data
+    # Patch atransform_data to throw exception for specific ID
+    original_transform = ngui_agent.ngui_agent.atransform_data
 
-    def transform_with_error(input_data, component):
-        if input_data["id"] == "id-error":
+    async def transform_with_error(input_data, component):
+        if InputDataContext.of(input_data).id == "id-error":
             raise ValueError(f"Simulated error for component {component.id}")
-        return original_transform(input_data, component)
+        return await original_transform(input_data, component)
 
-    ngui_agent.ngui_agent.transform_data = transform_with_error  # type: ignore
+    ngui_agent.ngui_agent.atransform_data = transform_with_error  # type: ignore
 
     success_count = 0
     error_count = 0
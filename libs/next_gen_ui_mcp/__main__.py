@@ -76,6 +76,8 @@ def create_server(
     debug: bool = False,
     enabled_tools=None,
     structured_output_enabled=True,
+    warm_up: bool = False,
+    warm_up_probe_inference: bool = False,
 ) -> NextGenUIMCPServer:
     """Create NextGenUIMCPServer with optional external inference provider.
 
@@ -86,6 +88,8 @@ def create_server(
         sampling_cost_priority: Cost priority for MCP sampling (0.0-1.0)
         sampling_speed_priority: Speed priority for MCP sampling (0.0-1.0)
         sampling_intelligence_priority: Intelligence priority for MCP sampling (0.0-1.0)
+        warm_up: Warm-up the agent when the server starts, server is not ready until done
+        warm_up_probe_inference: Issue probe inference during the warm-up
 
     Returns:
         Configured NextGenUIMCPServer
@@ -105,11 +109,13 @@ def create_server(
         debug=debug,
         enabled_tools=enabled_tools,
         structured_output_enabled=structured_output_enabled,
+        warm_up=warm_up,
+        warm_up_probe_inference=warm_up_probe_inference,
     )
 
 
-def add_health_routes(mcp: FastMCP):
-    """Add /liveness and /readiness via custom routes"""
+def add_health_routes(mcp: FastMCP, server: NextGenUIMCPServer | None = None):
+    """Add /liveness and /readiness via custom routes. Readiness is reported when the `server` warm-up is done."""
 
     from starlette.responses import JSONResponse  # pants: no-infer-dep
 
@@ -119,7 +125,16 @@ def add_health_routes(mcp: FastMCP):
 
     @mcp.custom_route("/readiness", methods=["GET"])
     async def readiness(request) -> JSONResponse:
-        return JSONResponse({"status": "healthy", "service": "mcp-server"})
+        if server and not server.ready:
+            return JSONResponse(
+                {"status": "warming-up", "service": "mcp-server"}, status_code=503
+            )
+        response: dict = {"status": "healthy", "service": "mcp-server"}
+        if server and server.ngui_agent.warm_up_duration is not None:
+            response["warm_up_duration"] = server.ngui_agent.warm_up_duration
+        if server and server.ngui_agent.rendering_cache:
+            response["rendering_cache"] = server.ngui_agent.rendering_cache.get_stats()
+        return JSONResponse(response)
 
     logger.info("Health checks available under /liveness and /readiness.")
 
@@ -184,6 +199,8 @@ def main():
             debug=args.debug,
             enabled_tools=enabled_tools,
             structured_output_enabled=args.structured_output_enabled == "true",
+            warm_up=args.warm_up != "false",
+            warm_up_probe_inference=args.warm_up == "probe-inference",
         )
 
     except (ImportError, RuntimeError) as e:
@@ -196,11 +213,11 @@ def main():
             logger.info("Server running on stdio - connect with MCP clients")
             agent.run(transport="stdio")
         elif transport == "sse":
-            add_health_routes(agent.get_mcp_server())
+            add_health_routes(agent.get_mcp_server(), agent)
             logger.info("Starting server on http://%s:%s/sse", args.host, args.port)
             agent.run(transport="sse", host=args.host, port=args.port)
         elif transport == "streamable-http":
-            add_health_routes(agent.get_mcp_server())
+            add_health_routes(agent.get_mcp_server(), agent)
             logger.info("Starting server on http://%s:%s/mcp", args.host, args.port)
             agent.run(transport="streamable-http", host=args.host, port=args.port)
         else:
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+import os
 import uuid
-from typing import Annotated, Any, List, Literal, Optional
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, List, Literal, Optional
 
 from fastmcp import Context, FastMCP
 from fastmcp.tools.tool import ToolResult
@@ -9,6 +11,7 @@ from mcp import types
 from mcp.types import ModelPreferences, TextContent
 from next_gen_ui_agent.agent import NextGenUIAgent
 from next_gen_ui_agent.inference.inference_base import InferenceBase
+from next_gen_ui_agent.input_data_context import InputDataContext
 from next_gen_ui_agent.types import InputData, UIBlock
 from next_gen_ui_mcp.agent_config import MCPAgentConfig, MCPAgentToolConfig
 from next_gen_ui_mcp.types import MCPGenerateUIOutput
@@ -181,7 +184,15 @@ class NextGenUIMCPServer:
         debug: bool = False,
         enabled_tools=None,
         structured_output_enabled=True,
+        warm_up: bool = False,
+        warm_up_probe_inference: bool = False,
     ):
+        """
+        * `warm_up` - if `True`, the agent is warmed up (see `NextGenUIAgent.warm_up()`) in the background when the server starts,
+          and the server is not `ready` until the warm-up is done.
+        * `warm_up_probe_inference` - if `True`, the warm-up issues probe inference to the external `inference`.
+          Probe is not possible for MCP sampling, as there is no client connected during the warm-up.
+        """
         self.debug = debug
         self.config = config
         self.sampling_max_tokens = sampling_max_tokens
@@ -190,10 +201,14 @@ class NextGenUIMCPServer:
         self.sampling_speed_priority = sampling_speed_priority
         self.sampling_intelligence_priority = sampling_intelligence_priority
         self.structured_output_enabled = structured_output_enabled
+        self.warm_up_probe_inference = warm_up_probe_inference
+        self.ready = not warm_up
+        """`False` until the warm-up is done, if requested. Used by the readiness check."""
         self.mcp: FastMCP = FastMCP(
             name,
             strict_input_validation=True,
             mask_error_details=False,
+            lifespan=self._warm_up_lifespan if warm_up else None,
         )
         if enabled_tools:
             # CLI/env has highest precedence
@@ -223,6 +238,40 @@ class NextGenUIMCPServer:
         self.inference = inference
         self.ngui_agent = NextGenUIAgent(config=self.config)
 
+    async def warm_up(self, probe_inference: bool = False) -> float:
+        """
+        Warm-up the agent (see `NextGenUIAgent.warm_up()`) and mark the server as `ready`.
+        Returns warm-up duration in seconds.
+        """
+        if probe_inference and not self.inference:
+            logger.warning(
+                "Warm-up probe inference skipped, MCP sampling can't be used without connected client"
+            )
+            probe_inference = False
+        duration = await self.ngui_agent.warm_up(self.inference, probe_inference)
+        self.ready = True
+        return duration
+
+    async def _warm_up_in_background(self) -> None:
+        try:
+            await self.warm_up(self.warm_up_probe_inference)
+        except Exception:
+            # warm-up only speeds up the first requests, the server is able to process them anyway
+            logger.exception("UI Agent warm-up failed")
+            self.ready = True
+
+    @asynccontextmanager
+    async def _warm_up_lifespan(self, mcp: FastMCP) -> AsyncIterator[dict]:
+        # warm-up runs in the background, so the server responds (not ready) to the readiness checks meanwhile
+        task = None
+        if not self.ready:
+            task = asyncio.create_task(self._warm_up_in_background())
+        try:
+            yield {}
+        finally:
+            if task and not task.done():
+                task.cancel()
+
     def _get_argument_description(
         self,
         tool_config: Optional[MCPAgentToolConfig],
@@ -548,37 +597,66 @@ class NextGenUIMCPServer:
         inference: InferenceBase,
     ) -> UIBlock:
         await ctx.info("Starting UI generation...")
+        self.check_data_file(input_data)
 
         # Run the complete agent pipeline using the configured inference
-        # 1. Component selection
-        await ctx.info("Performing component selection...")
-        component_metadata = await self.ngui_agent.select_component(
-            user_prompt=user_prompt, input_data=input_data, inference=inference
-        )
+        # Input data are parsed only once and shared by all the steps through the context
+        with InputDataContext(input_data) as input_data_context:
+            # 1. Component selection
+            await ctx.info("Performing component selection...")
+            component_metadata = await self.ngui_agent.select_component(
+                user_prompt=user_prompt,
+                input_data=input_data_context,
+                inference=inference,
+            )
 
-        # 2. Data transformation
-        await ctx.info("Transforming data to match components...")
-        components_data = self.ngui_agent.transform_data(
-            input_data=input_data, component=component_metadata
-        )
+            # 2. Data transformation
+            await ctx.info("Transforming data to match components...")
+            components_data = await self.ngui_agent.atransform_data(
+                input_data=input_data_context, component=component_metadata
+            )
 
-        # 3. Design system rendering
-        await ctx.info("Rendering final UI components...")
-        rendering = self.ngui_agent.generate_rendering(
-            component=components_data,
-            component_system=self.config.component_system,
-        )
-        await ctx.info("Successfully generated UI component")
+            # 3. Design system rendering
+            await ctx.info("Rendering final UI components...")
+            rendering = await self.ngui_agent.agenerate_rendering(
+                component=components_data,
+                component_system=self.config.component_system,
+                data_size=input_data_context.data_size,
+            )
+            await ctx.info("Successfully generated UI component")
 
-        block_config = self.ngui_agent.construct_UIBlockConfiguration(
-            input_data=input_data,
-            component_metadata=component_metadata,
-        )
+            block_config = self.ngui_agent.construct_UIBlockConfiguration(
+                input_data=input_data_context,
+                component_metadata=component_metadata,
+            )
         ui_block = UIBlock(
             id=rendering.id, rendering=rendering, configuration=block_config
         )
         return ui_block
 
+    def check_data_file(self, input_data: InputData) -> None:
+        """
+        Check that input data passed by reference in `InputData.data_file` are in one of the `MCPConfig.data_file_dirs`.
+        Raises:
+            ValueError: If the data file is not allowed.
+        """
+        data_file = input_data.get("data_file")
+        if not data_file:
+            return
+        data_file_dirs = self.config.mcp.data_file_dirs if self.config.mcp else None
+        if not data_file_dirs:
+            raise ValueError(
+                "Passing input data by reference in 'data_file' is not enabled on this MCP server"
+            )
+        real_path = os.path.realpath(data_file)
+        for data_file_dir in data_file_dirs:
+            real_dir = os.path.realpath(data_file_dir)
+            if os.path.commonpath([real_dir, real_path]) == real_dir:
+                return
+        raise ValueError(
+            f"Input data file '{data_file}' is not in any of the allowed directories"
+        )
+
     def create_mcp_output(
         self,
         blocks: list[UIBlock],
@@ -56,6 +56,15 @@ class MCPConfig(BaseModel):
     )
     """Tools info to override default values in the MCP Agent."""
 
+    data_file_dirs: Optional[List[str]] = Field(
+        default=None,
+        description="Local directories MCP clients can pass the input data from by reference, in the `data_file` field of the `structured_data` items of the `generate_ui_multiple_components` tool. Files are memory-mapped and parsed without reading them into memory. Passing data by reference is disabled if not set.",
+    )
+    """
+    Local directories MCP clients can pass the input data from by reference, in the `data_file` field of the `structured_data` items.
+    Passing data by reference is disabled if not set.
+    """
+
 
 class MCPAgentConfig(AgentConfig):
     """MCP Agent Configuration."""
@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import List
+from typing import List, cast
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -8,7 +9,11 @@ from fastmcp.exceptions import ToolError
 from mcp import CreateMessageResult, types
 from mcp.types import ModelPreferences
 from next_gen_ui_agent.data_transform.types import ComponentDataBaseWithArrayValueFileds
-from next_gen_ui_agent.types import InputData, UIComponentMetadata
+from next_gen_ui_agent.types import (
+    AgentConfigRenderingCache,
+    InputData,
+    UIComponentMetadata,
+)
 from next_gen_ui_mcp import MCPGenerateUIOutput, NextGenUIMCPServer
 from next_gen_ui_mcp.__main__ import add_health_routes
 from next_gen_ui_mcp.agent_config import (
@@ -721,6 +726,76 @@ class TestGenerateUIMultipleComponents:
         assert configuration.data_type == "movie_detail"
         assert configuration.data_type_metadata == test_metadata
 
+    @pytest.mark.asyncio
+    async def test_structured_data_data_file(
+        self, external_inference, tmp_path
+    ) -> None:
+        """Test that input data can be passed by reference in `data_file` if enabled."""
+        data_file = tmp_path / "movie.json"
+        data_file.write_text(json.dumps(find_movie("Toy Story"), default=str))
+        ngui_agent = NextGenUIMCPServer(
+            config=MCPAgentConfig(
+                component_system="json",
+                mcp=MCPConfig(data_file_dirs=[str(tmp_path)]),
+            ),
+            inference=external_inference,
+        )
+
+        async with Client(ngui_agent.get_mcp_server()) as client:
+            result = await client.call_tool(
+                "generate_ui_multiple_components",
+                {
+                    "user_prompt": "Tell me brief details of Toy Story",
+                    "structured_data": [
+                        {"id": "test_id", "data": "", "data_file": str(data_file)}
+                    ],
+                },
+            )
+
+        output = MCPGenerateUIOutput.model_validate(result.data)
+        assert len(output.blocks) == 1
+        rendering = output.blocks[0].rendering
+        assert rendering is not None
+        assert rendering.id == "test_id"
+        assert '"Toy Story"' in rendering.content
+
+
+class TestCheckDataFile:
+    """Tests for `NextGenUIMCPServer.check_data_file`."""
+
+    def test_no_data_file(self) -> None:
+        ngui_agent = NextGenUIMCPServer(config=MCPAgentConfig(component_system="json"))
+        ngui_agent.check_data_file({"id": "1", "data": "{}"})
+
+    def test_not_enabled(self, tmp_path) -> None:
+        ngui_agent = NextGenUIMCPServer(config=MCPAgentConfig(component_system="json"))
+        with pytest.raises(ValueError, match="not enabled"):
+            ngui_agent.check_data_file(
+                {"id": "1", "data": "", "data_file": str(tmp_path / "a.json")}
+            )
+
+    def test_allowed_dir(self, tmp_path) -> None:
+        ngui_agent = NextGenUIMCPServer(
+            config=MCPAgentConfig(
+                component_system="json",
+                mcp=MCPConfig(data_file_dirs=[str(tmp_path / "data")]),
+            )
+        )
+        ngui_agent.check_data_file(
+            {"id": "1", "data": "", "data_file": str(tmp_path / "data" / "a.json")}
+        )
+        for data_file in [
+            tmp_path / "a.json",
+            tmp_path / "data" / ".." / "a.json",
+            tmp_path / "data2" / "a.json",
+        ]:
+            with pytest.raises(
+                ValueError, match="not in any of the allowed directories"
+            ):
+                ngui_agent.check_data_file(
+                    {"id": "1", "data": "", "data_file": str(data_file)}
+                )
+
 
 class TestToolDescriptions:
     """Tests for tool description configuration and overrides."""
@@ -1372,6 +1447,94 @@ class TestHealthRoutes:
         assert isinstance(mcp_server._additional_http_routes[1], Route)
         assert mcp_server._additional_http_routes[1].path == "/readiness"
 
+    @pytest.mark.asyncio
+    async def test_readiness_route_warm_up(self) -> None:
+        ngui_agent = NextGenUIMCPServer(name="TestAgent", warm_up=True)
+        mcp_server = ngui_agent.get_mcp_server()
+        add_health_routes(mcp_server, ngui_agent)
+        readiness = cast(Route, mcp_server._additional_http_routes[1]).endpoint
+
+        response = await readiness(None)
+        assert response.status_code == 503
+        assert json.loads(response.body)["status"] == "warming-up"
+
+        await ngui_agent.warm_up()
+        response = await readiness(None)
+        assert response.status_code == 200
+        body = json.loads(response.body)
+        assert body["status"] == "healthy"
+        assert body["warm_up_duration"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_readiness_route_rendering_cache(self) -> None:
+        ngui_agent = NextGenUIMCPServer(
+            name="TestAgent",
+            config=MCPAgentConfig(rendering_cache=AgentConfigRenderingCache()),
+        )
+        mcp_server = ngui_agent.get_mcp_server()
+        add_health_routes(mcp_server, ngui_agent)
+        readiness = cast(Route, mcp_server._additional_http_routes[1]).endpoint
+
+        response = await readiness(None)
+        assert response.status_code == 200
+        assert json.loads(response.body)["rendering_cache"] == {
+            "entries": 0,
+            "size": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "hit_rate": 0.0,
+        }
+
+
+class TestWarmUp:
+    """Tests for the server warm-up."""
+
+    def test_ready(self) -> None:
+        assert NextGenUIMCPServer(name="TestAgent").ready
+        assert not NextGenUIMCPServer(name="TestAgent", warm_up=True).ready
+
+    @pytest.mark.asyncio
+    async def test_warm_up(self) -> None:
+        ngui_agent = NextGenUIMCPServer(name="TestAgent", warm_up=True)
+        duration = await ngui_agent.warm_up()
+
+        assert ngui_agent.ready
+        assert ngui_agent.ngui_agent.warm_up_duration == duration
+
+    @pytest.mark.asyncio
+    async def test_warm_up_probe_inference_skipped_for_sampling(self) -> None:
+        ngui_agent = NextGenUIMCPServer(name="TestAgent", warm_up=True)
+        await ngui_agent.warm_up(probe_inference=True)
+        assert ngui_agent.ready
+
+    @pytest.mark.asyncio
+    async def test_warm_up_probe_inference(self) -> None:
+        inference = MockedExceptionInference(Exception("LLM down"))
+        ngui_agent = NextGenUIMCPServer(
+            name="TestAgent", inference=inference, warm_up=True
+        )
+        with pytest.raises(Exception, match="LLM down"):
+            await ngui_agent.warm_up(probe_inference=True)
+        assert not ngui_agent.ready
+
+    @pytest.mark.asyncio
+    async def test_warm_up_lifespan(self) -> None:
+        ngui_agent = NextGenUIMCPServer(
+            name="TestAgent",
+            inference=MockedExceptionInference(Exception("LLM down")),
+            warm_up=True,
+            warm_up_probe_inference=True,
+        )
+        async with Client(ngui_agent.get_mcp_server()) as client:
+            for _ in range(100):
+                if ngui_agent.ready:
+                    break
+                await asyncio.sleep(0.01)
+            # failed warm-up doesn't block the server
+            assert ngui_agent.ready
+            assert await client.list_tools()
+
 
 class TestMCPModelPreferences:
     """Tests for MCP sampling model preferences (hints and priorities)."""
@@ -152,6 +152,18 @@ Examples:
         action=EnvDefault,
         envvar="MCP_STRUCTURED_OUTPUT_ENABLED",
     )
+    parser.add_argument(
+        "--warm-up",
+        choices=["true", "false", "probe-inference"],
+        default="true",
+        help=(
+            "Warm-up the agent when the server starts (build system prompts, compile configured JSONPaths and renderer templates), "
+            "`/readiness` reports the server ready only when done. `probe-inference` issues also probe inference "
+            "to establish the LLM connection (not possible for MCP sampling)."
+        ),
+        action=EnvDefault,
+        envvar="MCP_WARM_UP",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     return parser
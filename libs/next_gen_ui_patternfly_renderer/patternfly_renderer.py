@@ -1,6 +1,11 @@
 from jinja2 import Environment, PackageLoader  # pants: no-infer-dep
 from next_gen_ui_agent.data_transform.types import ComponentDataBase
-from next_gen_ui_agent.renderer.base_renderer import RenderStrategyBase, StrategyFactory
+from next_gen_ui_agent.renderer.base_renderer import (
+    RenderStrategyBase,
+    StrategyFactory,
+    shallow_model_dump,
+)
+from next_gen_ui_agent.renderer.bytecode_cache import create_bytecode_cache
 from next_gen_ui_agent.renderer.image import ImageRenderStrategy
 from next_gen_ui_agent.renderer.one_card import OneCardRenderStrategy
 from next_gen_ui_agent.renderer.set_of_cards import SetOfCardsRenderStrategy
@@ -10,6 +15,9 @@ from typing_extensions import override
 templates_env = Environment(
     loader=PackageLoader("next_gen_ui_patternfly_renderer", "templates"),
     trim_blocks=True,
+    # templates are package resources, they do not change at runtime
+    auto_reload=False,
+    bytecode_cache=create_bytecode_cache(),
 )
 
 
@@ -17,7 +25,12 @@ class PatternflyStrategyBase(RenderStrategyBase):
     @override
     def generate_output(self, component, additional_context):
         template = templates_env.get_template(f"/{component.component}.jinja")
-        return template.render(component.model_dump() | additional_context)
+        return template.render(shallow_model_dump(component) | additional_context)
+
+    @override
+    def generate_output_stream(self, component, additional_context):
+        template = templates_env.get_template(f"/{component.component}.jinja")
+        return template.generate(shallow_model_dump(component) | additional_context)
 
 
 class PatternflyOneCardRenderStrategy(OneCardRenderStrategy, PatternflyStrategyBase):
@@ -38,6 +51,14 @@ class PatternflyVideoRenderStrategy(VideoRenderStrategy, PatternflyStrategyBase)
     pass
 
 
+PATTERNFLY_RENDER_STRATEGIES: list[type[PatternflyStrategyBase]] = [
+    PatternflyOneCardRenderStrategy,
+    PatternflySetOfCardsRenderStrategy,
+    PatternflyImageRenderStrategy,
+    PatternflyVideoRenderStrategy,
+]
+
+
 class PatternflyStrategyFactory(StrategyFactory):
     def get_component_system_name(self) -> str:
         return "patternfly"
@@ -45,6 +66,12 @@ class PatternflyStrategyFactory(StrategyFactory):
     def get_output_mime_type(self) -> str:
         return "text/html"
 
+    @override
+    def warm_up(self) -> None:
+        """Load and compile templates of all the components."""
+        for strategy in PATTERNFLY_RENDER_STRATEGIES:
+            templates_env.get_template(f"/{strategy.COMPONENT_NAME}.jinja")
+
     def get_render_strategy(self, component: ComponentDataBase):
         match component.component:
             case PatternflyOneCardRenderStrategy.COMPONENT_NAME:
@@ -4,6 +4,7 @@ from next_gen_ui_agent.design_system_handler import PLUGGABLE_RENDERERS_NAMESPAC
 from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
 from next_gen_ui_agent.renderer.one_card_shareable_tests import BaseOneCardRendererTests
 from next_gen_ui_patternfly_renderer import PatternflyStrategyFactory
+from next_gen_ui_patternfly_renderer.patternfly_renderer import templates_env
 from next_gen_ui_testing.data_after_transformation import get_transformed_component
 from stevedore.extension import Extension, ExtensionManager
 
@@ -75,3 +76,21 @@ return (
 
 export default OneCard;"""
     )
+
+
+def test_factory_warm_up() -> None:
+    """Warm-up loads templates of all the components, so they are cached for the rendering."""
+    PatternflyStrategyFactory().warm_up()
+    assert templates_env.cache
+    assert {template.name for template in templates_env.cache.values()} >= {
+        "/one-card.jinja",
+        "/set-of-cards.jinja",
+        "/image.jinja",
+        "/video-player.jinja",
+    }
+
+
+def test_render_stream() -> None:
+    component = get_transformed_component()
+    strategy = PatternflyStrategyFactory().get_render_strategy(component)
+    assert "".join(strategy.render_stream(component)) == strategy.render(component)
@@ -1,7 +1,14 @@
+from threading import Lock
+
 from jinja2 import Environment, PackageLoader  # pants: no-infer-dep
 from next_gen_ui_agent.data_transform.types import ComponentDataBase
 from next_gen_ui_agent.renderer.audio import AudioPlayerRenderStrategy
-from next_gen_ui_agent.renderer.base_renderer import RenderStrategyBase, StrategyFactory
+from next_gen_ui_agent.renderer.base_renderer import (
+    RenderStrategyBase,
+    StrategyFactory,
+    shallow_model_dump,
+)
+from next_gen_ui_agent.renderer.bytecode_cache import create_bytecode_cache
 from next_gen_ui_agent.renderer.image import ImageRenderStrategy
 from next_gen_ui_agent.renderer.one_card import OneCardRenderStrategy
 from next_gen_ui_agent.renderer.set_of_cards import SetOfCardsRenderStrategy
@@ -9,6 +16,10 @@ from next_gen_ui_agent.renderer.table import TableRenderStrategy
 from next_gen_ui_agent.renderer.video import VideoRenderStrategy
 from typing_extensions import override
 
+_templates_envs: dict[tuple[str, str], Environment] = {}
+"""Templates environments shared by all the strategies loading templates from the same module and subdir."""
+_templates_envs_lock = Lock()
+
 
 class RhdsStrategyBase(RenderStrategyBase):
     templates_env: Environment
@@ -43,18 +54,33 @@ class RhdsStrategyBase(RenderStrategyBase):
 
         Returns:
             A Jinja2 Environment configured for the calling class's module.
+            Environment is shared by all the classes from the same module and `template_subdir`,
+            so every template is loaded and compiled only once.
         """
         # Get the module name from the class
         module = cls.__module__
-        return Environment(
-            loader=PackageLoader(module, template_subdir),
-            trim_blocks=True,
-        )
+        with _templates_envs_lock:
+            templates_env = _templates_envs.get((module, template_subdir))
+            if not templates_env:
+                templates_env = Environment(
+                    loader=PackageLoader(module, template_subdir),
+                    trim_blocks=True,
+                    # templates are package resources, they do not change at runtime
+                    auto_reload=False,
+                    bytecode_cache=create_bytecode_cache(),
+                )
+                _templates_envs[(module, template_subdir)] = templates_env
+        return templates_env
 
     @override
     def generate_output(self, component, additional_context):
         template = self.templates_env.get_template(f"/{component.component}.jinja")
-        return template.render(component.model_dump() | additional_context)
+        return template.render(shallow_model_dump(component) | additional_context)
+
+    @override
+    def generate_output_stream(self, component, additional_context):
+        template = self.templates_env.get_template(f"/{component.component}.jinja")
+        return template.generate(shallow_model_dump(component) | additional_context)
 
 
 class RhdsOneCardRenderStrategy(OneCardRenderStrategy, RhdsStrategyBase):
@@ -81,6 +107,16 @@ class RhdsAudioPlayerRenderStrategy(AudioPlayerRenderStrategy, RhdsStrategyBase)
     pass
 
 
+RHDS_RENDER_STRATEGIES: list[type[RhdsStrategyBase]] = [
+    RhdsOneCardRenderStrategy,
+    RhdsTableRenderStrategy,
+    RhdsSetOfCardsRenderStrategy,
+    RhdsImageRenderStrategy,
+    RhdsVideoRenderStrategy,
+    RhdsAudioPlayerRenderStrategy,
+]
+
+
 class RhdsStrategyFactory(StrategyFactory):
     def get_component_system_name(self) -> str:
         return "rhds"
@@ -88,6 +124,12 @@ class RhdsStrategyFactory(StrategyFactory):
     def get_output_mime_type(self) -> str:
         return "text/html"
 
+    @override
+    def warm_up(self) -> None:
+        """Load and compile templates of all the components."""
+        for strategy in RHDS_RENDER_STRATEGIES:
+            strategy.templates_env.get_template(f"/{strategy.COMPONENT_NAME}.jinja")
+
     def get_render_strategy(self, component: ComponentDataBase):
         match component.component:
             case RhdsOneCardRenderStrategy.COMPONENT_NAME:
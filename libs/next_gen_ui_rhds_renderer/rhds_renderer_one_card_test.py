@@ -1,8 +1,17 @@
+from jinja2 import Environment, PackageLoader  # pants: no-infer-dep
 from next_gen_ui_agent import design_system_handler
 from next_gen_ui_agent.agent import NextGenUIAgent
 from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.renderer.bytecode_cache import (
+    BYTECODE_CACHE_DIR_ENV,
+    create_bytecode_cache,
+)
 from next_gen_ui_agent.renderer.one_card_shareable_tests import BaseOneCardRendererTests
 from next_gen_ui_rhds_renderer import RhdsStrategyFactory
+from next_gen_ui_rhds_renderer.rhds_renderer import (
+    RHDS_RENDER_STRATEGIES,
+    RhdsStrategyBase,
+)
 from next_gen_ui_testing.agent_testing import extension_manager_for_testing
 from next_gen_ui_testing.data_after_transformation import (
     get_transformed_component,
@@ -123,3 +132,32 @@ def test_renderer_one_card_image() -> None:
         in rendition
     )
     assert "&::part(image) {" in rendition
+
+
+def test_factory_warm_up() -> None:
+    """Warm-up loads templates of all the components, so they are cached for the rendering."""
+    RhdsStrategyFactory().warm_up()
+    for strategy in RHDS_RENDER_STRATEGIES:
+        assert strategy.templates_env.cache
+        assert f"/{strategy.COMPONENT_NAME}.jinja" in [
+            template.name for template in strategy.templates_env.cache.values()
+        ]
+
+
+def test_templates_env_shared() -> None:
+    envs = {id(strategy.templates_env) for strategy in RHDS_RENDER_STRATEGIES}
+    assert len(envs) == 1
+    assert (
+        RhdsStrategyBase.create_templates_env()
+        is RHDS_RENDER_STRATEGIES[0].templates_env
+    )
+
+
+def test_bytecode_cache_used(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv(BYTECODE_CACHE_DIR_ENV, str(tmp_path))
+    env = Environment(
+        loader=PackageLoader("next_gen_ui_rhds_renderer", "templates"),
+        bytecode_cache=create_bytecode_cache(),
+    )
+    env.get_template("/one-card.jinja")
+    assert list(tmp_path.iterdir())
@@ -60,3 +60,13 @@ def test_renderer_table() -> None:
   import '@rhds/elements/rh-table/rh-table.js';
 </script>"""
     )
+
+
+def test_render_stream_table() -> None:
+    component = get_transformed_component("table")
+    strategy = RhdsStrategyFactory().get_render_strategy(component)
+
+    chunks = list(strategy.render_stream(component))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == strategy.render(component)
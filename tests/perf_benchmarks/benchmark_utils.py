@@ -0,0 +1,114 @@
+import gc
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Any, Callable
+
+Scenario = Callable[[int], Callable[[], Any]]
+"""Scenario prepares data of given size (eg. number of rows) and returns function performing one measured request."""
+
+
+def generate_movies_data(rows: int) -> list[dict[str, Any]]:
+    """Generate list of movies with nested objects and arrays, as typically returned by tools."""
+    return [
+        {
+            "title": f"Movie {i}",
+            "year": 1980 + i % 45,
+            "imdbRating": round(5 + (i % 50) / 10, 1),
+            "released": f"{1980 + i % 45}-0{1 + i % 9}-1{i % 9}",
+            "plot": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            "posterUrl": f"https://image.example.com/posters/{i}.jpg",
+            "actors": [f"Actor {i}-{a}" for a in range(5)],
+            "director": {"name": f"Director {i % 100}", "born": 1950 + i % 40},
+            "languages": ["English", "Spanish"],
+        }
+        for i in range(rows)
+    ]
+
+
+def generate_movies_payload(rows: int) -> str:
+    """Generate JSON string with `rows` movies."""
+    return json.dumps(generate_movies_data(rows))
+
+
+def _read_proc_status_bytes(key: str) -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> int:
+    """
+    Reset peak RSS of the current process if possible (linux only) and return value the peak increase is counted from.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        rss = _read_proc_status_bytes("VmRSS")
+        if rss is not None:
+            return rss
+    except OSError:
+        pass
+    return _get_peak_rss()
+
+
+def _get_peak_rss() -> int:
+    peak_rss = _read_proc_status_bytes("VmHWM")
+    if peak_rss is not None:
+        return peak_rss
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _run_scenario(queue: Any, scenario: Scenario, size: int) -> None:
+    request = scenario(size)
+    gc.collect()
+    rss_before = _reset_peak_rss()
+    start = time.perf_counter()
+    request()
+    duration = time.perf_counter() - start
+    queue.put((max(_get_peak_rss() - rss_before, 0), duration))
+
+
+def measure_request(scenario: Scenario, size: int) -> tuple[int, float]:
+    """
+    Run one request of the `scenario` in a fresh process, so peak RSS is not affected by previous runs.
+    Returns increase of the peak RSS caused by the request (in bytes) and request duration (in seconds).
+    """
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_scenario, args=(queue, scenario, size))
+    process.start()
+    rss, duration = queue.get()
+    process.join()
+    return rss, duration
+
+
+def print_comparison(
+    title: str,
+    scenarios: dict[str, Scenario],
+    sizes: list[int],
+    size_label: str = "rows",
+) -> None:
+    """Measure all the `scenarios` for all the `sizes` and print table with results."""
+    print(f"# {title}\n")
+    print(
+        f"| {size_label} | "
+        + " | ".join(f"{name} peak RSS [MB] | {name} time [ms]" for name in scenarios)
+        + " |"
+    )
+    print("|---:|" + "---:|---:|" * len(scenarios))
+    for size in sizes:
+        cells = []
+        for scenario in scenarios.values():
+            rss, duration = measure_request(scenario, size)
+            cells.append(f"{rss / 1024 / 1024:.1f} | {duration * 1000:.3f}")
+        print(f"| {size} | " + " | ".join(cells) + " |")
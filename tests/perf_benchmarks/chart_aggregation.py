@@ -0,0 +1,150 @@
+"""
+Benchmark of the pie and bar chart data aggregation.
+
+Compares duration and peak RSS of the chart data building (from already extracted fields,
+as the JSONPath extraction is the same for all the scenarios) followed by the `json` component system rendering
+without and with the aggregation, for the pie chart with high cardinality category field (top-N slices with `Other`),
+and for the bar chart with numeric x-axis (histogram binning by the vectorized `numpy` and the pure Python implementation).
+Prints size of the rendered JSON payload too.
+"""
+
+import argparse
+from typing import Any, Callable
+
+from next_gen_ui_agent.data_transform.chart import (
+    BarChartDataTransformer,
+    PieChartDataTransformer,
+    aggregation,
+)
+from next_gen_ui_agent.data_transform.chart.base import ChartDataTransformerBase
+from next_gen_ui_agent.data_transform.types import DataFieldArrayValue
+from next_gen_ui_agent.design_system_handler import render_component
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.types import AgentConfigChartAggregation, UIComponentMetadata
+from perf_benchmarks.benchmark_utils import print_comparison
+
+CATEGORIES = 10000
+
+
+def _scenario(
+    rows: int,
+    transformer: ChartDataTransformerBase,
+    fields: list[DataFieldArrayValue],
+    aggregated: bool,
+) -> Callable[[], Any]:
+    component = UIComponentMetadata(
+        id="chart",
+        component=transformer.COMPONENT_NAME,
+        title="Chart",
+        fields=[],
+        chart_aggregation=(
+            AgentConfigChartAggregation(bar_histogram=True) if aggregated else None
+        ),
+    )
+    factory = JsonStrategyFactory()
+    factory.warm_up()
+
+    def request() -> Any:
+        component_data = transformer.create_component_data()
+        component_data.id = "chart"
+        component_data.title = "Chart"
+        series_values = transformer._build_chart_data(
+            component_data, fields, None, component
+        )
+        component_data.data = transformer._create_series(series_values)
+        return render_component(component_data, factory)
+
+    return request
+
+
+def _pie_scenario(rows: int, aggregated: bool) -> Callable[[], Any]:
+    fields = [
+        DataFieldArrayValue(
+            id="category",
+            name="Category",
+            data_path="$..items[*].category",
+            data=[f"Category {(i * 7919) % CATEGORIES}" for i in range(rows)],
+        )
+    ]
+    return _scenario(rows, PieChartDataTransformer(), fields, aggregated)
+
+
+def _bar_scenario(rows: int, sum_into_bins: Callable | None) -> Callable[[], Any]:
+    fields = [
+        DataFieldArrayValue(
+            id="size",
+            name="Size",
+            data_path="$..items[*].size",
+            data=[(i * 7919) % (rows * 10) / 10 for i in range(rows)],
+        ),
+        DataFieldArrayValue(
+            id="value",
+            name="Value",
+            data_path="$..items[*].value",
+            data=[i % 100 for i in range(rows)],
+        ),
+    ]
+    if sum_into_bins:
+        setattr(aggregation, "_load_sum_into_bins", lambda: sum_into_bins)
+    return _scenario(rows, BarChartDataTransformer(), fields, bool(sum_into_bins))
+
+
+def scenario_pie(rows: int) -> Callable[[], Any]:
+    return _pie_scenario(rows, False)
+
+
+def scenario_pie_aggregated(rows: int) -> Callable[[], Any]:
+    return _pie_scenario(rows, True)
+
+
+def scenario_bar(rows: int) -> Callable[[], Any]:
+    return _bar_scenario(rows, None)
+
+
+def scenario_bar_binned_numpy(rows: int) -> Callable[[], Any]:
+    return _bar_scenario(rows, aggregation._load_sum_into_bins())  # numpy installed
+
+
+def scenario_bar_binned_python(rows: int) -> Callable[[], Any]:
+    return _bar_scenario(rows, aggregation._sum_into_bins_python)
+
+
+def print_payload_sizes(sizes: list[int]) -> None:
+    print("\nJSON payload size [kB]\n")
+    print("| rows | pie | pie, aggregated | bar | bar, binned |")
+    print("|---:|---:|---:|---:|---:|")
+    for rows in sizes:
+        cells = [
+            f"{len(scenario(rows)().content) / 1024:.1f}"
+            for scenario in (
+                scenario_pie,
+                scenario_pie_aggregated,
+                scenario_bar,
+                scenario_bar_binned_numpy,
+            )
+        ]
+        print(f"| {rows} | " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10000, 100000, 1000000],
+        help=f"Numbers of rows of the input data, pie chart counts up to {CATEGORIES} categories, bar chart has bar for each row.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "Pie and bar chart data building and JSON rendering",
+        {
+            "pie": scenario_pie,
+            "pie, aggregated": scenario_pie_aggregated,
+            "bar": scenario_bar,
+            "bar, binned numpy": scenario_bar_binned_numpy,
+            "bar, binned python": scenario_bar_binned_python,
+        },
+        args.rows,
+    )
+    print_payload_sizes(args.rows)
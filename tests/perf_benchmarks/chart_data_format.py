@@ -0,0 +1,110 @@
+"""
+Benchmark of the chart data formats for large line charts.
+
+Compares duration and peak RSS of the line chart data building (from already extracted fields,
+as the JSONPath extraction is the same for all the formats) followed by the `json` component system rendering
+for the `points` chart data format (data point object per chart value) and the `columns` one
+(x-axis values shared by all the series), and prints size of the rendered JSON payload.
+"""
+
+import argparse
+from typing import Any, Callable
+
+from next_gen_ui_agent.data_transform.chart import LineChartDataTransformer
+from next_gen_ui_agent.data_transform.types import DataFieldArrayValue
+from next_gen_ui_agent.design_system_handler import render_component
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.types import (
+    CONFIG_OPTIONS_CHART_DATA_FORMAT,
+    UIComponentMetadata,
+)
+from perf_benchmarks.benchmark_utils import print_comparison
+
+SERIES = 3
+
+
+def generate_line_chart_fields(points: int) -> list[DataFieldArrayValue]:
+    """Generate extracted fields of the line chart with `points` x-axis values and `SERIES` series."""
+    return [
+        DataFieldArrayValue(
+            id="time",
+            name="Time",
+            data_path="$..metrics[*].time",
+            data=[f"T{i}" for i in range(points)],
+        ),
+        *[
+            DataFieldArrayValue(
+                id=f"m{series}",
+                name=f"Metric {series}",
+                data_path=f"$..metrics[*].m{series}",
+                data=[i * (series + 1) for i in range(points)],
+            )
+            for series in range(SERIES)
+        ],
+    ]
+
+
+def _scenario(
+    points: int, chart_data_format: CONFIG_OPTIONS_CHART_DATA_FORMAT
+) -> Callable[[], Any]:
+    fields = generate_line_chart_fields(points)
+    component = UIComponentMetadata(
+        id="metrics", component="chart-line", title="Metrics", fields=[]
+    )
+    transformer = LineChartDataTransformer()
+    factory = JsonStrategyFactory()
+    factory.warm_up()
+
+    def request() -> Any:
+        component_data = transformer.create_component_data()
+        component_data.id = "metrics"
+        component_data.title = "Metrics"
+        series_values = transformer._build_chart_data(
+            component_data, fields, None, component
+        )
+        if chart_data_format == "columns":
+            component_data.data = None
+            component_data.columns = transformer._create_columns(series_values)
+        else:
+            component_data.data = transformer._create_series(series_values)
+        return render_component(component_data, factory)
+
+    return request
+
+
+def scenario_points(points: int) -> Callable[[], Any]:
+    return _scenario(points, "points")
+
+
+def scenario_columns(points: int) -> Callable[[], Any]:
+    return _scenario(points, "columns")
+
+
+def print_payload_sizes(sizes: list[int]) -> None:
+    print("\nJSON payload size [kB]\n")
+    print("| points | points format | columns format |")
+    print("|---:|---:|---:|")
+    for points in sizes:
+        cells = [
+            f"{len(scenario(points)().content) / 1024:.1f}"
+            for scenario in (scenario_points, scenario_columns)
+        ]
+        print(f"| {points} | " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--points",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help=f"Numbers of x-axis values of the line chart, each with {SERIES} series values.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        f"Line chart data building and JSON rendering ({SERIES} series)",
+        {"points": scenario_points, "columns": scenario_columns},
+        args.points,
+    )
+    print_payload_sizes(args.points)
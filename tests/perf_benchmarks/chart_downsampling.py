@@ -0,0 +1,98 @@
+"""
+Benchmark of the line chart data downsampling.
+
+Compares duration and peak RSS of the large line chart data building and JSON rendering
+without downsampling and with downsampling by the vectorized `numpy` and the pure Python
+Largest-Triangle-Three-Buckets implementation, and prints size of the rendered JSON payload.
+"""
+
+import argparse
+from typing import Any, Callable
+
+from next_gen_ui_agent.data_transform.chart import (
+    LineChartDataTransformer,
+    downsampling,
+)
+from next_gen_ui_agent.design_system_handler import render_component
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.types import AgentConfigChartDownsampling, UIComponentMetadata
+from perf_benchmarks.benchmark_utils import print_comparison
+from perf_benchmarks.chart_data_format import SERIES, generate_line_chart_fields
+
+MAX_POINTS = 1000
+
+
+def _scenario(points: int, lttb: Callable | None) -> Callable[[], Any]:
+    fields = generate_line_chart_fields(points)
+    component = UIComponentMetadata(
+        id="metrics",
+        component="chart-line",
+        title="Metrics",
+        fields=[],
+        chart_downsampling=(
+            AgentConfigChartDownsampling(max_points=MAX_POINTS) if lttb else None
+        ),
+    )
+    if lttb:
+        setattr(downsampling, "_load_lttb", lambda: lttb)
+    transformer = LineChartDataTransformer()
+    factory = JsonStrategyFactory()
+    factory.warm_up()
+
+    def request() -> Any:
+        component_data = transformer.create_component_data()
+        component_data.id = "metrics"
+        component_data.title = "Metrics"
+        series_values = transformer._build_chart_data(
+            component_data, fields, None, component
+        )
+        component_data.data = transformer._create_series(series_values)
+        return render_component(component_data, factory)
+
+    return request
+
+
+def scenario_no_downsampling(points: int) -> Callable[[], Any]:
+    return _scenario(points, None)
+
+
+def scenario_downsampling_numpy(points: int) -> Callable[[], Any]:
+    return _scenario(points, downsampling._load_lttb())  # numpy is installed
+
+
+def scenario_downsampling_python(points: int) -> Callable[[], Any]:
+    return _scenario(points, downsampling._lttb_python)
+
+
+def print_payload_sizes(sizes: list[int]) -> None:
+    print("\nJSON payload size [kB]\n")
+    print("| points | no downsampling | downsampling |")
+    print("|---:|---:|---:|")
+    for points in sizes:
+        cells = [
+            f"{len(scenario(points)().content) / 1024:.1f}"
+            for scenario in (scenario_no_downsampling, scenario_downsampling_numpy)
+        ]
+        print(f"| {points} | " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--points",
+        type=int,
+        nargs="+",
+        default=[10000, 100000, 1000000],
+        help=f"Numbers of x-axis values of the line chart, each with {SERIES} series values, downsampled to {MAX_POINTS} data points.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        f"Line chart data building and JSON rendering ({SERIES} series)",
+        {
+            "no downsampling": scenario_no_downsampling,
+            "numpy": scenario_downsampling_numpy,
+            "python": scenario_downsampling_python,
+        },
+        args.points,
+    )
+    print_payload_sizes(args.points)
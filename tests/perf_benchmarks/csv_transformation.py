@@ -0,0 +1,88 @@
+"""
+Benchmark of the CSV input data transformation for large input data.
+
+Compares duration and peak RSS of the CSV transformation with the previous implementation,
+which sanitized headers for every row, transformed every value by generic `transform_value`
+and copied whole input data into `io.StringIO` buffer.
+Streaming transformation limited to `MAX_ROWS` rows (`AgentConfig.input_data_max_rows`) is measured too.
+"""
+
+import argparse
+import csv
+from io import StringIO
+from typing import Any, Callable
+
+from next_gen_ui_agent.data_structure_tools import sanitize_field_name, transform_value
+from next_gen_ui_agent.input_data_transform.csv_input_data_transformer import (
+    CsvCommaInputDataTransformer,
+)
+from perf_benchmarks.benchmark_utils import print_comparison
+
+COLUMNS = 10
+MAX_ROWS = 1000
+
+
+def generate_csv_payload(rows: int) -> str:
+    """Generate CSV string with `rows` rows of `COLUMNS` columns of different types."""
+    lines = [
+        "Title,Year,IMDB Rating,Released,Plot,Poster URL,Votes,Available,Country,Note"
+    ]
+    for i in range(rows):
+        lines.append(
+            f"Movie {i},{1980 + i % 45},{5 + (i % 50) / 10},{1980 + i % 45}-0{1 + i % 9}-1{i % 9},"
+            f'"Lorem ipsum, dolor sit amet",https://image.example.com/posters/{i}.jpg,'
+            f"{i * 17},{'true' if i % 2 else 'false'},Czechia,"
+        )
+    return "\n".join(lines)
+
+
+def _previous_transform(input_data: str) -> Any:
+    """Previous implementation of the CSV transformation."""
+    csv_reader = csv.DictReader(StringIO(input_data), delimiter=",")
+    parsed_data = []
+    for row in csv_reader:
+        sanitized_row = {}
+        for key, value in row.items():
+            sanitized_key = sanitize_field_name(key)
+            if sanitized_key:
+                sanitized_row[sanitized_key] = transform_value(value)
+        parsed_data.append(sanitized_row)
+    return parsed_data
+
+
+def scenario_previous(rows: int) -> Callable[[], Any]:
+    input_data = generate_csv_payload(rows)
+    return lambda: _previous_transform(input_data)
+
+
+def scenario_current(rows: int) -> Callable[[], Any]:
+    input_data = generate_csv_payload(rows)
+    transformer = CsvCommaInputDataTransformer()
+    return lambda: transformer.transform(input_data)
+
+
+def scenario_max_rows(rows: int) -> Callable[[], Any]:
+    input_data = generate_csv_payload(rows)
+    transformer = CsvCommaInputDataTransformer()
+    return lambda: transformer.transform_rows(input_data, MAX_ROWS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help=f"Numbers of rows in the input data to benchmark, each row has {COLUMNS} cells.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        f"CSV input data transformation ({COLUMNS} cells per row)",
+        {
+            "previous": scenario_previous,
+            "current": scenario_current,
+            f"max {MAX_ROWS} rows": scenario_max_rows,
+        },
+        args.rows,
+    )
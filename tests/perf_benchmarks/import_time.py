@@ -0,0 +1,99 @@
+"""
+Benchmark of the UI Agent import time (cold start), measured by `python -X importtime` in a fresh process.
+
+Import time of every statement is a sum of the cumulative import times of the modules imported by it,
+modules imported by the python interpreter startup are not counted. Median of the `--runs` runs is compared
+with the tracked budget in `BUDGETS_MS`, `--check` fails if some statement exceeds its budget.
+Budgets are set with a reserve for slower machines, update them when import time intentionally changes.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Optional
+
+BUDGETS_MS: dict[str, Optional[float]] = {
+    "import next_gen_ui_agent": 20,
+    "from next_gen_ui_agent import AgentConfig": 250,
+    "from next_gen_ui_agent import NextGenUIAgent": 500,
+    # MCP and A2A bindings are dominated by the third party server frameworks, reported only
+    "import next_gen_ui_mcp": None,
+    "import next_gen_ui_a2a": None,
+}
+"""Import time budgets [ms] of the measured statements, `None` if not tracked."""
+
+
+def measure_import_time(statement: str, startup_modules: set[str]) -> float:
+    """
+    Run the `statement` in a fresh python process and return its import time in milliseconds,
+    `startup_modules` imported by the python interpreter startup are not counted.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # only top level imports, nested ones are included in their cumulative time
+        if not name.startswith("  ") and name.strip() not in startup_modules:
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def get_startup_modules() -> set[str]:
+    """Get modules imported by the python interpreter startup."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.split("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of measured runs of every statement.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with error if some statement exceeds its import time budget.",
+    )
+    args = parser.parse_args()
+    startup_modules = get_startup_modules()
+
+    print("# UI Agent import time\n")
+    print("| statement | median [ms] | min [ms] | budget [ms] | |")
+    print("|---|---:|---:|---:|---|")
+    exceeded = []
+    for statement, budget in BUDGETS_MS.items():
+        times = [
+            measure_import_time(statement, startup_modules) for _ in range(args.runs)
+        ]
+        median = statistics.median(times)
+        status = ""
+        if budget is not None:
+            status = "OK" if median <= budget else "EXCEEDED"
+            if median > budget:
+                exceeded.append(statement)
+        print(
+            f"| `{statement}` | {median:.1f} | {min(times):.1f} | "
+            f"{budget if budget is not None else '-'} | {status} |"
+        )
+    if args.check and exceeded:
+        sys.exit(f"Import time budget exceeded by: {', '.join(exceeded)}")
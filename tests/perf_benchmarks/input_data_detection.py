@@ -0,0 +1,109 @@
+"""
+Benchmark of the input data structure auto-detection for large input data.
+
+Compares duration and peak RSS of the auto-detection with the previous implementation,
+where each of the JSON, YAML and CSV detectors copied the whole data by `strip()`
+just to inspect their first kilobyte.
+"""
+
+import argparse
+from typing import Any, Callable
+
+from next_gen_ui_agent.data_structure_tools import InputDataSample
+from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    BUILTIN_INPUT_DATA_TRANSFORMERS,
+    get_auto_detected_transformer_name,
+)
+from next_gen_ui_agent.types import InputData
+from perf_benchmarks.benchmark_utils import print_comparison
+
+MB = 1024 * 1024
+
+# detectors which called `input_data["data"].strip()` in the previous implementation
+_PREVIOUS_STRIPPING_DETECTORS = {
+    "yaml",
+    "json",
+    "csv-comma",
+    "csv-semicolon",
+    "csv-tab",
+}
+
+
+def generate_json_payload(size_mb: int) -> str:
+    row = '{"title": "Toy Story", "year": 1995, "imdbRating": 8.3, "actors": ["Tom Hanks", "Tim Allen"]}'
+    count = size_mb * MB // (len(row) + 2)
+    return "\n  [\n" + ",\n".join([row] * count) + "\n]\n  "
+
+
+def generate_csv_tab_payload(size_mb: int) -> str:
+    row = "Toy Story\t1995\t8.3\tTom Hanks, Tim Allen"
+    count = size_mb * MB // (len(row) + 1)
+    return "title\tyear\timdbRating\tactors\n" + "\n".join([row] * count) + "\n"
+
+
+def _previous_auto_detection(input_data: InputData) -> Any:
+    """Previous implementation - each detector took its sample from the stripped data."""
+    for name, transformer in BUILTIN_INPUT_DATA_TRANSFORMERS.items():
+        if name in _PREVIOUS_STRIPPING_DETECTORS:
+            input_data["data"].strip()
+        if transformer.detect_my_data_structure_in_sample(
+            input_data, InputDataSample(input_data["data"])
+        ):
+            return name
+    return None
+
+
+def _scenario(
+    generate_payload: Callable[[int], str], detect: Callable[[InputData], Any]
+) -> Callable[[int], Callable[[], Any]]:
+    def scenario(size_mb: int) -> Callable[[], Any]:
+        input_data = InputData(id="1", data=generate_payload(size_mb))
+        return lambda: detect(input_data)
+
+    return scenario
+
+
+def scenario_json_previous(size_mb: int) -> Callable[[], Any]:
+    return _scenario(generate_json_payload, _previous_auto_detection)(size_mb)
+
+
+def scenario_json_current(size_mb: int) -> Callable[[], Any]:
+    return _scenario(generate_json_payload, get_auto_detected_transformer_name)(size_mb)
+
+
+def scenario_csv_tab_previous(size_mb: int) -> Callable[[], Any]:
+    return _scenario(generate_csv_tab_payload, _previous_auto_detection)(size_mb)
+
+
+def scenario_csv_tab_current(size_mb: int) -> Callable[[], Any]:
+    return _scenario(generate_csv_tab_payload, get_auto_detected_transformer_name)(
+        size_mb
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Sizes of the input data in MB to benchmark.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "Auto-detection of JSON input data",
+        {"previous": scenario_json_previous, "current": scenario_json_current},
+        args.sizes,
+        size_label="MB",
+    )
+    print()
+    print_comparison(
+        "Auto-detection of tab separated CSV input data",
+        {
+            "previous": scenario_csv_tab_previous,
+            "current": scenario_csv_tab_current,
+        },
+        args.sizes,
+        size_label="MB",
+    )
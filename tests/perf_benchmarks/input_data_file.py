@@ -0,0 +1,111 @@
+"""
+Benchmark of the large input data passed as a string, as bytes and as a file reference (`InputData.data_file`).
+
+Compares duration and peak RSS of the input data transformation, including reading of the data file
+the tool result is stored in: decoded into the string, read into the bytes, or memory-mapped by the transformer.
+Transformation is limited to `MAX_ROWS` rows (`AgentConfig.input_data_max_rows`). CSV rows over the limit are counted
+while reading only beginning of the memory-mapped file, JSON root array items over the limit are counted in the whole file.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from next_gen_ui_agent.input_data_transform.input_data_transform import (
+    init_input_data_transformers,
+    perform_input_data_transformation_with_limits,
+)
+from next_gen_ui_agent.types import AgentConfig, InputData
+from perf_benchmarks.benchmark_utils import generate_movies_data, print_comparison
+
+MAX_ROWS = 1000
+
+
+def get_data_file(data_dir: str, transformer_name: str, rows: int) -> str:
+    return os.path.join(data_dir, f"{transformer_name}-{rows}")
+
+
+def write_data_files(data_dir: str, rows_list: list[int]) -> None:
+    """Write JSON and CSV data files with movies for all the numbers of rows."""
+    for rows in rows_list:
+        movies = generate_movies_data(rows)
+        Path(get_data_file(data_dir, "json", rows)).write_text(json.dumps(movies))
+        csv_lines = ["Title,Year,IMDB Rating,Plot,Poster URL"]
+        for movie in movies:
+            csv_lines.append(
+                f"{movie['title']},{movie['year']},{movie['imdbRating']},"
+                f"\"{movie['plot']}\",{movie['posterUrl']}"
+            )
+        Path(get_data_file(data_dir, "csv-comma", rows)).write_text(
+            "\n".join(csv_lines)
+        )
+
+
+def _transform(
+    input_data_factory: Callable[[], InputData], transformer_name: str
+) -> Callable[[], Any]:
+    init_input_data_transformers(AgentConfig(input_data_max_rows=MAX_ROWS))
+
+    def request() -> Any:
+        return perform_input_data_transformation_with_limits(
+            input_data_factory(), transformer_name
+        )
+
+    return request
+
+
+def scenario_str(data_dir: str, transformer_name: str, rows: int) -> Callable[[], Any]:
+    path = Path(get_data_file(data_dir, transformer_name, rows))
+    return _transform(
+        lambda: InputData(id="1", data=path.read_text()), transformer_name
+    )
+
+
+def scenario_bytes(
+    data_dir: str, transformer_name: str, rows: int
+) -> Callable[[], Any]:
+    path = Path(get_data_file(data_dir, transformer_name, rows))
+    return _transform(
+        lambda: InputData(id="1", data=path.read_bytes()), transformer_name
+    )
+
+
+def scenario_data_file(
+    data_dir: str, transformer_name: str, rows: int
+) -> Callable[[], Any]:
+    path = get_data_file(data_dir, transformer_name, rows)
+    return _transform(
+        lambda: InputData(id="1", data="", data_file=path), transformer_name
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="Numbers of movies in the input data to benchmark.",
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as data_dir:
+        write_data_files(data_dir, args.rows)
+        for transformer_name in ["json", "csv-comma"]:
+            print_comparison(
+                f"Transformation of the '{transformer_name}' input data",
+                {
+                    name: partial(scenario, data_dir, transformer_name)
+                    for name, scenario in [
+                        ("str", scenario_str),
+                        ("bytes", scenario_bytes),
+                        ("data_file", scenario_data_file),
+                    ]
+                },
+                args.rows,
+            )
+            print()
@@ -0,0 +1,60 @@
+"""
+Benchmark of the JSON backend used by the UI Agent (`next_gen_ui_agent.json_tools`).
+
+Compares duration and peak RSS of the JSON decoding and encoding of the typical tool output payload
+by stdlib `json` and by the backend selected by `json_tools` (`orjson` or `msgspec` if installed).
+"""
+
+import argparse
+import json
+from typing import Any, Callable
+
+from next_gen_ui_agent.json_tools import JSON_BACKEND, json_dumps, json_loads
+from perf_benchmarks.benchmark_utils import (
+    generate_movies_data,
+    generate_movies_payload,
+    print_comparison,
+)
+
+
+def scenario_stdlib_loads(rows: int) -> Callable[[], Any]:
+    payload = generate_movies_payload(rows)
+    return lambda: json.loads(payload)
+
+
+def scenario_backend_loads(rows: int) -> Callable[[], Any]:
+    payload = generate_movies_payload(rows)
+    return lambda: json_loads(payload)
+
+
+def scenario_stdlib_dumps(rows: int) -> Callable[[], Any]:
+    data = generate_movies_data(rows)
+    return lambda: json.dumps(data)
+
+
+def scenario_backend_dumps(rows: int) -> Callable[[], Any]:
+    data = generate_movies_data(rows)
+    return lambda: json_dumps(data)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000, 50000],
+        help="Numbers of movies in the JSON payload to benchmark.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "JSON decoding",
+        {"json": scenario_stdlib_loads, JSON_BACKEND: scenario_backend_loads},
+        args.rows,
+    )
+    print()
+    print_comparison(
+        "JSON encoding",
+        {"json": scenario_stdlib_dumps, JSON_BACKEND: scenario_backend_dumps},
+        args.rows,
+    )
@@ -0,0 +1,152 @@
+"""
+Benchmark of the `json` component system payload size on the UI component evaluation datasets.
+
+Every dataset item is rendered without LLM, by the component showing all the simple fields of the input data
+(`table` for arrays, `one-card` for objects). Size of the rendered content and of the UI block as sent
+in the MCP/A2A response (with the rendered content escaped as JSON string) is compared for the full
+and the compact JSON output (`AgentConfigJsonRenderer.compact`), together with the rendering duration.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from next_gen_ui_agent import NextGenUIAgent
+from next_gen_ui_agent.types import (
+    AgentConfig,
+    AgentConfigJsonRenderer,
+    DataField,
+    InputData,
+    UIBlock,
+    UIComponentMetadata,
+)
+
+DATASET_DIRS = [
+    Path(__file__).parent.parent / "ai_eval_components" / "dataset",
+    Path(__file__).parent.parent / "ai_eval_components" / "dataset_k8s",
+]
+
+SIMPLE_TYPES = (str, int, float, bool)
+
+
+def _is_simple(value: Any) -> bool:
+    if isinstance(value, list):
+        return all(isinstance(item, SIMPLE_TYPES) for item in value)
+    return isinstance(value, SIMPLE_TYPES)
+
+
+def create_component_metadata(item_id: str, data: Any) -> Optional[UIComponentMetadata]:
+    """Create component showing all the simple fields of the `data`, `None` if there is no such field."""
+    component = "one-card"
+    base_path = "$"
+    record = data
+    if isinstance(data, dict):
+        arrays = [
+            key
+            for key, value in data.items()
+            if isinstance(value, list) and value and isinstance(value[0], dict)
+        ]
+        if arrays:
+            component, base_path, record = (
+                "table",
+                f"$.{arrays[0]}[*]",
+                data[arrays[0]][0],
+            )
+    elif isinstance(data, list) and data and isinstance(data[0], dict):
+        component, base_path, record = "table", "$[*]", data[0]
+    if not isinstance(record, dict):
+        return None
+    fields = [
+        DataField(id=key, name=key, data_path=f"{base_path}.{key}")
+        for key, value in record.items()
+        if _is_simple(value)
+    ]
+    if not fields:
+        return None
+    return UIComponentMetadata(
+        id=item_id, title=item_id, component=component, fields=fields
+    )
+
+
+def _block_size(agent: NextGenUIAgent, component: Any) -> tuple[int, int, float]:
+    start = time.perf_counter()
+    rendering = agent.generate_rendering(component, "json")
+    duration = time.perf_counter() - start
+    block = UIBlock(id=rendering.id, rendering=rendering).model_dump_json(
+        exclude_unset=True, exclude_defaults=True, exclude_none=True
+    )
+    return len(rendering.content), len(block), duration
+
+
+def measure_dataset(
+    dataset_file: Path, full: NextGenUIAgent, compact: NextGenUIAgent
+) -> Optional[list[float]]:
+    """Measure the sizes and durations summed for all the items of the `dataset_file`, `None` if no item can be rendered."""
+    totals = [0.0] * 7
+    for item in json.loads(dataset_file.read_text()):
+        try:
+            data = json.loads(item["backend_data"])
+        except ValueError:
+            continue
+        metadata = create_component_metadata(item["id"], data)
+        if not metadata:
+            continue
+        input_data = InputData(id=item["id"], data=item["backend_data"])
+        component = full.transform_data(input_data, metadata)
+        totals[0] += 1
+        for offset, agent in ((1, full), (4, compact)):
+            content, block, duration = _block_size(agent, component)
+            totals[offset] += content
+            totals[offset + 1] += block
+            totals[offset + 2] += duration * 1000
+    return totals if totals[0] else None
+
+
+def _reduction(full: float, compact: float) -> str:
+    return f"{(1 - compact / full) * 100:.0f}%" if full else "-"
+
+
+def print_results(results: dict[str, list[float]]) -> None:
+    print("# JSON payload size on the evaluation datasets")
+    print()
+    print(
+        "| dataset | items | full content [chars] | compact content [chars] | content reduction "
+        "| full block [chars] | compact block [chars] | block reduction | full time [ms] | compact time [ms] |"
+    )
+    print("|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
+    total = [0.0] * 7
+    for name, values in [*results.items(), ("total", total)]:
+        if name != "total":
+            total[:] = [t + v for t, v in zip(total, values)]
+        items, full_content, full_block, full_time = values[:4]
+        compact_content, compact_block, compact_time = values[4:]
+        print(
+            f"| {name} | {items:.0f} | {full_content:.0f} | {compact_content:.0f} "
+            f"| {_reduction(full_content, compact_content)} | {full_block:.0f} | {compact_block:.0f} "
+            f"| {_reduction(full_block, compact_block)} | {full_time:.3f} | {compact_time:.3f} |"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--dataset-dirs",
+        type=Path,
+        nargs="+",
+        default=DATASET_DIRS,
+        help="Directories with the evaluation dataset files.",
+    )
+    args = parser.parse_args()
+    full = NextGenUIAgent(config=AgentConfig())
+    compact = NextGenUIAgent(
+        config=AgentConfig(json_renderer=AgentConfigJsonRenderer(compact=True))
+    )
+    results = {}
+    for dataset_dir in args.dataset_dirs:
+        for dataset_file in sorted(dataset_dir.glob("*.json")):
+            measured = measure_dataset(dataset_file, full, compact)
+            if measured:
+                results[f"{dataset_dir.name}/{dataset_file.stem}"] = measured
+    print_results(results)
@@ -0,0 +1,97 @@
+"""
+Memory benchmark of the `UIBlockConfiguration` construction and component refresh for large input data.
+
+Compares peak RSS of one request (`construct_UIBlockConfiguration` + `refresh_component`)
+with the previous implementation, which dumped whole component metadata including `json_data`.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Callable
+
+from next_gen_ui_agent.agent import NextGenUIAgent
+from next_gen_ui_agent.input_data_context import InputDataContext
+from next_gen_ui_agent.types import (
+    DataField,
+    InputData,
+    UIBlockComponentMetadata,
+    UIBlockConfiguration,
+    UIComponentMetadata,
+)
+from perf_benchmarks.benchmark_utils import generate_movies_payload, print_comparison
+
+
+def _prepare(rows: int) -> tuple[InputDataContext, UIComponentMetadata]:
+    input_data_context = InputDataContext(
+        InputData(id="1", data=generate_movies_payload(rows), type="movies")
+    )
+    agent = NextGenUIAgent()
+    component_metadata = asyncio.run(
+        agent.refresh_component(
+            input_data_context,
+            UIBlockConfiguration(
+                component_metadata=UIBlockComponentMetadata(
+                    id="1",
+                    title="Movies",
+                    component="table",
+                    fields=[
+                        DataField(id="title", name="Title", data_path="$..title"),
+                        DataField(id="year", name="Year", data_path="$..year"),
+                    ],
+                ),
+                input_data_transformer_name="json",
+                json_wrapping_field_name="movies",
+            ),
+        )
+    )
+    return input_data_context, component_metadata
+
+
+def scenario_previous(rows: int) -> Callable[[], Any]:
+    """Previous implementation, dumping `json_data` when converting component metadata."""
+    input_data_context, component_metadata = _prepare(rows)
+
+    def request() -> Any:
+        block_component_metadata = UIBlockComponentMetadata(
+            **component_metadata.model_dump()
+        )
+        return UIComponentMetadata(
+            **block_component_metadata.model_dump(),
+            json_data=input_data_context.wrapped_json_data,
+        )
+
+    return request
+
+
+def scenario_current(rows: int) -> Callable[[], Any]:
+    """Current agent implementation."""
+    input_data_context, component_metadata = _prepare(rows)
+    agent = NextGenUIAgent()
+    loop = asyncio.new_event_loop()
+
+    def request() -> Any:
+        block_configuration = agent.construct_UIBlockConfiguration(
+            input_data_context, component_metadata
+        )
+        return loop.run_until_complete(
+            agent.refresh_component(input_data_context, block_configuration)
+        )
+
+    return request
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Numbers of rows in the input data to benchmark.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "Peak RSS of one UIBlockConfiguration construction and component refresh",
+        {"previous": scenario_previous, "current": scenario_current},
+        args.rows,
+    )
@@ -0,0 +1,86 @@
+"""
+Benchmark of the rendering cache for large components.
+
+Compares duration and peak RSS of the RHDS table and JSON rendering without the cache,
+with the cache hit (unchanged component refreshed by the client) and with the cache miss
+(cost of the component data digest added to the rendering).
+"""
+
+import argparse
+from typing import Any, Callable
+
+from next_gen_ui_agent.design_system_handler import render_component
+from next_gen_ui_agent.renderer.base_renderer import StrategyFactory
+from next_gen_ui_agent.renderer.json.json_renderer import JsonStrategyFactory
+from next_gen_ui_agent.rendering_cache import RenderingCache
+from next_gen_ui_rhds_renderer import RhdsStrategyFactory
+from perf_benchmarks.benchmark_utils import print_comparison
+from perf_benchmarks.template_rendering import COLUMNS, generate_table_component
+
+
+def _scenario(
+    rows: int, factory: StrategyFactory, cache: str | None
+) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    factory.warm_up()
+    if not cache:
+        return lambda: render_component(component, factory)
+
+    rendering_cache = RenderingCache()
+    if cache == "hit":
+        render_component(component, factory, rendering_cache)
+        return lambda: render_component(component, factory, rendering_cache)
+
+    def request() -> Any:
+        rendering_cache.clear()
+        return render_component(component, factory, rendering_cache)
+
+    return request
+
+
+def scenario_rhds_no_cache(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, RhdsStrategyFactory(), None)
+
+
+def scenario_rhds_cache_miss(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, RhdsStrategyFactory(), "miss")
+
+
+def scenario_rhds_cache_hit(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, RhdsStrategyFactory(), "hit")
+
+
+def scenario_json_no_cache(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, JsonStrategyFactory(), None)
+
+
+def scenario_json_cache_miss(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, JsonStrategyFactory(), "miss")
+
+
+def scenario_json_cache_hit(rows: int) -> Callable[[], Any]:
+    return _scenario(rows, JsonStrategyFactory(), "hit")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help=f"Numbers of rows of the rendered table, each row has {COLUMNS} cells.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        f"Rendering cache, table rendering ({COLUMNS} cells per row)",
+        {
+            "rhds, no cache": scenario_rhds_no_cache,
+            "rhds, cache miss": scenario_rhds_cache_miss,
+            "rhds, cache hit": scenario_rhds_cache_hit,
+            "json, no cache": scenario_json_no_cache,
+            "json, cache miss": scenario_json_cache_miss,
+            "json, cache hit": scenario_json_cache_hit,
+        },
+        args.rows,
+    )
@@ -0,0 +1,88 @@
+"""
+Benchmark of the UI Agent startup, important for deployments spawning process per client session (eg. MCP stdio).
+
+Every run is measured in a fresh process, so nothing is imported before the measured request:
+* `import` - import of the agent module.
+* `agent init` - import and `NextGenUIAgent` construction, which validates the configured component system.
+* `agent init + render` - import, construction and first rendering with the configured component system.
+* `eager plugins` - import and construction, plus eager discovery and instantiation of all the installed renderer
+  and input data transformer plugins with stevedore `ExtensionManager(..., invoke_on_load=True)`, as it was done
+  at import time before the plugins were loaded lazily.
+"""
+
+import argparse
+from typing import Any, Callable
+
+
+def scenario_import(run: int) -> Callable[[], Any]:
+    def request() -> Any:
+        import next_gen_ui_agent.agent  # noqa: F401
+
+    return request
+
+
+def _agent_init() -> Any:
+    from next_gen_ui_agent.agent import NextGenUIAgent
+    from next_gen_ui_agent.types import AgentConfig
+
+    return NextGenUIAgent(config=AgentConfig(component_system="json"))
+
+
+def scenario_agent_init(run: int) -> Callable[[], Any]:
+    return _agent_init
+
+
+def scenario_agent_init_render(run: int) -> Callable[[], Any]:
+    def request() -> Any:
+        from next_gen_ui_testing.data_after_transformation import (
+            get_transformed_component,
+        )
+
+        return _agent_init().generate_rendering(get_transformed_component(), "json")
+
+    return request
+
+
+def scenario_eager_plugins(run: int) -> Callable[[], Any]:
+    def request() -> Any:
+        from next_gen_ui_agent.design_system_handler import (
+            PLUGGABLE_RENDERERS_NAMESPACE,
+        )
+        from next_gen_ui_agent.input_data_transform.input_data_transform import (
+            PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE,
+        )
+        from stevedore import ExtensionManager
+
+        agent = _agent_init()
+        for namespace in [
+            PLUGGABLE_RENDERERS_NAMESPACE,
+            PLUGGABLE_INPUT_DATA_TRANSFORMERS_NAMESPACE,
+        ]:
+            ExtensionManager(namespace=namespace, invoke_on_load=True)
+        return agent
+
+    return request
+
+
+if __name__ == "__main__":
+    from perf_benchmarks.benchmark_utils import print_comparison
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of measured runs of every scenario.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "UI Agent startup",
+        {
+            "import": scenario_import,
+            "agent init": scenario_agent_init,
+            "agent init + render": scenario_agent_init_render,
+            "eager plugins": scenario_eager_plugins,
+        },
+        list(range(1, args.runs + 1)),
+        size_label="run",
+    )
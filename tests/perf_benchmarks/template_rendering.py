@@ -0,0 +1,177 @@
+"""
+Benchmark of the RHDS renderer throughput for large tables.
+
+Compares duration and peak RSS of the table rendering with the previous implementation,
+which looked up field data for every table cell in the template and copied the whole component
+by `model_dump()` to create the template rendering context.
+First rendering in a fresh process is measured too, with templates loaded from the persistent
+bytecode cache and compiled from the sources.
+Streamed rendering is measured for all the chunks (written to the null device, as sent to the client)
+and for the first chunk only (time to the first byte).
+"""
+
+import argparse
+import os
+from typing import Any, Callable
+
+from jinja2 import Environment, PackageLoader  # pants: no-infer-dep
+from next_gen_ui_agent.data_transform.types import (
+    ComponentDataTable,
+    DataFieldArrayValue,
+)
+from next_gen_ui_agent.design_system_handler import render_component_stream
+from next_gen_ui_rhds_renderer import RhdsStrategyFactory
+from next_gen_ui_rhds_renderer.rhds_renderer import RhdsTableRenderStrategy
+from perf_benchmarks.benchmark_utils import print_comparison
+
+COLUMNS = 6
+
+PREVIOUS_TABLE_TEMPLATE = """
+<rh-table>
+  <table>
+    {% if title %}
+    <caption>{{title}}</caption>
+    {% endif %}
+    <colgroup>
+      {% for field in fields %}
+      <col>
+      {% endfor %}
+    </colgroup>
+    <thead>
+      <tr>
+        {% for field in fields %}
+        <th scope="col">{{ field.get("name") }}<rh-sort-button></rh-sort-button>
+        {% endfor %}
+        </th>
+      </tr>
+    </thead>
+    <tbody>
+      {% for i in range(data_length) %}
+      <tr>
+      {% for field in fields %}
+        {% if field.get("data")|length > i %}
+        <td>{{ field.get("data")[i] }}</td>
+        {% else  %}
+          <td>-</td>
+        {% endif %}
+      {% endfor %}
+      </tr>
+      {% endfor %}
+    </tbody>
+  </table>
+</rh-table>
+"""
+"""Body of the previous RHDS table template."""
+
+
+def generate_table_component(rows: int) -> ComponentDataTable:
+    """Generate table component with `rows` rows of `COLUMNS` columns of different types."""
+    return ComponentDataTable(
+        id="movies",
+        component="table",
+        title="Movies",
+        fields=[
+            DataFieldArrayValue(
+                id=f"field_{column}",
+                name=f"Field {column}",
+                data_path=f"$..movies[*].field_{column}",
+                data=[f"Movie {i}" if column % 2 else i * column for i in range(rows)],
+            )
+            for column in range(COLUMNS)
+        ],
+    )
+
+
+def scenario_previous(rows: int) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    strategy = RhdsStrategyFactory().get_render_strategy(component)
+    template = Environment(
+        loader=PackageLoader("next_gen_ui_rhds_renderer", "templates"),
+        trim_blocks=True,
+    ).from_string(PREVIOUS_TABLE_TEMPLATE)
+
+    def request() -> Any:
+        additional_context = strategy.get_additional_context(component)
+        return template.render(component.model_dump() | additional_context)
+
+    return request
+
+
+def scenario_current(rows: int) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    factory = RhdsStrategyFactory()
+    factory.warm_up()
+    strategy = factory.get_render_strategy(component)
+    return lambda: strategy.render(component)
+
+
+def scenario_streamed(rows: int) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    factory = RhdsStrategyFactory()
+    factory.warm_up()
+
+    def request() -> Any:
+        _, chunks = render_component_stream(component, factory)
+        with open(os.devnull, "w") as out:
+            for chunk in chunks:
+                out.write(chunk)
+
+    return request
+
+
+def scenario_streamed_first_chunk(rows: int) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    factory = RhdsStrategyFactory()
+    factory.warm_up()
+
+    def request() -> Any:
+        _, chunks = render_component_stream(component, factory)
+        return next(chunks)
+
+    return request
+
+
+def _scenario_first_rendering(rows: int, bytecode_cache: bool) -> Callable[[], Any]:
+    component = generate_table_component(rows)
+    factory = RhdsStrategyFactory()
+    strategy = RhdsTableRenderStrategy()
+    if bytecode_cache:
+        # store compiled templates into the bytecode cache
+        factory.warm_up()
+    else:
+        strategy.templates_env.bytecode_cache = None
+    if strategy.templates_env.cache is not None:
+        strategy.templates_env.cache.clear()
+    return lambda: strategy.render(component)
+
+
+def scenario_first_bytecode_cache(rows: int) -> Callable[[], Any]:
+    return _scenario_first_rendering(rows, bytecode_cache=True)
+
+
+def scenario_first_no_bytecode_cache(rows: int) -> Callable[[], Any]:
+    return _scenario_first_rendering(rows, bytecode_cache=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help=f"Numbers of rows of the rendered table, each row has {COLUMNS} cells.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        f"RHDS table rendering ({COLUMNS} cells per row)",
+        {
+            "previous": scenario_previous,
+            "current": scenario_current,
+            "streamed": scenario_streamed,
+            "streamed, first chunk": scenario_streamed_first_chunk,
+            "first, bytecode cache": scenario_first_bytecode_cache,
+            "first, no bytecode cache": scenario_first_no_bytecode_cache,
+        },
+        args.rows,
+    )
@@ -0,0 +1,91 @@
+"""
+Benchmark of the YAML input data transformation for Kubernetes-style YAML dumps.
+
+Compares duration and peak RSS of the YAML transformation with the previous implementation,
+which used pure python `yaml.safe_load`, and the current one using `libyaml` `CSafeLoader` if available.
+Multi-document YAML transformation limited to `MAX_ROWS` documents (`AgentConfig.input_data_max_rows`) is measured too.
+"""
+
+import argparse
+from typing import Any, Callable
+
+import yaml  # type: ignore[import-untyped]
+from next_gen_ui_agent.input_data_transform.yaml_input_data_transformer import (
+    YamlInputDataTransformer,
+)
+from perf_benchmarks.benchmark_utils import print_comparison
+
+MAX_ROWS = 100
+
+
+def generate_pod_yaml(i: int) -> str:
+    """Generate YAML document with Kubernetes Pod resource."""
+    return f"""apiVersion: v1
+kind: Pod
+metadata:
+  name: backend-{i}
+  namespace: team-{i % 10}
+  labels:
+    app: backend
+    tier: "{i % 3}"
+  creationTimestamp: "2025-01-{1 + i % 28:02d}T10:00:00Z"
+spec:
+  containers:
+  - name: app
+    image: quay.io/example/backend:1.{i % 20}
+    ports:
+    - containerPort: 8080
+      protocol: TCP
+    resources:
+      limits:
+        cpu: 500m
+        memory: 512Mi
+status:
+  phase: Running
+  podIP: 10.0.{i % 256}.{i % 200}
+  restartCount: {i % 5}
+"""
+
+
+def generate_multi_document_yaml(documents: int) -> str:
+    """Generate multi-document YAML with `documents` Pods."""
+    return "---\n" + "---\n".join(generate_pod_yaml(i) for i in range(documents))
+
+
+def scenario_previous(documents: int) -> Callable[[], Any]:
+    input_data = generate_multi_document_yaml(documents)
+    return lambda: list(yaml.safe_load_all(input_data))
+
+
+def scenario_current(documents: int) -> Callable[[], Any]:
+    input_data = generate_multi_document_yaml(documents)
+    transformer = YamlInputDataTransformer()
+    return lambda: transformer.transform(input_data)
+
+
+def scenario_max_rows(documents: int) -> Callable[[], Any]:
+    input_data = generate_multi_document_yaml(documents)
+    transformer = YamlInputDataTransformer()
+    return lambda: transformer.transform_documents(input_data, MAX_ROWS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--documents",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Numbers of Kubernetes Pod YAML documents in the input data to benchmark.",
+    )
+    args = parser.parse_args()
+    print_comparison(
+        "YAML input data transformation (Kubernetes Pods)",
+        {
+            "previous": scenario_previous,
+            "current": scenario_current,
+            f"max {MAX_ROWS} documents": scenario_max_rows,
+        },
+        args.documents,
+        size_label="documents",
+    )